@@ -3,6 +3,7 @@ TradingAgents - App Web Interattiva con Chainlit
 Interfaccia completa con Dashboard, Report e Grafici
 """
 
+import asyncio
 import sys
 import os
 from pathlib import Path
@@ -109,93 +110,67 @@ AGENT_NAMES_IT = {
     "Portfolio Manager": "Portfolio Manager"
 }
 
-async def stream_analysis_with_updates(graph, ticker: str, date: str, progress_msg):
+def extract_new_reports(delta: dict, reports_data: dict) -> dict:
+    """Report sections completed by a graph step and not shown yet"""
+    new_reports = {}
+    for key in ("market_report", "sentiment_report", "news_report", "fundamentals_report", "trader_investment_plan"):
+        if delta.get(key) and key not in reports_data:
+            new_reports[key] = delta[key]
+    
+    # Research team decision / final decision live inside the debate states
+    debate = delta.get("investment_debate_state") or {}
+    if debate.get("judge_decision") and "investment_plan" not in reports_data:
+        new_reports["investment_plan"] = debate["judge_decision"]
+    risk = delta.get("risk_debate_state") or {}
+    if risk.get("judge_decision") and "final_trade_decision" not in reports_data:
+        new_reports["final_trade_decision"] = risk["judge_decision"]
+    return new_reports
+
+
+async def stream_analysis_with_updates(graph, ticker: str, date: str, progress_msg, profiler=None,
+                                      resume_run_id: Optional[str] = None):
     """
     Stream analysis with real-time progressive updates and progress bar.
     Shows each report section as soon as it's completed with live progress tracking.
+    An optional GraphProfiler records per-node / per-tool timings of the run.
+    With a checkpointer configured, resume_run_id continues a failed run from its last step.
     """
-    import asyncio
-    from queue import Queue
-    import time
+    from tradingagents.graph.service import ServiceBusyError
+    from tradingagents.graph.streaming import StateTracker, StreamBridge
     
-    # Initialize state
+    # Initialize state (a resumed run starts from its checkpoint)
+    resume_state = None
+    if resume_run_id:
+        resume_state = (await asyncio.to_thread(graph.get_checkpoint, resume_run_id)).values
+    run_id = graph.propagator.new_run_id(ticker, date, resume_run_id)
     init_agent_state = graph.propagator.create_initial_state(ticker, date)
-    args = graph.propagator.get_graph_args(callbacks=[])
-    
-    # Queue for thread-safe communication between streaming thread and async loop
-    report_queue = Queue()
-    streaming_done = False
+    args = graph.propagator.get_graph_args(
+        callbacks=[profiler] if profiler else [], run_id=run_id, stream_mode="updates"
+    )
     
-    # Run streaming in executor thread
-    loop = asyncio.get_event_loop()
-    
-    def stream_graph_and_queue():
-        """Synchronous streaming that puts reports into queue"""
-        nonlocal streaming_done
-        reports_data = {}
-        trace = []
-        last_keys = set()
-        
-        try:
-            for chunk in graph.graph.stream(init_agent_state, **args):
-                trace.append(chunk)
-                
-                # Extract all available reports from current chunk
-                reports_to_send = {}
-                
-                # Check each report type
-                if "market_report" in chunk and chunk["market_report"] and "market_report" not in reports_data:
-                    reports_data["market_report"] = chunk["market_report"]
-                    reports_to_send["market_report"] = chunk["market_report"]
-                    
-                if "sentiment_report" in chunk and chunk["sentiment_report"] and "sentiment_report" not in reports_data:
-                    reports_data["sentiment_report"] = chunk["sentiment_report"]
-                    reports_to_send["sentiment_report"] = chunk["sentiment_report"]
-                    
-                if "news_report" in chunk and chunk["news_report"] and "news_report" not in reports_data:
-                    reports_data["news_report"] = chunk["news_report"]
-                    reports_to_send["news_report"] = chunk["news_report"]
-                    
-                if "fundamentals_report" in chunk and chunk["fundamentals_report"] and "fundamentals_report" not in reports_data:
-                    reports_data["fundamentals_report"] = chunk["fundamentals_report"]
-                    reports_to_send["fundamentals_report"] = chunk["fundamentals_report"]
-                
-                # Check for research team decision
-                if "investment_debate_state" in chunk and chunk["investment_debate_state"]:
-                    debate = chunk["investment_debate_state"]
-                    if debate.get("judge_decision") and "investment_plan" not in reports_data:
-                        reports_data["investment_plan"] = debate["judge_decision"]
-                        reports_to_send["investment_plan"] = debate["judge_decision"]
-                
-                # Check for trader plan
-                if "trader_investment_plan" in chunk and chunk["trader_investment_plan"] and "trader_investment_plan" not in reports_data:
-                    reports_data["trader_investment_plan"] = chunk["trader_investment_plan"]
-                    reports_to_send["trader_investment_plan"] = chunk["trader_investment_plan"]
-                
-                # Check for final decision
-                if "risk_debate_state" in chunk and chunk["risk_debate_state"]:
-                    risk = chunk["risk_debate_state"]
-                    if risk.get("judge_decision") and "final_trade_decision" not in reports_data:
-                        reports_data["final_trade_decision"] = risk["judge_decision"]
-                        reports_to_send["final_trade_decision"] = risk["judge_decision"]
-                
-                # Queue any new reports
-                if reports_to_send:
-                    for key, content in reports_to_send.items():
-                        report_queue.put(("report", key, content, len(reports_data)))
-            
-            # Signal end of streaming
-            final_state = trace[-1] if trace else {}
-            decision = graph.process_signal(final_state.get("final_trade_decision", ""))
-            report_queue.put(("done", final_state, decision, reports_data))
-            
-        except Exception as e:
-            report_queue.put(("error", str(e)))
-        finally:
-            streaming_done = True
-    
-    # Start streaming in thread
-    future = loop.run_in_executor(None, stream_graph_and_queue)
+    # The graph runs on the shared worker pool (admission control + queue) and
+    # hands every step to this loop as soon as it completes (no polling)
+    service = get_graph_service()
+    bridge = StreamBridge(
+        graph.graph,
+        None if resume_state else init_agent_state,
+        args,
+        submit=service.submit,
+        tracker=StateTracker(resume_state or init_agent_state),
+    )
+    position = service.queue_position()
+    try:
+        bridge.start()
+    except ServiceBusyError:
+        await progress_msg.remove()
+        await cl.Message(
+            content="⛔ **Server occupato:** troppe analisi in corso e in coda. Riprova tra qualche minuto (`STATO` per i dettagli)."
+        ).send()
+        return None, None, {}
+    if position:
+        await cl.Message(
+            content=f"🕒 Analisi in coda (posizione {position}): partirà appena si libera un worker."
+        ).send()
     
     # Remove progress message and start showing real updates
     await progress_msg.remove()
@@ -209,74 +184,74 @@ async def stream_analysis_with_updates(graph, ticker: str, date: str, progress_m
     
     # Consumer loop: Process reports as they arrive
     reports_data = {}
-    final_state = None
-    decision = None
     completed_sections = []
+    translation_tasks = []
+    pending_sections = []
+    
+    async def translate_and_send(sections: list):
+        """Translate the sections that arrived together in one batch and send them in order"""
+        translated = await translate_many_to_italian([content[:2500] for _, content in sections])
+        for (section_key, _), translated_content in zip(sections, translated):
+            section_title = SECTION_TRANSLATIONS.get(section_key, section_key)
+            await cl.Message(
+                content=f"## {section_title}\n\n{translated_content}"
+            ).send()
+    
+    def flush_translations():
+        """Start translating every section received since the last flush"""
+        nonlocal pending_sections
+        if pending_sections:
+            translation_tasks.append(asyncio.create_task(translate_and_send(pending_sections)))
+            pending_sections = []
+    
+    # Sections completed before the interruption
+    if resume_state:
+        for section_key, content in extract_new_reports(resume_state, reports_data).items():
+            reports_data[section_key] = content
+            completed_sections.append(section_key)
+            pending_sections.append((section_key, content))
+        flush_translations()
     
-    while True:
+    try:
+        async for _, delta in bridge:
+            new_reports = extract_new_reports(delta, reports_data)
+            for section_key, content in new_reports.items():
+                reports_data[section_key] = content
+                completed_sections.append(section_key)
+                # Translated in the background once the bridge is drained:
+                # sections that arrive together share one translation request
+                pending_sections.append((section_key, content))
+            if not bridge.pending():
+                flush_translations()
+            if not new_reports:
+                continue
+            
+            # Replace the progress indicator with what's completed
+            try:
+                await progress_text.remove()
+            except:
+                pass
+            progress_text = await cl.Message(
+                content=f"🔄 **Analisi in corso...**\n\n"
+                        f"✅ Completati: {len(completed_sections)}/{7}\n\n"
+                        + "\n".join([f"  ✓ {SECTION_TRANSLATIONS.get(s, s)}" for s in completed_sections]) +
+                        f"\n\n_Agenti in lavoro..._"
+            ).send()
+    except Exception as e:
         try:
-            # Check queue without blocking
-            if not report_queue.empty():
-                item = report_queue.get(timeout=0.5)
-                
-                if item[0] == "report":
-                    _, section_key, content, total_count = item
-                    reports_data[section_key] = content
-                    completed_sections.append(section_key)
-                    
-                    # Remove progress indicator (will add new one if more sections coming)
-                    try:
-                        await progress_text.remove()
-                    except:
-                        pass
-                    
-                    # Translate and send the completed report immediately
-                    section_title = SECTION_TRANSLATIONS.get(section_key, section_key)
-                    
-                    # Translate the report to Italian
-                    translated_content = await translate_to_italian(content[:2500])
-                    
-                    # Send the translated report
-                    await cl.Message(
-                        content=f"## {section_title}\n\n{translated_content}"
-                    ).send()
-                    
-                    # Update progress with what's completed
-                    progress_text = await cl.Message(
-                        content=f"🔄 **Analisi in corso...**\n\n"
-                                f"✅ Completati: {len(completed_sections)}/{7}\n\n"
-                                + "\n".join([f"  ✓ {SECTION_TRANSLATIONS.get(s, s)}" for s in completed_sections]) +
-                                f"\n\n_Agenti in lavoro..._"
-                    ).send()
-                    
-                    await asyncio.sleep(0.5)
-                    
-                elif item[0] == "done":
-                    _, final_state, decision, reports_data = item
-                    break
-                    
-                elif item[0] == "error":
-                    _, error_msg = item
-                    try:
-                        await progress_text.remove()
-                    except:
-                        pass
-                    await cl.Message(content=f"❌ Errore durante l'analisi: {error_msg}").send()
-                    return None, None, {}
-                    
-            elif streaming_done and report_queue.empty():
-                # Wait a bit more to ensure we got all items
-                await asyncio.sleep(1)
-                if report_queue.empty():
-                    break
-            else:
-                # Nothing in queue yet, check again soon
-                await asyncio.sleep(0.5)
-                
-        except Exception as e:
-            # Queue timeout or other error, continue loop
-            await asyncio.sleep(0.5)
-            continue
+            await progress_text.remove()
+        except:
+            pass
+        resume_note = f"\n\n💾 Analisi salvata: riprendila con `RIPRENDI {run_id}`" if run_id else ""
+        await cl.Message(content=f"❌ Errore durante l'analisi: {e}{resume_note}").send()
+        return None, None, {}
+    
+    final_state = bridge.state
+    decision = await asyncio.to_thread(graph.process_signal, final_state.get("final_trade_decision", ""))
+    
+    # Sections still being translated
+    flush_translations()
+    await asyncio.gather(*translation_tasks)
     
     # Clean up progress message
     try:
@@ -291,35 +266,137 @@ async def stream_analysis_with_updates(graph, ticker: str, date: str, progress_m
                 f"🔄 _Generazione file completi in corso..._"
     ).send()
     
-    await future  # Ensure thread finishes
-    
     return final_state, decision, reports_data
 
 
+_translation_client = None
+
+
+def get_translation_client():
+    """Shared async OpenAI client (translations must not block the event loop)"""
+    global _translation_client
+    if _translation_client is None:
+        import openai
+        _translation_client = openai.AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    return _translation_client
+
+
+# Cache traduzioni su disco: chiave = hash di modello + prompt + testo, quindi
+# riaprire un report o rilanciare la stessa analisi non richiede nuove chiamate
+TRANSLATION_MODEL = "gpt-3.5-turbo"
+TRANSLATION_PROMPT = "Sei un traduttore esperto. Traduci il seguente testo finanziario dall'inglese all'italiano, mantenendo la terminologia tecnica appropriata."
+TRANSLATION_CACHE_DIR = Path(os.getenv("TA_TRANSLATION_CACHE_DIR", current_dir / ".cache" / "translations"))
+# Caratteri di input per singola richiesta batch (l'output resta sotto il limite del modello)
+TRANSLATION_BATCH_CHARS = 6000
+
+
+def _translation_cache_path(text: str) -> Path:
+    import hashlib
+    digest = hashlib.sha256(f"{TRANSLATION_MODEL}\0{TRANSLATION_PROMPT}\0{text}".encode("utf-8")).hexdigest()
+    return TRANSLATION_CACHE_DIR / digest[:2] / f"{digest}.txt"
+
+
+def get_cached_translation(text: str) -> Optional[str]:
+    """Cached translation of text, or None"""
+    try:
+        return _translation_cache_path(text).read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def store_translation(text: str, translated: str) -> None:
+    """Save a translation (write + rename, so readers never see partial files)"""
+    path = _translation_cache_path(text)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(translated, encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass  # The cache is an optimization: never fail a translation because of it
+
+
 async def translate_to_italian(text: str) -> str:
-    """Translate English text to Italian using OpenAI"""
+    """Translate English text to Italian using OpenAI (disk-cached)"""
+    cached = get_cached_translation(text)
+    if cached is not None:
+        return cached
     try:
-        import openai
-        import os
+        client = get_translation_client()
         
-        client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        
-        response = client.chat.completions.create(
-            model="gpt-3.5-turbo",
+        response = await client.chat.completions.create(
+            model=TRANSLATION_MODEL,
             messages=[
-                {"role": "system", "content": "Sei un traduttore esperto. Traduci il seguente testo finanziario dall'inglese all'italiano, mantenendo la terminologia tecnica appropriata."},
+                {"role": "system", "content": TRANSLATION_PROMPT},
                 {"role": "user", "content": text}
             ],
             temperature=0.3,
             max_tokens=1500
         )
         
-        return response.choices[0].message.content
+        translated = response.choices[0].message.content
+        store_translation(text, translated)
+        return translated
     except Exception as e:
         # If translation fails, return original with note
         return f"⚠️ _Traduzione non disponibile_\n\n{text[:300]}..."
 
 
+async def _translate_batch(texts: list) -> list:
+    """Translate several texts in one request (JSON in / JSON out).
+
+    Falls back to one request per text if the answer can't be mapped back.
+    """
+    import json
+    if len(texts) == 1:
+        return [await translate_to_italian(texts[0])]
+    try:
+        client = get_translation_client()
+        response = await client.chat.completions.create(
+            model=TRANSLATION_MODEL,
+            messages=[
+                {"role": "system", "content": TRANSLATION_PROMPT
+                    + " Riceverai un oggetto JSON {\"sections\": [...]}: rispondi solo con un oggetto JSON "
+                      "{\"sections\": [...]} con le traduzioni, nello stesso ordine e nello stesso numero."},
+                {"role": "user", "content": json.dumps({"sections": texts}, ensure_ascii=False)}
+            ],
+            temperature=0.3,
+            max_tokens=4096,
+            response_format={"type": "json_object"},
+        )
+        translated = json.loads(response.choices[0].message.content)["sections"]
+        if len(translated) != len(texts) or not all(isinstance(t, str) and t.strip() for t in translated):
+            raise ValueError("batch translation returned a different number of sections")
+    except Exception:
+        return list(await asyncio.gather(*(translate_to_italian(t) for t in texts)))
+    for text, result in zip(texts, translated):
+        store_translation(text, result)
+    return translated
+
+
+async def translate_many_to_italian(texts: list) -> list:
+    """Translate several texts: cache hits return at once, the rest go out in
+    as few requests as possible (batches up to TRANSLATION_BATCH_CHARS, in parallel)"""
+    results = [get_cached_translation(t) for t in texts]
+    missing = [i for i, r in enumerate(results) if r is None]
+    
+    batches, current, size = [], [], 0
+    for i in missing:
+        if current and size + len(texts[i]) > TRANSLATION_BATCH_CHARS:
+            batches.append(current)
+            current, size = [], 0
+        current.append(i)
+        size += len(texts[i])
+    if current:
+        batches.append(current)
+    
+    translated = await asyncio.gather(*(_translate_batch([texts[i] for i in batch]) for batch in batches))
+    for batch, batch_result in zip(batches, translated):
+        for i, result in zip(batch, batch_result):
+            results[i] = result
+    return results
+
+
 def generate_complete_markdown_report(ticker: str, date: str, final_state: dict, decision_score: float, sentiment: str) -> str:
     """
     Generate a complete markdown report from final_state, similar to CLI's display_complete_report.
@@ -415,6 +492,108 @@ def generate_complete_markdown_report(ticker: str, date: str, final_state: dict,
     
     return "\n\n".join(report_parts)
 
+# ========== PIPELINE ARTEFATTI (fuori dall'event loop) ==========
+
+def save_markdown_reports(report_base_dir: Path, ticker: str, date: str, final_state: dict,
+                          decision_score: float, sentiment: str) -> Path:
+    """Write complete_report.md and the per-section files (like the CLI). Blocking: run in a thread."""
+    complete_report = generate_complete_markdown_report(ticker, date, final_state, decision_score, sentiment)
+    complete_report_path = report_base_dir / "complete_report.md"
+    complete_report_path.write_text(complete_report, encoding="utf-8")
+    
+    sections_dir = report_base_dir / "sections"
+    sections_dir.mkdir(exist_ok=True)
+    
+    # Save analyst reports
+    if final_state.get("market_report"):
+        (sections_dir / "1_market_report.md").write_text(final_state["market_report"], encoding="utf-8")
+    if final_state.get("sentiment_report"):
+        (sections_dir / "2_sentiment_report.md").write_text(final_state["sentiment_report"], encoding="utf-8")
+    if final_state.get("news_report"):
+        (sections_dir / "3_news_report.md").write_text(final_state["news_report"], encoding="utf-8")
+    if final_state.get("fundamentals_report"):
+        (sections_dir / "4_fundamentals_report.md").write_text(final_state["fundamentals_report"], encoding="utf-8")
+    
+    # Save research team reports
+    if final_state.get("investment_debate_state"):
+        debate_state = final_state["investment_debate_state"]
+        research_dir = sections_dir / "5_research_team"
+        research_dir.mkdir(exist_ok=True)
+        if debate_state.get("bull_history"):
+            (research_dir / "bull_researcher.md").write_text(debate_state["bull_history"], encoding="utf-8")
+        if debate_state.get("bear_history"):
+            (research_dir / "bear_researcher.md").write_text(debate_state["bear_history"], encoding="utf-8")
+        if debate_state.get("judge_decision"):
+            (research_dir / "research_manager.md").write_text(debate_state["judge_decision"], encoding="utf-8")
+    
+    # Save trading team report
+    if final_state.get("trader_investment_plan"):
+        (sections_dir / "6_trader_plan.md").write_text(final_state["trader_investment_plan"], encoding="utf-8")
+    
+    # Save risk management reports
+    if final_state.get("risk_debate_state"):
+        risk_state = final_state["risk_debate_state"]
+        risk_dir = sections_dir / "7_risk_management"
+        risk_dir.mkdir(exist_ok=True)
+        if risk_state.get("aggressive_history"):
+            (risk_dir / "aggressive_analyst.md").write_text(risk_state["aggressive_history"], encoding="utf-8")
+        if risk_state.get("conservative_history"):
+            (risk_dir / "conservative_analyst.md").write_text(risk_state["conservative_history"], encoding="utf-8")
+        if risk_state.get("neutral_history"):
+            (risk_dir / "neutral_analyst.md").write_text(risk_state["neutral_history"], encoding="utf-8")
+        if risk_state.get("judge_decision"):
+            (risk_dir / "portfolio_manager.md").write_text(risk_state["judge_decision"], encoding="utf-8")
+    
+    return complete_report_path
+
+
+def render_dashboard(dash_gen, ticker: str, decision_score: float, sentiment: str, timestamp: str) -> str:
+    """Build the Plotly figures and write the dashboard HTML. Blocking: run in a thread."""
+    decision_fig = dash_gen.create_decision_gauge(decision_score, sentiment)
+    sentiment_breakdown = {
+        "Rialzista": decision_score,
+        "Neutro": 1 - abs(decision_score),
+        "Ribassista": -decision_score if decision_score < 0 else 0
+    }
+    sentiment_fig = dash_gen.create_sentiment_breakdown(sentiment_breakdown)
+    
+    return dash_gen.create_dashboard_html(
+        ticker=ticker,
+        decision_fig=decision_fig,
+        sentiment_fig=sentiment_fig,
+        filename=f"dashboard_{ticker}_{timestamp}.html"
+    )
+
+
+async def send_file(title: str, path, missing_note: str):
+    """Send a generated file as soon as it is ready (or where it was saved, if sending fails)"""
+    try:
+        await cl.Message(
+            content=title,
+            elements=[
+                cl.File(
+                    name=Path(path).name,
+                    path=str(path),
+                    display="inline"
+                )
+            ]
+        ).send()
+    except Exception as e:
+        await cl.Message(content=f"⚠️ Nota: {missing_note} salvato in `{path}`").send()
+
+
+async def produce_artifact(title: str, missing_note: str, render, *args):
+    """Render one artifact in a worker thread, then stream it to the user. Returns its path or None."""
+    try:
+        path = await asyncio.to_thread(render, *args)
+    except Exception as e:
+        await cl.Message(content=f"⚠️ {missing_note} non generato: {e}").send()
+        return None
+    if path:
+        await send_file(title, path, missing_note)
+    return path
+
+
 # ========== LAZY LOADERS ==========
 
 def get_report_gen():
@@ -436,71 +615,80 @@ def get_dashboard_gen():
     if dashboard_gen is None:
         try:
             from tradingagents.utils.dashboard import DashboardGenerator as DG
-            dashboard_gen = DG(output_dir="./dashboards")
+            dashboard_gen = DG(output_dir="./dashboards", shared_assets=False)  # Inviata come file singolo
         except Exception as e:
             import traceback
             print(f"⚠️ Error loading DashboardGenerator: {e}\n{traceback.format_exc()}")
             return None
     return dashboard_gen
 
-# Istanza globale TradingAgents - lazy loading
-ta = None
-user_config = None  # Configurazione dell'utente
+# Servizio grafi condiviso - lazy loading
+# Un TradingAgentsGraph per configurazione, condiviso in sola lettura tra le sessioni;
+# ogni analisi ha il proprio stato e gira su un pool limitato con coda.
+graph_service = None
 last_error = None  # Track last error for debugging
 
-def get_ta():
-    """Lazy load TradingAgentsGraph only when needed"""
-    global ta, config, last_error
-    if ta is None:
-        try:
-            # Ensure local package paths are available (avoid shadowed installs)
-            local_root = Path(__file__).parent.parent
-            alt_root = local_root / "TradingAgents"
-            for path in (local_root, alt_root):
-                if path.exists() and str(path) not in sys.path:
-                    sys.path.insert(0, str(path))
-
-            # Verify API keys are available
-            openai_key = os.getenv("OPENAI_API_KEY")
-            anthropic_key = os.getenv("ANTHROPIC_API_KEY")
-            google_key = os.getenv("GOOGLE_API_KEY")
-            
-            if not any([openai_key, anthropic_key, google_key]):
-                last_error = "No API keys found in environment"
-                print("❌ No API keys available. Check .env file.")
-                return None
-            
-            # Lazy load config if needed - check for essential keys
-            if "project_dir" not in config:
-                from tradingagents.default_config import DEFAULT_CONFIG as DC
-                # Start fresh with DEFAULT_CONFIG and preserve data_vendors
-                vendors = config.get("data_vendors", {})
-                config.clear()
-                config.update(DC)
-                if vendors:
-                    config["data_vendors"] = vendors
-            
-            # Ensure API keys info in config
-            config["api_keys_available"] = {
-                "openai": openai_key is not None,
-                "anthropic": anthropic_key is not None,
-                "google": google_key is not None,
-            }
-            
-            print(f"🔑 Using {config.get('llm_provider', 'openai')} provider")
-            
-            # Now load TradingAgentsGraph
-            from tradingagents.graph.trading_graph import TradingAgentsGraph as TAG
-            ta = TAG(debug=False, config=config)
-            last_error = None  # Clear error on success
-            print("✅ TradingAgentsGraph loaded successfully")
-        except Exception as e:
-            import traceback
-            last_error = str(e)
-            error_msg = f"⚠️ Error loading TradingAgentsGraph: {e}\n{traceback.format_exc()}"
-            print(error_msg)
+MAX_CONCURRENT_ANALYSES = int(os.getenv("TA_MAX_CONCURRENT_ANALYSES", "2"))
+MAX_QUEUED_ANALYSES = int(os.getenv("TA_MAX_QUEUED_ANALYSES", "8"))
+
+
+def get_graph_service():
+    """Lazy load the shared GraphService (graph cache + bounded worker pool)"""
+    global graph_service
+    if graph_service is None:
+        from tradingagents.graph.service import GraphService
+        graph_service = GraphService(
+            max_workers=MAX_CONCURRENT_ANALYSES, max_queue=MAX_QUEUED_ANALYSES
+        )
+    return graph_service
+
+
+def get_ta(session_config: Optional[Dict[str, Any]] = None):
+    """Shared TradingAgentsGraph for the session configuration (built once per config)"""
+    global last_error
+    try:
+        # Ensure local package paths are available (avoid shadowed installs)
+        local_root = Path(__file__).parent.parent
+        alt_root = local_root / "TradingAgents"
+        for path in (local_root, alt_root):
+            if path.exists() and str(path) not in sys.path:
+                sys.path.insert(0, str(path))
+
+        # Verify API keys are available
+        openai_key = os.getenv("OPENAI_API_KEY")
+        anthropic_key = os.getenv("ANTHROPIC_API_KEY")
+        google_key = os.getenv("GOOGLE_API_KEY")
+        
+        if not any([openai_key, anthropic_key, google_key]):
+            last_error = "No API keys found in environment"
+            print("❌ No API keys available. Check .env file.")
             return None
-    return ta
+        
+        # DEFAULT_CONFIG + data_vendors dell'app + parametri della sessione (CONFIGURA)
+        from tradingagents.default_config import DEFAULT_CONFIG as DC
+        ta_config = DC.copy()
+        if config.get("data_vendors"):
+            ta_config["data_vendors"] = config["data_vendors"]
+        ta_config.update(session_config or {})
+        
+        # Ensure API keys info in config
+        ta_config["api_keys_available"] = {
+            "openai": openai_key is not None,
+            "anthropic": anthropic_key is not None,
+            "google": google_key is not None,
+        }
+        
+        print(f"🔑 Using {ta_config.get('llm_provider', 'openai')} provider")
+        
+        trading_graph = get_graph_service().get_graph(ta_config)
+        last_error = None  # Clear error on success
+        return trading_graph
+    except Exception as e:
+        import traceback
+        last_error = str(e)
+        error_msg = f"⚠️ Error loading TradingAgentsGraph: {e}\n{traceback.format_exc()}"
+        print(error_msg)
+        return None
 
 
 async def get_collect_parameters():
@@ -513,10 +701,7 @@ async def get_collect_parameters():
 @cl.on_chat_start
 async def start():
     """Inizializzazione dell'app"""
-    global ta, user_config
-    
-    # Lazy initialize on first use
-    # ta = get_ta()  # Don't load yet
+    # Il grafo viene caricato al primo ANALIZZA (condiviso tra le sessioni)
     
     # Messaggio di benvenuto
     welcome_msg = """
@@ -564,8 +749,6 @@ AIUTO
 @cl.on_message
 async def main(message: cl.Message):
     """Handler principale per i messaggi dell'utente"""
-    global ta, user_config
-    
     user_input = message.content.strip().upper()
     
     try:
@@ -587,11 +770,9 @@ async def main(message: cl.Message):
             ta_config["llm_provider"] = user_config["llm_provider"]
             ta_config["backend_url"] = user_config["backend_url"]
             
-            # Update global config for next ta initialization
-            config.update(ta_config)
-            
-            # Force reset of ta so it gets recreated with new config on next use
-            ta = None
+            # Parametri per questa sessione: le altre sessioni non vengono toccate
+            cl.user_session.set("user_config", user_config)
+            cl.user_session.set("ta_config", ta_config)
             
             await cl.Message(
                 content="""
@@ -614,11 +795,21 @@ Ora puoi eseguire analisi usando:
             await show_assets()
             return
         
+        # Comando STATO - carico del server
+        if user_input == "STATO" or user_input == "STATUS":
+            await show_service_status()
+            return
+        
         # Comando ANALIZZA
         if user_input.startswith("ANALIZZA") or user_input.startswith("ANALYZE"):
             await analyze_stock(user_input)
             return
         
+        # Comando RIPRENDI - continua un'analisi interrotta (checkpoint)
+        if user_input.startswith("RIPRENDI") or user_input.startswith("RESUME"):
+            await resume_analysis(message.content.strip())
+            return
+        
         # Fallback
         await cl.Message(
             content="""❌ Comando non riconosciuto.
@@ -626,7 +817,9 @@ Ora puoi eseguire analisi usando:
 Comandi disponibili:
 - `CONFIGURA` - Configurazione guidata dei parametri
 - `ANALIZZA <TICKER>` - Analizza un titolo
+- `RIPRENDI <RUN_ID>` - Riprende un'analisi interrotta
 - `LISTA` - Mostra asset disponibili
+- `STATO` - Analisi in corso e in coda
 - `AIUTO` - Mostra questa guida
             """.strip()
         ).send()
@@ -759,7 +952,14 @@ async def show_help():
 3️⃣ LISTA
    Mostra i principali asset su cui puoi fare analisi
 
-4️⃣ AIUTO
+4️⃣ STATO
+   Analisi in corso, coda e tempi di attesa del server
+
+↩️ RIPRENDI <RUN_ID>
+   Riprende un'analisi interrotta dall'ultimo step completato
+   (solo con checkpoint attivi: config["checkpointer"])
+
+5️⃣ AIUTO
    Mostra questa guida
 
 **WORKFLOW CONSIGLIATO:**
@@ -858,9 +1058,47 @@ Prova con: `ANALIZZA [TICKER]`
     await cl.Message(content=assets_text).send()
 
 
-async def analyze_stock(user_input: str):
-    """Esegui analisi completa di un titolo"""
-    global ta, user_config
+async def show_service_status():
+    """Mostra analisi in corso, coda e tempi di attesa"""
+    m = get_graph_service().metrics()
+    await cl.Message(
+        content=f"""📊 **Stato del server**
+
+- Analisi in corso: **{m['running']}/{m['max_workers']}**
+- In coda: **{m['queued']}/{m['max_queue']}**
+- Attesa in coda: p50 {m['wait_p50']:.1f}s · p95 {m['wait_p95']:.1f}s · max {m['wait_max']:.1f}s
+- Completate: {m['completed']} (errori: {m['failed']}) · Rifiutate: {m['rejected']}
+- Grafi in memoria: {m['graphs']}"""
+    ).send()
+
+
+async def resume_analysis(raw_input: str):
+    """Riprende un'analisi interrotta (richiede config["checkpointer"])"""
+    parts = raw_input.split()
+    if len(parts) < 2:
+        await cl.Message(content="❌ Uso: `RIPRENDI <RUN_ID>` (l'id è indicato nel messaggio di errore)").send()
+        return
+    run_id = parts[1]  # L'id è case-sensitive: preso dal testo originale
+    
+    trading_graph = get_ta(cl.user_session.get("ta_config"))
+    if trading_graph is None:
+        await cl.Message(content=f"❌ Impossibile caricare TradingAgentsGraph: `{last_error}`").send()
+        return
+    try:
+        snapshot = await asyncio.to_thread(trading_graph.get_checkpoint, run_id)
+    except ValueError as e:
+        await cl.Message(content=f"❌ {e}").send()
+        return
+    
+    values = snapshot.values
+    await analyze_stock(
+        f"ANALIZZA {values['company_of_interest']} {values['trade_date']}", resume_run_id=run_id
+    )
+
+
+async def analyze_stock(user_input: str, resume_run_id: Optional[str] = None):
+    """Esegui analisi completa di un titolo (resume_run_id: riprende un'analisi interrotta)"""
+    user_config = cl.user_session.get("user_config")
     
     # Estrai ticker e data
     parts = user_input.split()
@@ -899,7 +1137,7 @@ Stai utilizzando i parametri di default. Per personalizzare l'analisi, digita:
             content=f"⏳ Caricamento TradingAgentsGraph (prima volta: 10-20 secondi)..."
         ).send()
         
-        trading_graph = get_ta()
+        trading_graph = get_ta(cl.user_session.get("ta_config"))
         if trading_graph is None:
             # Show specific error if available
             error_detail = f"\n\n**Errore specifico:** `{last_error}`" if last_error else ""
@@ -928,112 +1166,70 @@ Controlla anche i log del server per il traceback completo."""
         ).send()
         
         # Run streaming analysis with progressive updates
-        import asyncio
+        from tradingagents.graph.profiler import GraphProfiler
+        profiler = GraphProfiler()
         final_state, decision, reports_data = await stream_analysis_with_updates(
-            trading_graph, ticker, date, progress_msg
+            trading_graph, ticker, date, progress_msg, profiler, resume_run_id
         )
+        if final_state is None:
+            return  # Errore o server occupato: già notificato all'utente
         
         # Estrai informazioni dalla decisione
         decision_score = extract_decision_score(decision)
         sentiment = extract_sentiment(decision)
         
-        # Messaggio completamento
-        await cl.Message(
-            content=f"✅ Analisi completata! Generazione report completo e dashboard..."
-        ).send()
-        
-        # ========== GENERATE COMPLETE REPORT (like CLI) ==========
+        # ========== REPORT, DASHBOARD, PDF & EXCEL (pipeline non bloccante) ==========
         # Create report directory structure like CLI
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         # Use absolute path based on app.py location
         web_dir = Path(__file__).parent
         report_base_dir = web_dir / "reports" / f"{ticker}_{timestamp}"
         report_base_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Build complete markdown report from final_state
-        complete_report = generate_complete_markdown_report(ticker, date, final_state, decision_score, sentiment)
-        
-        # Save complete report
-        complete_report_path = report_base_dir / "complete_report.md"
-        with open(complete_report_path, "w", encoding="utf-8") as f:
-            f.write(complete_report)
-        
-        # Save individual sections (like CLI does)
         sections_dir = report_base_dir / "sections"
-        sections_dir.mkdir(exist_ok=True)
         
-        # Save analyst reports
-        if final_state.get("market_report"):
-            (sections_dir / "1_market_report.md").write_text(final_state["market_report"], encoding="utf-8")
-        if final_state.get("sentiment_report"):
-            (sections_dir / "2_sentiment_report.md").write_text(final_state["sentiment_report"], encoding="utf-8")
-        if final_state.get("news_report"):
-            (sections_dir / "3_news_report.md").write_text(final_state["news_report"], encoding="utf-8")
-        if final_state.get("fundamentals_report"):
-            (sections_dir / "4_fundamentals_report.md").write_text(final_state["fundamentals_report"], encoding="utf-8")
+        # Decisione subito, i file arrivano man mano che sono pronti
+        result_text = f"""
+✅ **ANALISI COMPLETATA** per `{ticker}`
+
+📊 **DECISIONE TRADING:**
+"""
         
-        # Save research team reports
-        if final_state.get("investment_debate_state"):
-            debate_state = final_state["investment_debate_state"]
-            research_dir = sections_dir / "5_research_team"
-            research_dir.mkdir(exist_ok=True)
-            if debate_state.get("bull_history"):
-                (research_dir / "bull_researcher.md").write_text(debate_state["bull_history"], encoding="utf-8")
-            if debate_state.get("bear_history"):
-                (research_dir / "bear_researcher.md").write_text(debate_state["bear_history"], encoding="utf-8")
-            if debate_state.get("judge_decision"):
-                (research_dir / "research_manager.md").write_text(debate_state["judge_decision"], encoding="utf-8")
+        # Emoji decisione
+        if decision_score > 0.5:
+            result_text += f"\n💚 **ACQUISTO CONSIGLIATO** (Score: +{decision_score:.1%})"
+        elif decision_score < -0.5:
+            result_text += f"\n❌ **VENDITA CONSIGLIATA** (Score: {decision_score:.1%})"
+        else:
+            result_text += f"\n⚖️ **ATTESA CONSIGLIATA** (Score: {decision_score:.1%})"
         
-        # Save trading team report
-        if final_state.get("trader_investment_plan"):
-            (sections_dir / "6_trader_plan.md").write_text(final_state["trader_investment_plan"], encoding="utf-8")
+        result_text += f"\n\n**Sentiment:** {sentiment}\n\n🔄 _Generazione file in corso: li ricevi appena pronti..._"
         
-        # Save risk management reports
-        if final_state.get("risk_debate_state"):
-            risk_state = final_state["risk_debate_state"]
-            risk_dir = sections_dir / "7_risk_management"
-            risk_dir.mkdir(exist_ok=True)
-            if risk_state.get("aggressive_history"):
-                (risk_dir / "aggressive_analyst.md").write_text(risk_state["aggressive_history"], encoding="utf-8")
-            if risk_state.get("conservative_history"):
-                (risk_dir / "conservative_analyst.md").write_text(risk_state["conservative_history"], encoding="utf-8")
-            if risk_state.get("neutral_history"):
-                (risk_dir / "neutral_analyst.md").write_text(risk_state["neutral_history"], encoding="utf-8")
-            if risk_state.get("judge_decision"):
-                (risk_dir / "portfolio_manager.md").write_text(risk_state["judge_decision"], encoding="utf-8")
+        await cl.Message(content=result_text).send()
+        
+        # Ogni artefatto viene generato in un thread e inviato appena completato
+        artifacts = [
+            produce_artifact(
+                "📥 **Scarica il Report Completo (Markdown):**", "Report Markdown",
+                save_markdown_reports, report_base_dir, ticker, date, final_state, decision_score, sentiment,
+            ),
+        ]
         
-        # ========== GENERATE DASHBOARD ==========
         dash_gen = get_dashboard_gen()
         if dash_gen is None:
             await cl.Message(
                 content="⚠️ Dashboard generator non disponibile"
             ).send()
-            return
-            
-        decision_fig = dash_gen.create_decision_gauge(decision_score, sentiment)
-        sentiment_breakdown = {
-            "Rialzista": decision_score,
-            "Neutro": 1 - abs(decision_score),
-            "Ribassista": -decision_score if decision_score < 0 else 0
-        }
-        sentiment_fig = dash_gen.create_sentiment_breakdown(sentiment_breakdown)
-        
-        dashboard_path = dash_gen.create_dashboard_html(
-            ticker=ticker,
-            decision_fig=decision_fig,
-            sentiment_fig=sentiment_fig,
-            filename=f"dashboard_{ticker}_{timestamp}.html"
-        )
+        else:
+            artifacts.append(produce_artifact(
+                "📊 **Dashboard Interattivo (HTML):**", "Dashboard",
+                render_dashboard, dash_gen, ticker, decision_score, sentiment, timestamp,
+            ))
         
-        # ========== GENERATE PDF & EXCEL REPORTS ==========
         rep_gen = get_report_gen()
         if rep_gen is None:
             await cl.Message(
                 content="⚠️ Report generator non disponibile"
             ).send()
-            # Continue without PDF/Excel
-            pdf_path = None
-            excel_path = None
         else:
             analysis_data = {
                 "Ticker": ticker,
@@ -1041,42 +1237,37 @@ Controlla anche i log del server per il traceback completo."""
                 "Decision Score": round(decision_score, 3),
                 "Sentiment": sentiment
             }
-            
-            # Generate PDF and Excel
-            pdf_path, excel_path = rep_gen.generate_both_reports(
-                ticker=ticker,
-                date=date,
-                decision=decision,
-                analysis_data=analysis_data
-            )
-        
-        # Crea messaggio finale
-        result_text = f"""
-✅ **ANALISI COMPLETATA** per `{ticker}`
-
-📊 **DECISIONE TRADING:**
-"""
+            # PDF ed Excel in parallelo (documenti indipendenti)
+            artifacts.append(produce_artifact(
+                "📑 **Scarica il Report PDF:**", "Report PDF",
+                rep_gen.generate_pdf_report, ticker, date, decision, analysis_data,
+            ))
+            artifacts.append(produce_artifact(
+                "📊 **Scarica i Dati Excel:**", "Dati Excel",
+                rep_gen.generate_excel_report, ticker, date, decision, analysis_data,
+            ))
         
-        # Emoji decisione
-        if decision_score > 0.5:
-            result_text += f"\n💚 **ACQUISTO CONSIGLIATO** (Score: +{decision_score:.1%})"
-        elif decision_score < -0.5:
-            result_text += f"\n❌ **VENDITA CONSIGLIATA** (Score: {decision_score:.1%})"
-        else:
-            result_text += f"\n⚖️ **ATTESA CONSIGLIATA** (Score: {decision_score:.1%})"
+        # ========== PROFILO TEMPI (nodi / tool) ==========
+        if profiler.spans:
+            trace_path = profiler.write_chrome_trace(report_base_dir / "profile_trace.json")
+            await cl.Message(
+                content=f"⏱️ **Dove è stato speso il tempo**\n\n{profiler.summary_markdown()}\n\n"
+                        f"_Trace: `{report_base_dir.name}/{trace_path.name}` (apribile in chrome://tracing o ui.perfetto.dev)_"
+            ).send()
         
-        result_text += f"\n\n**Sentiment:** {sentiment}\n"
+        paths = await asyncio.gather(*artifacts)
+        complete_report_path = paths[0]
+        dashboard_path = paths[1] if dash_gen is not None else None
+        pdf_path, excel_path = paths[-2:] if rep_gen is not None else (None, None)
         
         # Count generated sections
         num_sections = len(list(sections_dir.rglob('*.md'))) if sections_dir.exists() else 0
         
-        result_text += f"""
----
-
+        await cl.Message(content=f"""
 📂 **FILE GENERATI:**
 
-📄 **Report Completo (Markdown):** `{report_base_dir.name}/complete_report.md`
-📊 **Dashboard Interattivo (HTML):** `{Path(dashboard_path).name}`
+📄 **Report Completo (Markdown):** {f"`{report_base_dir.name}/{Path(complete_report_path).name}`" if complete_report_path else "Non disponibile"}
+📊 **Dashboard Interattivo (HTML):** {f"`{Path(dashboard_path).name}`" if dashboard_path else "Non disponibile"}
 📑 **Report PDF:** {f"`{Path(pdf_path).name}`" if pdf_path else "Non disponibile"}
 📊 **Dati Excel:** {f"`{Path(excel_path).name}`" if excel_path else "Non disponibile"}
 
@@ -1088,73 +1279,7 @@ Controlla anche i log del server per il traceback completo."""
 - ✅ Piano del Trader
 - ✅ Analisi Risk Management
 - ✅ Decisione finale Portfolio Manager
-
-💾 **Download disponibili qui sotto!**
-        """
-        
-        await cl.Message(content=result_text).send()
-        
-        # Send complete report as downloadable file
-        try:
-            await cl.Message(
-                content="📥 **Scarica il Report Completo (Markdown):**",
-                elements=[
-                    cl.File(
-                        name=complete_report_path.name,
-                        path=str(complete_report_path),
-                        display="inline"
-                    )
-                ]
-            ).send()
-        except Exception as e:
-            await cl.Message(content=f"⚠️ Nota: Report Markdown salvato in `{complete_report_path}`").send()
-        
-        # Send PDF report if generated
-        if pdf_path:
-            try:
-                await cl.Message(
-                    content="📑 **Scarica il Report PDF:**",
-                    elements=[
-                        cl.File(
-                            name=Path(pdf_path).name,
-                            path=str(pdf_path),
-                            display="inline"
-                        )
-                    ]
-                ).send()
-            except Exception as e:
-                await cl.Message(content=f"⚠️ Nota: Report PDF salvato in `{pdf_path}`").send()
-        
-        # Send Excel report if generated
-        if excel_path:
-            try:
-                await cl.Message(
-                    content="📊 **Scarica i Dati Excel:**",
-                    elements=[
-                        cl.File(
-                            name=Path(excel_path).name,
-                            path=str(excel_path),
-                            display="inline"
-                        )
-                    ]
-                ).send()
-            except Exception as e:
-                await cl.Message(content=f"⚠️ Nota: Dati Excel salvati in `{excel_path}`").send()
-        
-        # Send dashboard file
-        try:
-            await cl.Message(
-                content="📊 **Dashboard Interattivo (HTML):**",
-                elements=[
-                    cl.File(
-                        name=Path(dashboard_path).name,
-                        path=str(dashboard_path),
-                        display="inline"
-                    )
-                ]
-            ).send()
-        except Exception as e:
-            await cl.Message(content=f"⚠️ Nota: Dashboard salvato in `{dashboard_path}`").send()
+        """).send()
         
     except Exception as e:
         await cl.Message(
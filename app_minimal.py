@@ -3,6 +3,7 @@ TradingAgents - Versione Minimalista
 Carica moduli pesanti SOLO quando necessario
 """
 
+import asyncio
 import sys
 import os
 from pathlib import Path
@@ -34,6 +35,15 @@ config = {
     }
 }
 
+REPORT_SECTIONS = {
+    "market_report": "Analisi tecnica",
+    "sentiment_report": "Sentimento social",
+    "news_report": "Analisi notizie",
+    "fundamentals_report": "Analisi fondamentali",
+    "trader_investment_plan": "Piano del trader",
+    "final_trade_decision": "Decisione finale",
+}
+
 # ============================================================================
 # LAZY LOADERS - Import only when called
 # ============================================================================
@@ -126,13 +136,28 @@ async def analyze_stock(user_input: str):
         await cl.Message(content="❌ Impossibile caricare TradingAgentsGraph").send()
         return
     
+    # Con config["checkpointer"] ogni run ha un id (ta.resume(run_id) dopo un errore)
+    run_id = ta.propagator.new_run_id(ticker, date)
     try:
         await cl.Message(content=f"🔄 Analizzando {ticker} per {date}...").send()
-        _, decision = ta.propagate(ticker, date)
+        from tradingagents.graph.streaming import StreamBridge
+        
+        # Il grafo gira in un thread: ogni step arriva qui appena completato
+        bridge = StreamBridge(
+            ta.graph,
+            ta.propagator.create_initial_state(ticker, date),
+            ta.propagator.get_graph_args(run_id=run_id, stream_mode="updates"),
+        )
+        async for _, delta in bridge:
+            for key in REPORT_SECTIONS:
+                if delta.get(key):
+                    await cl.Message(content=f"✅ {REPORT_SECTIONS[key]} completato").send()
+        decision = await asyncio.to_thread(ta.process_signal, bridge.state["final_trade_decision"])
         
         await cl.Message(content=f"✅ **Decisione**: {decision[:100]}...").send()
     except Exception as e:
-        await cl.Message(content=f"❌ Errore durante l'analisi: {str(e)[:200]}").send()
+        resume_note = f"\n💾 Run salvato: `{run_id}`" if run_id else ""
+        await cl.Message(content=f"❌ Errore durante l'analisi: {str(e)[:200]}{resume_note}").send()
 
 
 async def configure():
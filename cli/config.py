@@ -3,4 +3,8 @@ CLI_CONFIG = {
     "announcements_url": "https://api.tauric.ai/v1/announcements",
     "announcements_timeout": 1.0,
     "announcements_fallback": "[cyan]For more information, please visit[/cyan] [link=https://github.com/TauricResearch]https://github.com/TauricResearch[/link]",
+    # message_tool.log writer (see cli/log_writer.py)
+    "message_log_flush_interval": 1.0,  # Seconds between batched writes
+    "message_log_buffer": 10_000,       # Max buffered records before writers wait
+    "message_log_jsonl": False,         # Also write message_tool.jsonl.gz
 }
@@ -0,0 +1,117 @@
+import gzip
+import json
+import os
+import queue
+import threading
+import time
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+_CLOSE = object()
+
+
+class BufferedLogWriter:
+    """Background writer for the CLI message/tool log.
+
+    write() only enqueues the record; a writer thread appends batches to
+    message_tool.log every `flush_interval` seconds (or as soon as
+    `batch_size` records are waiting) and fsyncs on close(), so disk I/O
+    stays off the streaming loop. The buffer holds at most `max_buffer`
+    records: when the disk can't keep up, write() blocks instead of growing
+    memory without bound.
+
+    With jsonl_path set, every record is also written as one JSON line to a
+    gzip file; each flush appends its own gzip member, so the file stays
+    readable (gzip.open / zcat) even if the run is interrupted.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        jsonl_path: Optional[Union[str, Path]] = None,
+        flush_interval: float = 1.0,
+        batch_size: int = 200,
+        max_buffer: int = 10_000,
+    ):
+        self.path = Path(path)
+        self.jsonl_path = Path(jsonl_path) if jsonl_path else None
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_buffer)
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="cli-log-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, timestamp: str, kind: str, text: str, **fields: Any) -> None:
+        """Queue one log line: "<timestamp> [<kind>] <text>" (fields go to the JSONL only)."""
+        if not self._thread.is_alive():
+            raise RuntimeError("log writer thread is not running") from self._error
+        self._queue.put({"time": timestamp, "type": kind, "text": text, **fields})
+
+    def close(self) -> None:
+        """Write everything still buffered, fsync and stop the writer thread."""
+        if self._thread.is_alive():
+            self._queue.put(_CLOSE)
+            self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self) -> "BufferedLogWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as log, \
+                    (open(self.jsonl_path, "ab") if self.jsonl_path else nullcontext()) as jsonl:
+                self._write_batches(log, jsonl)
+        except Exception as e:
+            # e.g. the log can't be opened: record it for close() and keep
+            # draining, so write() never blocks on a full buffer
+            self._error = e
+            self._drain()
+
+    def _write_batches(self, log, jsonl) -> None:
+        while not self._closed:
+            # Wait for a record, then collect for up to flush_interval
+            batch: List[Dict[str, Any]] = []
+            item = self._queue.get()
+            deadline = time.monotonic() + self.flush_interval
+            while item is not _CLOSE:
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+            self._closed = item is _CLOSE
+            try:
+                self._flush(batch, log, jsonl, sync=self._closed)
+            except OSError as e:
+                # Keep draining so writers never block on a dead disk; report on close()
+                self._error = e
+
+    def _drain(self) -> None:
+        """Discard queued records until close()."""
+        while not self._closed:
+            self._closed = self._queue.get() is _CLOSE
+
+    def _flush(self, batch: List[Dict[str, Any]], log, jsonl, sync: bool) -> None:
+        if batch:
+            log.write("".join(f"{r['time']} [{r['type']}] {r['text']}\n" for r in batch))
+        log.flush()
+        if jsonl is not None and batch:
+            lines = "".join(json.dumps(r, ensure_ascii=False, default=str) + "\n" for r in batch)
+            jsonl.write(gzip.compress(lines.encode("utf-8")))
+            jsonl.flush()
+        if sync:
+            os.fsync(log.fileno())
+            if jsonl is not None:
+                os.fsync(jsonl.fileno())
+
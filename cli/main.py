@@ -3,6 +3,8 @@ import datetime
 import typer
 from pathlib import Path
 from functools import wraps
+from contextlib import contextmanager
+from itertools import chain
 from rich.console import Console
 from dotenv import load_dotenv
 
@@ -17,6 +19,7 @@ from rich.layout import Layout
 from rich.text import Text
 from rich.table import Table
 from collections import deque
+import threading
 import time
 from rich.tree import Tree
 from rich import box
@@ -24,11 +27,15 @@ from rich.align import Align
 from rich.rule import Rule
 
 from tradingagents.graph.trading_graph import TradingAgentsGraph
+from tradingagents.graph.profiler import GraphProfiler
+from tradingagents.graph.streaming import StateTracker, iter_graph_deltas
 from tradingagents.default_config import DEFAULT_CONFIG
 from cli.models import AnalystType
 from cli.utils import *
 from cli.announcements import fetch_announcements, display_announcements
 from cli.stats_handler import StatsCallbackHandler
+from cli.log_writer import BufferedLogWriter
+from cli.config import CLI_CONFIG
 
 console = Console()
 
@@ -70,15 +77,32 @@ class MessageBuffer:
         "final_trade_decision": (None, "Portfolio Manager"),
     }
 
+    # Layout panels rebuilt by update_display only when marked dirty
+    PANELS = ("header", "progress", "messages", "analysis")
+
     def __init__(self, max_length=100):
         self.messages = deque(maxlen=max_length)
         self.tool_calls = deque(maxlen=max_length)
         self.current_report = None
-        self.final_report = None  # Store the complete final report
         self.agent_status = {}
         self.current_agent = None
         self.report_sections = {}
         self.selected_analysts = []
+        # The Live refresh thread renders while the stream loop mutates
+        self.lock = threading.RLock()
+        self.dirty = set(self.PANELS)
+        self.spinner_text = None
+
+    def take_dirty(self):
+        """Panels changed since the last render (clears the flags)."""
+        with self.lock:
+            dirty, self.dirty = self.dirty, set()
+        return dirty
+
+    @property
+    def final_report(self):
+        """The complete report, built on demand rather than on every update."""
+        return self._build_final_report()
 
     def init_for_analysis(self, selected_analysts):
         """Initialize agent status and report sections based on selected analysts.
@@ -109,10 +133,10 @@ class MessageBuffer:
 
         # Reset other state
         self.current_report = None
-        self.final_report = None
         self.current_agent = None
         self.messages.clear()
         self.tool_calls.clear()
+        self.dirty = set(self.PANELS)
 
     def get_completed_reports_count(self):
         """Count reports that are finalized (their finalizing agent is completed).
@@ -137,21 +161,30 @@ class MessageBuffer:
 
     def add_message(self, message_type, content):
         timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        self.messages.append((timestamp, message_type, content))
+        with self.lock:
+            self.messages.append((timestamp, message_type, content))
+            self.dirty.add("messages")
 
     def add_tool_call(self, tool_name, args):
         timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        self.tool_calls.append((timestamp, tool_name, args))
+        with self.lock:
+            self.tool_calls.append((timestamp, tool_name, args))
+            self.dirty.add("messages")
 
     def update_agent_status(self, agent, status):
         if agent in self.agent_status:
-            self.agent_status[agent] = status
-            self.current_agent = agent
+            with self.lock:
+                if self.agent_status[agent] != status:
+                    self.dirty.add("progress")
+                self.agent_status[agent] = status
+                self.current_agent = agent
 
     def update_report_section(self, section_name, content):
         if section_name in self.report_sections:
-            self.report_sections[section_name] = content
-            self._update_current_report()
+            with self.lock:
+                self.report_sections[section_name] = content
+                self._update_current_report()
+                self.dirty.add("analysis")
 
     def _update_current_report(self):
         # For the panel display, only show the most recently updated section
@@ -179,10 +212,7 @@ class MessageBuffer:
                 f"### {section_titles[latest_section]}\n{latest_content}"
             )
 
-        # Update the final complete report
-        self._update_final_report()
-
-    def _update_final_report(self):
+    def _build_final_report(self):
         report_parts = []
 
         # Analyst Team Reports - use .get() to handle missing sections
@@ -221,7 +251,7 @@ class MessageBuffer:
             report_parts.append("## Portfolio Management Decision")
             report_parts.append(f"{self.report_sections['final_trade_decision']}")
 
-        self.final_report = "\n\n".join(report_parts) if report_parts else None
+        return "\n\n".join(report_parts) if report_parts else None
 
 
 message_buffer = MessageBuffer()
@@ -251,74 +281,76 @@ def format_tokens(n):
 
 
 def update_display(layout, spinner_text=None, stats_handler=None, start_time=None):
-    # Header with welcome message
-    layout["header"].update(
-        Panel(
-            "[bold green]Welcome to TradingAgents CLI[/bold green]\n"
-            "[dim]© [Tauric Research](https://github.com/TauricResearch)[/dim]",
-            title="Welcome to TradingAgents",
-            border_style="green",
-            padding=(1, 2),
-            expand=True,
-        )
-    )
+    """Refresh the layout in place.
 
-    # Progress panel showing agent status
-    progress_table = Table(
-        show_header=True,
-        header_style="bold magenta",
-        show_footer=False,
-        box=box.SIMPLE_HEAD,  # Use simple header with horizontal lines
-        title=None,  # Remove the redundant Progress title
-        padding=(0, 2),  # Add horizontal padding
-        expand=True,  # Make table expand to fill available space
-    )
-    progress_table.add_column("Team", style="cyan", justify="center", width=20)
-    progress_table.add_column("Agent", style="green", justify="center", width=20)
-    progress_table.add_column("Status", style="yellow", justify="center", width=20)
-
-    # Group agents by team - filter to only include agents in agent_status
-    all_teams = {
-        "Analyst Team": [
-            "Market Analyst",
-            "Social Analyst",
-            "News Analyst",
-            "Fundamentals Analyst",
-        ],
-        "Research Team": ["Bull Researcher", "Bear Researcher", "Research Manager"],
-        "Trading Team": ["Trader"],
-        "Risk Management": ["Aggressive Analyst", "Neutral Analyst", "Conservative Analyst"],
-        "Portfolio Management": ["Portfolio Manager"],
-    }
-
-    # Filter teams to only include agents that are in agent_status
-    teams = {}
-    for team, agents in all_teams.items():
-        active_agents = [a for a in agents if a in message_buffer.agent_status]
-        if active_agents:
-            teams[team] = active_agents
-
-    for team, agents in teams.items():
-        # Add first agent with team name
-        first_agent = agents[0]
-        status = message_buffer.agent_status.get(first_agent, "pending")
-        if status == "in_progress":
-            spinner = Spinner(
-                "dots", text="[blue]in_progress[/blue]", style="bold cyan"
+    Panels are rebuilt only when MessageBuffer marked them dirty (the footer,
+    with stats and elapsed time, on every call). Called from the Live refresh
+    callback, so the render rate is bounded by Live's refresh_per_second and
+    does not depend on how fast messages arrive.
+    """
+    with message_buffer.lock:
+        if spinner_text != message_buffer.spinner_text:
+            message_buffer.spinner_text = spinner_text
+            message_buffer.dirty.add("messages")
+        dirty = message_buffer.take_dirty()
+        _update_panels(layout, dirty, spinner_text)
+        _update_footer(layout, stats_handler, start_time)
+
+
+def _update_panels(layout, dirty, spinner_text=None):
+    if "header" in dirty:
+        # Header with welcome message
+        layout["header"].update(
+            Panel(
+                "[bold green]Welcome to TradingAgents CLI[/bold green]\n"
+                "[dim]© [Tauric Research](https://github.com/TauricResearch)[/dim]",
+                title="Welcome to TradingAgents",
+                border_style="green",
+                padding=(1, 2),
+                expand=True,
             )
-            status_cell = spinner
-        else:
-            status_color = {
-                "pending": "yellow",
-                "completed": "green",
-                "error": "red",
-            }.get(status, "white")
-            status_cell = f"[{status_color}]{status}[/{status_color}]"
-        progress_table.add_row(team, first_agent, status_cell)
-
-        # Add remaining agents in team
-        for agent in agents[1:]:
-            status = message_buffer.agent_status.get(agent, "pending")
+        )
+
+    if "progress" in dirty:
+        # Progress panel showing agent status
+        progress_table = Table(
+            show_header=True,
+            header_style="bold magenta",
+            show_footer=False,
+            box=box.SIMPLE_HEAD,  # Use simple header with horizontal lines
+            title=None,  # Remove the redundant Progress title
+            padding=(0, 2),  # Add horizontal padding
+            expand=True,  # Make table expand to fill available space
+        )
+        progress_table.add_column("Team", style="cyan", justify="center", width=20)
+        progress_table.add_column("Agent", style="green", justify="center", width=20)
+        progress_table.add_column("Status", style="yellow", justify="center", width=20)
+
+        # Group agents by team - filter to only include agents in agent_status
+        all_teams = {
+            "Analyst Team": [
+                "Market Analyst",
+                "Social Analyst",
+                "News Analyst",
+                "Fundamentals Analyst",
+            ],
+            "Research Team": ["Bull Researcher", "Bear Researcher", "Research Manager"],
+            "Trading Team": ["Trader"],
+            "Risk Management": ["Aggressive Analyst", "Neutral Analyst", "Conservative Analyst"],
+            "Portfolio Management": ["Portfolio Manager"],
+        }
+
+        # Filter teams to only include agents that are in agent_status
+        teams = {}
+        for team, agents in all_teams.items():
+            active_agents = [a for a in agents if a in message_buffer.agent_status]
+            if active_agents:
+                teams[team] = active_agents
+
+        for team, agents in teams.items():
+            # Add first agent with team name
+            first_agent = agents[0]
+            status = message_buffer.agent_status.get(first_agent, "pending")
             if status == "in_progress":
                 spinner = Spinner(
                     "dots", text="[blue]in_progress[/blue]", style="bold cyan"
@@ -331,119 +363,140 @@ def update_display(layout, spinner_text=None, stats_handler=None, start_time=Non
                     "error": "red",
                 }.get(status, "white")
                 status_cell = f"[{status_color}]{status}[/{status_color}]"
-            progress_table.add_row("", agent, status_cell)
-
-        # Add horizontal line after each team
-        progress_table.add_row("─" * 20, "─" * 20, "─" * 20, style="dim")
-
-    layout["progress"].update(
-        Panel(progress_table, title="Progress", border_style="cyan", padding=(1, 2))
-    )
-
-    # Messages panel showing recent messages and tool calls
-    messages_table = Table(
-        show_header=True,
-        header_style="bold magenta",
-        show_footer=False,
-        expand=True,  # Make table expand to fill available space
-        box=box.MINIMAL,  # Use minimal box style for a lighter look
-        show_lines=True,  # Keep horizontal lines
-        padding=(0, 1),  # Add some padding between columns
-    )
-    messages_table.add_column("Time", style="cyan", width=8, justify="center")
-    messages_table.add_column("Type", style="green", width=10, justify="center")
-    messages_table.add_column(
-        "Content", style="white", no_wrap=False, ratio=1
-    )  # Make content column expand
-
-    # Combine tool calls and messages
-    all_messages = []
-
-    # Add tool calls
-    for timestamp, tool_name, args in message_buffer.tool_calls:
-        # Truncate tool call args if too long
-        if isinstance(args, str) and len(args) > 100:
-            args = args[:97] + "..."
-        all_messages.append((timestamp, "Tool", f"{tool_name}: {args}"))
-
-    # Add regular messages
-    for timestamp, msg_type, content in message_buffer.messages:
-        # Convert content to string if it's not already
-        content_str = content
-        if isinstance(content, list):
-            # Handle list of content blocks (Anthropic format)
-            text_parts = []
-            for item in content:
-                if isinstance(item, dict):
-                    if item.get('type') == 'text':
-                        text_parts.append(item.get('text', ''))
-                    elif item.get('type') == 'tool_use':
-                        text_parts.append(f"[Tool: {item.get('name', 'unknown')}]")
+            progress_table.add_row(team, first_agent, status_cell)
+
+            # Add remaining agents in team
+            for agent in agents[1:]:
+                status = message_buffer.agent_status.get(agent, "pending")
+                if status == "in_progress":
+                    spinner = Spinner(
+                        "dots", text="[blue]in_progress[/blue]", style="bold cyan"
+                    )
+                    status_cell = spinner
                 else:
-                    text_parts.append(str(item))
-            content_str = ' '.join(text_parts)
-        elif not isinstance(content_str, str):
-            content_str = str(content)
-            
-        # Truncate message content if too long
-        if len(content_str) > 200:
-            content_str = content_str[:197] + "..."
-        all_messages.append((timestamp, msg_type, content_str))
-
-    # Sort by timestamp
-    all_messages.sort(key=lambda x: x[0])
-
-    # Calculate how many messages we can show based on available space
-    # Start with a reasonable number and adjust based on content length
-    max_messages = 12  # Increased from 8 to better fill the space
-
-    # Get the last N messages that will fit in the panel
-    recent_messages = all_messages[-max_messages:]
-
-    # Add messages to table
-    for timestamp, msg_type, content in recent_messages:
-        # Format content with word wrapping
-        wrapped_content = Text(content, overflow="fold")
-        messages_table.add_row(timestamp, msg_type, wrapped_content)
-
-    if spinner_text:
-        messages_table.add_row("", "Spinner", spinner_text)
-
-    # Add a footer to indicate if messages were truncated
-    if len(all_messages) > max_messages:
-        messages_table.footer = (
-            f"[dim]Showing last {max_messages} of {len(all_messages)} messages[/dim]"
+                    status_color = {
+                        "pending": "yellow",
+                        "completed": "green",
+                        "error": "red",
+                    }.get(status, "white")
+                    status_cell = f"[{status_color}]{status}[/{status_color}]"
+                progress_table.add_row("", agent, status_cell)
+
+            # Add horizontal line after each team
+            progress_table.add_row("─" * 20, "─" * 20, "─" * 20, style="dim")
+
+        layout["progress"].update(
+            Panel(progress_table, title="Progress", border_style="cyan", padding=(1, 2))
         )
 
-    layout["messages"].update(
-        Panel(
-            messages_table,
-            title="Messages & Tools",
-            border_style="blue",
-            padding=(1, 2),
+    if "messages" in dirty:
+        # Messages panel showing recent messages and tool calls
+        messages_table = Table(
+            show_header=True,
+            header_style="bold magenta",
+            show_footer=False,
+            expand=True,  # Make table expand to fill available space
+            box=box.MINIMAL,  # Use minimal box style for a lighter look
+            show_lines=True,  # Keep horizontal lines
+            padding=(0, 1),  # Add some padding between columns
         )
-    )
+        messages_table.add_column("Time", style="cyan", width=8, justify="center")
+        messages_table.add_column("Type", style="green", width=10, justify="center")
+        messages_table.add_column(
+            "Content", style="white", no_wrap=False, ratio=1
+        )  # Make content column expand
+
+        # Combine tool calls and messages
+        all_messages = []
+
+        # Add tool calls
+        for timestamp, tool_name, args in message_buffer.tool_calls:
+            # Truncate tool call args if too long
+            if isinstance(args, str) and len(args) > 100:
+                args = args[:97] + "..."
+            all_messages.append((timestamp, "Tool", f"{tool_name}: {args}"))
+
+        # Add regular messages
+        for timestamp, msg_type, content in message_buffer.messages:
+            # Convert content to string if it's not already
+            content_str = content
+            if isinstance(content, list):
+                # Handle list of content blocks (Anthropic format)
+                text_parts = []
+                for item in content:
+                    if isinstance(item, dict):
+                        if item.get('type') == 'text':
+                            text_parts.append(item.get('text', ''))
+                        elif item.get('type') == 'tool_use':
+                            text_parts.append(f"[Tool: {item.get('name', 'unknown')}]")
+                    else:
+                        text_parts.append(str(item))
+                content_str = ' '.join(text_parts)
+            elif not isinstance(content_str, str):
+                content_str = str(content)
+
+            # Truncate message content if too long
+            if len(content_str) > 200:
+                content_str = content_str[:197] + "..."
+            all_messages.append((timestamp, msg_type, content_str))
+
+        # Sort by timestamp
+        all_messages.sort(key=lambda x: x[0])
+
+        # Calculate how many messages we can show based on available space
+        # Start with a reasonable number and adjust based on content length
+        max_messages = 12  # Increased from 8 to better fill the space
+
+        # Get the last N messages that will fit in the panel
+        recent_messages = all_messages[-max_messages:]
+
+        # Add messages to table
+        for timestamp, msg_type, content in recent_messages:
+            # Format content with word wrapping
+            wrapped_content = Text(content, overflow="fold")
+            messages_table.add_row(timestamp, msg_type, wrapped_content)
+
+        if spinner_text:
+            messages_table.add_row("", "Spinner", spinner_text)
+
+        # Add a footer to indicate if messages were truncated
+        if len(all_messages) > max_messages:
+            messages_table.footer = (
+                f"[dim]Showing last {max_messages} of {len(all_messages)} messages[/dim]"
+            )
 
-    # Analysis panel showing current report
-    if message_buffer.current_report:
-        layout["analysis"].update(
+        layout["messages"].update(
             Panel(
-                Markdown(message_buffer.current_report),
-                title="Current Report",
-                border_style="green",
+                messages_table,
+                title="Messages & Tools",
+                border_style="blue",
                 padding=(1, 2),
             )
         )
-    else:
-        layout["analysis"].update(
-            Panel(
-                "[italic]Waiting for analysis report...[/italic]",
-                title="Current Report",
-                border_style="green",
-                padding=(1, 2),
+
+    if "analysis" in dirty:
+        # Analysis panel showing current report
+        if message_buffer.current_report:
+            layout["analysis"].update(
+                Panel(
+                    Markdown(message_buffer.current_report),
+                    title="Current Report",
+                    border_style="green",
+                    padding=(1, 2),
+                )
             )
-        )
+        else:
+            layout["analysis"].update(
+                Panel(
+                    "[italic]Waiting for analysis report...[/italic]",
+                    title="Current Report",
+                    border_style="green",
+                    padding=(1, 2),
+                )
+            )
+
 
+def _update_footer(layout, stats_handler=None, start_time=None):
     # Footer with statistics
     # Agent progress - derived from agent_status dict
     agents_completed = sum(
@@ -463,6 +516,8 @@ def update_display(layout, spinner_text=None, stats_handler=None, start_time=Non
         stats = stats_handler.get_stats()
         stats_parts.append(f"LLM: {stats['llm_calls']}")
         stats_parts.append(f"Tools: {stats['tool_calls']}")
+        if stats["cache_hits"] or stats["cache_misses"]:
+            stats_parts.append(f"Cache: {stats['cache_hits']}/{stats['cache_hits'] + stats['cache_misses']}")
 
         # Token display with graceful fallback
         if stats["tokens_in"] > 0 or stats["tokens_out"] > 0:
@@ -830,6 +885,44 @@ def display_complete_report(final_state):
             )
 
 
+def display_profile_summary(profiler, trace_path=None):
+    """Display where the analysis spent its time, per node and per tool."""
+    table = Table(
+        title="Profile",
+        box=box.SIMPLE_HEAD,
+        header_style="bold magenta",
+        title_style="bold",
+    )
+    table.add_column("Node / Tool", style="cyan", no_wrap=True)
+    for column in ("Calls", "Wall (s)", "Queue (s)", "LLM", "LLM (s)", "Tokens", "Cache", "Vendor"):
+        table.add_column(column, justify="right")
+
+    for row in profiler.summary():
+        tokens = (
+            f"{format_tokens(row['tokens_in'])}\u2191 {format_tokens(row['tokens_out'])}\u2193"
+            if row["tokens_in"] or row["tokens_out"] else ""
+        )
+        vendor = (
+            f"{row['vendor_attempts']} ({row['vendor_failures']} failed)"
+            if row["vendor_attempts"] else ""
+        )
+        table.add_row(
+            row["name"] if row["kind"] == "node" else f"  {row['name']}",
+            str(row["calls"]),
+            f"{row['wall_s']:.1f}",
+            f"{row['queue_s']:.2f}",
+            str(row["llm_calls"] or ""),
+            f"{row['llm_s']:.1f}" if row["llm_calls"] else "",
+            tokens,
+            str(row["cache_hits"] or ""),
+            vendor,
+        )
+
+    console.print(table)
+    if trace_path:
+        console.print(f"[dim]Trace saved to {trace_path} (open in chrome://tracing or ui.perfetto.dev)[/dim]")
+
+
 def update_research_team_status(status):
     """Update status for all research team members and trader."""
     research_team = ["Bull Researcher", "Bear Researcher", "Research Manager", "Trader"]
@@ -877,7 +970,25 @@ def extract_content_string(content):
 
     return str(content).strip() if not is_empty(content) else None
 
-def run_analysis():
+# Minimum seconds between rewrites of the per-section report .md files
+REPORT_FLUSH_INTERVAL = 2.0
+
+
+@contextmanager
+def resume_hint(run_id):
+    """On failure, tell how to continue a checkpointed run."""
+    try:
+        yield
+    except Exception:
+        if run_id:
+            console.print(
+                f"\n[yellow]Run saved as [bold]{run_id}[/bold]. Continue it with: "
+                f"tradingagents analyze --resume {run_id}[/yellow]"
+            )
+        raise
+
+
+def run_analysis(resume_run_id: Optional[str] = None):
     # First get all user selections
     selections = get_user_selections()
 
@@ -895,6 +1006,8 @@ def run_analysis():
 
     # Create stats callback handler for tracking LLM/tool calls
     stats_handler = StatsCallbackHandler()
+    # Per-node / per-tool timings, written as a trace when the analysis ends
+    profiler = GraphProfiler()
 
     # Initialize the graph with callbacks bound to LLMs
     graph = TradingAgentsGraph(
@@ -904,6 +1017,17 @@ def run_analysis():
         callbacks=[stats_handler],
     )
 
+    # With config["checkpointer"] set, every step is saved under run_id; a
+    # resumed run takes ticker and date from its checkpoint
+    resume_state = None
+    if resume_run_id:
+        resume_state = graph.get_checkpoint(resume_run_id).values
+        selections["ticker"] = resume_state["company_of_interest"]
+        selections["analysis_date"] = resume_state["trade_date"]
+    run_id = graph.propagator.new_run_id(
+        selections["ticker"], selections["analysis_date"], resume_run_id
+    )
+
     # Initialize message buffer with selected analysts
     selected_analyst_keys = [analyst.value for analyst in selections["analysts"]]
     message_buffer.init_for_analysis(selected_analyst_keys)
@@ -918,6 +1042,13 @@ def run_analysis():
     report_dir.mkdir(parents=True, exist_ok=True)
     log_file = results_dir / "message_tool.log"
     log_file.touch(exist_ok=True)
+    # Messages and tool calls are logged by a background writer (batched, fsync at the end)
+    log_writer = BufferedLogWriter(
+        log_file,
+        jsonl_path=results_dir / "message_tool.jsonl.gz" if CLI_CONFIG["message_log_jsonl"] else None,
+        flush_interval=CLI_CONFIG["message_log_flush_interval"],
+        max_buffer=CLI_CONFIG["message_log_buffer"],
+    )
 
     def save_message_decorator(obj, func_name):
         func = getattr(obj, func_name)
@@ -926,8 +1057,7 @@ def run_analysis():
             func(*args, **kwargs)
             timestamp, message_type, content = obj.messages[-1]
             content = content.replace("\n", " ")  # Replace newlines with spaces
-            with open(log_file, "a") as f:
-                f.write(f"{timestamp} [{message_type}] {content}\n")
+            log_writer.write(timestamp, message_type, content)
         return wrapper
     
     def save_tool_call_decorator(obj, func_name):
@@ -937,8 +1067,7 @@ def run_analysis():
             func(*args, **kwargs)
             timestamp, tool_name, args = obj.tool_calls[-1]
             args_str = ", ".join(f"{k}={v}" for k, v in args.items())
-            with open(log_file, "a") as f:
-                f.write(f"{timestamp} [Tool Call] {tool_name}({args_str})\n")
+            log_writer.write(timestamp, "Tool Call", f"{tool_name}({args_str})", tool=tool_name, args=args)
         return wrapper
 
     def save_report_section_decorator(obj, func_name):
@@ -949,67 +1078,98 @@ def run_analysis():
             if section_name in obj.report_sections and obj.report_sections[section_name] is not None:
                 content = obj.report_sections[section_name]
                 if content:
-                    file_name = f"{section_name}.md"
-                    with open(report_dir / file_name, "w") as f:
-                        f.write(content)
+                    pending_reports[section_name] = content
+                    flush_reports()
         return wrapper
 
+    # Debates rewrite the same section many times: report files are written
+    # at most every REPORT_FLUSH_INTERVAL seconds, and once more at the end
+    pending_reports = {}
+    last_report_flush = 0.0
+
+    def flush_reports(force=False):
+        nonlocal last_report_flush
+        if not pending_reports:
+            return
+        if not force and time.time() - last_report_flush < REPORT_FLUSH_INTERVAL:
+            return
+        for section_name, content in pending_reports.items():
+            with open(report_dir / f"{section_name}.md", "w") as f:
+                f.write(content)
+        pending_reports.clear()
+        last_report_flush = time.time()
+
     message_buffer.add_message = save_message_decorator(message_buffer, "add_message")
     message_buffer.add_tool_call = save_tool_call_decorator(message_buffer, "add_tool_call")
     message_buffer.update_report_section = save_report_section_decorator(message_buffer, "update_report_section")
 
     # Now start the display layout
     layout = create_layout()
+    spinner_text = None
 
-    with Live(layout, refresh_per_second=4) as live:
-        # Initial display
-        update_display(layout, stats_handler=stats_handler, start_time=start_time)
+    def render():
+        # Rebuilds only the panels whose content changed since the last refresh
+        update_display(layout, spinner_text, stats_handler=stats_handler, start_time=start_time)
+        return layout
 
+    # The stream loop only updates message_buffer; Live re-renders at a fixed rate.
+    # Leaving the block flushes and fsyncs the message log, also on errors
+    with resume_hint(run_id), log_writer, Live(get_renderable=render, refresh_per_second=4) as live:
         # Add initial messages
         message_buffer.add_message("System", f"Selected ticker: {selections['ticker']}")
         message_buffer.add_message(
             "System", f"Analysis date: {selections['analysis_date']}"
         )
+        if run_id:
+            message_buffer.add_message(
+                "System", f"Run id: {run_id}" + (" (resumed)" if resume_state else "")
+            )
         message_buffer.add_message(
             "System",
             f"Selected analysts: {', '.join(analyst.value for analyst in selections['analysts'])}",
         )
-        update_display(layout, stats_handler=stats_handler, start_time=start_time)
 
         # Update agent status to in_progress for the first analyst
         first_analyst = f"{selections['analysts'][0].value.capitalize()} Analyst"
         message_buffer.update_agent_status(first_analyst, "in_progress")
-        update_display(layout, stats_handler=stats_handler, start_time=start_time)
 
         # Create spinner text
         spinner_text = (
             f"Analyzing {selections['ticker']} on {selections['analysis_date']}..."
         )
-        update_display(layout, spinner_text, stats_handler=stats_handler, start_time=start_time)
 
         # Initialize state and get graph args with callbacks
         init_agent_state = graph.propagator.create_initial_state(
             selections["ticker"], selections["analysis_date"]
         )
         # Pass callbacks to graph config for tool execution tracking
-        # (LLM tracking is handled separately via LLM constructor)
-        args = graph.propagator.get_graph_args(callbacks=[stats_handler])
-
-        # Stream the analysis
-        trace = []
-        for chunk in graph.graph.stream(init_agent_state, **args):
-            if len(chunk["messages"]) > 0:
-                # Get the last message from the chunk
-                last_message = chunk["messages"][-1]
+        # (LLM tracking is handled separately via LLM constructor).
+        # "updates" streams only the fields each node changed, not the full state
+        args = graph.propagator.get_graph_args(
+            callbacks=[stats_handler, profiler], run_id=run_id, stream_mode="updates"
+        )
 
+        # Stream the analysis (only the latest state is kept, not every chunk).
+        # A resumed run continues from its checkpoint (input None) and first
+        # replays the saved reports
+        tracker = StateTracker(resume_state or init_agent_state)
+        deltas = iter_graph_deltas(
+            graph.graph, None if resume_state else init_agent_state, args, tracker
+        )
+        if resume_state:
+            saved = {k: v for k, v in resume_state.items() if k != "messages"}
+            deltas = chain([(None, saved, tracker.state)], deltas)
+        for _, delta, final_state in deltas:
+            # Messages added by this node
+            for message in delta.get("messages", []):
                 # Extract message content and type
                 content = None
                 msg_type = "Reasoning"
 
-                if hasattr(last_message, "content"):
-                    content = extract_content_string(last_message.content)
-                elif last_message is not None:
-                    raw = str(last_message).strip()
+                if hasattr(message, "content"):
+                    content = extract_content_string(message.content)
+                elif message is not None:
+                    raw = str(message).strip()
                     if raw and raw != '{}':
                         content = raw
                         msg_type = "System"
@@ -1019,8 +1179,8 @@ def run_analysis():
                     message_buffer.add_message(msg_type, content)
 
                 # Handle tool calls separately
-                if hasattr(last_message, "tool_calls") and last_message.tool_calls:
-                    for tool_call in last_message.tool_calls:
+                if hasattr(message, "tool_calls") and message.tool_calls:
+                    for tool_call in message.tool_calls:
                         # Handle both dictionary and object tool calls
                         if isinstance(tool_call, dict):
                             message_buffer.add_tool_call(
@@ -1029,190 +1189,180 @@ def run_analysis():
                         else:
                             message_buffer.add_tool_call(tool_call.name, tool_call.args)
 
-                # Update reports and agent status based on chunk content
-                # Analyst Team Reports
-                if "market_report" in chunk and chunk["market_report"]:
-                    message_buffer.update_report_section(
-                        "market_report", chunk["market_report"]
+            # Update reports and agent status based on the fields this node changed
+            # Analyst Team Reports
+            if delta.get("market_report"):
+                message_buffer.update_report_section(
+                    "market_report", delta["market_report"]
+                )
+                message_buffer.update_agent_status("Market Analyst", "completed")
+                # Set next analyst to in_progress
+                if "social" in selections["analysts"]:
+                    message_buffer.update_agent_status(
+                        "Social Analyst", "in_progress"
+                    )
+
+            if delta.get("sentiment_report"):
+                message_buffer.update_report_section(
+                    "sentiment_report", delta["sentiment_report"]
+                )
+                message_buffer.update_agent_status("Social Analyst", "completed")
+                # Set next analyst to in_progress
+                if "news" in selections["analysts"]:
+                    message_buffer.update_agent_status(
+                        "News Analyst", "in_progress"
+                    )
+
+            if delta.get("news_report"):
+                message_buffer.update_report_section(
+                    "news_report", delta["news_report"]
+                )
+                message_buffer.update_agent_status("News Analyst", "completed")
+                # Set next analyst to in_progress
+                if "fundamentals" in selections["analysts"]:
+                    message_buffer.update_agent_status(
+                        "Fundamentals Analyst", "in_progress"
                     )
-                    message_buffer.update_agent_status("Market Analyst", "completed")
-                    # Set next analyst to in_progress
-                    if "social" in selections["analysts"]:
-                        message_buffer.update_agent_status(
-                            "Social Analyst", "in_progress"
-                        )
-
-                if "sentiment_report" in chunk and chunk["sentiment_report"]:
+
+            if delta.get("fundamentals_report"):
+                message_buffer.update_report_section(
+                    "fundamentals_report", delta["fundamentals_report"]
+                )
+                message_buffer.update_agent_status(
+                    "Fundamentals Analyst", "completed"
+                )
+                # Set all research team members to in_progress
+                update_research_team_status("in_progress")
+
+            # Research Team - Handle Investment Debate State
+            if delta.get("investment_debate_state"):
+                debate_state = delta["investment_debate_state"]
+
+                # Update Bull Researcher status and report
+                if "bull_history" in debate_state and debate_state["bull_history"]:
+                    update_research_team_status("in_progress")
                     message_buffer.update_report_section(
-                        "sentiment_report", chunk["sentiment_report"]
+                        "investment_plan",
+                        f"### Bull Researcher Analysis\n{debate_state['bull_history']}",
                     )
-                    message_buffer.update_agent_status("Social Analyst", "completed")
-                    # Set next analyst to in_progress
-                    if "news" in selections["analysts"]:
-                        message_buffer.update_agent_status(
-                            "News Analyst", "in_progress"
-                        )
-
-                if "news_report" in chunk and chunk["news_report"]:
+
+                # Update Bear Researcher status and report
+                if "bear_history" in debate_state and debate_state["bear_history"]:
+                    update_research_team_status("in_progress")
                     message_buffer.update_report_section(
-                        "news_report", chunk["news_report"]
+                        "investment_plan",
+                        f"### Bear Researcher Analysis\n{debate_state['bear_history']}",
                     )
-                    message_buffer.update_agent_status("News Analyst", "completed")
-                    # Set next analyst to in_progress
-                    if "fundamentals" in selections["analysts"]:
-                        message_buffer.update_agent_status(
-                            "Fundamentals Analyst", "in_progress"
-                        )
-
-                if "fundamentals_report" in chunk and chunk["fundamentals_report"]:
+
+                # Update Research Manager status and final decision
+                if (
+                    "judge_decision" in debate_state
+                    and debate_state["judge_decision"]
+                ):
+                    update_research_team_status("in_progress")
                     message_buffer.update_report_section(
-                        "fundamentals_report", chunk["fundamentals_report"]
+                        "investment_plan",
+                        f"### Research Manager Decision\n{debate_state['judge_decision']}",
                     )
+                    update_research_team_status("completed")
+                    # Set first risk analyst to in_progress
                     message_buffer.update_agent_status(
-                        "Fundamentals Analyst", "completed"
+                        "Aggressive Analyst", "in_progress"
                     )
-                    # Set all research team members to in_progress
-                    update_research_team_status("in_progress")
 
-                # Research Team - Handle Investment Debate State
+            # Trading Team
+            if delta.get("trader_investment_plan"):
+                message_buffer.update_report_section(
+                    "trader_investment_plan", delta["trader_investment_plan"]
+                )
+                # Set first risk analyst to in_progress
+                message_buffer.update_agent_status("Aggressive Analyst", "in_progress")
+
+            # Risk Management Team - Handle Risk Debate State
+            if delta.get("risk_debate_state"):
+                risk_state = delta["risk_debate_state"]
+
+                # Update Aggressive Analyst status and report
                 if (
-                    "investment_debate_state" in chunk
-                    and chunk["investment_debate_state"]
+                    "current_aggressive_response" in risk_state
+                    and risk_state["current_aggressive_response"]
                 ):
-                    debate_state = chunk["investment_debate_state"]
-
-                    # Update Bull Researcher status and report
-                    if "bull_history" in debate_state and debate_state["bull_history"]:
-                        update_research_team_status("in_progress")
-                        message_buffer.update_report_section(
-                            "investment_plan",
-                            f"### Bull Researcher Analysis\n{debate_state['bull_history']}",
-                        )
-
-                    # Update Bear Researcher status and report
-                    if "bear_history" in debate_state and debate_state["bear_history"]:
-                        update_research_team_status("in_progress")
-                        message_buffer.update_report_section(
-                            "investment_plan",
-                            f"### Bear Researcher Analysis\n{debate_state['bear_history']}",
-                        )
-
-                    # Update Research Manager status and final decision
-                    if (
-                        "judge_decision" in debate_state
-                        and debate_state["judge_decision"]
-                    ):
-                        update_research_team_status("in_progress")
-                        message_buffer.update_report_section(
-                            "investment_plan",
-                            f"### Research Manager Decision\n{debate_state['judge_decision']}",
-                        )
-                        update_research_team_status("completed")
-                        # Set first risk analyst to in_progress
-                        message_buffer.update_agent_status(
-                            "Aggressive Analyst", "in_progress"
-                        )
-
-                # Trading Team
+                    message_buffer.update_agent_status(
+                        "Aggressive Analyst", "in_progress"
+                    )
+                    message_buffer.add_message(
+                        "Reasoning",
+                        f"Aggressive Analyst: {risk_state['current_aggressive_response']}",
+                    )
+                    # Update risk report with aggressive analyst's latest analysis only
+                    message_buffer.update_report_section(
+                        "final_trade_decision",
+                        f"### Aggressive Analyst Analysis\n{risk_state['current_aggressive_response']}",
+                    )
+
+                # Update Conservative Analyst status and report
                 if (
-                    "trader_investment_plan" in chunk
-                    and chunk["trader_investment_plan"]
+                    "current_conservative_response" in risk_state
+                    and risk_state["current_conservative_response"]
                 ):
+                    message_buffer.update_agent_status(
+                        "Conservative Analyst", "in_progress"
+                    )
+                    message_buffer.add_message(
+                        "Reasoning",
+                        f"Conservative Analyst: {risk_state['current_conservative_response']}",
+                    )
+                    # Update risk report with conservative analyst's latest analysis only
                     message_buffer.update_report_section(
-                        "trader_investment_plan", chunk["trader_investment_plan"]
+                        "final_trade_decision",
+                        f"### Conservative Analyst Analysis\n{risk_state['current_conservative_response']}",
+                    )
+
+                # Update Neutral Analyst status and report
+                if (
+                    "current_neutral_response" in risk_state
+                    and risk_state["current_neutral_response"]
+                ):
+                    message_buffer.update_agent_status(
+                        "Neutral Analyst", "in_progress"
+                    )
+                    message_buffer.add_message(
+                        "Reasoning",
+                        f"Neutral Analyst: {risk_state['current_neutral_response']}",
+                    )
+                    # Update risk report with neutral analyst's latest analysis only
+                    message_buffer.update_report_section(
+                        "final_trade_decision",
+                        f"### Neutral Analyst Analysis\n{risk_state['current_neutral_response']}",
+                    )
+
+                # Update Portfolio Manager status and final decision
+                if "judge_decision" in risk_state and risk_state["judge_decision"]:
+                    message_buffer.update_agent_status(
+                        "Portfolio Manager", "in_progress"
+                    )
+                    message_buffer.add_message(
+                        "Reasoning",
+                        f"Portfolio Manager: {risk_state['judge_decision']}",
+                    )
+                    # Update risk report with final decision only
+                    message_buffer.update_report_section(
+                        "final_trade_decision",
+                        f"### Portfolio Manager Decision\n{risk_state['judge_decision']}",
+                    )
+                    # Mark risk analysts as completed
+                    message_buffer.update_agent_status("Aggressive Analyst", "completed")
+                    message_buffer.update_agent_status("Conservative Analyst", "completed")
+                    message_buffer.update_agent_status(
+                        "Neutral Analyst", "completed"
+                    )
+                    message_buffer.update_agent_status(
+                        "Portfolio Manager", "completed"
                     )
-                    # Set first risk analyst to in_progress
-                    message_buffer.update_agent_status("Aggressive Analyst", "in_progress")
-
-                # Risk Management Team - Handle Risk Debate State
-                if "risk_debate_state" in chunk and chunk["risk_debate_state"]:
-                    risk_state = chunk["risk_debate_state"]
-
-                    # Update Aggressive Analyst status and report
-                    if (
-                        "current_aggressive_response" in risk_state
-                        and risk_state["current_aggressive_response"]
-                    ):
-                        message_buffer.update_agent_status(
-                            "Aggressive Analyst", "in_progress"
-                        )
-                        message_buffer.add_message(
-                            "Reasoning",
-                            f"Aggressive Analyst: {risk_state['current_aggressive_response']}",
-                        )
-                        # Update risk report with aggressive analyst's latest analysis only
-                        message_buffer.update_report_section(
-                            "final_trade_decision",
-                            f"### Aggressive Analyst Analysis\n{risk_state['current_aggressive_response']}",
-                        )
-
-                    # Update Conservative Analyst status and report
-                    if (
-                        "current_conservative_response" in risk_state
-                        and risk_state["current_conservative_response"]
-                    ):
-                        message_buffer.update_agent_status(
-                            "Conservative Analyst", "in_progress"
-                        )
-                        message_buffer.add_message(
-                            "Reasoning",
-                            f"Conservative Analyst: {risk_state['current_conservative_response']}",
-                        )
-                        # Update risk report with conservative analyst's latest analysis only
-                        message_buffer.update_report_section(
-                            "final_trade_decision",
-                            f"### Conservative Analyst Analysis\n{risk_state['current_conservative_response']}",
-                        )
-
-                    # Update Neutral Analyst status and report
-                    if (
-                        "current_neutral_response" in risk_state
-                        and risk_state["current_neutral_response"]
-                    ):
-                        message_buffer.update_agent_status(
-                            "Neutral Analyst", "in_progress"
-                        )
-                        message_buffer.add_message(
-                            "Reasoning",
-                            f"Neutral Analyst: {risk_state['current_neutral_response']}",
-                        )
-                        # Update risk report with neutral analyst's latest analysis only
-                        message_buffer.update_report_section(
-                            "final_trade_decision",
-                            f"### Neutral Analyst Analysis\n{risk_state['current_neutral_response']}",
-                        )
-
-                    # Update Portfolio Manager status and final decision
-                    if "judge_decision" in risk_state and risk_state["judge_decision"]:
-                        message_buffer.update_agent_status(
-                            "Portfolio Manager", "in_progress"
-                        )
-                        message_buffer.add_message(
-                            "Reasoning",
-                            f"Portfolio Manager: {risk_state['judge_decision']}",
-                        )
-                        # Update risk report with final decision only
-                        message_buffer.update_report_section(
-                            "final_trade_decision",
-                            f"### Portfolio Manager Decision\n{risk_state['judge_decision']}",
-                        )
-                        # Mark risk analysts as completed
-                        message_buffer.update_agent_status("Aggressive Analyst", "completed")
-                        message_buffer.update_agent_status("Conservative Analyst", "completed")
-                        message_buffer.update_agent_status(
-                            "Neutral Analyst", "completed"
-                        )
-                        message_buffer.update_agent_status(
-                            "Portfolio Manager", "completed"
-                        )
-
-                # Update the display
-                update_display(layout, stats_handler=stats_handler, start_time=start_time)
-
-            trace.append(chunk)
+
+            flush_reports()
 
         # Get final state and decision
-        final_state = trace[-1]
         decision = graph.process_signal(final_state["final_trade_decision"])
 
         # Update all agent statuses to completed
@@ -1231,12 +1381,21 @@ def run_analysis():
         # Display the complete final report
         display_complete_report(final_state)
 
-        update_display(layout, stats_handler=stats_handler, start_time=start_time)
+        spinner_text = None
+        flush_reports(force=True)
+        live.refresh()
+
+    trace_path = profiler.write_chrome_trace(results_dir / "profile_trace.json")
+    display_profile_summary(profiler, trace_path)
 
 
 @app.command()
-def analyze():
-    run_analysis()
+def analyze(
+    resume: Optional[str] = typer.Option(
+        None, "--resume", help="Continue a checkpointed run (run id shown by a failed run)"
+    ),
+):
+    run_analysis(resume)
 
 
 if __name__ == "__main__":
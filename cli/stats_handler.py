@@ -5,6 +5,8 @@ from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.outputs import LLMResult
 from langchain_core.messages import AIMessage
 
+from tradingagents.llm_clients.response_cache import CACHE_STATUS_KEY
+
 
 class StatsCallbackHandler(BaseCallbackHandler):
     """Callback handler that tracks LLM calls, tool calls, and token usage."""
@@ -16,6 +18,8 @@ class StatsCallbackHandler(BaseCallbackHandler):
         self.tool_calls = 0
         self.tokens_in = 0
         self.tokens_out = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     def on_llm_start(
         self,
@@ -50,6 +54,17 @@ class StatsCallbackHandler(BaseCallbackHandler):
             if isinstance(message, AIMessage) and hasattr(message, "usage_metadata"):
                 usage_metadata = message.usage_metadata
 
+            # Responses replayed from the LLM cache cost no tokens
+            cache_status = getattr(message, "response_metadata", {}).get(CACHE_STATUS_KEY)
+            if cache_status:
+                with self._lock:
+                    if cache_status == "hit":
+                        self.cache_hits += 1
+                    else:
+                        self.cache_misses += 1
+                if cache_status == "hit":
+                    return
+
         if usage_metadata:
             with self._lock:
                 self.tokens_in += usage_metadata.get("input_tokens", 0)
@@ -73,4 +88,6 @@ class StatsCallbackHandler(BaseCallbackHandler):
                 "tool_calls": self.tool_calls,
                 "tokens_in": self.tokens_in,
                 "tokens_out": self.tokens_out,
+                "cache_hits": self.cache_hits,
+                "cache_misses": self.cache_misses,
             }
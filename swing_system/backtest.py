@@ -41,8 +41,9 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from indicators import compute_all
-from market_structure import analyze as analyze_structure
-from scoring import score_ticker, DEFAULT_FILTERS, DEFAULT_WEIGHTS, DEFAULT_TRADE
+from market_structure import WeeklyStructureCache, analyze as analyze_structure
+from scoring import (score_ticker, score_matrix, mtf_columns,
+                     DEFAULT_FILTERS, DEFAULT_WEIGHTS, DEFAULT_TRADE)
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -154,22 +155,39 @@ def backtest_ticker(ticker: str,
     if len(df_raw) < warmup + 20:
         return []
 
-    df   = compute_all(df_raw)
-    n    = len(df)
-    out  = []
+    df     = compute_all(df_raw)
+    n      = len(df)
+    out    = []
+    weekly = WeeklyStructureCache.from_frame(df)   # resample + pivot weekly una volta sola
 
+    bars, mtfs = [], []
     for i in range(warmup, n - max_days - 1, step):
         sl = df.iloc[:i + 1]
         try:
-            res = analyze_structure(sl, include_weekly=True)
+            res = analyze_structure(sl, include_weekly=True, weekly_cache=weekly)
             mtf = res.get("mtf", {})
         except Exception:
             continue
         if not mtf:
             continue
+        bars.append(i)
+        mtfs.append(mtf)
 
+    if not bars:
+        return out
+
+    # Punteggi di tutte le barre in un passaggio vettoriale: SwingSignal solo
+    # sulle barre che superano soglia e filtri.
+    matrix = score_matrix(df.iloc[bars], mtf_columns(mtfs, df.index[bars]),
+                          weights=weights or DEFAULT_WEIGHTS,
+                          filters=filters or DEFAULT_FILTERS)
+
+    for k, i in enumerate(bars):
         for direction in ("LONG", "SHORT"):
-            sig = score_ticker(ticker, sl, mtf,
+            if not matrix[direction, "passed"].iat[k] or matrix[direction, "total"].iat[k] < min_score:
+                continue
+
+            sig = score_ticker(ticker, df.iloc[:i + 1], mtfs[k],
                                direction=direction,
                                filters=filters or DEFAULT_FILTERS,
                                weights=weights or DEFAULT_WEIGHTS,
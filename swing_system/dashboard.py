@@ -1,16 +1,26 @@
 """
 dashboard.py  —  MTF Swing System
-Genera HTML standalone con:
+Genera HTML (CSS/JS condivisi in output/static/) con:
   Tab SCAN     : segnali, filtri, distribuzione score
-  Tab BACKTEST : 12 KPI, equity chart SVG, breakdown per evento/score/durata
+  Tab BACKTEST : 12 KPI, equity chart SVG (LTTB, disegnato nel browser), breakdown per evento/score/durata
   Tab POSIZIONI: tracker in-memory (no localStorage)
 """
 
+import json
+import sys
 from datetime import datetime
 from pathlib import Path
 import numpy as np
 import pandas as pd
 
+# Helper condivisi con TradingAgents (root del repo), come in market_structure.py
+_REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from tradingagents.utils.chart_data import encode_f32, lttb_indices
+from tradingagents.utils.static_assets import asset_tags
+
 OUTPUT_DIR = Path("output")
 OUTPUT_DIR.mkdir(exist_ok=True)
 
@@ -52,48 +62,26 @@ def _f(v, d=2):
     except: return "—"
 
 
-# ── equity chart SVG ─────────────────────────────────────────────────────────
+# ── equity chart (SVG disegnato nel browser) ─────────────────────────────────
+
+EQUITY_MAX_POINTS = 600   # punti LTTB inviati al browser (~1 per pixel)
+
 
-def _equity_svg(series, W=680, H=210):
+def _equity_chart(series, W=680, H=210):
+    """Payload colonnare dell'equity (float32 base64), disegnato da drawEquity()"""
     if not series or len(series) < 2:
         return '<p style="color:#4a5568;padding:20px">Nessun dato equity.</p>'
-    vals  = [s["equity"] for s in series]
-    dates = [s["date"]   for s in series]
-    n     = len(vals)
-    mn, mx = min(vals), max(vals)
-    rng   = max(mx - mn, 0.01)
-    PL, PR, PT, PB = 52, 16, 18, 30
-    iw, ih = W-PL-PR, H-PT-PB
-
-    def px(i): return PL + i/(max(n-1,1))*iw
-    def py(v): return PT + (1-(v-mn)/rng)*ih
-
-    pts  = " ".join(f"{px(i):.1f},{py(v):.1f}" for i,v in enumerate(vals))
-    fill = f"{PL:.0f},{PT+ih:.0f} {pts} {px(n-1):.1f},{PT+ih:.0f}"
-    lc   = "#00e676" if vals[-1] >= 100 else "#ff5252"
-    fc   = "rgba(0,230,118,0.07)" if vals[-1] >= 100 else "rgba(255,82,82,0.07)"
-
-    y_ax = "".join(
-        f'<text x="{PL-5}" y="{py(mn+rng*k/3)+4:.0f}" text-anchor="end" font-size="9" fill="#555">{mn+rng*k/3:.1f}</text>'
-        f'<line x1="{PL}" y1="{py(mn+rng*k/3):.0f}" x2="{PL+iw}" y2="{py(mn+rng*k/3):.0f}" stroke="#1c2535" stroke-width="0.5"/>'
-        for k in range(4)
-    )
-    x_ax = "".join(
-        f'<text x="{px(int(k*(n-1)/3)):.0f}" y="{H-6}" text-anchor="middle" font-size="9" fill="#555">{dates[int(k*(n-1)/3)][:7]}</text>'
-        for k in range(4)
-    )
-    base = f'<line x1="{PL}" y1="{py(100):.1f}" x2="{PL+iw}" y2="{py(100):.1f}" stroke="#333" stroke-width="0.8" stroke-dasharray="4,3"/>'
-    end_x, end_y = f"{px(n-1):.1f}", f"{py(vals[-1]):.1f}"
-
-    return (
-        f'<svg viewBox="0 0 {W} {H}" xmlns="http://www.w3.org/2000/svg" style="width:100%">'
-        + y_ax + x_ax + base
-        + f'<polygon points="{fill}" fill="{fc}"/>'
-        + f'<polyline points="{pts}" fill="none" stroke="{lc}" stroke-width="1.8"/>'
-        + f'<circle cx="{end_x}" cy="{end_y}" r="4" fill="{lc}"/>'
-        + f'<text x="{float(end_x)+7}" y="{float(end_y)+4:.0f}" font-size="10" fill="{lc}" font-weight="700">{vals[-1]:.2f}</text>'
-        + '</svg>'
-    )
+    vals = np.asarray([s["equity"] for s in series], dtype=float)
+    n    = len(vals)
+    keep = lttb_indices(vals, EQUITY_MAX_POINTS)
+    payload = {
+        "w": W, "h": H,
+        "x": encode_f32(keep / (n-1)),          # posizione 0..1 sull'asse
+        "equity": encode_f32(vals[keep]),
+        "labels": [[k/3, series[int(k*(n-1)/3)]["date"][:7]] for k in range(4)],
+    }
+    return ('<div class="eq-chart"></div>'
+            f'<script type="application/json" data-equity>{json.dumps(payload)}</script>')
 
 
 # ── score distribution mini-chart ────────────────────────────────────────────
@@ -235,32 +223,15 @@ def _bt_tab(stats):
 <div class="kpi-grid">{"".join(kpis)}</div>
 <div class="card" style="margin-top:20px">
   <div class="bdt">Equity Curve — base 100, rischio {s['risk_per_trade']:.0f}%/trade</div>
-  <div style="padding:6px 0">{_equity_svg(eq)}</div>
+  <div style="padding:6px 0">{_equity_chart(eq)}</div>
 </div>
 <div class="bd-grid" style="margin-top:18px">{bd}</div>
 """
 
 
-# ── main generator ────────────────────────────────────────────────────────────
-
-def generate_dashboard(signals, bt_stats=None, title="MTF Swing Screener"):
-    ts     = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    n      = len(signals)
-    n_l    = sum(1 for s in signals if s.get("direction")=="LONG")
-    n_s    = n - n_l
-    n_ch   = sum(1 for s in signals if "CHoCH" in (s.get("structure_event") or ""))
-    n_bo   = sum(1 for s in signals if "BOS"   in (s.get("structure_event") or ""))
-    avg_sc = sum(float(s.get("score",0) or 0) for s in signals)/max(n,1)
-    avg_rr = sum(float(s.get("risk_reward",0) or 0) for s in signals)/max(n,1)
-
-    rows    = "\n".join(_sig_row(s,i+1) for i,s in enumerate(signals[:60]))
-    no_sig  = ('<tr><td colspan="16" style="text-align:center;color:var(--mu);padding:32px">'
-               'Nessun segnale. Esegui: <code>python screener.py scan --synthetic</code>'
-               '</td></tr>') if not rows.strip() else ""
-    dsv     = _dist_svg(signals)
-    bt_html = _bt_tab(bt_stats)
+# ── assets (condivisi in output/static/) ─────────────────────────────────────
 
-    CSS = """
+CSS = """
 @import url('https://fonts.googleapis.com/css2?family=Syne:wght@600;800&family=IBM+Plex+Mono:wght@300;400;600&display=swap');
 :root{--bg:#07090e;--s1:#0d1117;--s2:#111922;--bd:#1c2535;
   --tx:#c9d1d9;--mu:#4a5568;
@@ -366,7 +337,7 @@ label.fl input:focus{border-color:var(--b)}
 .hidden{display:none!important}
 """
 
-    JS = """
+JS = """
 function showTab(id,el){
   document.querySelectorAll('.tc').forEach(t=>t.classList.remove('act'));
   document.querySelectorAll('.tab').forEach(t=>t.classList.remove('act'));
@@ -443,15 +414,74 @@ function renderPos(){
   }).join('');
 }
 renderPos();
+
+// equity: payload float32 base64 -> SVG
+function f32(b){
+  const s=atob(b),u=new Uint8Array(s.length);
+  for(let i=0;i<s.length;i++)u[i]=s.charCodeAt(i);
+  return new Float32Array(u.buffer);
+}
+function drawEquity(el){
+  const d=JSON.parse(el.textContent),x=f32(d.x),v=f32(d.equity),n=v.length;
+  const W=d.w,H=d.h,PL=52,PR=16,PT=18,PB=30,iw=W-PL-PR,ih=H-PT-PB;
+  let mn=Infinity,mx=-Infinity;
+  v.forEach(y=>{if(y<mn)mn=y;if(y>mx)mx=y;});
+  const rng=Math.max(mx-mn,0.01);
+  const px=f=>PL+f*iw, py=y=>PT+(1-(y-mn)/rng)*ih;
+  const pts=Array.from(v,(y,i)=>px(x[i]).toFixed(1)+','+py(y).toFixed(1)).join(' ');
+  const last=v[n-1], up=last>=100;
+  const lc=up?'#00e676':'#ff5252', fc=up?'rgba(0,230,118,0.07)':'rgba(255,82,82,0.07)';
+  let g='';
+  for(let k=0;k<4;k++){
+    const y=mn+rng*k/3;
+    g+=`<text x="${PL-5}" y="${(py(y)+4).toFixed(0)}" text-anchor="end" font-size="9" fill="#555">${y.toFixed(1)}</text>`
+     +`<line x1="${PL}" y1="${py(y).toFixed(0)}" x2="${PL+iw}" y2="${py(y).toFixed(0)}" stroke="#1c2535" stroke-width="0.5"/>`;
+  }
+  d.labels.forEach(([f,t])=>{
+    g+=`<text x="${px(f).toFixed(0)}" y="${H-6}" text-anchor="middle" font-size="9" fill="#555">${t}</text>`;
+  });
+  g+=`<line x1="${PL}" y1="${py(100).toFixed(1)}" x2="${PL+iw}" y2="${py(100).toFixed(1)}" stroke="#333" stroke-width="0.8" stroke-dasharray="4,3"/>`;
+  const ex=px(x[n-1]), ey=py(last);
+  el.previousElementSibling.innerHTML=
+    `<svg viewBox="0 0 ${W} ${H}" xmlns="http://www.w3.org/2000/svg" style="width:100%">${g}`
+    +`<polygon points="${PL},${PT+ih} ${pts} ${ex.toFixed(1)},${PT+ih}" fill="${fc}"/>`
+    +`<polyline points="${pts}" fill="none" stroke="${lc}" stroke-width="1.8"/>`
+    +`<circle cx="${ex.toFixed(1)}" cy="${ey.toFixed(1)}" r="4" fill="${lc}"/>`
+    +`<text x="${(ex+7).toFixed(1)}" y="${(ey+4).toFixed(0)}" font-size="10" fill="${lc}" font-weight="700">${last.toFixed(2)}</text></svg>`;
+}
+document.querySelectorAll('script[type="application/json"][data-equity]').forEach(drawEquity);
 """
 
+
+# ── main generator ────────────────────────────────────────────────────────────
+
+def generate_dashboard(signals, bt_stats=None, title="MTF Swing Screener"):
+    ts     = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    n      = len(signals)
+    n_l    = sum(1 for s in signals if s.get("direction")=="LONG")
+    n_s    = n - n_l
+    n_ch   = sum(1 for s in signals if "CHoCH" in (s.get("structure_event") or ""))
+    n_bo   = sum(1 for s in signals if "BOS"   in (s.get("structure_event") or ""))
+    avg_sc = sum(float(s.get("score",0) or 0) for s in signals)/max(n,1)
+    avg_rr = sum(float(s.get("risk_reward",0) or 0) for s in signals)/max(n,1)
+
+    rows    = "\n".join(_sig_row(s,i+1) for i,s in enumerate(signals[:60]))
+    no_sig  = ('<tr><td colspan="16" style="text-align:center;color:var(--mu);padding:32px">'
+               'Nessun segnale. Esegui: <code>python screener.py scan --synthetic</code>'
+               '</td></tr>') if not rows.strip() else ""
+    dsv     = _dist_svg(signals)
+    bt_html = _bt_tab(bt_stats)
+    head_assets, body_assets = asset_tags(OUTPUT_DIR, "swing_dashboard", css=CSS, js=JS)
+
+
+
     html = f"""<!DOCTYPE html>
 <html lang="it">
 <head>
 <meta charset="UTF-8">
 <meta name="viewport" content="width=device-width,initial-scale=1">
 <title>{title}</title>
-<style>{CSS}</style>
+{head_assets}
 </head>
 <body>
 
@@ -545,7 +575,7 @@ renderPos();
   </div>
 </div>
 
-<script>{JS}</script>
+{body_assets}
 </body>
 </html>"""
 
@@ -19,12 +19,25 @@ LOGICA CHoCH vs BOS:
     CHoCH_UP  = prezzo rompe sopra l'ultimo LH → inversione bullish
 """
 
-from dataclasses import dataclass, field
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from pathlib import Path
+from typing import Optional, Union
+import sys
 import numpy as np
 import pandas as pd
 
+_REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from tradingagents.dataflows.pivot_engine import (
+    LABEL_NAMES, LABEL_NONE, NAT, PIVOT_DTYPE,
+    PivotEngine, PivotTable, classify_labels, compute_pivots, pivot_table, timestamp_str, timestamps_ns,
+)
+from tradingagents.dataflows.weekly_aggregator import WeeklyAggregator
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # TIPI
@@ -48,7 +61,14 @@ class TrendState(str, Enum):
     UNDEFINED = "UNDEFINED"
 
 
-@dataclass
+# Codici int8 usati nelle tabelle (indice nella tupla)
+EVENT_CODES = tuple(StructureEvent)
+TREND_CODES = tuple(TrendState)
+_BOS_UP, _BOS_DOWN, _CHOCH_UP, _CHOCH_DOWN = range(4)
+_UPTREND, _DOWNTREND, _UNDEFINED = range(3)
+
+
+@dataclass(slots=True)
 class Pivot:
     bar_index:  int
     timestamp:  pd.Timestamp
@@ -74,7 +94,7 @@ class Pivot:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class StructureSignal:
     bar_index:  int
     timestamp:  pd.Timestamp
@@ -107,6 +127,121 @@ class StructureSignal:
         }
 
 
+# ──────────────────────────────────────────────────────────────────────────────
+# TABELLE COMPATTE (struct-of-arrays)
+# ──────────────────────────────────────────────────────────────────────────────
+# Pivot ed eventi vivono in array strutturati NumPy (timestamp int64 ns).
+# Gli oggetti Pivot / StructureSignal e i dict vengono creati solo su
+# richiesta (to_pivots / to_signals / to_records), cioè al momento del report.
+
+STRUCTURE_DTYPE = np.dtype([
+    ("bar_index",    np.int64),
+    ("timestamp",    np.int64),     # nanosecondi epoch
+    ("event",        np.int8),      # indice in EVENT_CODES
+    ("price",        np.float64),
+    ("level",        np.float64),
+    ("pivot_row",    np.int64),     # riga del pivot rotto nella PivotTable (-1 = ignota)
+    ("trend_before", np.int8),      # indice in TREND_CODES
+    ("volume_ratio", np.float64),
+])
+
+
+class StructureTable:
+    """Eventi BOS/CHoCH ordinati per bar_index, con riferimento alla PivotTable."""
+
+    __slots__ = ("data", "pivots")
+
+    def __init__(self, data: Optional[np.ndarray] = None, pivots: Optional[PivotTable] = None):
+        self.data   = np.empty(0, dtype=STRUCTURE_DTYPE) if data is None else data
+        self.pivots = PivotTable() if pivots is None else pivots
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __repr__(self) -> str:
+        return f"StructureTable(n={len(self)})"
+
+    def event(self, row: int) -> StructureEvent:
+        return EVENT_CODES[self.data["event"][row]]
+
+    def record(self, row: int) -> dict:
+        """Una riga come dict (stesso formato di StructureSignal.to_dict)."""
+        r     = self.data[row]
+        event = EVENT_CODES[r["event"]]
+        return {
+            "bar_index":    int(r["bar_index"]),
+            "timestamp":    timestamp_str(int(r["timestamp"])),
+            "event":        event.value,
+            "price":        round(float(r["price"]), 6),
+            "level":        round(float(r["level"]), 6),
+            "trend_before": TREND_CODES[r["trend_before"]].value,
+            "volume_ratio": round(float(r["volume_ratio"]), 2),
+            "is_bullish":   event in (StructureEvent.BOS_UP, StructureEvent.CHOCH_UP),
+            "is_choch":     event in (StructureEvent.CHOCH_UP, StructureEvent.CHOCH_DOWN),
+        }
+
+    def to_records(self) -> list[dict]:
+        return [self.record(row) for row in range(len(self.data))]
+
+    def to_signals(self) -> list[StructureSignal]:
+        return [
+            StructureSignal(
+                bar_index    = int(r["bar_index"]),
+                timestamp    = pd.Timestamp(int(r["timestamp"])),
+                event        = EVENT_CODES[r["event"]],
+                price        = float(r["price"]),
+                level        = float(r["level"]),
+                prev_pivot   = _pivot_from_row(self.pivots, int(r["pivot_row"])) if r["pivot_row"] >= 0 else None,
+                trend_before = TREND_CODES[r["trend_before"]],
+                volume_ratio = float(r["volume_ratio"]),
+            )
+            for r in self.data
+        ]
+
+
+def _pivot_from_row(table: PivotTable, row: int) -> Pivot:
+    r    = table.data[row]
+    code = int(r["label"])
+    return Pivot(
+        bar_index  = int(r["bar_index"]),
+        timestamp  = pd.Timestamp(int(r["timestamp"])),
+        price      = float(r["price"]),
+        is_high    = bool(r["is_high"]),
+        label      = SwingLabel(LABEL_NAMES[code]) if code != LABEL_NONE else None,
+        prominence = float(r["prominence"]),
+        volume     = float(r["volume"]),
+    )
+
+
+def _as_pivot_table(pivots: Union[PivotTable, list]) -> PivotTable:
+    """Accetta sia PivotTable sia la vecchia lista di Pivot."""
+    if isinstance(pivots, PivotTable):
+        return pivots
+    pivots = sorted(pivots, key=lambda p: p.bar_index)
+    data   = np.empty(len(pivots), dtype=PIVOT_DTYPE)
+    for row, p in enumerate(pivots):
+        data[row] = (
+            p.bar_index,
+            pd.Timestamp(p.timestamp).value if p.timestamp is not None else NAT,
+            p.price, p.is_high, p.prominence, p.volume,
+            LABEL_NAMES.index(p.label.value) if p.label else LABEL_NONE,
+        )
+    return PivotTable(data)
+
+
+def _as_structure_table(signals: Union[StructureTable, list]) -> StructureTable:
+    """Accetta sia StructureTable sia la vecchia lista di StructureSignal."""
+    if isinstance(signals, StructureTable):
+        return signals
+    data = np.empty(len(signals), dtype=STRUCTURE_DTYPE)
+    for row, s in enumerate(signals):
+        data[row] = (
+            s.bar_index, pd.Timestamp(s.timestamp).value, EVENT_CODES.index(s.event),
+            s.price, s.level, -1, TREND_CODES.index(s.trend_before), s.volume_ratio,
+        )
+    return StructureTable(data)
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # IDENTIFICAZIONE PIVOT
 # ──────────────────────────────────────────────────────────────────────────────
@@ -116,13 +251,16 @@ def find_pivots(df: pd.DataFrame,
                 right_bars: int = 5,
                 min_prominence_pct: float = 1.0) -> list[Pivot]:
     """
-    Identifica pivot high e low usando un approccio rolling window.
+    Identifica pivot high e low con il motore vettoriale condiviso
+    (tradingagents/dataflows/pivot_engine.py).
     Un pivot high alla barra i richiede:
       - high[i] == max(high[i-left : i+right+1])
       - rilievo (prominence) >= min_prominence_pct% del prezzo
 
     Zero lookahead: il pivot viene confermato solo dopo right_bars barre.
     Il chiamante deve usare il bar_index originale, non quello spostato.
+    Per l'uso barra-per-barra (backtest/live) vedi PivotEngine.update();
+    per evitare la creazione degli oggetti vedi pivot_table().
 
     Args:
         df:                  DataFrame OHLCV con DatetimeIndex
@@ -133,53 +271,18 @@ def find_pivots(df: pd.DataFrame,
     Returns:
         Lista di Pivot ordinati per bar_index
     """
-    highs    = df["high"].values
-    lows     = df["low"].values
-    closes   = df["close"].values
-    volumes  = df["volume"].values if "volume" in df.columns else np.ones(len(df))
-    n        = len(df)
-    pivots   = []
-
-    for i in range(left_bars, n - right_bars):
-        # ── Pivot HIGH
-        window_h = highs[i - left_bars : i + right_bars + 1]
-        if highs[i] == window_h.max():
-            # Calcola prominence: differenza tra il picco e il massimo
-            # dei minimi di entrambi i lati della finestra
-            left_min  = lows[i - left_bars : i].min()  if i > left_bars else lows[i]
-            right_min = lows[i + 1 : i + right_bars + 1].min() if i + right_bars < n else lows[i]
-            prominence = highs[i] - max(left_min, right_min)
-            prom_pct   = prominence / highs[i] * 100 if highs[i] > 0 else 0
-
-            if prom_pct >= min_prominence_pct:
-                pivots.append(Pivot(
-                    bar_index  = i,
-                    timestamp  = df.index[i],
-                    price      = highs[i],
-                    is_high    = True,
-                    prominence = prominence,
-                    volume     = volumes[i],
-                ))
-
-        # ── Pivot LOW
-        window_l = lows[i - left_bars : i + right_bars + 1]
-        if lows[i] == window_l.min():
-            left_max  = highs[i - left_bars : i].max()  if i > left_bars else highs[i]
-            right_max = highs[i + 1 : i + right_bars + 1].max() if i + right_bars < n else highs[i]
-            prominence = min(left_max, right_max) - lows[i]
-            prom_pct   = prominence / lows[i] * 100 if lows[i] > 0 else 0
-
-            if prom_pct >= min_prominence_pct:
-                pivots.append(Pivot(
-                    bar_index  = i,
-                    timestamp  = df.index[i],
-                    price      = lows[i],
-                    is_high    = False,
-                    prominence = prominence,
-                    volume     = volumes[i],
-                ))
-
-    return sorted(pivots, key=lambda p: p.bar_index)
+    table = pivot_table(df, left_bars, right_bars, min_prominence_pct)
+    return [
+        Pivot(
+            bar_index  = int(r["bar_index"]),
+            timestamp  = df.index[r["bar_index"]],
+            price      = r["price"],
+            is_high    = bool(r["is_high"]),
+            prominence = r["prominence"],
+            volume     = r["volume"],
+        )
+        for r in table.data
+    ]
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -195,6 +298,8 @@ def classify_pivots(pivots: list[Pivot]) -> list[Pivot]:
     LH: pivot high < pivot high precedente  → debolezza (possibile inversione)
     HL: pivot low  > pivot low precedente   → forza bullish
     LL: pivot low  < pivot low precedente   → forza bearish
+
+    Per la PivotTable usare classify_pivot_table().
     """
     highs = [p for p in pivots if p.is_high]
     lows  = [p for p in pivots if not p.is_high]
@@ -218,25 +323,31 @@ def classify_pivots(pivots: list[Pivot]) -> list[Pivot]:
     return pivots
 
 
+def classify_pivot_table(table: PivotTable) -> PivotTable:
+    """Versione vettoriale di classify_pivots() (stesse label di default HH/HL)."""
+    return classify_labels(table, first_high="HH", first_low="HL")
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # TREND STATE — macchina a stati basata sulla struttura
 # ──────────────────────────────────────────────────────────────────────────────
 
-def compute_trend_state(pivots: list[Pivot]) -> TrendState:
+def compute_trend_state(pivots: Union[PivotTable, list[Pivot]]) -> TrendState:
     """
     Determina il trend corrente dall'ultimo pivot:
     - Uptrend   = ultimo HH > penultimo HH E ultimo HL > penultimo HL
     - Downtrend = ultimo LH < penultimo LH E ultimo LL < penultimo LL
     - Undefined = struttura non chiara
     """
-    highs = [p for p in pivots if p.is_high]
-    lows  = [p for p in pivots if not p.is_high]
+    table = _as_pivot_table(pivots)
+    highs = table.label[table.is_high]
+    lows  = table.label[~table.is_high]
 
     if len(highs) >= 2 and len(lows) >= 2:
-        hh_seq = highs[-1].label == SwingLabel.HH
-        hl_seq = lows[-1].label  == SwingLabel.HL
-        lh_seq = highs[-1].label == SwingLabel.LH
-        ll_seq = lows[-1].label  == SwingLabel.LL
+        hh_seq = highs[-1] == LABEL_NAMES.index("HH")
+        hl_seq = lows[-1]  == LABEL_NAMES.index("HL")
+        lh_seq = highs[-1] == LABEL_NAMES.index("LH")
+        ll_seq = lows[-1]  == LABEL_NAMES.index("LL")
 
         if hh_seq and hl_seq:
             return TrendState.UPTREND
@@ -250,11 +361,78 @@ def compute_trend_state(pivots: list[Pivot]) -> TrendState:
 # RILEVAMENTO BOS e CHoCH
 # ──────────────────────────────────────────────────────────────────────────────
 
+def detect_structure_table(df: pd.DataFrame,
+                           pivots: PivotTable,
+                           require_close: bool = True) -> StructureTable:
+    """
+    Rileva le rotture strutturali su tutte le barre in un solo passaggio vettoriale.
+
+    Alla barra i il livello attivo è l'ultimo pivot (high o low) con
+    bar_index < i. Una rottura sopra il pivot high ha precedenza su quella
+    sotto il pivot low. Il tipo di evento dipende solo dalla direzione della
+    rottura precedente:
+      rottura up   dopo una rottura down → CHoCH_UP,  altrimenti BOS_UP
+      rottura down dopo una rottura up   → CHoCH_DOWN, altrimenti BOS_DOWN
+
+    Args:
+        df:            DataFrame OHLCV con indicatori
+        pivots:        PivotTable (classificata o no)
+        require_close: True = richiede chiusura oltre il livello (più robusto)
+                       False = basta che il prezzo tocchi il livello (più reattivo)
+
+    Returns:
+        StructureTable ordinata per bar_index
+    """
+    hi_rows = np.flatnonzero(pivots.is_high)
+    lo_rows = np.flatnonzero(~pivots.is_high)
+    n       = len(df)
+
+    if not len(hi_rows) or not len(lo_rows) or n < 2:
+        return StructureTable(pivots=pivots)
+
+    closes    = df["close"].values
+    vol_ratio = df["volume_ratio"].values if "volume_ratio" in df.columns else np.ones(n)
+    price_h   = closes if require_close else df["high"].values
+    price_l   = closes if require_close else df["low"].values
+
+    bars = np.arange(1, n)
+    k_h  = np.searchsorted(pivots.bar_index[hi_rows], bars, side="left") - 1
+    k_l  = np.searchsorted(pivots.bar_index[lo_rows], bars, side="left") - 1
+    ok   = (k_h >= 0) & (k_l >= 0)
+
+    row_h   = hi_rows[np.maximum(k_h, 0)]
+    row_l   = lo_rows[np.maximum(k_l, 0)]
+    level_h = pivots.price[row_h]
+    level_l = pivots.price[row_l]
+
+    up   = ok & (price_h[bars] > level_h)
+    down = ok & ~up & (price_l[bars] < level_l)
+    hit  = up | down
+
+    direction = np.where(up[hit], 1, -1)
+    prev_dir  = np.concatenate(([0], direction[:-1]))
+    idx       = bars[hit]
+
+    data = np.empty(len(idx), dtype=STRUCTURE_DTYPE)
+    data["bar_index"]    = idx
+    data["timestamp"]    = timestamps_ns(df.index)[idx]
+    data["event"]        = np.where(direction > 0,
+                                    np.where(prev_dir < 0, _CHOCH_UP, _BOS_UP),
+                                    np.where(prev_dir > 0, _CHOCH_DOWN, _BOS_DOWN))
+    data["price"]        = closes[idx]
+    data["level"]        = np.where(direction > 0, level_h[hit], level_l[hit])
+    data["pivot_row"]    = np.where(direction > 0, row_h[hit], row_l[hit])
+    data["trend_before"] = np.select([prev_dir > 0, prev_dir < 0], [_UPTREND, _DOWNTREND], _UNDEFINED)
+    data["volume_ratio"] = vol_ratio[idx]
+    return StructureTable(data, pivots)
+
+
 def detect_structure_events(df: pd.DataFrame,
                              pivots: list[Pivot],
                              require_close: bool = True) -> list[StructureSignal]:
     """
-    Scansiona barra per barra e rileva rotture strutturali.
+    Rileva rotture strutturali e restituisce oggetti StructureSignal.
+    Wrapper di detect_structure_table() per il codice che lavora con liste.
 
     Args:
         df:            DataFrame OHLCV con indicatori
@@ -265,97 +443,12 @@ def detect_structure_events(df: pd.DataFrame,
     Returns:
         Lista di StructureSignal ordinati per bar_index
     """
-    closes       = df["close"].values
-    highs        = df["high"].values
-    lows         = df["low"].values
-    vol_ratio    = df["volume_ratio"].values if "volume_ratio" in df.columns else np.ones(len(df))
-    n            = len(df)
-    signals      = []
-
-    # Separa pivot high e low e ordina per bar_index
-    pivot_highs = sorted([p for p in pivots if p.is_high],     key=lambda p: p.bar_index)
-    pivot_lows  = sorted([p for p in pivots if not p.is_high], key=lambda p: p.bar_index)
-
-    if not pivot_highs or not pivot_lows:
-        return signals
-
-    # Per ogni barra, tieni traccia dei pivot "attivi" (già confermati prima di i)
-    # e del trend corrente
-    ph_idx = 0   # puntatore ai pivot high
-    pl_idx = 0   # puntatore ai pivot low
-
-    # Pivot attivi: ultimo high e ultimo low confermati prima della barra corrente
-    active_high: Optional[Pivot] = None
-    active_low:  Optional[Pivot] = None
-
-    # Struttura dei pivot precedenti per classificazione BOS/CHoCH
-    prev_high: Optional[Pivot] = None
-    prev_low:  Optional[Pivot] = None
-
-    current_trend = TrendState.UNDEFINED
-
-    for i in range(1, n):
-        ts = df.index[i]
-
-        # Aggiorna pivot attivi: includi tutti i pivot confermati prima di i
-        while ph_idx < len(pivot_highs) and pivot_highs[ph_idx].bar_index < i:
-            prev_high   = active_high
-            active_high = pivot_highs[ph_idx]
-            ph_idx += 1
-
-        while pl_idx < len(pivot_lows) and pivot_lows[pl_idx].bar_index < i:
-            prev_low   = active_low
-            active_low = pivot_lows[pl_idx]
-            pl_idx += 1
-
-        if active_high is None or active_low is None:
-            continue
-
-        price  = closes[i] if require_close else highs[i]
-        price_l = closes[i] if require_close else lows[i]
-
-        # ── Rottura sopra l'ultimo pivot HIGH
-        if price > active_high.price:
-            if current_trend == TrendState.DOWNTREND:
-                # Uptrend inverso: CHoCH bullish
-                event = StructureEvent.CHOCH_UP
-            else:
-                # Continuazione o partenza uptrend: BOS bullish
-                event = StructureEvent.BOS_UP
-
-            signals.append(StructureSignal(
-                bar_index    = i,
-                timestamp    = ts,
-                event        = event,
-                price        = closes[i],
-                level        = active_high.price,
-                prev_pivot   = active_high,
-                trend_before = current_trend,
-                volume_ratio = float(vol_ratio[i]),
-            ))
-            current_trend = TrendState.UPTREND
-
-        # ── Rottura sotto l'ultimo pivot LOW
-        elif price_l < active_low.price:
-            if current_trend == TrendState.UPTREND:
-                # Downtrend inverso: CHoCH bearish
-                event = StructureEvent.CHOCH_DOWN
-            else:
-                # Continuazione o partenza downtrend: BOS bearish
-                event = StructureEvent.BOS_DOWN
-
-            signals.append(StructureSignal(
-                bar_index    = i,
-                timestamp    = ts,
-                event        = event,
-                price        = closes[i],
-                level        = active_low.price,
-                prev_pivot   = active_low,
-                trend_before = current_trend,
-                volume_ratio = float(vol_ratio[i]),
-            ))
-            current_trend = TrendState.DOWNTREND
-
+    ordered = sorted(pivots, key=lambda p: p.bar_index)
+    table   = detect_structure_table(df, _as_pivot_table(ordered), require_close)
+    signals = table.to_signals()
+    for sig, r in zip(signals, table.data):
+        sig.prev_pivot = ordered[r["pivot_row"]]   # mantiene gli oggetti del chiamante
+        sig.timestamp  = df.index[r["bar_index"]]
     return signals
 
 
@@ -363,43 +456,41 @@ def detect_structure_events(df: pd.DataFrame,
 # STRUTTURA CORRENTE — snapshot dello stato attuale
 # ──────────────────────────────────────────────────────────────────────────────
 
-def get_current_structure(pivots: list[Pivot],
-                          signals: list[StructureSignal]) -> dict:
+def get_current_structure(pivots: Union[PivotTable, list[Pivot]],
+                          signals: Union[StructureTable, list[StructureSignal]]) -> dict:
     """
     Restituisce uno snapshot della struttura di mercato corrente:
     trend, ultimo swing high/low, prossimi livelli chiave.
+    Solo gli elementi riportati nello snapshot vengono convertiti in dict.
     """
-    if not pivots:
-        return {"trend": "UNDEFINED"}
+    pivots  = _as_pivot_table(pivots)
+    signals = _as_structure_table(signals)
 
-    highs = sorted([p for p in pivots if p.is_high],     key=lambda p: p.bar_index)
-    lows  = sorted([p for p in pivots if not p.is_high], key=lambda p: p.bar_index)
-
-    last_high = highs[-1]  if highs else None
-    last_low  = lows[-1]   if lows  else None
-    last_sig  = signals[-1] if signals else None
-    trend     = compute_trend_state(pivots)
+    if not len(pivots):
+        return {"trend": "UNDEFINED"}
 
-    # Sequenza degli ultimi 4 pivot (per visualizzazione)
-    recent = sorted(pivots, key=lambda p: p.bar_index)[-6:]
+    hi_rows = np.flatnonzero(pivots.is_high)
+    lo_rows = np.flatnonzero(~pivots.is_high)
+    trend   = compute_trend_state(pivots)
 
     # Struttura intatta: uptrend = nessun LL dopo l'ultimo HL, downtrend = nessun HH dopo l'ultimo LH
     structure_intact = True
-    if trend == TrendState.UPTREND and lows:
-        recent_lows = [p for p in lows if p.bar_index > lows[-2].bar_index] if len(lows) >= 2 else []
-        structure_intact = not any(p.label == SwingLabel.LL for p in recent_lows)
-    elif trend == TrendState.DOWNTREND and highs:
-        recent_highs = [p for p in highs if p.bar_index > highs[-2].bar_index] if len(highs) >= 2 else []
-        structure_intact = not any(p.label == SwingLabel.HH for p in recent_highs)
-
+    if trend == TrendState.UPTREND and len(lo_rows):
+        recent = lo_rows[pivots.bar_index[lo_rows] > pivots.bar_index[lo_rows[-2]]] if len(lo_rows) >= 2 else lo_rows[:0]
+        structure_intact = not bool((pivots.label[recent] == LABEL_NAMES.index("LL")).any())
+    elif trend == TrendState.DOWNTREND and len(hi_rows):
+        recent = hi_rows[pivots.bar_index[hi_rows] > pivots.bar_index[hi_rows[-2]]] if len(hi_rows) >= 2 else hi_rows[:0]
+        structure_intact = not bool((pivots.label[recent] == LABEL_NAMES.index("HH")).any())
+
+    n = len(pivots)
     return {
         "trend":            trend.value,
         "structure_intact": structure_intact,
-        "last_high":        last_high.to_dict()  if last_high else None,
-        "last_low":         last_low.to_dict()   if last_low  else None,
-        "last_signal":      last_sig.to_dict()   if last_sig  else None,
-        "recent_pivots":    [p.to_dict() for p in recent],
-        "n_pivots_total":   len(pivots),
+        "last_high":        pivots.record(hi_rows[-1]) if len(hi_rows) else None,
+        "last_low":         pivots.record(lo_rows[-1]) if len(lo_rows) else None,
+        "last_signal":      signals.record(len(signals) - 1) if len(signals) else None,
+        "recent_pivots":    [pivots.record(row) for row in range(max(n - 6, 0), n)],
+        "n_pivots_total":   n,
         "n_signals_total":  len(signals),
     }
 
@@ -422,12 +513,215 @@ def resample_to_weekly(df: pd.DataFrame) -> pd.DataFrame:
     return weekly
 
 
+class WeeklyStructureCache:
+    """
+    Struttura weekly mantenuta incrementalmente mentre si aggiungono barre daily.
+
+    Le settimane chiuse alimentano un PivotEngine (label HH/LH/HL/LL assegnate
+    alla conferma) e gli eventi BOS/CHoCH ormai definitivi vengono salvati una
+    volta sola. asof(i) ricostruisce la vista weekly alla barra daily i
+    lavorando solo sulla coda non ancora stabile (ultime right_bars settimane +
+    settimana in corso), quindi costa O(1) per barra invece di un resample e una
+    ricerca pivot sull'intero storico.
+
+    Il risultato coincide con mtf_structure_confluence(df.iloc[:i+1]) per la
+    parte weekly (trend, snapshot, numero pivot).
+
+    Esempio:
+        cache = WeeklyStructureCache.from_frame(df)
+        for i in range(60, len(df)):
+            res = analyze(df.iloc[:i+1], weekly_cache=cache)
+    """
+
+    def __init__(self,
+                 left_bars: int = 3,
+                 right_bars: int = 3,
+                 min_prominence_pct: float = 2.0):
+        self.left_bars          = left_bars
+        self.right_bars         = right_bars
+        self.min_prominence_pct = min_prominence_pct
+
+        self.weeks  = WeeklyAggregator()
+        self.engine = PivotEngine(left_bars, right_bars, min_prominence_pct)
+
+        # Righe dell'engine per tipo (ordinate per bar_index)
+        self._high_rows: list[int] = []
+        self._low_rows:  list[int] = []
+
+        # Eventi definitivi: tuple STRUCTURE_DTYPE + bar_index per la ricerca binaria
+        self._events:     list[tuple] = []
+        self._event_bars: list[int]   = []
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, **kwargs) -> "WeeklyStructureCache":
+        cache = cls(**kwargs)
+        cache.extend(df)
+        return cache
+
+    # ── alimentazione
+    def append(self, timestamp, open_: float, high: float, low: float,
+               close: float, volume: float = 0.0) -> None:
+        """Aggiunge una barra daily; alla chiusura di una settimana aggiorna pivot ed eventi."""
+        if self.weeks.append(timestamp, open_, high, low, close, volume):
+            self._close_week(self.weeks.n_weeks - 2)
+
+    def extend(self, df: pd.DataFrame) -> None:
+        volumes = df["volume"].values if "volume" in df.columns else np.ones(len(df))
+        for ts, o, h, l, c, v in zip(df.index, df["open"].values, df["high"].values,
+                                     df["low"].values, df["close"].values, volumes):
+            self.append(ts, o, h, l, c, v)
+
+    def _close_week(self, w: int) -> None:
+        _, high, low, _, volume = self.weeks.week_bar(w)
+        new   = self.engine.update(high, low, volume, pd.Timestamp(self.weeks.week_label(w)))
+        data  = self.engine.table.data        # vista: le label vengono scritte nell'engine
+        start = len(data) - len(new)
+
+        for row in range(start, len(data)):
+            rows = self._high_rows if data["is_high"][row] else self._low_rows
+            prev = data["price"][rows[-1]] if rows else None
+            data["label"][row] = _label_code(bool(data["is_high"][row]), data["price"][row], prev)
+            rows.append(row)
+
+        # Con w+1 settimane chiuse i pivot con indice < j sono tutti noti per j = w+1-R:
+        # l'evento sulla barra j non può più cambiare.
+        j = w + 1 - self.right_bars
+        if j >= 1 and self._high_rows and self._low_rows:
+            event = self._event_at(j, self.weeks.week_bar(j)[3],
+                                   data["price"][self._high_rows[-1]],
+                                   data["price"][self._low_rows[-1]],
+                                   self._last_direction(len(self._events)))
+            if event is not None:
+                self._events.append(event)
+                self._event_bars.append(j)
+
+    # ── lookup
+    def asof(self, day_index: int) -> dict:
+        """
+        Struttura weekly vista alla barra daily day_index.
+
+        Returns:
+            dict con trend (TrendState), structure (snapshot come
+            get_current_structure) e n_pivots
+        """
+        w    = self.weeks.week_of(day_index)
+        R    = self.right_bars
+        data = self.engine.table.data
+
+        # Pivot definitivi: bar_index <= w-1-R (finestra destra tutta in settimane chiuse)
+        n_prefix  = int(np.searchsorted(data["bar_index"], w - R, side="left"))
+        high_rows = self._high_rows[:bisect_left(self._high_rows, n_prefix)]
+        low_rows  = self._low_rows[:bisect_left(self._low_rows, n_prefix)]
+        peek      = self._peek_pivots(day_index, w, data, high_rows, low_rows)
+
+        # Livelli attivi per le barre non ancora stabili: l'ultimo pivot noto di ciascun tipo
+        level_high = _last_price(peek, True,  data, high_rows)
+        level_low  = _last_price(peek, False, data, low_rows)
+
+        n_stable = bisect_right(self._event_bars, w - R)
+        events   = []
+        if level_high is not None and level_low is not None:
+            direction = self._last_direction(n_stable)
+            for j in range(max(1, w - R + 1), w + 1):
+                close = self.weeks.week_bar(j)[3] if j < w else self.weeks.bar_asof(day_index)[3]
+                event = self._event_at(j, close, level_high, level_low, direction)
+                if event is not None:
+                    events.append(event)
+                    direction = 1 if EVENT_CODES[event[2]] in (StructureEvent.BOS_UP, StructureEvent.CHOCH_UP) else -1
+
+        # Tabella ridotta: basta la coda che copre gli ultimi 6 pivot e i penultimi high/low
+        start = n_prefix - 6
+        if len(high_rows) >= 2:
+            start = min(start, high_rows[-2])
+        if len(low_rows) >= 2:
+            start = min(start, low_rows[-2])
+        pivots = PivotTable(np.concatenate([data[max(start, 0):n_prefix], peek]))
+
+        last_event = events[-1:] or self._events[n_stable - 1:n_stable]
+        signals    = StructureTable(np.array(last_event, dtype=STRUCTURE_DTYPE), pivots)
+
+        n_pivots  = n_prefix + len(peek)
+        structure = get_current_structure(pivots, signals)
+        if len(pivots):
+            structure["n_pivots_total"]  = n_pivots
+            structure["n_signals_total"] = n_stable + len(events)
+
+        return {
+            "trend":     compute_trend_state(pivots),
+            "structure": structure,
+            "n_pivots":  n_pivots,
+        }
+
+    def _peek_pivots(self, day_index: int, w: int, data: np.ndarray,
+                     high_rows: list[int], low_rows: list[int]) -> np.ndarray:
+        """Pivot sulla barra w-R, confermato dalla settimana in corso (ancora parziale)."""
+        L, R = self.left_bars, self.right_bars
+        c    = w - R
+        if c < L:
+            return np.empty(0, dtype=PIVOT_DTYPE)
+
+        # Una barra in più a sinistra (se esiste) così il candidato non è il primo
+        # della finestra e la prominence usa il lato sinistro come nel batch.
+        s    = c - L - 1 if c > L else 0
+        bars = [self.weeks.week_bar(k) for k in range(s, w)] + [self.weeks.bar_asof(day_index)]
+        bars = np.array(bars, dtype=np.float64)
+        ts   = np.array([self.weeks.week_label(k) for k in range(s, w + 1)], dtype=np.int64)
+
+        table = compute_pivots(bars[:, 1], bars[:, 2], bars[:, 4], ts, L, R, self.min_prominence_pct)
+        peek  = table.data[table.data["bar_index"] == c - s].copy()
+        peek["bar_index"] += s
+
+        for row in range(len(peek)):
+            rows = high_rows if peek["is_high"][row] else low_rows
+            prev = data["price"][rows[-1]] if rows else None
+            peek["label"][row] = _label_code(bool(peek["is_high"][row]), peek["price"][row], prev)
+        return peek
+
+    def _last_direction(self, n_events: int) -> int:
+        if not n_events:
+            return 0
+        event = EVENT_CODES[self._events[n_events - 1][2]]
+        return 1 if event in (StructureEvent.BOS_UP, StructureEvent.CHOCH_UP) else -1
+
+    def _event_at(self, j: int, close: float, level_high: float, level_low: float,
+                  prev_dir: int) -> Optional[tuple]:
+        """Evento sulla barra weekly j: stessa regola di detect_structure_table (require_close=True)."""
+        if close > level_high:
+            code, level = (_CHOCH_UP if prev_dir < 0 else _BOS_UP), level_high
+        elif close < level_low:
+            code, level = (_CHOCH_DOWN if prev_dir > 0 else _BOS_DOWN), level_low
+        else:
+            return None
+
+        trend_before = _UPTREND if prev_dir > 0 else _DOWNTREND if prev_dir < 0 else _UNDEFINED
+        return (j, self.weeks.week_label(j), code, close, level, -1, trend_before, 1.0)
+
+
+def _label_code(is_high: bool, price: float, prev_price: Optional[float]) -> int:
+    """Label di un pivot rispetto al precedente dello stesso tipo (come classify_labels)."""
+    if prev_price is None:
+        return LABEL_NAMES.index("HH" if is_high else "HL")
+    if is_high:
+        return LABEL_NAMES.index("HH" if price > prev_price else "LH")
+    return LABEL_NAMES.index("HL" if price > prev_price else "LL")
+
+
+def _last_price(peek: np.ndarray, is_high: bool,
+                data: np.ndarray, rows: list[int]) -> Optional[float]:
+    """Prezzo dell'ultimo pivot del tipo richiesto: prima il peek, poi quelli definitivi."""
+    peek_rows = np.flatnonzero(peek["is_high"] == is_high)
+    if len(peek_rows):
+        return float(peek["price"][peek_rows[-1]])
+    return float(data["price"][rows[-1]]) if rows else None
+
+
 def mtf_structure_confluence(daily_df: pd.DataFrame,
-                              daily_pivots: list[Pivot],
-                              daily_signals: list[StructureSignal],
+                              daily_pivots: Union[PivotTable, list[Pivot]],
+                              daily_signals: Union[StructureTable, list[StructureSignal]],
                               left_bars_weekly: int = 3,
                               right_bars_weekly: int = 3,
-                              min_prom_weekly: float = 2.0) -> dict:
+                              min_prom_weekly: float = 2.0,
+                              weekly_cache: Optional[WeeklyStructureCache] = None) -> dict:
     """
     Analisi della struttura su due TF: daily e weekly.
     Restituisce un dizionario di confluenza.
@@ -437,35 +731,48 @@ def mtf_structure_confluence(daily_df: pd.DataFrame,
       - Trend daily  = segnale operativo
       - Confluenza LONG  = weekly UPTREND + daily UPTREND o CHoCH_UP
       - Confluenza SHORT = weekly DOWNTREND + daily DOWNTREND o CHoCH_DOWN
-    """
-    weekly_df     = resample_to_weekly(daily_df)
-    if "volume" not in weekly_df.columns:
-        weekly_df["volume"] = 1.0
-    weekly_df["volume_ratio"] = 1.0  # non rilevante su weekly
 
-    weekly_pivots  = find_pivots(weekly_df, left_bars_weekly, right_bars_weekly, min_prom_weekly)
-    weekly_pivots  = classify_pivots(weekly_pivots)
-    weekly_signals = detect_structure_events(weekly_df, weekly_pivots)
+    Con weekly_cache (costruita sull'intero storico daily) la parte weekly è
+    letta in O(1) alla barra len(daily_df)-1 invece di ricalcolare il resample:
+    è il percorso da usare nei backtest barra per barra.
+    """
+    daily_pivots  = _as_pivot_table(daily_pivots)
+    daily_signals = _as_structure_table(daily_signals)
+
+    if weekly_cache is not None:
+        weekly = weekly_cache.asof(len(daily_df) - 1)
+        weekly_trend, weekly_struct, weekly_n = weekly["trend"], weekly["structure"], weekly["n_pivots"]
+    else:
+        weekly_df     = resample_to_weekly(daily_df)
+        if "volume" not in weekly_df.columns:
+            weekly_df["volume"] = 1.0
+        weekly_df["volume_ratio"] = 1.0  # non rilevante su weekly
+
+        weekly_pivots  = classify_pivot_table(
+            pivot_table(weekly_df, left_bars_weekly, right_bars_weekly, min_prom_weekly))
+        weekly_signals = detect_structure_table(weekly_df, weekly_pivots)
+
+        weekly_trend  = compute_trend_state(weekly_pivots)
+        weekly_struct = get_current_structure(weekly_pivots, weekly_signals)
+        weekly_n      = len(weekly_pivots)
 
-    weekly_trend = compute_trend_state(weekly_pivots)
     daily_trend  = compute_trend_state(daily_pivots)
 
     # Ultimo segnale daily rilevante
-    last_daily_sig = daily_signals[-1] if daily_signals else None
+    last_daily_event = daily_signals.event(len(daily_signals) - 1) if len(daily_signals) else None
 
     # Confluenza
     long_confluence  = (
         weekly_trend == TrendState.UPTREND and
         (daily_trend == TrendState.UPTREND or
-         (last_daily_sig and last_daily_sig.event == StructureEvent.CHOCH_UP))
+         last_daily_event == StructureEvent.CHOCH_UP)
     )
     short_confluence = (
         weekly_trend == TrendState.DOWNTREND and
         (daily_trend == TrendState.DOWNTREND or
-         (last_daily_sig and last_daily_sig.event == StructureEvent.CHOCH_DOWN))
+         last_daily_event == StructureEvent.CHOCH_DOWN)
     )
 
-    weekly_struct = get_current_structure(weekly_pivots, weekly_signals)
     daily_struct  = get_current_structure(daily_pivots, daily_signals)
 
     return {
@@ -475,7 +782,7 @@ def mtf_structure_confluence(daily_df: pd.DataFrame,
         "short_confluence":  short_confluence,
         "weekly_structure":  weekly_struct,
         "daily_structure":   daily_struct,
-        "weekly_n_pivots":   len(weekly_pivots),
+        "weekly_n_pivots":   weekly_n,
         "daily_n_pivots":    len(daily_pivots),
     }
 
@@ -489,30 +796,34 @@ def analyze(df: pd.DataFrame,
             right_bars: int = 5,
             min_prominence_pct: float = 1.0,
             require_close: bool = True,
-            include_weekly: bool = True) -> dict:
+            include_weekly: bool = True,
+            weekly_cache: Optional[WeeklyStructureCache] = None) -> dict:
     """
     Pipeline completa su un singolo ticker.
 
     Args:
         df:  DataFrame OHLCV daily con DatetimeIndex e colonna volume_ratio
              (calcolata da indicators.compute_all)
+        weekly_cache: WeeklyStructureCache dell'intero storico (backtest):
+             la struttura weekly viene letta alla barra len(df)-1
 
     Returns:
-        Dizionario con pivots, signals, structure, mtf_confluence
+        Dizionario con pivots (PivotTable), signals (StructureTable),
+        structure, mtf. Per l'export usare result["pivots"].to_records()
+        e result["signals"].to_records().
     """
-    pivots  = find_pivots(df, left_bars, right_bars, min_prominence_pct)
-    pivots  = classify_pivots(pivots)
-    signals = detect_structure_events(df, pivots, require_close)
+    pivots  = classify_pivot_table(pivot_table(df, left_bars, right_bars, min_prominence_pct))
+    signals = detect_structure_table(df, pivots, require_close)
     current = get_current_structure(pivots, signals)
 
     result = {
-        "pivots":    [p.to_dict() for p in pivots],
-        "signals":   [s.to_dict() for s in signals],
+        "pivots":    pivots,
+        "signals":   signals,
         "structure": current,
     }
 
     if include_weekly and len(df) >= 30:
-        mtf = mtf_structure_confluence(df, pivots, signals)
+        mtf = mtf_structure_confluence(df, pivots, signals, weekly_cache=weekly_cache)
         result["mtf"] = mtf
 
     return result
@@ -148,7 +148,9 @@ def _sma(s: pd.Series, period: int) -> pd.Series:
     return s.rolling(window=period, min_periods=1).mean()
 
 
-def _rma(s: pd.Series, period: int) -> pd.Series:
+def _rma(s: pd.Series | pd.DataFrame, period: int) -> pd.Series | pd.DataFrame:
+    if isinstance(s, pd.DataFrame):
+        return _rma_wide(s, period)
     result = np.full(len(s), np.nan)
     vals = s.values
     alpha = 1.0 / period
@@ -166,52 +168,110 @@ def _rma(s: pd.Series, period: int) -> pd.Series:
     return pd.Series(result, index=s.index)
 
 
-def compute_indicators(df: pd.DataFrame, params: dict | None = None) -> pd.DataFrame:
+def _rma_wide(s: pd.DataFrame, period: int) -> pd.DataFrame:
+    # Same recursion as _rma, one time step at a time for all columns (tickers) at once
+    vals = s.to_numpy(dtype=float)
+    result = np.full(vals.shape, np.nan)
+    alpha = 1.0 / period
+    prev = np.full(vals.shape[1], np.nan)
+    for i in range(len(vals)):
+        x = vals[i]
+        step = np.where(np.isnan(x), prev, alpha * x + (1 - alpha) * prev)
+        prev = np.where(np.isnan(prev), x, step)
+        result[i] = prev
+    return pd.DataFrame(result, index=s.index, columns=s.columns)
+
+
+def _supertrend_direction(closes: np.ndarray, ur: np.ndarray, lr: np.ndarray) -> np.ndarray:
+    n = len(closes)
+    upper = np.zeros(n)
+    lower = np.zeros(n)
+    st_dir = np.zeros(n, dtype=int)
+
+    upper[0] = ur[0]
+    lower[0] = lr[0]
+    st_dir[0] = 1
+    for i in range(1, n):
+        upper[i] = ur[i] if ur[i] < upper[i - 1] or closes[i - 1] > upper[i - 1] else upper[i - 1]
+        lower[i] = lr[i] if lr[i] > lower[i - 1] or closes[i - 1] < lower[i - 1] else lower[i - 1]
+        if st_dir[i - 1] == 1:
+            st_dir[i] = 1 if closes[i] <= upper[i] else -1
+        else:
+            st_dir[i] = -1 if closes[i] >= lower[i] else 1
+    return st_dir
+
+
+def _supertrend_direction_wide(closes: np.ndarray, ur: np.ndarray, lr: np.ndarray) -> np.ndarray:
+    # 2-D (dates x tickers) version of _supertrend_direction; each column starts at its
+    # first valid band, rows before it stay NaN
+    n, k = closes.shape
+    upper = np.full(k, np.nan)
+    lower = np.full(k, np.nan)
+    st_dir = np.full((n, k), np.nan)
+    prev_dir = np.full(k, np.nan)
+    prev_c = np.full(k, np.nan)
+    for i in range(n):
+        started = ~np.isnan(upper)
+        up_i = np.where(started & ~(ur[i] < upper) & ~(prev_c > upper), upper, ur[i])
+        lo_i = np.where(started & ~(lr[i] > lower) & ~(prev_c < lower), lower, lr[i])
+        d = np.where(prev_dir == 1, np.where(closes[i] <= up_i, 1.0, -1.0),
+                     np.where(closes[i] >= lo_i, -1.0, 1.0))
+        d = np.where(np.isnan(prev_dir), 1.0, d)
+        valid = ~np.isnan(up_i)
+        st_dir[i] = np.where(valid, d, np.nan)
+        prev_dir = np.where(valid, d, prev_dir)
+        upper, lower = np.where(valid, up_i, upper), np.where(valid, lo_i, lower)
+        prev_c = np.where(valid, closes[i], prev_c)
+    return st_dir
+
+
+def indicator_columns(c, h, lo, v, params: dict | None = None) -> dict:
+    """
+    Indicator formulas shared by compute_indicators (one ticker, Series inputs)
+    and the universe panel (dates x tickers DataFrame inputs).
+    """
     p = _merge_dict(DEFAULT_INDICATOR_PARAMS, params or {})
-    df = df.copy()
-    c = df["close"]
-    h = df["high"]
-    lo = df["low"]
-    v = df["volume"]
-
-    df["ema10"] = _ema(c, p["ema_period"])
-    df["sma50"] = _sma(c, p["sma_fast"])
-    df["sma200"] = _sma(c, p["sma_slow"])
+    wide = isinstance(c, pd.DataFrame)
+    out = {}
+
+    out["ema10"] = _ema(c, p["ema_period"])
+    out["sma50"] = _sma(c, p["sma_fast"])
+    out["sma200"] = sma200 = _sma(c, p["sma_slow"])
     tp = (h + lo + c) / 3
     vol_sum = v.rolling(p["vwma_period"], min_periods=1).sum()
-    df["vwma"] = (tp * v).rolling(p["vwma_period"], min_periods=1).sum() / vol_sum.replace(0, np.nan)
-    df["pct_from_200"] = (c - df["sma200"]) / df["sma200"].replace(0, np.nan) * 100
+    out["vwma"] = (tp * v).rolling(p["vwma_period"], min_periods=1).sum() / vol_sum.replace(0, np.nan)
+    out["pct_from_200"] = (c - sma200) / sma200.replace(0, np.nan) * 100
 
     delta = c.diff()
     gain = delta.clip(lower=0)
     loss = (-delta).clip(lower=0)
-    df["rsi"] = 100 - (100 / (1 + _rma(gain, p["rsi_period"]) / _rma(loss, p["rsi_period"]).replace(0, np.nan)))
+    out["rsi"] = 100 - (100 / (1 + _rma(gain, p["rsi_period"]) / _rma(loss, p["rsi_period"]).replace(0, np.nan)))
 
     pc = c.diff()
     apc = pc.abs()
-    df["tsi"] = 100 * _ema(_ema(pc, p["tsi_long"]), p["tsi_short"]) / _ema(
+    out["tsi"] = tsi = 100 * _ema(_ema(pc, p["tsi_long"]), p["tsi_short"]) / _ema(
         _ema(apc, p["tsi_long"]), p["tsi_short"]
     ).replace(0, np.nan)
-    df["tsi_signal"] = _ema(df["tsi"], p["tsi_short"])
+    out["tsi_signal"] = _ema(tsi, p["tsi_short"])
 
-    df["macd"] = _ema(c, p["macd_fast"]) - _ema(c, p["macd_slow"])
-    df["macd_sig"] = _ema(df["macd"], p["macd_sig"])
-    df["macdh"] = df["macd"] - df["macd_sig"]
-    df["macdh_slope"] = df["macdh"].diff()
+    out["macd"] = macd = _ema(c, p["macd_fast"]) - _ema(c, p["macd_slow"])
+    out["macd_sig"] = macd_sig = _ema(macd, p["macd_sig"])
+    out["macdh"] = macdh = macd - macd_sig
+    out["macdh_slope"] = macdh.diff()
 
     bb_mid = _sma(c, p["bb_period"])
     bb_std_s = c.rolling(p["bb_period"], min_periods=1).std(ddof=0)
-    df["bb_mid"] = bb_mid
-    df["bb_upper"] = bb_mid + p["bb_std"] * bb_std_s
-    df["bb_lower"] = bb_mid - p["bb_std"] * bb_std_s
-    bb_w = (df["bb_upper"] - df["bb_lower"]).replace(0, np.nan)
-    df["bb_bw"] = bb_w / bb_mid.replace(0, np.nan) * 100
-    df["bb_pctb"] = (c - df["bb_lower"]) / bb_w
+    out["bb_mid"] = bb_mid
+    out["bb_upper"] = bb_upper = bb_mid + p["bb_std"] * bb_std_s
+    out["bb_lower"] = bb_lower = bb_mid - p["bb_std"] * bb_std_s
+    bb_w = (bb_upper - bb_lower).replace(0, np.nan)
+    out["bb_bw"] = bb_w / bb_mid.replace(0, np.nan) * 100
+    out["bb_pctb"] = (c - bb_lower) / bb_w
 
     prev_c = c.shift(1).fillna(c)
-    tr = pd.concat([h - lo, (h - prev_c).abs(), (lo - prev_c).abs()], axis=1).max(axis=1)
-    df["atr"] = _rma(tr, p["atr_period"])
-    df["atr_pct"] = df["atr"] / c * 100
+    tr = np.fmax(np.fmax(h - lo, (h - prev_c).abs()), (lo - prev_c).abs())
+    out["atr"] = atr = _rma(tr, p["atr_period"])
+    out["atr_pct"] = atr / c * 100
 
     up = h.diff().clip(lower=0)
     down = (-lo.diff()).clip(lower=0)
@@ -221,40 +281,32 @@ def compute_indicators(df: pd.DataFrame, params: dict | None = None) -> pd.DataF
     plus_di = 100 * _rma(plus_dm, p["adx_period"]) / atr_adx.replace(0, np.nan)
     minus_di = 100 * _rma(minus_dm, p["adx_period"]) / atr_adx.replace(0, np.nan)
     dx = 100 * (plus_di - minus_di).abs() / (plus_di + minus_di).replace(0, np.nan)
-    df["plus_di"] = plus_di
-    df["minus_di"] = minus_di
-    df["adx"] = _rma(dx, p["adx_period"])
+    out["plus_di"] = plus_di
+    out["minus_di"] = minus_di
+    out["adx"] = _rma(dx, p["adx_period"])
 
     net = (c - c.shift(p["er_period"])).abs()
     path = c.diff().abs().rolling(p["er_period"], min_periods=1).sum()
-    df["er"] = (net / path.replace(0, np.nan)).clip(0, 1)
+    out["er"] = (net / path.replace(0, np.nan)).clip(0, 1)
 
     hl2 = (h + lo) / 2
     atr_st = _rma(tr, p["st_period"])
     upper_raw = hl2 + p["st_multiplier"] * atr_st
     lower_raw = hl2 - p["st_multiplier"] * atr_st
 
-    n = len(df)
-    closes = c.values
-    ur = upper_raw.values
-    lr = lower_raw.values
-    upper = np.zeros(n)
-    lower = np.zeros(n)
-    st_dir = np.zeros(n, dtype=int)
-
-    upper[0] = ur[0]
-    lower[0] = lr[0]
-    st_dir[0] = 1
-    for i in range(1, n):
-        upper[i] = ur[i] if ur[i] < upper[i - 1] or closes[i - 1] > upper[i - 1] else upper[i - 1]
-        lower[i] = lr[i] if lr[i] > lower[i - 1] or closes[i - 1] < lower[i - 1] else lower[i - 1]
-        if st_dir[i - 1] == 1:
-            st_dir[i] = 1 if closes[i] <= upper[i] else -1
-        else:
-            st_dir[i] = -1 if closes[i] >= lower[i] else 1
+    if wide:
+        st_dir = _supertrend_direction_wide(c.to_numpy(dtype=float), upper_raw.to_numpy(), lower_raw.to_numpy())
+        out["st_dir"] = pd.DataFrame(st_dir, index=c.index, columns=c.columns)
+    else:
+        out["st_dir"] = _supertrend_direction(c.values, upper_raw.values, lower_raw.values)
+    return out
 
-    df["st_dir"] = st_dir
 
+def compute_indicators(df: pd.DataFrame, params: dict | None = None) -> pd.DataFrame:
+    df = df.copy()
+    columns = indicator_columns(df["close"], df["high"], df["low"], df["volume"], params)
+    for name, values in columns.items():
+        df[name] = values
     return df.ffill()
 
 
@@ -68,8 +68,9 @@ DEFAULT_TRADE = {
 # ──────────────────────────────────────────────────────────────────────────────
 # DATACLASS RISULTATO
 # ──────────────────────────────────────────────────────────────────────────────
+# slots=True: nessun __dict__ per istanza — nel backtest se ne creano migliaia.
 
-@dataclass
+@dataclass(slots=True)
 class SwingSignal:
     ticker:          str
     timestamp:       pd.Timestamp
@@ -576,6 +577,222 @@ def score_both_directions(ticker: str,
     return signals
 
 
+# ──────────────────────────────────────────────────────────────────────────────
+# SCORING VETTORIALE — tutte le barre (o tutti i ticker) in un passaggio
+# ──────────────────────────────────────────────────────────────────────────────
+# Stesse regole delle funzioni riga-per-riga sopra, espresse come operazioni
+# NumPy su colonne. Ogni riga del frame è una barra (backtest) oppure l'ultima
+# barra di un ticker (screener sull'universo). La struttura MTF, che nelle
+# versioni scalari è un dizionario, qui è un DataFrame di colonne allineato
+# alle righe (vedi mtf_columns).
+
+MTF_COLUMNS = {
+    "weekly_trend":      "UNDEFINED",
+    "daily_trend":       "UNDEFINED",
+    "long_confluence":   False,
+    "short_confluence":  False,
+    "last_event":        "",
+    "last_volume_ratio": 1.0,
+    "structure_intact":  False,
+}
+
+SCORE_BLOCKS = ("structure", "trend", "momentum", "volatility", "volume")
+
+
+def mtf_columns(mtfs: list, index=None) -> pd.DataFrame:
+    """
+    Converte una lista di dizionari mtf (uno per riga, None = assente)
+    nelle colonne MTF_COLUMNS usate dallo scoring vettoriale.
+    """
+    rows = []
+    for mtf in mtfs:
+        mtf   = mtf or {}
+        daily = mtf.get("daily_structure", {})
+        last  = daily.get("last_signal") or {}
+        rows.append((
+            mtf.get("weekly_trend", "UNDEFINED"),
+            mtf.get("daily_trend", "UNDEFINED"),
+            bool(mtf.get("long_confluence", False)),
+            bool(mtf.get("short_confluence", False)),
+            last.get("event", ""),
+            last.get("volume_ratio", 1.0) if last else 1.0,
+            bool(daily.get("structure_intact", False)),
+        ))
+    return pd.DataFrame(rows, columns=list(MTF_COLUMNS), index=index)
+
+
+def _column(frame, name: str, default: float) -> np.ndarray:
+    """Colonna come array float64 (equivalente vettoriale di row.get(name, default))."""
+    if name in frame:
+        return np.asarray(frame[name], dtype=np.float64)
+    return np.full(len(frame), default, dtype=np.float64)
+
+
+def _scale_vec(values: np.ndarray, lo: float, hi: float) -> np.ndarray:
+    if hi <= lo:
+        return np.full(len(values), 0.5)
+    return np.clip((values - lo) / (hi - lo), 0.0, 1.0)
+
+
+def _score_rsi_vec(rsi: np.ndarray, is_long: bool) -> np.ndarray:
+    if is_long:
+        return np.select([rsi < 30, rsi < 40, rsi <= 60, rsi <= 70], [0.3, 0.7, 1.0, 0.6], 0.2)
+    return np.select([rsi > 70, rsi > 60, rsi >= 40, rsi >= 30], [0.3, 0.7, 1.0, 0.6], 0.2)
+
+
+def score_structure_vec(mtf_cols: pd.DataFrame, direction: str) -> np.ndarray:
+    """score_structure() su tutte le righe di mtf_cols."""
+    is_long = direction == "LONG"
+    conf    = mtf_cols["long_confluence" if is_long else "short_confluence"].to_numpy(dtype=bool)
+    aligned = mtf_cols["daily_trend"].to_numpy() == ("UPTREND" if is_long else "DOWNTREND")
+    event   = mtf_cols["last_event"].to_numpy()
+    intact  = mtf_cols["structure_intact"].to_numpy(dtype=bool)
+    vol     = mtf_cols["last_volume_ratio"].to_numpy(dtype=np.float64)
+    choch, bos = ("CHoCH_UP", "BOS_UP") if is_long else ("CHoCH_DOWN", "BOS_DOWN")
+
+    score = np.where(conf, 40.0, np.where(aligned, 20.0, 0.0))
+    score = score + np.select([event == choch, event == bos], [30.0, 20.0], 0.0)
+    score = score + np.where(intact, 20.0, 0.0)
+    score = score + np.select([vol >= 1.5, vol >= 1.0], [10.0, 5.0], 0.0)
+    return np.minimum(score, 100.0)
+
+
+def score_trend_strength_vec(frame: pd.DataFrame, direction: str) -> np.ndarray:
+    """score_trend_strength() su tutte le righe di frame."""
+    bullish = -1 if direction == "LONG" else 1      # convenzione SuperTrend Pine v6
+
+    score = _scale_vec(_column(frame, "adx", 0), 15, 45) * 35
+    score = score + _scale_vec(_column(frame, "er", 0), 0.3, 0.8) * 25
+    score = score + np.where(_column(frame, "supertrend_direction", 0) == bullish, 25.0, 0.0)
+    score = score + _scale_vec(_column(frame, "linear_regression_r2", 0), 0.3, 0.9) * 15
+    return np.minimum(score, 100.0)
+
+
+def score_momentum_vec(frame: pd.DataFrame, direction: str) -> np.ndarray:
+    """score_momentum() su tutte le righe di frame."""
+    is_long = direction == "LONG"
+    tsi     = _column(frame, "tsi", 0)
+    tsi_s   = _column(frame, "tsi_signal", 0)
+    slope   = _column(frame, "macdh_slope", 0)
+    mfi     = _column(frame, "mfi", 50)
+
+    if is_long:
+        tsi_ok, tsi_gap = tsi > tsi_s, tsi - tsi_s
+        macd_ok, macd   = slope > 0, slope
+        mfi_s           = _scale_vec(mfi, 30, 70)
+    else:
+        tsi_ok, tsi_gap = tsi < tsi_s, tsi_s - tsi
+        macd_ok, macd   = slope < 0, -slope
+        mfi_s           = _scale_vec(70 - mfi, 0, 40)
+
+    score = _score_rsi_vec(_column(frame, "rsi", 50), is_long) * 30
+    score = score + np.where(tsi_ok, np.minimum(_scale_vec(tsi_gap, 0, 5) * 25, 25), 0.0)
+    score = score + np.where(macd_ok, np.minimum(_scale_vec(macd, 0, 0.5) * 25, 25), 0.0)
+    score = score + mfi_s * 20
+    return np.minimum(score, 100.0)
+
+
+def score_volatility_setup_vec(frame: pd.DataFrame, direction: str) -> np.ndarray:
+    """score_volatility_setup() su tutte le righe di frame."""
+    pct_b = _column(frame, "boll_pct_b", 0.5)
+    if direction == "LONG":
+        zone = np.select([(pct_b >= 0.2) & (pct_b <= 0.6), pct_b < 0.2], [50.0, 30.0], 10.0)
+    else:
+        zone = np.select([(pct_b >= 0.4) & (pct_b <= 0.8), pct_b > 0.8], [50.0, 30.0], 10.0)
+
+    score = _scale_vec(15 - _column(frame, "boll_bandwidth", 10), 0, 10) * 50
+    return np.minimum(score + zone, 100.0)
+
+
+def score_volume_vec(frame: pd.DataFrame) -> np.ndarray:
+    """score_volume() su tutte le righe di frame."""
+    return np.clip(_scale_vec(_column(frame, "volume_ratio", 1.0), 0.8, 2.0) * 100, 0, 100)
+
+
+def apply_filters_vec(frame: pd.DataFrame,
+                      mtf_cols: pd.DataFrame,
+                      direction: str,
+                      filters: dict = None) -> np.ndarray:
+    """
+    apply_filters() su tutte le righe: array bool dei filtri superati.
+    I messaggi di errore non vengono generati (servono solo per i segnali
+    finali, vedi apply_filters).
+    """
+    if filters is None:
+        filters = DEFAULT_FILTERS
+
+    is_long = direction == "LONG"
+    passed  = np.ones(len(frame), dtype=bool)
+
+    if filters.get("require_weekly_uptrend", True):
+        passed &= mtf_cols["weekly_trend"].to_numpy() == ("UPTREND" if is_long else "DOWNTREND")
+
+    if filters.get("require_above_200sma", True):
+        close  = _column(frame, "close", 0)
+        sma200 = _column(frame, "close_200_sma", 0)
+        passed &= ~(close < sma200) if is_long else ~(close > sma200)
+
+    passed &= ~(_column(frame, "adx", 0) < filters.get("require_adx_min", 20))
+
+    if filters.get("require_supertrend_bull", True):
+        passed &= _column(frame, "supertrend_direction", 0) == (-1 if is_long else 1)
+
+    if is_long:
+        passed &= ~(_column(frame, "pct_from_200sma", 0) > filters.get("max_pct_from_200sma", 25))
+
+    atr_pct = _column(frame, "atr_pct", 0)
+    passed &= ~(atr_pct < filters.get("min_atr_pct", 0.5))
+    passed &= ~(atr_pct > filters.get("max_atr_pct", 8))
+    return passed
+
+
+def score_matrix(frame: pd.DataFrame,
+                 mtf=None,
+                 weights: dict = None,
+                 filters: dict = None,
+                 directions: tuple = ("LONG", "SHORT")) -> pd.DataFrame:
+    """
+    Matrice dei punteggi per tutte le righe di frame e per entrambe le direzioni.
+
+    Args:
+        frame:  DataFrame con gli indicatori (una riga per barra o per ticker)
+        mtf:    DataFrame da mtf_columns() allineato a frame, oppure un singolo
+                dizionario mtf applicato a tutte le righe
+        weights, filters: come score_ticker()
+
+    Returns:
+        DataFrame con indice di frame e colonne MultiIndex (direction, campo):
+        i 5 sub-score, "total" (media pesata) e "passed" (filtri obbligatori).
+        Una riga con passed=True e total >= min_score corrisponde a un
+        segnale di score_ticker() sulla stessa barra.
+    """
+    if weights is None:
+        weights = DEFAULT_WEIGHTS
+    if mtf is None or isinstance(mtf, dict):
+        mtf = mtf_columns([mtf] * len(frame), frame.index)
+
+    volume  = score_volume_vec(frame)
+    columns = {}
+    for direction in directions:
+        sub = {
+            "structure":  score_structure_vec(mtf, direction),
+            "trend":      score_trend_strength_vec(frame, direction),
+            "momentum":   score_momentum_vec(frame, direction),
+            "volatility": score_volatility_setup_vec(frame, direction),
+            "volume":     volume,
+        }
+        total = 0
+        for k in SCORE_BLOCKS:
+            total = total + sub[k] * weights.get(k, 0)
+
+        for k in SCORE_BLOCKS:
+            columns[(direction, k)] = sub[k]
+        columns[(direction, "total")]  = total
+        columns[(direction, "passed")] = apply_filters_vec(frame, mtf, direction, filters)
+
+    return pd.DataFrame(columns, index=frame.index)
+
+
 # necessario per il type hint Optional
 from typing import Optional
 
@@ -16,10 +16,11 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from indicators      import compute_all
 from market_structure import analyze as analyze_structure
-from scoring         import score_both_directions, DEFAULT_FILTERS, DEFAULT_WEIGHTS, DEFAULT_TRADE
+from scoring         import DEFAULT_FILTERS, DEFAULT_WEIGHTS, DEFAULT_TRADE, score_both_directions
 from data_layer      import DataManager, load_config, generate_synthetic, SP500_SUBSET
 from backtest        import backtest_ticker, compute_stats, print_report, Trade, simulate_trade
 from optimized_engine import load_ticker_params, scan_ticker, backtest_ticker as backtest_ticker_opt, compute_stats as compute_stats_opt
+from universe_panel  import build_panel, scan_panel, score_panel
 from dashboard       import generate_dashboard
 
 OUTPUT_DIR = Path("output")
@@ -41,8 +42,9 @@ def run_scan(cfg, synthetic=False):
     print(f"  Ticker: {len(tickers)}  Score soglia: {min_score}")
     print(f"{'═'*58}\n")
 
+    # 1) dati di tutto l'universo
+    frames, params_by_ticker = {}, {}
     for i, tk in enumerate(tickers, 1):
-        print(f"[{i:3d}/{len(tickers)}] {tk:<7}", end=" ", flush=True)
         try:
             if synthetic:
                 df_raw = generate_synthetic(tk, n_bars=504, trend="up", seed=i)
@@ -51,50 +53,87 @@ def run_scan(cfg, synthetic=False):
             else:
                 df_raw = dm.get(tk)
             if df_raw is None or len(df_raw) < 252:
-                print("✗ dati insufficienti"); continue
+                print(f"[{i:3d}/{len(tickers)}] {tk:<7} ✗ dati insufficienti"); continue
+            frames[tk] = df_raw
+            if use_optimized:
+                params_by_ticker[tk] = load_ticker_params(tk, cfg.get("params_dir"))
+        except Exception as e:
+            print(f"[{i:3d}/{len(tickers)}] {tk:<7} ✗ {e}")
+
+    # 2) valutazione cross-sectional sull'ultima barra di tutti i ticker;
+    #    se il batch fallisce si ripiega sul singolo ticker, così un ticker
+    #    malformato non ferma la scansione (errore stampato solo per lui)
+    by_ticker, mtfs, errors = {}, {}, {}
+    if use_optimized and frames:
+        profiles = {tk: cfg.get("risk_profile") or p.get("risk_profile_default", "bilanciato")
+                    for tk, p in params_by_ticker.items()}
+        try:
+            panel = build_panel(frames, params_by_ticker)
+            for risk_profile in sorted(set(profiles.values())):
+                group = {tk: p for tk, p in params_by_ticker.items() if profiles[tk] == risk_profile}
+                for sig in scan_panel(panel, group, min_score=min_score, risk_profile=risk_profile):
+                    if sig["ticker"] in group:
+                        by_ticker.setdefault(sig["ticker"], []).append(sig)
+        except Exception as e:
+            print(f"  pannello non disponibile ({e}): scansione per ticker\n")
+            by_ticker = {}
+            for tk, df_raw in frames.items():
+                try:
+                    by_ticker[tk] = scan_ticker(tk, df_raw, params=params_by_ticker[tk],
+                                                min_score=min_score, risk_profile=profiles[tk])
+                except Exception as e:
+                    errors[tk] = e
+    elif frames:
+        dfs = {}
+        for tk, df_raw in frames.items():
+            try:
+                dfs[tk]  = compute_all(df_raw)
+                mtfs[tk] = analyze_structure(dfs[tk], include_weekly=True).get("mtf", {})
+            except Exception as e:
+                errors[tk] = e
+        score_kw = dict(weights=cfg.get("weights", DEFAULT_WEIGHTS),
+                        filters=cfg.get("filters", DEFAULT_FILTERS),
+                        trade_params=cfg.get("trade", DEFAULT_TRADE))
+        try:
+            for sig in score_panel(dfs, mtfs, min_score=min_score, **score_kw):
+                by_ticker.setdefault(sig.ticker, []).append(sig)
+        except Exception as e:
+            print(f"  scoring batch non disponibile ({e}): scoring per ticker\n")
+            by_ticker = {}
+            for tk in dfs:
+                if not mtfs.get(tk):
+                    continue
+                try:
+                    by_ticker[tk] = score_both_directions(tk, dfs[tk], mtfs[tk],
+                                                          min_score=min_score, **score_kw)
+                except Exception as e:
+                    errors[tk] = e
 
+    for i, tk in enumerate(tickers, 1):
+        if tk not in frames:
+            continue
+        print(f"[{i:3d}/{len(tickers)}] {tk:<7}", end=" ", flush=True)
+        sigs = by_ticker.get(tk, [])
+        if tk in errors:
+            print(f"✗ {errors[tk]}")
+        elif not use_optimized and not mtfs.get(tk):
+            print("✗ MTF non disponibile")
+        elif sigs:
             if use_optimized:
-                params = load_ticker_params(tk, cfg.get("params_dir"))
-                risk_profile = cfg.get("risk_profile") or params.get("risk_profile_default", "bilanciato")
-                sigs = scan_ticker(
-                    tk,
-                    df_raw,
-                    params=params,
-                    min_score=min_score,
-                    risk_profile=risk_profile,
-                )
+                for s in sigs: signals.append(s)
+                best = max(sigs, key=lambda s: float(s.get("score", 0)))
+                print(f"🟢 LONG  score={float(best.get('score',0)):.0f}  "
+                      f"ADX={float(best.get('adx',0)):.0f}  RSI={float(best.get('rsi',0)):.0f}  "
+                      f"RR={float(best.get('risk_reward',0)):.2f}  [{best.get('structure_event') or '—'}]")
             else:
-                df      = compute_all(df_raw)
-                result  = analyze_structure(df, include_weekly=True)
-                mtf     = result.get("mtf", {})
-                if not mtf:
-                    print("✗ MTF non disponibile"); continue
-
-                sigs = score_both_directions(
-                    tk, df, mtf,
-                    weights=cfg.get("weights", DEFAULT_WEIGHTS),
-                    filters=cfg.get("filters", DEFAULT_FILTERS),
-                    trade_params=cfg.get("trade", DEFAULT_TRADE),
-                    min_score=min_score,
-                )
-            if sigs:
-                if use_optimized:
-                    for s in sigs: signals.append(s)
-                    best = max(sigs, key=lambda s: float(s.get("score", 0)))
-                    print(f"🟢 LONG  score={float(best.get('score',0)):.0f}  "
-                          f"ADX={float(best.get('adx',0)):.0f}  RSI={float(best.get('rsi',0)):.0f}  "
-                          f"RR={float(best.get('risk_reward',0)):.2f}  [{best.get('structure_event') or '—'}]")
-                else:
-                    for s in sigs: signals.append(s.to_dict())
-                    best = max(sigs, key=lambda s: s.score)
-                    ic   = "🟢" if best.direction == "LONG" else "🔴"
-                    print(f"{ic} {best.direction:<5} score={best.score:.0f}  "
-                          f"ADX={best.adx:.0f}  RSI={best.rsi:.0f}  "
-                          f"RR={best.risk_reward:.2f}  [{best.structure_event or '—'}]")
-            else:
-                print("—")
-        except Exception as e:
-            print(f"✗ {e}")
+                for s in sigs: signals.append(s.to_dict())
+                best = max(sigs, key=lambda s: s.score)
+                ic   = "🟢" if best.direction == "LONG" else "🔴"
+                print(f"{ic} {best.direction:<5} score={best.score:.0f}  "
+                      f"ADX={best.adx:.0f}  RSI={best.rsi:.0f}  "
+                      f"RR={best.risk_reward:.2f}  [{best.structure_event or '—'}]")
+        else:
+            print("—")
 
     signals.sort(key=lambda s: s["score"], reverse=True)
 
@@ -0,0 +1,383 @@
+"""
+universe_panel.py
+─────────────────
+Pannello dati dell'universo: tickers × date × campi in un unico array float64
+3-D (NaN dove il ticker non ha dati), con le date allineate sull'unione dei
+calendari.
+
+Invece di calcolare indicatori e segnali ticker per ticker senza conservare
+nulla, lo screener riempie il pannello in batch e valuta l'ultima barra di
+tutti i ticker in un passaggio NumPy:
+  - compute_indicators_panel  → stesse formule di optimized_engine.compute_indicators
+                                calcolate su DataFrame date × ticker
+  - scan_panel                → scan_ticker() cross-sectional
+  - score_panel               → score_both_directions() cross-sectional (motore legacy)
+  - percentile_scores / sector_relative → ranking e filtri relativi al settore
+
+Uso:
+  panel   = build_panel({tk: df_raw for tk in tickers})
+  signals = scan_panel(panel, params_by_ticker, min_score=65, risk_profile="bilanciato")
+  ranks   = percentile_scores(panel.cross_section(), ["er", "adx"], by_sector=True)
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from data_layer       import SP500_SUBSET
+from optimized_engine import (DEFAULT_RISK_PROFILES, DEFAULT_SIGNAL_PARAMS, DEFAULT_SIGNAL_SCORES,
+                              DEFAULT_WARMUP, SignalResult, indicator_columns)
+from scoring          import (DEFAULT_FILTERS, DEFAULT_TRADE, DEFAULT_WEIGHTS,
+                              mtf_columns, score_matrix, score_ticker)
+
+
+OHLCV_FIELDS = ["open", "high", "low", "close", "volume"]
+
+SECTOR_OF = {t: sector for sector, tickers in SP500_SUBSET.items() for t in tickers}
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# PANNELLO
+# ──────────────────────────────────────────────────────────────────────────────
+
+class UniversePanel:
+    """
+    values[t, d, f] = campo f del ticker t alla data d.
+
+    Esempio:
+        panel = UniversePanel.from_frames({"AAPL": df_aapl, "MSFT": df_msft})
+        panel.wide("close")          # DataFrame date × ticker
+        panel.cross_section()        # DataFrame ticker × campi (ultima barra di ciascuno)
+    """
+
+    __slots__ = ("tickers", "dates", "fields", "values", "sectors")
+
+    def __init__(self, tickers: list, dates: pd.DatetimeIndex, fields: list,
+                 values: np.ndarray, sectors: dict = None):
+        self.tickers = list(tickers)
+        self.dates   = dates
+        self.fields  = list(fields)
+        self.values  = values
+        sectors      = SECTOR_OF if sectors is None else sectors
+        self.sectors = np.array([sectors.get(t, "Other") for t in self.tickers], dtype=object)
+
+    def __repr__(self) -> str:
+        return f"UniversePanel(tickers={len(self.tickers)}, dates={len(self.dates)}, fields={len(self.fields)})"
+
+    @classmethod
+    def from_frames(cls, frames: dict, fields: list = None, sectors: dict = None) -> "UniversePanel":
+        """Allinea i DataFrame per ticker (indice = date) sull'unione delle date."""
+        frames = {t: df for t, df in frames.items() if df is not None and len(df)}
+        if fields is None:
+            fields = [c for c in next(iter(frames.values())).columns] if frames else list(OHLCV_FIELDS)
+        dates = pd.DatetimeIndex(sorted(set().union(*(df.index for df in frames.values()))))
+
+        values = np.full((len(frames), len(dates), len(fields)), np.nan)
+        for k, df in enumerate(frames.values()):
+            aligned   = df.reindex(index=dates, columns=fields)
+            values[k] = aligned.to_numpy(dtype=np.float64, na_value=np.nan)
+        return cls(list(frames), dates, fields, values, sectors)
+
+    @classmethod
+    def from_wide(cls, wide: dict, sectors: dict = None) -> "UniversePanel":
+        """Da {campo: DataFrame date × ticker} (tutti con stessi indice e colonne)."""
+        first  = next(iter(wide.values()))
+        values = np.stack([np.asarray(w, dtype=np.float64) for w in wide.values()], axis=-1)
+        return cls(list(first.columns), first.index, list(wide), values.transpose(1, 0, 2), sectors)
+
+    # ── accesso
+    def field(self, name: str) -> np.ndarray:
+        """Matrice ticker × date del campo."""
+        return self.values[:, :, self.fields.index(name)]
+
+    def wide(self, name: str) -> pd.DataFrame:
+        """Campo come DataFrame date × ticker."""
+        return pd.DataFrame(self.field(name).T, index=self.dates, columns=self.tickers)
+
+    def frame(self, ticker: str) -> pd.DataFrame:
+        """DataFrame del singolo ticker (solo le date in cui ha dati)."""
+        df = pd.DataFrame(self.values[self.tickers.index(ticker)], index=self.dates, columns=self.fields)
+        return df[~np.isnan(df["close"].to_numpy())] if "close" in self.fields else df
+
+    def with_fields(self, extra: dict) -> "UniversePanel":
+        """Nuovo pannello con i campi aggiunti ({nome: matrice ticker × date})."""
+        names  = [n for n in extra if n not in self.fields]
+        values = np.concatenate([self.values] + [np.asarray(extra[n], dtype=np.float64)[:, :, None] for n in names], axis=2)
+        for n in extra:
+            if n in self.fields:
+                values[:, :, self.fields.index(n)] = extra[n]
+        out = UniversePanel(self.tickers, self.dates, self.fields + names, values)
+        out.sectors = self.sectors
+        return out
+
+    # ── sezioni trasversali
+    def n_bars(self) -> np.ndarray:
+        """Numero di barre con close valido per ticker."""
+        return (~np.isnan(self.field("close"))).sum(axis=1)
+
+    def last_index(self, offset: int = 0) -> np.ndarray:
+        """
+        Indice (in dates) dell'ultima barra con close valido per ticker (-1 se nessuna).
+        offset=1 → la barra valida precedente (salta le date mancanti del ticker).
+        """
+        valid  = ~np.isnan(self.field("close"))
+        target = valid.sum(axis=1) - offset
+        hit    = valid & (valid.cumsum(axis=1) == target[:, None])
+        return np.where(target > 0, np.argmax(hit, axis=1), -1)
+
+    def cross_section(self, date=None, offset: int = 0) -> pd.DataFrame:
+        """
+        DataFrame ticker × campi.
+        date=None → ultima barra valida di ciascun ticker (offset=1 → la precedente).
+        """
+        if date is None:
+            idx  = self.last_index(offset)
+            rows = self.values[np.arange(len(self.tickers)), np.maximum(idx, 0)]
+            rows[idx < 0] = np.nan
+        else:
+            rows = self.values[:, self.dates.get_loc(pd.Timestamp(date)) - offset]
+        cs = pd.DataFrame(rows, index=pd.Index(self.tickers, name="ticker"), columns=self.fields)
+        return cs
+
+    def to_long(self) -> pd.DataFrame:
+        """Formato lungo colonnare: ticker, date, campi (solo righe con close valido)."""
+        t, d  = np.meshgrid(np.arange(len(self.tickers)), np.arange(len(self.dates)), indexing="ij")
+        flat  = self.values.reshape(-1, len(self.fields))
+        long  = pd.DataFrame(flat, columns=self.fields)
+        long.insert(0, "date",   self.dates.values[d.ravel()])
+        long.insert(0, "ticker", np.array(self.tickers, dtype=object)[t.ravel()])
+        if "close" in self.fields:
+            long = long[~np.isnan(long["close"].to_numpy())]
+        return long.reset_index(drop=True)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# INDICATORI IN BATCH
+# ──────────────────────────────────────────────────────────────────────────────
+
+def compute_indicators_panel(panel: UniversePanel, params: dict = None) -> UniversePanel:
+    """
+    optimized_engine.compute_indicators su tutti i ticker del pannello in una
+    sola passata: le formule girano su DataFrame date × ticker e le ricorsioni
+    (RMA, SuperTrend) avanzano di una data per volta su tutti i ticker insieme.
+    Per ticker con storici di lunghezza diversa il risultato coincide con il
+    calcolo per singolo ticker (le date iniziali mancanti restano NaN).
+    I ticker con date mancanti dentro il proprio storico (date che altri ticker
+    hanno) vengono ricalcolati sulle sole barre proprie: sul calendario unione
+    la riga NaN altererebbe rolling/diff/ricorsioni di tutte le barre successive.
+    """
+    c, h, lo, v = (panel.wide(f) for f in ("close", "high", "low", "volume"))
+    columns = indicator_columns(c, h, lo, v, params)
+
+    # ffill per ticker solo dentro il suo storico (prima → ultima barra valida),
+    # come compute_indicators sul DataFrame del singolo ticker
+    valid = c.notna()
+    span  = valid.cummax() & valid[::-1].cummax()[::-1]
+    extra = {name: w.ffill().where(span).to_numpy().T for name, w in columns.items()}
+
+    gapped = np.flatnonzero((span & ~valid).any().to_numpy())
+    if len(gapped):
+        extra = {name: values.copy() for name, values in extra.items()}  # viste read-only
+    for k in gapped:
+        rows = valid.iloc[:, k].to_numpy()
+        own  = indicator_columns(*(w.iloc[rows, [k]] for w in (c, h, lo, v)), params)
+        for name, w in own.items():
+            extra[name][k]       = np.nan
+            extra[name][k, rows] = w.ffill().to_numpy()[:, 0]
+    return panel.with_fields(extra)
+
+
+def _params_key(params: dict) -> str:
+    return json.dumps(params.get("indicators", {}), sort_keys=True)
+
+
+def build_panel(frames: dict, params_by_ticker: dict = None, sectors: dict = None) -> UniversePanel:
+    """
+    Pannello OHLCV + indicatori. I ticker con gli stessi parametri indicatori
+    vengono calcolati insieme (un batch per set di parametri).
+    """
+    params_by_ticker = params_by_ticker or {}
+    panel  = UniversePanel.from_frames({t: df[OHLCV_FIELDS] for t, df in frames.items()
+                                        if df is not None and len(df)}, OHLCV_FIELDS, sectors)
+    groups = {}
+    for t in panel.tickers:
+        params = params_by_ticker.get(t, {})
+        groups.setdefault(_params_key(params), (params.get("indicators"), []))[1].append(t)
+
+    if len(groups) == 1:
+        ind_params, _ = next(iter(groups.values()))
+        return compute_indicators_panel(panel, ind_params)
+
+    parts = []
+    for ind_params, tickers in groups.values():
+        sub = UniversePanel(tickers, panel.dates, panel.fields,
+                            panel.values[[panel.tickers.index(t) for t in tickers]])
+        parts.append(compute_indicators_panel(sub, ind_params))
+    order  = [t for part in parts for t in part.tickers]
+    merged = UniversePanel(order, panel.dates, parts[0].fields,
+                           np.concatenate([part.values for part in parts]), sectors)
+    return UniversePanel(panel.tickers, panel.dates, merged.fields,
+                         merged.values[[order.index(t) for t in panel.tickers]], sectors)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# SCAN CROSS-SECTIONAL (motore ottimizzato)
+# ──────────────────────────────────────────────────────────────────────────────
+
+def _param_column(params_list: list, section: str, key: str, default: dict) -> np.ndarray:
+    return np.array([float(p.get(section, default).get(key, default[key])) for p in params_list])
+
+
+def detect_signal_types(cs: pd.DataFrame, prev: pd.DataFrame, params_list: list) -> np.ndarray:
+    """
+    optimized_engine._detect_signal_type su tutte le righe (ticker) insieme.
+    cs/prev = sezione trasversale all'ultima barra e a quella precedente;
+    params_list = parametri per ticker (stesso ordine delle righe).
+    Restituisce un array di "TF"/"CP"/"MOM"/"MR"/"".
+    """
+    p    = {k: _param_column(params_list, "signals", k, DEFAULT_SIGNAL_PARAMS)
+            for k in ("mer", "madx", "mbw", "merc", "rsi_mr", "pb_mr")}
+    col  = lambda name: cs[name].to_numpy(dtype=np.float64)
+    st   = col("st_dir")
+    bull = st == -1
+
+    tsi_x = (col("tsi") > col("tsi_signal")) & (prev["tsi"].to_numpy() <= prev["tsi_signal"].to_numpy())
+    tf  = (col("er") >= p["mer"]) & (col("adx") >= p["madx"]) & (col("plus_di") > col("minus_di")) & bull
+    cp  = (col("bb_bw") <= p["mbw"]) & (col("er") >= p["merc"]) & bull & (col("adx") >= p["madx"] - 2)
+    mom = tsi_x & (col("macdh_slope") > 0) & bull & (col("close") > col("sma50")) & (col("adx") > 12)
+    mr  = (col("rsi") < p["rsi_mr"]) & (col("bb_pctb") < p["pb_mr"]) & (col("close") > col("sma200")) & bull
+    return np.select([tf, cp, mom, mr], ["TF", "CP", "MOM", "MR"], "")
+
+
+def scan_panel(panel: UniversePanel,
+               params_by_ticker: dict,
+               min_score: float,
+               risk_profile: str) -> list[dict]:
+    """
+    optimized_engine.scan_ticker valutato sull'ultima barra di tutti i ticker
+    del pannello (già passato da build_panel). Stesso output di scan_ticker,
+    concatenato nell'ordine dei ticker.
+    """
+    params_list = [params_by_ticker.get(t, {}) for t in panel.tickers]
+    cs     = panel.cross_section()
+    prev   = panel.cross_section(offset=1)
+    n_bars = panel.n_bars()
+    last   = panel.last_index()
+    warmup = np.array([p.get("warmup", DEFAULT_WARMUP) for p in params_list])
+    stypes = detect_signal_types(cs, prev, params_list)
+    stypes[(n_bars - 1 < warmup) | (n_bars < 2)] = ""
+
+    signals = []
+    for k, ticker in enumerate(panel.tickers):
+        stype = stypes[k]
+        if not stype:
+            continue
+        params = params_list[k]
+        score  = float(params.get("signal_scores", DEFAULT_SIGNAL_SCORES).get(stype, 0.0))
+        if score < min_score:
+            continue
+
+        risk_profiles = params.get("risk_profiles", DEFAULT_RISK_PROFILES)
+        risk_map = risk_profiles.get(risk_profile, risk_profiles.get(params.get("risk_profile_default", "bilanciato"), {}))
+        if risk_map.get(stype, 0) <= 0:
+            continue
+
+        row   = cs.iloc[k]
+        sp    = params.get("signals", DEFAULT_SIGNAL_PARAMS)
+        entry = float(row["close"])
+        atr   = max(float(row["atr"]), 1e-8)
+        sl_u, t1_u, t2_u = ((sp["sl_mr"], sp["t1_mr"], sp["t2_mr"]) if stype == "MR"
+                            else (sp["sl"], sp["t1"], sp["t2"]))
+        stop_p, tp1, tp2 = entry - sl_u * atr, entry + t1_u * atr, entry + t2_u * atr
+        rr = (tp1 - entry) / max(entry - stop_p, 1e-8)
+
+        signals.append(SignalResult(
+            ticker=ticker,
+            timestamp=panel.dates[last[k]],
+            signal_type=stype,
+            entry_price=entry,
+            stop_loss=stop_p,
+            target1=tp1,
+            target2=tp2,
+            atr_pct=float(row["atr_pct"]),
+            adx=float(row["adx"]),
+            rsi=float(row["rsi"]),
+            risk_reward=float(rr),
+            score=score,
+        ).to_dict())
+    return signals
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# SCORING CROSS-SECTIONAL (motore legacy: indicators + market_structure)
+# ──────────────────────────────────────────────────────────────────────────────
+
+def score_panel(frames: dict,
+                mtfs: dict,
+                min_score: float = 60.0,
+                weights: dict = None,
+                filters: dict = None,
+                trade_params: dict = None) -> list:
+    """
+    score_both_directions() per tutti i ticker: la matrice dei punteggi è
+    calcolata in un passaggio sull'ultima barra di ciascun ticker e gli
+    SwingSignal vengono costruiti solo dove soglia e filtri sono superati.
+
+    Args:
+        frames: {ticker: DataFrame indicatori (indicators.compute_all)}
+        mtfs:   {ticker: dict mtf da market_structure.analyze()}
+    """
+    tickers = [t for t in frames if mtfs.get(t) and len(frames[t]) >= 50]
+    if not tickers:
+        return []
+    last   = pd.DataFrame([frames[t].iloc[-1] for t in tickers], index=pd.Index(tickers, name="ticker"))
+    matrix = score_matrix(last, mtf_columns([mtfs[t] for t in tickers], last.index),
+                          weights=weights or DEFAULT_WEIGHTS, filters=filters or DEFAULT_FILTERS)
+
+    signals = []
+    for t in tickers:
+        for direction in ("LONG", "SHORT"):
+            if not matrix.at[t, (direction, "passed")] or matrix.at[t, (direction, "total")] < min_score:
+                continue
+            sig = score_ticker(t, frames[t], mtfs[t], direction=direction,
+                               weights=weights or DEFAULT_WEIGHTS,
+                               filters=filters or DEFAULT_FILTERS,
+                               trade_params=trade_params or DEFAULT_TRADE,
+                               min_score=min_score)
+            if sig is not None:
+                signals.append(sig)
+    return signals
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# RANKING E FILTRI RELATIVI
+# ──────────────────────────────────────────────────────────────────────────────
+
+def percentile_scores(cs: pd.DataFrame, fields: list, sectors=None, by_sector: bool = False) -> pd.DataFrame:
+    """
+    Percentile 0-100 di ciascun campo nella sezione trasversale (NaN esclusi),
+    sull'intero universo o all'interno del settore.
+    """
+    values = cs[fields]
+    if not by_sector:
+        return values.rank(pct=True) * 100
+    groups = _sector_labels(cs, sectors)
+    return values.groupby(groups).rank(pct=True) * 100
+
+
+def sector_relative(cs: pd.DataFrame, fields: list, sectors=None) -> pd.DataFrame:
+    """Scarto di ciascun campo dalla mediana del proprio settore."""
+    values = cs[fields]
+    groups = _sector_labels(cs, sectors)
+    return values - values.groupby(groups).transform("median")
+
+
+def _sector_labels(cs: pd.DataFrame, sectors) -> np.ndarray:
+    if sectors is None:
+        return np.array([SECTOR_OF.get(t, "Other") for t in cs.index], dtype=object)
+    return np.asarray(sectors, dtype=object)
@@ -0,0 +1,192 @@
+"""
+Test Suite - Chart Data
+Verifica il downsampling dei grafici (LTTB, barre OHLC aggregate), la
+codifica float32/base64 dei typed array e il volume in float64 nel report
+"""
+
+import base64
+import json
+import re
+import sys
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from tradingagents.dataflows.multi_timeframe import MultiTimeframeData, TimeframeData
+from tradingagents.dataflows.report_generator import ReportGenerator
+from tradingagents.utils.chart_data import (
+    downsample_ohlc,
+    encode_f32,
+    epoch_ms,
+    lttb_indices,
+    typed_array,
+)
+
+
+def _ohlcv(n: int, seed: int = 0, volume: float = 1_000_000) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.standard_normal(n).cumsum()
+    spread = rng.uniform(0.5, 2.0, n)
+    return pd.DataFrame({
+        "date": pd.bdate_range("2005-01-03", periods=n),
+        "open": close + rng.uniform(-1, 1, n),
+        "high": close + spread,
+        "low": close - spread,
+        "close": close,
+        "volume": volume + rng.integers(0, 1000, n),
+    })
+
+
+def _decode(array) -> np.ndarray:
+    """Typed array di plotly ({"dtype", "bdata"}) come numpy"""
+    return np.frombuffer(base64.b64decode(array["bdata"]), dtype="<" + array["dtype"])
+
+
+def test_lttb():
+    """Test 1: LTTB tiene primo/ultimo punto e al massimo threshold punti"""
+    print("\n" + "="*70)
+    print("TEST 1: LTTB")
+    print("="*70)
+
+    rng = np.random.default_rng(1)
+    y = rng.standard_normal(5000).cumsum()
+    y[2345] += 500  # picco isolato
+    for threshold in (3, 50, 400, 4999):
+        idx = lttb_indices(y, threshold)
+        assert len(idx) <= threshold, (threshold, len(idx))
+        assert idx[0] == 0 and idx[-1] == len(y) - 1
+        assert np.all(np.diff(idx) > 0)
+    assert 2345 in lttb_indices(y, 400)
+    print("✓ 3/50/400/4999 punti: primo e ultimo inclusi, indici crescenti, picco tenuto")
+
+    x = np.cumsum(rng.uniform(1, 3, 5000))
+    idx = lttb_indices(y, 200, x=x)
+    assert len(idx) == 200 and idx[0] == 0 and idx[-1] == 4999
+    print("✓ ascisse non uniformi")
+
+    assert np.array_equal(lttb_indices(y[:100], 400), np.arange(100))
+    assert np.array_equal(lttb_indices(y[:100], 2), np.arange(100))
+    print("✓ serie già corta (o threshold < 3): tutti gli indici")
+
+    print("\n✅ LTTB: PASSED")
+
+
+def test_ohlc_aggregation():
+    """Test 2: le barre aggregate conservano massimi e minimi del bucket"""
+    print("\n" + "="*70)
+    print("TEST 2: Aggregazione OHLC")
+    print("="*70)
+
+    df = _ohlcv(5000)
+    df["adx"] = np.linspace(10, 40, len(df))
+    out = downsample_ohlc(df, 400)
+    assert len(out) == 400, len(out)
+
+    buckets = np.arange(len(df)) * 400 // len(df)
+    for b in (0, 137, 399):
+        rows = df[buckets == b]
+        bar = out.iloc[b]
+        assert bar["high"] == rows["high"].max() and bar["low"] == rows["low"].min()
+        assert bar["open"] == rows["open"].iloc[0] and bar["close"] == rows["close"].iloc[-1]
+        assert bar["volume"] == rows["volume"].sum()
+        assert bar["date"] == rows["date"].iloc[0] and bar["adx"] == rows["adx"].iloc[-1]
+    assert out["high"].max() == df["high"].max() and out["low"].min() == df["low"].min()
+    print("✓ 5000 -> 400 barre: open first, high max, low min, close last, volume sum")
+    print("✓ massimo e minimo assoluti ancora visibili")
+
+    short = df.tail(300)
+    assert downsample_ohlc(short, 400) is short
+    print("✓ serie già corta: DataFrame invariato")
+
+    print("\n✅ OHLC AGGREGATION: PASSED")
+
+
+def test_f32_round_trip():
+    """Test 3: base64 float32 little-endian, NaN come punto mancante"""
+    print("\n" + "="*70)
+    print("TEST 3: Round-trip float32/base64")
+    print("="*70)
+
+    values = np.array([101.25, -3.5, np.nan, 1e-3, 4321.123456, 0.0])
+    decoded = np.frombuffer(base64.b64decode(encode_f32(values)), dtype="<f4")
+    assert np.array_equal(decoded, values.astype(np.float32), equal_nan=True)
+    assert np.isnan(decoded[2])
+    print("✓ valori identici al cast float32, NaN preservato")
+
+    array = typed_array(pd.Series(values))
+    assert array["dtype"] == "f4"
+    assert np.array_equal(_decode(array), decoded, equal_nan=True)
+    print("✓ typed_array: {'dtype': 'f4', 'bdata': ...}")
+
+    ms = epoch_ms(pd.Series(pd.to_datetime(["2024-01-02", "2024-01-03"]).tz_localize("UTC")))
+    assert ms.dtype == np.float64 and ms[1] - ms[0] == 86_400_000
+    assert ms[0] == pd.Timestamp("2024-01-02").value // 1_000_000
+    print("✓ epoch_ms: millisecondi float64, fuso orario rimosso")
+
+    print("\n✅ F32 ROUND-TRIP: PASSED")
+
+
+def test_report_volume_float64():
+    """Test 4: nel grafico del report il volume resta esatto (float64)"""
+    print("\n" + "="*70)
+    print("TEST 4: Volume float64 nel report")
+    print("="*70)
+
+    df = _ohlcv(1000, volume=123_456_789)
+    daily = TimeframeData("XYZ", "daily", df, {"adx": pd.Series(np.linspace(10, 40, len(df)))},
+                          datetime.now())
+    mtf = MultiTimeframeData("XYZ", daily, daily, datetime.now())
+
+    def traces(generator):
+        html = generator._create_chart(mtf, "XYZ")
+        fig = json.loads(re.search(r">(\{.*\})</script>", html, re.S).group(1).replace("<\\/", "</"))
+        return {t["type"]: t for t in fig["data"]}
+
+    data = traces(ReportGenerator())
+    volume = _decode(data["bar"]["y"])
+    assert data["bar"]["y"]["dtype"] == "f8"
+    assert np.array_equal(volume, df["volume"].tail(60).to_numpy(dtype=float))
+    assert np.float32(volume[0]) != volume[0]  # float32 arrotonderebbe
+    assert data["candlestick"]["high"]["dtype"] == "f4" and data["scatter"]["y"]["dtype"] == "f4"
+    print("✓ ultime 60 barre: volume f8 esatto, prezzi e ADX f4")
+
+    data = traces(ReportGenerator(chart_days=None, chart_max_points=200))
+    volume = _decode(data["bar"]["y"])
+    assert len(volume) == 200 and volume.sum() == df["volume"].sum()
+    assert _decode(data["candlestick"]["high"]).max() == np.float32(df["high"].max())
+    print("✓ storico completo aggregato a 200 barre: somma dei volumi esatta")
+
+    print("\n✅ REPORT VOLUME: PASSED")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*70)
+    print("🧪 CHART DATA TEST SUITE")
+    print("="*70)
+
+    tests = [
+        ("LTTB", test_lttb),
+        ("OHLC Aggregation", test_ohlc_aggregation),
+        ("F32 Round-Trip", test_f32_round_trip),
+        ("Report Volume", test_report_volume_float64),
+    ]
+
+    failed = 0
+    for test_name, test_fn in tests:
+        try:
+            test_fn()
+        except Exception as e:
+            failed += 1
+            print(f"\n❌ Error in {test_name}: {e}")
+            import traceback
+            traceback.print_exc()
+
+    print(f"\nTotal: {len(tests) - failed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
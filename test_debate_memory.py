@@ -0,0 +1,189 @@
+"""
+Test Suite - Debate Memory
+Verifica il taglio della storia del dibattito (ultimi K turni + riassunto
+incrementale), il budget di token per nodo e il testo inserito nel prompt
+"""
+
+import sys
+
+from tradingagents.agents.utils.debate_memory import (
+    DebateMemory,
+    create_debate_memory,
+    debate_context,
+    estimate_tokens,
+    split_turns,
+)
+
+
+class _Reply:
+    def __init__(self, content: str):
+        self.content = content
+
+
+class _SummaryLLM:
+    """LLM finto: registra i prompt e riassume con un contatore"""
+
+    def __init__(self):
+        self.prompts = []
+
+    def invoke(self, prompt: str) -> _Reply:
+        self.prompts.append(prompt)
+        return _Reply(f"summary #{len(self.prompts)}")
+
+
+def _history(n_turns: int, words: int = 5) -> str:
+    speakers = ["Bull", "Bear"]
+    return "".join(
+        f"\n{speakers[i % 2]} Analyst: turn {i} " + "arg " * words for i in range(n_turns)
+    )
+
+
+def _state(history: str, **memory) -> dict:
+    return {"history": history, "count": len(split_turns(history)), **memory}
+
+
+def test_short_debate_unchanged():
+    """Test 1: dibattito corto -> storia completa, nessuna chiamata LLM"""
+    print("\n" + "="*70)
+    print("TEST 1: Dibattito entro la finestra verbatim")
+    print("="*70)
+
+    llm = _SummaryLLM()
+    memory = DebateMemory(llm, keep_last_turns=4, token_budget=3000)
+    history = _history(3)
+
+    text, updates = memory.render(_state(history))
+    assert text == history
+    assert updates == {"history_summary": "", "summarized_turns": 0}
+    assert llm.prompts == []
+    assert split_turns(history)[0].startswith("Bull Analyst: turn 0")
+    print("✓ 3 turni con K=4: prompt identico alla storia completa")
+
+    text, updates = debate_context(None, _state(history))
+    assert text == history and updates == {}
+    print("✓ memoria disattivata: storia completa, nessun aggiornamento di stato")
+
+    print("\n✅ SHORT DEBATE: PASSED")
+
+
+def test_cutoff_and_incremental_summary():
+    """Test 2: turni oltre K riassunti una volta sola, poi solo i nuovi"""
+    print("\n" + "="*70)
+    print("TEST 2: Cutoff sugli ultimi K turni e riassunto incrementale")
+    print("="*70)
+
+    llm = _SummaryLLM()
+    memory = DebateMemory(llm, keep_last_turns=2, token_budget=3000)
+
+    state = _state(_history(6))
+    text, updates = memory.render(state)
+    assert updates == {"history_summary": "summary #1", "summarized_turns": 4}
+    assert "turn 3 " in llm.prompts[0] and "turn 4 " not in llm.prompts[0]
+    assert "[Summary of the earlier turns]\nsummary #1" in text
+    assert "turn 4 " in text and "turn 5 " in text and "turn 3 " not in text
+    print("✓ 6 turni, K=2: turni 0-3 nel riassunto, 4-5 verbatim")
+
+    # Stesso stato: niente da riassumere
+    state.update(updates)
+    memory.render(state)
+    assert len(llm.prompts) == 1
+    print("✓ stato invariato: nessuna nuova chiamata al summarizer")
+
+    # Un turno in più: al summarizer va solo il turno uscito dalla finestra
+    state = _state(_history(7), **updates)
+    _, updates = memory.render(state)
+    assert updates == {"history_summary": "summary #2", "summarized_turns": 5}
+    new_turns = llm.prompts[1].split("New turns:")[1]
+    assert "turn 4 " in new_turns and "turn 3 " not in new_turns
+    assert "Existing summary:\nsummary #1" in llm.prompts[1]
+    print("✓ turno 7: riassunto aggiornato col solo turno 4")
+
+    print("\n✅ CUTOFF/INCREMENTAL: PASSED")
+
+
+def test_token_budget():
+    """Test 3: turni lunghi spinti nel riassunto dal budget di token"""
+    print("\n" + "="*70)
+    print("TEST 3: Budget di token per nodo")
+    print("="*70)
+
+    llm = _SummaryLLM()
+    memory = DebateMemory(
+        llm, keep_last_turns=4, token_budget=600, summary_tokens=100,
+        node_budgets={"Risk Judge": 5000},
+    )
+    history = _history(6, words=200)  # ~200 token per turno
+
+    text, updates = memory.for_node("Bull Researcher").render(_state(history))
+    assert updates["summarized_turns"] == 4, updates
+    assert estimate_tokens(text) <= 600, estimate_tokens(text)
+    print(f"✓ budget 600: {updates['summarized_turns']} turni riassunti, "
+          f"{estimate_tokens(text)} token nel prompt")
+
+    _, updates = memory.for_node("Risk Judge").render(_state(history))
+    assert updates["summarized_turns"] == 2, updates
+    print("✓ budget del Risk Judge (5000): solo i turni oltre K=4 riassunti")
+
+    # Un singolo turno oltre il budget resta verbatim, tagliato in coda
+    huge = _history(1, words=2000)
+    text, updates = DebateMemory(llm, keep_last_turns=1, token_budget=300).render(_state(huge))
+    assert updates["summarized_turns"] == 0
+    assert text.startswith("[...]") and text.endswith(huge[-40:])
+    assert estimate_tokens(text) <= 302
+    print("✓ turno più lungo del budget: ne resta la parte finale")
+
+    print("\n✅ TOKEN BUDGET: PASSED")
+
+
+def test_create_from_config():
+    """Test 4: create_debate_memory legge le chiavi di config"""
+    print("\n" + "="*70)
+    print("TEST 4: create_debate_memory")
+    print("="*70)
+
+    llm = _SummaryLLM()
+    assert create_debate_memory(llm, {}) is None
+    assert create_debate_memory(llm, {"debate_memory_turns": 0}) is None
+    memory = create_debate_memory(llm, {
+        "debate_memory_turns": 3,
+        "debate_token_budget": 2000,
+        "debate_node_token_budgets": {"Research Manager": 4000},
+    })
+    assert memory.keep_last_turns == 3
+    assert memory.for_node("Bear Researcher").token_budget == 2000
+    assert memory.for_node("Research Manager").token_budget == 4000
+    print("✓ disattivata senza debate_memory_turns, budget per nodo applicati")
+
+    print("\n✅ CONFIG: PASSED")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*70)
+    print("🧪 DEBATE MEMORY TEST SUITE")
+    print("="*70)
+
+    tests = [
+        ("Short Debate", test_short_debate_unchanged),
+        ("Cutoff/Incremental", test_cutoff_and_incremental_summary),
+        ("Token Budget", test_token_budget),
+        ("Config", test_create_from_config),
+    ]
+
+    failed = 0
+    for test_name, test_fn in tests:
+        try:
+            test_fn()
+        except Exception as e:
+            failed += 1
+            print(f"\n❌ Error in {test_name}: {e}")
+            import traceback
+            traceback.print_exc()
+
+    print(f"\nTotal: {len(tests) - failed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
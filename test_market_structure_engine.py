@@ -0,0 +1,198 @@
+"""
+Test Suite - Market Structure Engine
+Verifica il motore pivot condiviso (batch + streaming) su dati sintetici
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent / "swing_system"))
+
+from tradingagents.dataflows.pivot_engine import PivotEngine, PivotTable, pivot_table
+from tradingagents.dataflows.structure_detector import PivotFinder
+from tradingagents.dataflows.weekly_aggregator import WeeklyAggregator
+import market_structure
+
+
+def _synthetic_ohlcv(n: int = 300, seed: int = 42) -> pd.DataFrame:
+    rng    = np.random.default_rng(seed)
+    close  = 100 + np.cumsum(rng.normal(0.1, 1.2, n))
+    high   = close + np.abs(rng.normal(0, 0.8, n))
+    low    = close - np.abs(rng.normal(0, 0.8, n))
+    volume = rng.integers(500_000, 5_000_000, n).astype(float)
+    df = pd.DataFrame({"open": close, "high": high, "low": low,
+                       "close": close, "volume": volume},
+                      index=pd.date_range("2023-01-02", periods=n, freq="B"))
+    df["volume_ratio"] = df["volume"] / df["volume"].rolling(20).mean()
+    return df
+
+
+def _loop_pivots(df: pd.DataFrame, left: int, right: int, min_prom: float) -> list:
+    """Implementazione di riferimento a loop (definizione originale)."""
+    highs, lows = df["high"].values, df["low"].values
+    n, out = len(df), []
+    for i in range(left, n - right):
+        if highs[i] == highs[i - left:i + right + 1].max():
+            left_min  = lows[i - left:i].min() if i > left else lows[i]
+            prom      = highs[i] - max(left_min, lows[i + 1:i + right + 1].min())
+            if prom / highs[i] * 100 >= min_prom:
+                out.append((i, True))
+        if lows[i] == lows[i - left:i + right + 1].min():
+            left_max  = highs[i - left:i].max() if i > left else highs[i]
+            prom      = min(left_max, highs[i + 1:i + right + 1].max()) - lows[i]
+            if prom / lows[i] * 100 >= min_prom:
+                out.append((i, False))
+    return out
+
+
+def test_pivot_table_matches_loop():
+    """Test 1: compute_pivots vettoriale == definizione a loop"""
+    print("\n" + "="*70)
+    print("TEST 1: Pivot vettoriali vs loop di riferimento")
+    print("="*70)
+
+    df = _synthetic_ohlcv()
+    for left, right, min_prom in [(5, 5, 1.0), (3, 2, 0.5), (1, 1, 0.0)]:
+        table    = pivot_table(df, left, right, min_prom)
+        expected = _loop_pivots(df, left, right, min_prom)
+        got      = list(zip(table.bar_index.tolist(), table.is_high.tolist()))
+        assert got == expected, f"mismatch con left={left} right={right}"
+        print(f"✓ left={left} right={right}: {len(table)} pivot identici")
+
+    print("\n✅ Pivot Table: PASSED")
+
+
+def test_streaming_engine_matches_batch():
+    """Test 2: PivotEngine.update() barra per barra == batch"""
+    print("\n" + "="*70)
+    print("TEST 2: PivotEngine streaming vs batch")
+    print("="*70)
+
+    df     = _synthetic_ohlcv()
+    batch  = pivot_table(df, 5, 5, 1.0)
+    engine = PivotEngine(left_bars=5, right_bars=5, min_prominence_pct=1.0)
+
+    for i, (ts, bar) in enumerate(df.iterrows()):
+        new = engine.update(bar["high"], bar["low"], bar["volume"], ts)
+        # Zero lookahead: i pivot nuovi sono sempre right_bars barre indietro
+        assert all(b == i - 5 for b in new.bar_index)
+
+    assert np.array_equal(engine.table.bar_index, batch.bar_index)
+    assert np.allclose(engine.table.prominence, batch.prominence)
+    assert engine.table.to_records() == batch.to_records()
+    print(f"✓ {len(batch)} pivot confermati, identici al batch")
+
+    print("\n✅ Streaming Engine: PASSED")
+
+
+def test_legacy_wrappers():
+    """Test 3: find_pivots / PivotFinder usano il motore condiviso"""
+    print("\n" + "="*70)
+    print("TEST 3: Wrapper legacy")
+    print("="*70)
+
+    df     = _synthetic_ohlcv()
+    pivots = market_structure.find_pivots(df, 5, 5, 1.0)
+    assert [p.bar_index for p in pivots] == pivot_table(df, 5, 5, 1.0).bar_index.tolist()
+    assert pivots[0].timestamp == df.index[pivots[0].bar_index]
+    print(f"✓ market_structure.find_pivots: {len(pivots)} Pivot")
+
+    highs, lows = PivotFinder(min_lookback=2, min_bar_height=0.0).find_pivots(df)
+    for p in highs:
+        window = df["high"].values[p.index - 2:p.index + 3]
+        assert (window < p.value).sum() == 4, "pivot high non stretto"
+    print(f"✓ PivotFinder: {len(highs)} high / {len(lows)} low stretti")
+
+    print("\n✅ Legacy Wrappers: PASSED")
+
+
+def test_structure_tables():
+    """Test 4: analyze() restituisce tabelle compatte, conversione lazy"""
+    print("\n" + "="*70)
+    print("TEST 4: PivotTable / StructureTable")
+    print("="*70)
+
+    df     = _synthetic_ohlcv(n=500)
+    result = market_structure.analyze(df, include_weekly=True)
+    assert isinstance(result["pivots"], PivotTable)
+    assert isinstance(result["signals"], market_structure.StructureTable)
+
+    # Stesso risultato del percorso a oggetti (liste di Pivot / StructureSignal)
+    pivots  = market_structure.classify_pivots(market_structure.find_pivots(df))
+    signals = market_structure.detect_structure_events(df, pivots)
+    assert result["pivots"].to_records() == [p.to_dict() for p in pivots]
+    assert [s["event"] for s in result["signals"].to_records()] == [s.event.value for s in signals]
+    assert result["structure"]["trend"] == market_structure.compute_trend_state(pivots).value
+    print(f"✓ {len(result['pivots'])} pivot / {len(result['signals'])} eventi coerenti con le liste")
+
+    # Oggetti slotted: nessun __dict__ per istanza
+    assert not hasattr(pivots[0], "__dict__")
+    assert not hasattr(signals[0], "__dict__")
+    print("✓ Pivot / StructureSignal senza __dict__")
+
+    print("\n✅ Structure Tables: PASSED")
+
+
+def test_weekly_cache_asof():
+    """Test 5: aggregazione weekly incrementale == resample per ogni barra"""
+    print("\n" + "="*70)
+    print("TEST 5: WeeklyAggregator / WeeklyStructureCache as-of")
+    print("="*70)
+
+    df  = _synthetic_ohlcv(n=260, seed=7).drop(pd.date_range("2023-05-01", "2023-05-05"))
+    agg = WeeklyAggregator.from_frame(df)
+    for i in range(0, len(df), 7):
+        expected = market_structure.resample_to_weekly(df.iloc[:i + 1])
+        pd.testing.assert_frame_equal(agg.asof(i), expected, check_freq=False,
+                                      check_names=False, check_index_type=False)
+    print(f"✓ {agg.n_weeks} settimane, as-of identico a resample_to_weekly")
+
+    cache = market_structure.WeeklyStructureCache.from_frame(df)
+    for i in range(30, len(df)):
+        sl      = df.iloc[:i + 1]
+        pivots  = market_structure.classify_pivot_table(pivot_table(sl))
+        signals = market_structure.detect_structure_table(sl, pivots)
+        full    = market_structure.mtf_structure_confluence(sl, pivots, signals)
+        cached  = market_structure.mtf_structure_confluence(sl, pivots, signals, weekly_cache=cache)
+        assert cached["weekly_trend"] == full["weekly_trend"], f"trend diverso alla barra {i}"
+        assert cached["weekly_n_pivots"] == full["weekly_n_pivots"]
+        assert str(cached["weekly_structure"]) == str(full["weekly_structure"]), f"snapshot diverso alla barra {i}"
+    print(f"✓ MTF con cache identico al ricalcolo su {len(df) - 30} barre")
+
+    print("\n✅ Weekly Cache: PASSED")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*70)
+    print("🧪 MARKET STRUCTURE ENGINE TEST SUITE")
+    print("="*70)
+
+    tests = [
+        ("Pivot Table", test_pivot_table_matches_loop),
+        ("Streaming Engine", test_streaming_engine_matches_batch),
+        ("Legacy Wrappers", test_legacy_wrappers),
+        ("Structure Tables", test_structure_tables),
+        ("Weekly Cache", test_weekly_cache_asof),
+    ]
+
+    failed = 0
+    for test_name, test_fn in tests:
+        try:
+            test_fn()
+        except Exception as e:
+            failed += 1
+            print(f"\n❌ Error in {test_name}: {e}")
+            import traceback
+            traceback.print_exc()
+
+    print(f"\nTotal: {len(tests) - failed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
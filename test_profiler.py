@@ -0,0 +1,254 @@
+"""
+Test Suite - Graph Profiler
+Verifica gli span registrati da GraphProfiler su un piccolo grafo LangGraph
+(nodo analista con LLM finto e tool get_stock_data): span node/llm/tool,
+aggregazione di summary(), trace Chrome valido e tentativi di vendor
+attribuiti al tool che li ha generati
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from langchain_core.language_models.fake_chat_models import FakeMessagesListChatModel
+from langchain_core.messages import AIMessage
+from langgraph.graph import END, START, MessagesState, StateGraph
+from langgraph.prebuilt import ToolNode
+
+from tradingagents.agents.utils.core_stock_tools import get_stock_data
+from tradingagents.dataflows import interface
+from tradingagents.graph.profiler import GraphProfiler
+from tradingagents.graph.propagation import Propagator
+from tradingagents.llm_clients.response_cache import SQLiteResponseCache
+
+USAGE = {"input_tokens": 120, "output_tokens": 30, "total_tokens": 150}
+
+
+def _llm(cache=None):
+    """LLM finto: prima chiede il tool, poi scrive il report"""
+    return FakeMessagesListChatModel(cache=cache, responses=[
+        AIMessage(content="", usage_metadata=USAGE, tool_calls=[{
+            "name": "get_stock_data", "id": "call_1",
+            "args": {"symbol": "NVDA", "start_date": "2024-05-01", "end_date": "2024-05-10"},
+        }]),
+        AIMessage(content="market report", usage_metadata=USAGE),
+    ])
+
+
+def _build_graph(llm):
+    def analyst(state):
+        time.sleep(0.01)
+        return {"messages": [llm.invoke(state["messages"])]}
+
+    def route(state):
+        return "tools_market" if state["messages"][-1].tool_calls else END
+
+    workflow = StateGraph(MessagesState)
+    workflow.add_node("Market Analyst", analyst)
+    workflow.add_node("tools_market", ToolNode([get_stock_data]))
+    workflow.add_edge(START, "Market Analyst")
+    workflow.add_conditional_edges("Market Analyst", route, ["tools_market", END])
+    workflow.add_edge("tools_market", "Market Analyst")
+    return workflow.compile()
+
+
+class _Vendors:
+    """Vendor finti per get_stock_data: il primario fallisce, il fallback risponde"""
+
+    def __enter__(self):
+        self.saved = interface.VENDOR_METHODS["get_stock_data"]
+
+        def down(*args, **kwargs):
+            raise ConnectionError("vendor down")
+
+        def ok(symbol, start_date, end_date):
+            time.sleep(0.01)
+            return f"{symbol} OHLCV {start_date}..{end_date}"
+
+        interface.VENDOR_METHODS["get_stock_data"] = {"test_down": down, "test_ok": ok}
+        return self
+
+    def __exit__(self, *exc):
+        interface.VENDOR_METHODS["get_stock_data"] = self.saved
+
+
+def _run(llm, profiler):
+    # Circuit breaker alto: il router condiviso deve riprovare test_down a ogni run
+    propagator = Propagator(config={
+        "data_vendors": {"core_stock_apis": "test_down"},
+        "vendor_breaker_failures": 1000,
+    })
+    graph = _build_graph(llm)
+    args = propagator.get_graph_args(callbacks=[profiler])
+    with _Vendors():
+        return graph.invoke({"messages": [("human", "NVDA")]}, **{"config": args["config"]})
+
+
+def test_spans():
+    """Test 1: span per nodi, chiamate LLM e tool"""
+    print("\n" + "="*70)
+    print("TEST 1: Span node/llm/tool")
+    print("="*70)
+
+    profiler = GraphProfiler()
+    final = _run(_llm(), profiler)
+    assert final["messages"][-1].content == "market report"
+
+    by_kind = {}
+    for span in profiler.spans:
+        by_kind.setdefault(span["kind"], []).append(span)
+    nodes = [s["name"] for s in sorted(by_kind["node"], key=lambda s: s["start"])]
+    assert nodes == ["Market Analyst", "tools_market", "Market Analyst"], nodes
+    assert all(s["duration"] >= 0.01 for s in by_kind["node"] if s["name"] == "Market Analyst")
+    print(f"✓ nodi: {nodes}")
+
+    assert len(by_kind["llm"]) == 2
+    assert all(s["node"] == "Market Analyst" and s["tokens_in"] == 120 and s["tokens_out"] == 30
+               for s in by_kind["llm"])
+    print("✓ 2 chiamate LLM attribuite a Market Analyst, token in/out")
+
+    (tool,) = by_kind["tool"]
+    assert tool["name"] == "get_stock_data" and tool["node"] == "tools_market"
+    assert "error" not in tool
+    print("✓ tool get_stock_data dentro tools_market")
+
+    assert all(s["end"] >= s["start"] and s["duration"] == s["end"] - s["start"]
+               for s in profiler.spans if s["kind"] != "vendor")
+    assert all(s["queue"] >= 0 for s in by_kind["node"])
+    print("✓ durate coerenti, tempo in coda registrato per ogni nodo")
+
+    print("\n✅ SPANS: PASSED")
+
+
+def test_vendor_attempts():
+    """Test 2: i tentativi di route_to_vendor sono attribuiti al tool chiamante"""
+    print("\n" + "="*70)
+    print("TEST 2: Tentativi di vendor attribuiti al tool")
+    print("="*70)
+
+    profiler = GraphProfiler()
+    _run(_llm(), profiler)
+
+    vendors = sorted((s for s in profiler.spans if s["kind"] == "vendor"), key=lambda s: s["attempt"])
+    assert [(s["vendor"], s["attempt"], s["ok"]) for s in vendors] == [
+        ("test_down", 1, False), ("test_ok", 2, True),
+    ], vendors
+    assert all(s["tool"] == "get_stock_data" and s["node"] == "tools_market" for s in vendors)
+    assert "ConnectionError" in vendors[0]["error"] and "error" not in vendors[1]
+    assert vendors[0]["name"] == "get_stock_data:test_down"
+    print("✓ test_down fallito poi test_ok, entrambi sotto get_stock_data")
+
+    (tool,) = [s for s in profiler.spans if s["kind"] == "tool"]
+    assert all(tool["start"] - 1e-3 <= s["start"] and s["end"] <= tool["end"] + 1e-3 for s in vendors)
+    print("✓ tentativi dentro l'intervallo del tool")
+
+    print("\n✅ VENDOR ATTEMPTS: PASSED")
+
+
+def test_summary():
+    """Test 3: summary() aggrega per nodo e per tool, cache hit senza token"""
+    print("\n" + "="*70)
+    print("TEST 3: Aggregazione summary()")
+    print("="*70)
+
+    root = tempfile.mkdtemp()
+    try:
+        cache = SQLiteResponseCache(os.path.join(root, "llm_cache.sqlite")).scoped("fake", "model")
+        _run(_llm(cache), GraphProfiler())
+
+        profiler = GraphProfiler()
+        _run(_llm(cache), profiler)
+        rows = {(r["kind"], r["name"]): r for r in profiler.summary()}
+        assert [r["kind"] for r in profiler.summary()] == ["node", "node", "tool"]
+
+        analyst = rows[("node", "Market Analyst")]
+        assert analyst["calls"] == 2 and analyst["llm_calls"] == 2
+        assert analyst["cache_hits"] == 2 and analyst["tokens_in"] == analyst["tokens_out"] == 0
+        assert analyst["wall_s"] >= analyst["llm_s"] > 0
+        print("✓ Market Analyst: 2 esecuzioni, 2 chiamate LLM servite dalla cache, 0 token")
+
+        tool = rows[("tool", "get_stock_data")]
+        assert tool["calls"] == 1 and tool["vendor_attempts"] == 2 and tool["vendor_failures"] == 1
+        assert rows[("node", "tools_market")]["calls"] == 1
+        print("✓ get_stock_data: 1 chiamata, 2 tentativi di vendor (1 fallito)")
+
+        table = profiler.summary_markdown()
+        assert "| get_stock_data | 1 |" in table and "2 (1 failed)" in table
+        print("✓ tabella markdown")
+    finally:
+        shutil.rmtree(root)
+
+    print("\n✅ SUMMARY: PASSED")
+
+
+def test_chrome_trace():
+    """Test 4: trace Chrome valido (eventi X completi, metadati dei thread), JSONL"""
+    print("\n" + "="*70)
+    print("TEST 4: Trace Chrome")
+    print("="*70)
+
+    profiler = GraphProfiler()
+    _run(_llm(), profiler)
+
+    root = tempfile.mkdtemp()
+    try:
+        with open(profiler.write(os.path.join(root, "trace", "run.json"))) as f:
+            trace = json.load(f)
+        events = trace["traceEvents"]
+        spans = [e for e in events if e["ph"] == "X"]
+        meta = [e for e in events if e["ph"] == "M"]
+        assert len(spans) == len(profiler.spans)
+        assert {e["cat"] for e in spans} == {"node", "llm", "tool", "vendor"}
+        for e in spans:
+            assert isinstance(e["ts"], int) and isinstance(e["dur"], int)
+            assert e["ts"] >= 0 and e["dur"] >= 0 and e["pid"] == 1
+        assert [e["ts"] for e in spans] == sorted(e["ts"] for e in spans)
+        assert {e["tid"] for e in spans} == {e["tid"] for e in meta}
+        assert all(e["name"] == "thread_name" for e in meta)
+        vendor = next(e for e in spans if e["cat"] == "vendor")
+        assert vendor["args"]["tool"] == "get_stock_data"
+        print(f"✓ {len(spans)} eventi X su {len(meta)} thread, timestamp in µs interi")
+
+        with open(profiler.write(os.path.join(root, "trace", "run.jsonl"))) as f:
+            lines = [json.loads(line) for line in f]
+        assert len(lines) == len(profiler.spans)
+        print("✓ write(*.jsonl): uno span per riga")
+    finally:
+        shutil.rmtree(root)
+
+    print("\n✅ CHROME TRACE: PASSED")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*70)
+    print("🧪 GRAPH PROFILER TEST SUITE")
+    print("="*70)
+
+    tests = [
+        ("Spans", test_spans),
+        ("Vendor Attempts", test_vendor_attempts),
+        ("Summary", test_summary),
+        ("Chrome Trace", test_chrome_trace),
+    ]
+
+    failed = 0
+    for test_name, test_fn in tests:
+        try:
+            test_fn()
+        except Exception as e:
+            failed += 1
+            print(f"\n❌ Error in {test_name}: {e}")
+            import traceback
+            traceback.print_exc()
+
+    print(f"\nTotal: {len(tests) - failed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,252 @@
+"""
+Test Suite - Reddit Index
+Verifica che la lettura indicizzata dei file Reddit (.jsonl) dia gli stessi
+post della scansione giorno per giorno, la ricostruzione dell'indice quando
+il file cambia, le query libere e le cartelle dati in sola lettura
+"""
+
+import json
+import os
+import random
+import re
+import shutil
+import stat
+import sys
+import tempfile
+from datetime import datetime, timedelta, timezone
+
+from tradingagents.dataflows import reddit_utils
+from tradingagents.dataflows.reddit_utils import (
+    INDEX_DIR,
+    fetch_top_from_category,
+    fetch_top_from_category_range,
+    ticker_to_company,
+)
+
+START = datetime(2024, 3, 1, tzinfo=timezone.utc)
+DAYS = [(START + timedelta(days=d)).strftime("%Y-%m-%d") for d in range(8)]
+WORDS = ["Apple", "Nvidia", "nvda", "Facebook", "blockchain", "rates", "earnings", "AAPL", "chips"]
+
+
+def _write_posts(path: str, n: int, seed: int) -> None:
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(n):
+            created = START + timedelta(hours=rng.randrange(len(DAYS) * 24))
+            post = {
+                "title": f"post {seed}-{i} " + " ".join(rng.sample(WORDS, 2)),
+                "selftext": rng.choice(["", "talking about " + rng.choice(WORDS)]),
+                "url": f"https://reddit.com/{seed}/{i}",
+                "ups": rng.randrange(6),  # pochi valori: molti pari merito
+                "created_utc": created.timestamp(),
+            }
+            f.write(json.dumps(post) + "\n")
+            if i % 17 == 0:
+                f.write("\n")
+
+
+def _make_data(root: str) -> None:
+    for category, files in (("company_news", 2), ("global_news", 1)):
+        os.makedirs(os.path.join(root, category))
+        for k in range(files):
+            _write_posts(os.path.join(root, category, f"sub{k}.jsonl"), 150, seed=10 * k + len(category))
+
+
+def _per_day_scan(category, date, max_limit, query, data_path):
+    """Il vecchio ciclo: scansione completa di ogni file per un giorno"""
+    category_path = os.path.join(data_path, category)
+    files = [f for f in os.listdir(category_path) if f.endswith(".jsonl")]
+    limit = max_limit // len(files)
+    out = []
+    for data_file in files:
+        posts = []
+        with open(os.path.join(category_path, data_file), "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                p = json.loads(line)
+                post_date = datetime.fromtimestamp(p["created_utc"], timezone.utc).strftime("%Y-%m-%d")
+                if post_date != date:
+                    continue
+                if "company" in category and query:
+                    company = ticker_to_company.get(query, query)
+                    terms = (company.split(" OR ") if "OR" in company else [company])
+                    terms += [query] if query in ticker_to_company else []
+                    if not any(re.search(t, p["title"], re.IGNORECASE)
+                               or re.search(t, p["selftext"], re.IGNORECASE) for t in terms):
+                        continue
+                posts.append({"title": p["title"], "content": p["selftext"], "url": p["url"],
+                              "upvotes": p["ups"], "posted_date": post_date})
+        posts.sort(key=lambda x: x["upvotes"], reverse=True)
+        out.extend(posts[:limit])
+    return out
+
+
+def _reference_range(category, start, end, max_limit, query, data_path):
+    return [post for day in DAYS if start <= day <= end
+            for post in _per_day_scan(category, day, max_limit, query, data_path)]
+
+
+def test_range_matches_per_day():
+    """Test 1: stessi post, stesso ordine, stesso limite per giorno"""
+    print("\n" + "="*70)
+    print("TEST 1: Range indicizzato vs scansione per giorno")
+    print("="*70)
+
+    root = tempfile.mkdtemp()
+    try:
+        _make_data(root)
+        cases = [
+            ("company_news", "AAPL"), ("company_news", "NVDA"), ("company_news", "META"),
+            ("company_news", None), ("global_news", None), ("global_news", "AAPL"),
+        ]
+        for category, query in cases:
+            for max_limit in (2, 6):
+                got = fetch_top_from_category_range(category, DAYS[1], DAYS[6], max_limit,
+                                                    query=query, data_path=root)
+                want = _reference_range(category, DAYS[1], DAYS[6], max_limit, query, root)
+                assert got == want, (category, query, max_limit, len(got), len(want))
+            print(f"✓ {category:<13} query={query}: {len(got)} post identici")
+
+        # Singolo giorno (fetch_top_from_category)
+        assert fetch_top_from_category("company_news", DAYS[3], 4, "AAPL", root) == \
+            _per_day_scan("company_news", DAYS[3], 4, "AAPL", root)
+        assert os.path.exists(os.path.join(root, "company_news", INDEX_DIR, "sub0.jsonl.json"))
+        print("✓ singolo giorno identico, indice salvato in .index/")
+    finally:
+        shutil.rmtree(root)
+
+    print("\n✅ RANGE == PER-DAY: PASSED")
+
+
+def test_index_rebuilt_on_change():
+    """Test 2: indice ricostruito se il .jsonl cambia (dimensione o mtime)"""
+    print("\n" + "="*70)
+    print("TEST 2: Ricostruzione dell'indice")
+    print("="*70)
+
+    root = tempfile.mkdtemp()
+    try:
+        _make_data(root)
+        path = os.path.join(root, "global_news", "sub0.jsonl")
+        before = fetch_top_from_category_range("global_news", DAYS[0], DAYS[-1], 50, data_path=root)
+
+        # Nuovo post in coda: cambia la dimensione
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"title": "fresh post", "selftext": "", "url": "u", "ups": 99,
+                                "created_utc": START.timestamp() + 60}) + "\n")
+        after = fetch_top_from_category_range("global_news", DAYS[0], DAYS[-1], 50, data_path=root)
+        assert after[0]["title"] == "fresh post" and len(after) == len(before) + 1
+        with open(os.path.join(root, "global_news", INDEX_DIR, "sub0.jsonl.json")) as f:
+            assert json.load(f)["size"] == os.path.getsize(path)
+        print("✓ post aggiunto: indice ricostruito e salvato")
+
+        # Stessa dimensione, post spostato al giorno dopo: conta l'mtime
+        old_ts, new_ts = json.dumps(START.timestamp() + 60), json.dumps(START.timestamp() + 86460)
+        assert len(old_ts) == len(new_ts)
+        with open(path, "r+", encoding="utf-8") as f:
+            data = f.read().replace(old_ts, new_ts)
+            f.seek(0)
+            f.write(data)
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+        for day in DAYS[:2]:
+            got = fetch_top_from_category_range("global_news", day, day, 50, data_path=root)
+            assert got == _per_day_scan("global_news", day, 50, None, root), day
+        assert fetch_top_from_category_range("global_news", DAYS[1], DAYS[1], 50,
+                                             data_path=root)[0]["title"] == "fresh post"
+        print("✓ stessa dimensione, mtime diverso: indice ricostruito")
+    finally:
+        shutil.rmtree(root)
+
+    print("\n✅ INDEX REBUILD: PASSED")
+
+
+def test_free_text_query():
+    """Test 3: query non presente in ticker_to_company (ricerca testuale)"""
+    print("\n" + "="*70)
+    print("TEST 3: Query libera")
+    print("="*70)
+
+    root = tempfile.mkdtemp()
+    try:
+        _make_data(root)
+        assert "blockchain" not in ticker_to_company
+        got = fetch_top_from_category_range("company_news", DAYS[0], DAYS[-1], 10,
+                                            query="blockchain", data_path=root)
+        want = _reference_range("company_news", DAYS[0], DAYS[-1], 10, "blockchain", root)
+        assert got and got == want
+        assert all("blockchain" in (p["title"] + p["content"]).lower() for p in got)
+        print(f"✓ 'blockchain': {len(got)} post, identici alla scansione")
+    finally:
+        shutil.rmtree(root)
+
+    print("\n✅ FREE-TEXT QUERY: PASSED")
+
+
+def test_read_only_data_dir():
+    """Test 4: cartella dati in sola lettura -> indice solo in memoria"""
+    print("\n" + "="*70)
+    print("TEST 4: Cartella dati in sola lettura")
+    print("="*70)
+
+    root = tempfile.mkdtemp()
+    category_path = os.path.join(root, "company_news")
+    makedirs = os.makedirs
+    try:
+        _make_data(root)
+        os.chmod(category_path, stat.S_IRUSR | stat.S_IXUSR)
+        if os.geteuid() == 0:
+            # root scrive anche dove i permessi lo vietano: simula l'errore
+            def makedirs_readonly(name, *args, **kwargs):
+                if str(name).startswith(category_path):
+                    raise PermissionError(13, "Permission denied", name)
+                return makedirs(name, *args, **kwargs)
+            reddit_utils.os.makedirs = makedirs_readonly
+
+        got = fetch_top_from_category_range("company_news", DAYS[0], DAYS[-1], 4,
+                                            query="NVDA", data_path=root)
+        assert got == _reference_range("company_news", DAYS[0], DAYS[-1], 4, "NVDA", root)
+        assert not os.path.exists(os.path.join(category_path, INDEX_DIR))
+        again = fetch_top_from_category_range("company_news", DAYS[0], DAYS[-1], 4,
+                                              query="NVDA", data_path=root)
+        assert again == got
+        print(f"✓ {len(got)} post senza scrivere .index/ (indice tenuto in memoria)")
+    finally:
+        reddit_utils.os.makedirs = makedirs
+        os.chmod(category_path, stat.S_IRWXU)
+        shutil.rmtree(root)
+
+    print("\n✅ READ-ONLY DATA DIR: PASSED")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*70)
+    print("🧪 REDDIT INDEX TEST SUITE")
+    print("="*70)
+
+    tests = [
+        ("Range == Per-Day", test_range_matches_per_day),
+        ("Index Rebuild", test_index_rebuilt_on_change),
+        ("Free-Text Query", test_free_text_query),
+        ("Read-Only Data Dir", test_read_only_data_dir),
+    ]
+
+    failed = 0
+    for test_name, test_fn in tests:
+        try:
+            test_fn()
+        except Exception as e:
+            failed += 1
+            print(f"\n❌ Error in {test_name}: {e}")
+            import traceback
+            traceback.print_exc()
+
+    print(f"\nTotal: {len(tests) - failed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
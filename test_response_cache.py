@@ -0,0 +1,273 @@
+"""
+Test Suite - Response Cache
+Verifica la cache SQLite delle risposte LLM: hit/miss tramite l'hook cache=
+dei chat model (anche ainvoke), isolamento per provider/modello, eviction LRU
+per numero di voci e per dimensione, totali tenuti senza scansioni, replay
+di conversazioni con più turni
+"""
+
+import asyncio
+import os
+import shutil
+import sys
+import tempfile
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration
+
+from tradingagents.llm_clients.response_cache import (
+    CACHE_STATUS_KEY,
+    SQLiteResponseCache,
+    create_response_cache,
+)
+
+
+def _model(cache, responses=("first", "second", "third")):
+    return FakeListChatModel(responses=list(responses), cache=cache)
+
+
+def _put(cache, prompt: str, text: str):
+    cache.update(prompt, "fake-llm", [ChatGeneration(message=AIMessage(content=text))])
+
+
+def _keys(cache):
+    return {row[0] for row in cache._conn.execute("SELECT key FROM responses")}
+
+
+def test_hit_miss():
+    """Test 1: la seconda chiamata uguale viene servita dalla cache"""
+    print("\n" + "="*70)
+    print("TEST 1: Hit/miss tramite cache= del chat model")
+    print("="*70)
+
+    root = tempfile.mkdtemp()
+    try:
+        cache = SQLiteResponseCache(os.path.join(root, "llm_cache.sqlite"))
+        model = _model(cache)
+
+        first = model.invoke("analizza NVDA")
+        again = model.invoke("analizza NVDA")
+        other = model.invoke("analizza AAPL")
+        assert first.content == again.content == "first" and other.content == "second"
+        assert first.response_metadata[CACHE_STATUS_KEY] == "miss"
+        assert again.response_metadata[CACHE_STATUS_KEY] == "hit"
+        assert cache.stats() == {"hits": 1, "misses": 2, "entries": 2, "bytes": cache.stats()["bytes"]}
+        print("✓ stesso prompt: risposta salvata riusata, metadata hit/miss")
+
+        # Un nuovo processo ritrova le risposte sul disco
+        reopened = SQLiteResponseCache(os.path.join(root, "llm_cache.sqlite"))
+        replay = _model(reopened).invoke("analizza AAPL")
+        assert replay.content == "second" and replay.response_metadata[CACHE_STATUS_KEY] == "hit"
+        print("✓ cache riaperta: risposte persistenti")
+
+        assert create_response_cache({}) is None
+        created = create_response_cache({"llm_cache": True, "data_cache_dir": root,
+                                         "llm_cache_max_entries": 10, "llm_cache_max_mb": 1})
+        assert created.path == os.path.join(root, "llm_cache.sqlite")
+        assert created.max_entries == 10 and created.max_bytes == 1024 * 1024
+        print("✓ create_response_cache legge le chiavi llm_cache_*")
+    finally:
+        shutil.rmtree(root)
+
+    print("\n✅ HIT/MISS: PASSED")
+
+
+def test_scope_isolation():
+    """Test 2: viste per provider/modello non si leggono a vicenda"""
+    print("\n" + "="*70)
+    print("TEST 2: Isolamento per provider e modello")
+    print("="*70)
+
+    root = tempfile.mkdtemp()
+    try:
+        cache = SQLiteResponseCache(os.path.join(root, "llm_cache.sqlite"))
+        openai = cache.scoped("OpenAI", "gpt-4o-mini")
+        anthropic = cache.scoped("anthropic", "claude-sonnet")
+        assert openai.namespace == "openai:gpt-4o-mini"
+
+        # Stesso modello finto (stesso llm_string) dietro le due viste
+        status = lambda view: _model(view).invoke("q").response_metadata[CACHE_STATUS_KEY]
+        assert status(openai) == "miss" and status(anthropic) == "miss"
+        assert status(openai) == "hit" and status(cache) == "miss"
+        assert (openai.hits, openai.misses) == (1, 1) and (anthropic.hits, anthropic.misses) == (0, 1)
+        print("✓ stesso prompt, namespace diversi: nessun hit incrociato")
+
+        anthropic.clear()
+        assert status(openai) == "hit" and status(anthropic) == "miss"
+        assert cache.stats()["entries"] == 3
+        print("✓ clear() su una vista rimuove solo il suo namespace")
+    finally:
+        shutil.rmtree(root)
+
+    print("\n✅ SCOPE ISOLATION: PASSED")
+
+
+def test_lru_eviction():
+    """Test 3: eviction delle voci usate meno di recente, per numero e per dimensione"""
+    print("\n" + "="*70)
+    print("TEST 3: Eviction LRU")
+    print("="*70)
+
+    root = tempfile.mkdtemp()
+    try:
+        cache = SQLiteResponseCache(os.path.join(root, "count.sqlite"), max_entries=10)
+        for i in range(10):
+            _put(cache, f"p{i}", f"r{i}")
+        assert cache.lookup("p0", "fake-llm") is not None  # p0 torna il più recente
+        key_p0 = cache._key("p0", "fake-llm")
+        _put(cache, "p10", "r10")
+        stats = cache.stats()
+        assert stats["entries"] == 9, stats  # sceso al 90% del limite
+        assert key_p0 in _keys(cache)
+        assert cache.lookup("p1", "fake-llm") is None and cache.lookup("p2", "fake-llm") is None
+        assert cache.lookup("p10", "fake-llm") is not None
+        print("✓ max_entries=10: rimossi p1 e p2, p0 (appena letto) conservato")
+
+        entry = len(cache._conn.execute("SELECT value FROM responses LIMIT 1").fetchone()[0])
+        sized = SQLiteResponseCache(os.path.join(root, "size.sqlite"), max_bytes=entry * 5 + 10)
+        for i in range(5):
+            _put(sized, f"p{i}", f"r{i}")
+        sized.lookup("p0", "fake-llm")
+        _put(sized, "p5", "r5")
+        stats = sized.stats()
+        assert stats["bytes"] <= sized.max_bytes * 0.9, stats
+        assert sized.lookup("p0", "fake-llm") is not None
+        assert sized.lookup("p1", "fake-llm") is None
+        print(f"✓ max_bytes={sized.max_bytes}: {stats['entries']} voci, {stats['bytes']} byte")
+    finally:
+        shutil.rmtree(root)
+
+    print("\n✅ LRU EVICTION: PASSED")
+
+
+def test_running_totals():
+    """Test 4: i totali seguono insert, sostituzioni, eviction e clear"""
+    print("\n" + "="*70)
+    print("TEST 4: Totali incrementali")
+    print("="*70)
+
+    root = tempfile.mkdtemp()
+    try:
+        cache = SQLiteResponseCache(os.path.join(root, "llm_cache.sqlite"), max_entries=20)
+        view = cache.scoped("openai", "gpt-4o-mini")
+        for i in range(30):
+            _put(cache if i % 2 else view, f"p{i % 25}", "x" * i)
+        _put(view, "p0", "replaced")
+        stats = cache.stats()
+        assert cache._totals == view._totals == {"count": stats["entries"], "bytes": stats["bytes"]}
+        print(f"✓ dopo 31 insert (con sostituzioni ed eviction): {cache._totals}")
+
+        view.clear()
+        stats = cache.stats()
+        assert cache._totals == {"count": stats["entries"], "bytes": stats["bytes"]}
+        print("✓ clear() di una vista: totali riallineati")
+
+        # Voci scritte da un altro processo: contate quando si riallinea (eviction)
+        other = SQLiteResponseCache(os.path.join(root, "llm_cache.sqlite"), max_entries=20)
+        for i in range(15):
+            _put(other, f"o{i}", "y")
+        assert cache.stats()["entries"] > cache._totals["count"]
+        for i in range(15):
+            _put(cache, f"n{i}", "z")
+        stats = cache.stats()
+        assert stats["entries"] <= 20 and cache._totals["count"] == stats["entries"], stats
+        print(f"✓ voci di un altro processo contate all'eviction: {stats['entries']} voci")
+    finally:
+        shutil.rmtree(root)
+
+    print("\n✅ RUNNING TOTALS: PASSED")
+
+
+def test_ainvoke():
+    """Test 5: il percorso asincrono usa la stessa cache"""
+    print("\n" + "="*70)
+    print("TEST 5: ainvoke")
+    print("="*70)
+
+    root = tempfile.mkdtemp()
+    try:
+        cache = SQLiteResponseCache(os.path.join(root, "llm_cache.sqlite")).scoped("openai", "gpt-4o")
+        model = _model(cache)
+
+        async def run():
+            first = await model.ainvoke("analizza NVDA")
+            again = await model.ainvoke("analizza NVDA")
+            return first, again
+
+        first, again = asyncio.run(run())
+        assert first.content == again.content == "first"
+        assert again.response_metadata[CACHE_STATUS_KEY] == "hit"
+        assert model.invoke("analizza NVDA").content == "first"
+        assert (cache.hits, cache.misses) == (2, 1)
+        print("✓ ainvoke: miss poi hit, condiviso con invoke")
+    finally:
+        shutil.rmtree(root)
+
+    print("\n✅ AINVOKE: PASSED")
+
+
+def test_multi_turn_replay():
+    """Test 6: conversazione con tool replicata: hit anche dopo il primo turno"""
+    print("\n" + "="*70)
+    print("TEST 6: Replay di più turni")
+    print("="*70)
+
+    root = tempfile.mkdtemp()
+    try:
+        cache = SQLiteResponseCache(os.path.join(root, "llm_cache.sqlite"))
+
+        def conversation():
+            model = _model(cache)
+            history = [HumanMessage(content="analizza NVDA")]
+            statuses = []
+            for turn in range(3):
+                reply = model.invoke(history)
+                statuses.append(reply.response_metadata[CACHE_STATUS_KEY])
+                history += [reply, ToolMessage(content=f"dati {turn}", tool_call_id=f"call_{turn}")]
+            return [m.content for m in history], statuses
+
+        first, statuses = conversation()
+        assert statuses == ["miss", "miss", "miss"]
+        again, statuses = conversation()
+        assert statuses == ["hit", "hit", "hit"], statuses
+        assert again == first
+        print("✓ marker di replay (hit/miss, total_cost) nella storia ignorati nella chiave")
+    finally:
+        shutil.rmtree(root)
+
+    print("\n✅ MULTI-TURN REPLAY: PASSED")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*70)
+    print("🧪 RESPONSE CACHE TEST SUITE")
+    print("="*70)
+
+    tests = [
+        ("Hit/Miss", test_hit_miss),
+        ("Scope Isolation", test_scope_isolation),
+        ("LRU Eviction", test_lru_eviction),
+        ("Running Totals", test_running_totals),
+        ("Ainvoke", test_ainvoke),
+        ("Multi-Turn Replay", test_multi_turn_replay),
+    ]
+
+    failed = 0
+    for test_name, test_fn in tests:
+        try:
+            test_fn()
+        except Exception as e:
+            failed += 1
+            print(f"\n❌ Error in {test_name}: {e}")
+            import traceback
+            traceback.print_exc()
+
+    print(f"\nTotal: {len(tests) - failed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,147 @@
+"""
+Test Suite - State Log
+Verifica il ripristino del log degli stati dopo un crash a metà scrittura
+(record troncato, record scritto ma non indicizzato), con e senza gzip
+"""
+
+import gzip
+import json
+import shutil
+import sys
+import tempfile
+
+from tradingagents.graph.state_log import StateLog
+
+
+def _entry(trade_date: str, decision: str = "HOLD") -> dict:
+    return {"trade_date": trade_date, "final_trade_decision": decision, "market_report": "x" * 200}
+
+
+def _record(entry: dict, compress: bool) -> bytes:
+    line = (json.dumps(entry) + "\n").encode("utf-8")
+    return gzip.compress(line) if compress else line
+
+
+def test_torn_record_recovery():
+    """Test 1: un record troncato viene tagliato prima del successivo append"""
+    print("\n" + "="*70)
+    print("TEST 1: Record troncato da un crash")
+    print("="*70)
+
+    for compress in (False, True):
+        root = tempfile.mkdtemp()
+        try:
+            log = StateLog(root, compress=compress)
+            log.append("NVDA", "2024-01-02", _entry("2024-01-02"))
+            log.append("NVDA", "2024-01-03", _entry("2024-01-03"))
+            good_size = log.log_path("NVDA").stat().st_size
+
+            # Crash a metà del terzo append: metà record nel log, nulla nell'indice
+            torn = _record(_entry("2024-01-04"), compress)
+            with open(log.log_path("NVDA"), "ab") as f:
+                f.write(torn[: len(torn) // 2])
+
+            # Lo stream salta il record illeggibile invece di sollevare
+            dates = [e["trade_date"] for e in StateLog(root, compress=compress).iter_states("NVDA")]
+            assert dates == ["2024-01-02", "2024-01-03"], dates
+
+            # Un nuovo processo: l'append parte dalla fine dell'ultimo record valido
+            log = StateLog(root, compress=compress)
+            log.append("NVDA", "2024-01-05", _entry("2024-01-05", "BUY"))
+            assert log.log_path("NVDA").stat().st_size == good_size + len(
+                _record(_entry("2024-01-05", "BUY"), compress)
+            )
+            assert log.get("NVDA", "2024-01-05")["final_trade_decision"] == "BUY"
+
+            # Indice ricostruito da zero: nessun record perso
+            log._index_path("NVDA").unlink()
+            log = StateLog(root, compress=compress)
+            assert log.dates("NVDA") == ["2024-01-02", "2024-01-03", "2024-01-05"]
+            dates = [e["trade_date"] for e in log.iter_states("NVDA")]
+            assert dates == ["2024-01-02", "2024-01-03", "2024-01-05"], dates
+            print(f"✓ compress={compress}: record troncato rimosso, append successivi leggibili")
+        finally:
+            shutil.rmtree(root)
+
+    print("\n✅ TORN RECORD: PASSED")
+
+
+def test_unindexed_record_recovery():
+    """Test 2: record completo nel log ma non nell'indice (crash tra le due scritture)"""
+    print("\n" + "="*70)
+    print("TEST 2: Record scritto ma non indicizzato")
+    print("="*70)
+
+    for compress in (False, True):
+        root = tempfile.mkdtemp()
+        try:
+            log = StateLog(root, compress=compress)
+            log.append("AAPL", "2024-01-02", _entry("2024-01-02"))
+            with open(log.log_path("AAPL"), "ab") as f:
+                f.write(_record(_entry("2024-01-03", "SELL"), compress))
+
+            log = StateLog(root, compress=compress)
+            assert log.get("AAPL", "2024-01-03")["final_trade_decision"] == "SELL"
+            log.append("AAPL", "2024-01-04", _entry("2024-01-04"))
+            assert log.dates("AAPL") == ["2024-01-02", "2024-01-03", "2024-01-04"]
+            assert len(list(StateLog(root, compress=compress).iter_states("AAPL"))) == 3
+            print(f"✓ compress={compress}: record recuperato nell'indice")
+        finally:
+            shutil.rmtree(root)
+
+    print("\n✅ UNINDEXED RECORD: PASSED")
+
+
+def test_partial_line_is_dropped():
+    """Test 3: riga JSON completa ma senza newline (il prossimo append la unirebbe)"""
+    print("\n" + "="*70)
+    print("TEST 3: Riga senza newline finale")
+    print("="*70)
+
+    root = tempfile.mkdtemp()
+    try:
+        log = StateLog(root)
+        log.append("MSFT", "2024-01-02", _entry("2024-01-02"))
+        with open(log.log_path("MSFT"), "ab") as f:
+            f.write(json.dumps(_entry("2024-01-03")).encode("utf-8"))
+
+        log = StateLog(root)
+        log.append("MSFT", "2024-01-04", _entry("2024-01-04"))
+        dates = [e["trade_date"] for e in log.iter_states("MSFT")]
+        assert dates == ["2024-01-02", "2024-01-04"], dates
+        print("✓ riga parziale tagliata, nessun record fuso con il successivo")
+    finally:
+        shutil.rmtree(root)
+
+    print("\n✅ PARTIAL LINE: PASSED")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*70)
+    print("🧪 STATE LOG TEST SUITE")
+    print("="*70)
+
+    tests = [
+        ("Torn Record", test_torn_record_recovery),
+        ("Unindexed Record", test_unindexed_record_recovery),
+        ("Partial Line", test_partial_line_is_dropped),
+    ]
+
+    failed = 0
+    for test_name, test_fn in tests:
+        try:
+            test_fn()
+        except Exception as e:
+            failed += 1
+            print(f"\n❌ Error in {test_name}: {e}")
+            import traceback
+            traceback.print_exc()
+
+    print(f"\nTotal: {len(tests) - failed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,218 @@
+"""
+Test Suite - Streaming
+Verifica che lo stato ricostruito da StateTracker in modalità "updates"
+(replay del reducer dei messaggi, incluso Msg Clear) coincida con
+graph.invoke, i delta in modalità "values" e StreamBridge (errori, close)
+"""
+
+import asyncio
+import sys
+import time
+
+from langchain_core.messages import AIMessage
+from langgraph.graph import END, START, StateGraph
+
+from tradingagents.agents.utils.agent_states import AgentState
+from tradingagents.agents.utils.agent_utils import create_msg_delete
+from tradingagents.graph.propagation import Propagator
+from tradingagents.graph.streaming import StateTracker, StreamBridge, iter_graph_deltas
+
+
+def _analyst(report_key: str, text: str):
+    def node(state):
+        return {"messages": [AIMessage(content=text)], report_key: f"{text} report"}
+    return node
+
+
+def _build_graph(fail_at: str = None, delay: float = 0.0, calls: list = None):
+    """Analisti in sequenza, ciascuno seguito da Msg Clear come nel grafo reale"""
+    workflow = StateGraph(AgentState)
+
+    def wrap(name, fn):
+        def node(state):
+            if calls is not None:
+                calls.append(name)
+            if delay:
+                time.sleep(delay)
+            if name == fail_at:
+                raise ValueError(f"{name} failed")
+            return fn(state)
+        return node
+
+    workflow.add_node("Market Analyst", wrap("Market Analyst", _analyst("market_report", "market")))
+    workflow.add_node("News Analyst", wrap("News Analyst", _analyst("news_report", "news")))
+    workflow.add_node("Msg Clear Market", wrap("Msg Clear Market", create_msg_delete()))
+    workflow.add_node("Msg Clear News", wrap("Msg Clear News", create_msg_delete()))
+    workflow.add_node("Trader", wrap("Trader", lambda state: {
+        "messages": [AIMessage(content="trader")],
+        "trader_investment_plan": f"plan from {len(state['messages'])} messages",
+    }))
+    workflow.add_node("Risk Judge", wrap("Risk Judge", lambda state: {
+        "final_trade_decision": "FINAL TRANSACTION PROPOSAL: BUY",
+    }))
+    workflow.add_edge(START, "Market Analyst")
+    workflow.add_edge("Market Analyst", "Msg Clear Market")
+    workflow.add_edge("Msg Clear Market", "News Analyst")
+    workflow.add_edge("News Analyst", "Msg Clear News")
+    workflow.add_edge("Msg Clear News", "Trader")
+    workflow.add_edge("Trader", "Risk Judge")
+    workflow.add_edge("Risk Judge", END)
+    return workflow.compile()
+
+
+def _messages(state):
+    return [(m.type, m.content) for m in state["messages"]]
+
+
+def test_updates_match_invoke():
+    """Test 1: stato da "updates" == risultato di graph.invoke"""
+    print("\n" + "="*70)
+    print("TEST 1: StateTracker in modalità updates vs graph.invoke")
+    print("="*70)
+
+    propagator = Propagator()
+    graph = _build_graph()
+    init_state = propagator.create_initial_state("NVDA", "2024-05-10")
+    expected = graph.invoke(init_state, **{"config": propagator.get_graph_args()["config"]})
+
+    tracker = StateTracker(init_state)
+    nodes = []
+    for node, delta, _ in iter_graph_deltas(
+        graph, init_state, propagator.get_graph_args(stream_mode="updates"), tracker
+    ):
+        nodes.append(node)
+        assert all(m.type != "remove" for m in delta.get("messages", []))
+
+    assert _messages(tracker.state) == _messages(expected), (
+        _messages(tracker.state), _messages(expected)
+    )
+    for key in ("market_report", "news_report", "trader_investment_plan", "final_trade_decision"):
+        assert tracker.state[key] == expected[key], key
+    assert nodes[-1] == "Risk Judge" and len(nodes) == 6
+    print(f"✓ {len(nodes)} step, messaggi finali {_messages(tracker.state)}")
+    print("✓ Msg Clear (RemoveMessage per id, messaggio iniziale senza id) replicato")
+
+    print("\n✅ UPDATES == INVOKE: PASSED")
+
+
+def test_values_delta():
+    """Test 2: in modalità "values" il delta contiene solo i campi cambiati"""
+    print("\n" + "="*70)
+    print("TEST 2: Delta in modalità values")
+    print("="*70)
+
+    propagator = Propagator()
+    graph = _build_graph()
+    init_state = propagator.create_initial_state("NVDA", "2024-05-10")
+    deltas = [
+        delta for _, delta, _ in iter_graph_deltas(
+            graph, init_state, propagator.get_graph_args(stream_mode="values")
+        )
+    ]
+
+    first_report = next(d for d in deltas if "market_report" in d)
+    assert [m.content for m in first_report["messages"]] == ["market"]
+    assert set(first_report) == {"messages", "market_report"}, set(first_report)
+    print("✓ step analista: solo il messaggio aggiunto e il report nuovo")
+
+    # Msg Clear sostituisce la lista: il delta è la lista nuova
+    clear = deltas[deltas.index(first_report) + 1]
+    assert set(clear) == {"messages"} and [m.content for m in clear["messages"]] == ["Continue"]
+    print("✓ Msg Clear: messaggi sostituiti dal placeholder")
+
+    trader = next(d for d in deltas if "trader_investment_plan" in d)
+    assert [m.content for m in trader["messages"]] == ["trader"]
+    final = deltas[-1]
+    assert set(final) == {"final_trade_decision"}, set(final)
+    print("✓ step finale: solo final_trade_decision")
+
+    print("\n✅ VALUES DELTA: PASSED")
+
+
+def test_bridge_error():
+    """Test 3: un errore nel grafo arriva al consumer asincrono"""
+    print("\n" + "="*70)
+    print("TEST 3: StreamBridge propaga gli errori")
+    print("="*70)
+
+    propagator = Propagator()
+    graph = _build_graph(fail_at="Trader")
+    init_state = propagator.create_initial_state("NVDA", "2024-05-10")
+
+    async def consume():
+        bridge = StreamBridge(graph, init_state, propagator.get_graph_args(stream_mode="updates"))
+        seen = []
+        try:
+            async for node, _ in bridge:
+                seen.append(node)
+        except ValueError as e:
+            return seen, e, bridge.state
+        raise AssertionError("l'errore non è stato propagato")
+
+    seen, error, state = asyncio.run(consume())
+    assert str(error) == "Trader failed"
+    assert seen[-1] == "Msg Clear News" and "Trader" not in seen
+    assert state["market_report"] == "market report"
+    print(f"✓ ValueError ricevuto dopo {len(seen)} step, stato parziale disponibile")
+
+    print("\n✅ BRIDGE ERROR: PASSED")
+
+
+def test_bridge_close():
+    """Test 4: close() ferma il worker dopo lo step in corso"""
+    print("\n" + "="*70)
+    print("TEST 4: StreamBridge close anticipato")
+    print("="*70)
+
+    propagator = Propagator()
+    calls = []
+    graph = _build_graph(delay=0.1, calls=calls)
+    init_state = propagator.create_initial_state("NVDA", "2024-05-10")
+
+    async def consume():
+        bridge = StreamBridge(graph, init_state, propagator.get_graph_args(stream_mode="updates"))
+        future = bridge.start()
+        async for node, _ in bridge:
+            bridge.close()
+            break
+        await future
+        return node
+
+    first = asyncio.run(consume())
+    assert first == "Market Analyst"
+    assert "Trader" not in calls and "Risk Judge" not in calls, calls
+    print(f"✓ consumer chiuso dopo '{first}': eseguiti {len(calls)} nodi su 6")
+
+    print("\n✅ BRIDGE CLOSE: PASSED")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*70)
+    print("🧪 STREAMING TEST SUITE")
+    print("="*70)
+
+    tests = [
+        ("Updates == Invoke", test_updates_match_invoke),
+        ("Values Delta", test_values_delta),
+        ("Bridge Error", test_bridge_error),
+        ("Bridge Close", test_bridge_close),
+    ]
+
+    failed = 0
+    for test_name, test_fn in tests:
+        try:
+            test_fn()
+        except Exception as e:
+            failed += 1
+            print(f"\n❌ Error in {test_name}: {e}")
+            import traceback
+            traceback.print_exc()
+
+    print(f"\nTotal: {len(tests) - failed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,179 @@
+"""
+Test Suite - Swing Scoring
+Verifica lo scoring vettoriale (score_matrix) contro le funzioni riga-per-riga
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent / "swing_system"))
+
+from data_layer import generate_synthetic
+from indicators import compute_all
+import optimized_engine
+import scoring
+import universe_panel
+
+
+MTF_LONG = {
+    "weekly_trend": "UPTREND", "daily_trend": "UPTREND",
+    "long_confluence": True, "short_confluence": False,
+    "daily_structure": {
+        "structure_intact": True,
+        "last_signal": {"event": "BOS_UP", "volume_ratio": 1.8},
+    },
+}
+
+
+def _same(a: float, b: float) -> bool:
+    return a == b or (np.isnan(a) and np.isnan(b))
+
+
+def test_score_matrix_matches_rows():
+    """Test 1: score_matrix == sub-score scalari su ogni barra"""
+    print("\n" + "="*70)
+    print("TEST 1: Score matrix vs funzioni riga-per-riga")
+    print("="*70)
+
+    df     = compute_all(generate_synthetic("TEST", 300, seed=3))
+    mtfs   = [MTF_LONG if i % 2 else {} for i in range(len(df))]
+    matrix = scoring.score_matrix(df, scoring.mtf_columns(mtfs, df.index))
+
+    for i in range(len(df)):
+        row = df.iloc[i]
+        for direction in ("LONG", "SHORT"):
+            expected = {
+                "structure":  scoring.score_structure(row, mtfs[i], direction),
+                "trend":      scoring.score_trend_strength(row, direction),
+                "momentum":   scoring.score_momentum(row, direction),
+                "volatility": scoring.score_volatility_setup(row, direction),
+                "volume":     scoring.score_volume(row),
+            }
+            for block, value in expected.items():
+                assert _same(matrix[direction, block].iat[i], value), f"{block} {direction} barra {i}"
+            passed, _ = scoring.apply_filters(row, mtfs[i], direction)
+            assert bool(matrix[direction, "passed"].iat[i]) == passed, f"filtri {direction} barra {i}"
+
+    print(f"✓ {len(df)} barre x 2 direzioni identiche (incluse le barre di warmup con NaN)")
+    print("\n✅ Score Matrix: PASSED")
+
+
+def test_score_matrix_matches_score_ticker():
+    """Test 2: passed & total >= soglia ⇔ score_ticker restituisce un segnale"""
+    print("\n" + "="*70)
+    print("TEST 2: Score matrix vs score_ticker")
+    print("="*70)
+
+    df     = compute_all(generate_synthetic("TEST", 300, seed=5))
+    matrix = scoring.score_matrix(df, MTF_LONG)
+    n_sig  = 0
+
+    for i in range(60, len(df)):
+        for direction in ("LONG", "SHORT"):
+            sig      = scoring.score_ticker("TEST", df.iloc[:i + 1], MTF_LONG, direction, min_score=40)
+            selected = bool(matrix[direction, "passed"].iat[i]) and matrix[direction, "total"].iat[i] >= 40
+            assert selected == (sig is not None), f"{direction} barra {i}"
+            if sig is not None:
+                assert sig.score == round(matrix[direction, "total"].iat[i], 1)
+                n_sig += 1
+
+    print(f"✓ {n_sig} segnali coerenti con score_ticker")
+    print("\n✅ Score Ticker: PASSED")
+
+
+def test_universe_panel_scan():
+    """Test 3: pannello universo == compute_indicators / scan_ticker per ticker"""
+    print("\n" + "="*70)
+    print("TEST 3: UniversePanel cross-sectional")
+    print("="*70)
+
+    # Storici di lunghezza diversa e un ticker con dati fermi
+    frames = {tk: generate_synthetic(tk, 300 + 40 * k, trend=("up", "down")[k % 2], seed=k)
+              for k, tk in enumerate(["AAPL", "MSFT", "JPM", "XOM", "LLY", "CAT"])}
+    frames["LLY"] = frames["LLY"].iloc[:-7]
+    params = {tk: optimized_engine.load_ticker_params(tk, None) for tk in frames}
+    panel  = universe_panel.build_panel(frames, params)
+
+    for tk, df in frames.items():
+        expected = optimized_engine.compute_indicators(df).astype(float)
+        got      = panel.frame(tk)[expected.columns]
+        assert np.array_equal(expected.to_numpy(), got.to_numpy(), equal_nan=True), tk
+    print(f"✓ {panel}: indicatori identici al calcolo per ticker")
+
+    for min_score in (0, 75):
+        expected = [s for tk, df in frames.items()
+                    for s in optimized_engine.scan_ticker(tk, df, params[tk], min_score, "bilanciato")]
+        assert universe_panel.scan_panel(panel, params, min_score, "bilanciato") == expected
+    print("✓ scan_panel == scan_ticker")
+
+    ranks = universe_panel.percentile_scores(panel.cross_section(), ["er", "adx"], by_sector=True)
+    assert ranks.index.tolist() == panel.tickers and ranks.max().max() <= 100
+    print("✓ percentili per settore")
+
+    print("\n✅ Universe Panel: PASSED")
+
+
+def test_universe_panel_gaps():
+    """Test 4: ticker con date mancanti nel proprio storico (presenti per altri ticker)"""
+    print("\n" + "="*70)
+    print("TEST 4: UniversePanel con buchi interni")
+    print("="*70)
+
+    frames = {tk: generate_synthetic(tk, 320, trend="up", seed=k)
+              for k, tk in enumerate(["AAPL", "MSFT", "JPM"])}
+    msft = frames["MSFT"]
+    frames["MSFT"] = msft.drop(msft.index[[40, 200, len(msft) - 2]])   # anche la penultima barra
+    params = {tk: optimized_engine.load_ticker_params(tk, None) for tk in frames}
+    panel  = universe_panel.build_panel(frames, params)
+    assert len(panel.dates) == 320
+
+    for tk, df in frames.items():
+        expected = optimized_engine.compute_indicators(df).astype(float)
+        got      = panel.frame(tk)[expected.columns]
+        assert got.index.equals(expected.index), tk
+        assert np.array_equal(expected.to_numpy(), got.to_numpy(), equal_nan=True), tk
+    print("✓ indicatori identici al calcolo per ticker anche con date mancanti")
+
+    prev = panel.cross_section(offset=1)
+    assert prev.loc["MSFT", "close"] == frames["MSFT"]["close"].iloc[-2]
+    for min_score in (0, 75):
+        expected = [s for tk, df in frames.items()
+                    for s in optimized_engine.scan_ticker(tk, df, params[tk], min_score, "bilanciato")]
+        assert universe_panel.scan_panel(panel, params, min_score, "bilanciato") == expected
+    print("✓ barra precedente e scan_panel == scan_ticker")
+
+    print("\n✅ Universe Panel Gaps: PASSED")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*70)
+    print("🧪 SWING SCORING TEST SUITE")
+    print("="*70)
+
+    tests = [
+        ("Score Matrix", test_score_matrix_matches_rows),
+        ("Score Ticker", test_score_matrix_matches_score_ticker),
+        ("Universe Panel", test_universe_panel_scan),
+        ("Universe Panel Gaps", test_universe_panel_gaps),
+    ]
+
+    failed = 0
+    for test_name, test_fn in tests:
+        try:
+            test_fn()
+        except Exception as e:
+            failed += 1
+            print(f"\n❌ Error in {test_name}: {e}")
+            import traceback
+            traceback.print_exc()
+
+    print(f"\nTotal: {len(tests) - failed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
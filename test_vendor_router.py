@@ -0,0 +1,267 @@
+"""
+Test Suite - Vendor Router
+Verifica fallback, timeout, hedging e transizioni del circuit breaker
+"""
+
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from langgraph.graph import END, START, StateGraph
+from typing_extensions import TypedDict
+
+from tradingagents.dataflows.config import get_config, set_config
+from tradingagents.dataflows.vendor_router import CircuitBreaker, VendorRouter, VendorTimeoutError
+from tradingagents.graph.propagation import Propagator
+
+
+class RateLimited(Exception):
+    pass
+
+
+def _ok(value, delay: float = 0.0):
+    def impl(*args, **kwargs):
+        if delay:
+            time.sleep(delay)
+        return value
+    return impl
+
+
+def _fail(error: Exception = None):
+    def impl(*args, **kwargs):
+        raise error or ConnectionError("vendor down")
+    return impl
+
+
+def _router(**config) -> VendorRouter:
+    router = VendorRouter(max_workers=4)
+    router.configure({"vendor_timeout": 5.0, **config})
+    return router
+
+
+def test_fallback():
+    """Test 1: il primario fallisce -> risponde il fallback"""
+    print("\n" + "="*70)
+    print("TEST 1: Fallback sul vendor successivo")
+    print("="*70)
+
+    router = _router()
+    attempts = []
+    result = router.route(
+        "get_stock_data", ["alpha_vantage", "yfinance"],
+        {"alpha_vantage": _fail(), "yfinance": _ok("yf data")},
+        on_attempt=lambda vendor, attempt, started, error: attempts.append((vendor, attempt, error)),
+    )
+    assert result == ["yf data"]
+    assert [(v, a) for v, a, _ in attempts] == [("alpha_vantage", 1), ("yfinance", 2)]
+    assert isinstance(attempts[0][2], ConnectionError) and attempts[1][2] is None
+    print("✓ alpha_vantage fallito, risultato da yfinance")
+
+    # Vendor con più implementazioni: una fallita non fa fallire il vendor
+    result = router.route("get_news", ["local"], {"local": [_fail(), _ok("news")]})
+    assert result == ["news"]
+    print("✓ implementazioni multiple: errori parziali ignorati")
+
+    try:
+        router.route("get_news", ["a", "b"], {"a": _fail(), "b": _fail()})
+        raise AssertionError("doveva fallire")
+    except RuntimeError as e:
+        assert "get_news" in str(e)
+    print("✓ tutti i vendor falliti: RuntimeError")
+
+    print("\n✅ FALLBACK: PASSED")
+
+
+def test_timeout():
+    """Test 2: il primario lento viene abbandonato allo scadere del timeout"""
+    print("\n" + "="*70)
+    print("TEST 2: Timeout per vendor")
+    print("="*70)
+
+    router = _router(vendor_timeouts={"slow": 0.2})
+    errors = []
+    start = time.perf_counter()
+    result = router.route(
+        "get_indicators", ["slow", "fast"],
+        {"slow": _ok("late", delay=1.0), "fast": _ok("fast data")},
+        on_attempt=lambda vendor, attempt, started, error: errors.append((vendor, error)),
+    )
+    elapsed = time.perf_counter() - start
+    assert result == ["fast data"]
+    assert isinstance(errors[0][1], VendorTimeoutError)
+    assert elapsed < 0.8, elapsed
+    print(f"✓ 'slow' abbandonato dopo 0.2s, risposta in {elapsed:.2f}s")
+
+    print("\n✅ TIMEOUT: PASSED")
+
+
+def test_hedging():
+    """Test 3: con il percentile di hedge il fallback parte prima del timeout"""
+    print("\n" + "="*70)
+    print("TEST 3: Hedged fallback")
+    print("="*70)
+
+    router = _router(vendor_hedge_percentile=90, vendor_hedge_min_delay=0.05)
+    for _ in range(5):
+        router.route("get_news", ["primary", "backup"], {"primary": _ok("p", delay=0.01), "backup": _ok("b")})
+
+    start = time.perf_counter()
+    result = router.route(
+        "get_news", ["primary", "backup"],
+        {"primary": _ok("p", delay=1.0), "backup": _ok("b")},
+    )
+    elapsed = time.perf_counter() - start
+    assert result == ["b"], result
+    assert elapsed < 0.5, elapsed
+    print(f"✓ primario oltre il p90: backup avviato, risposta in {elapsed:.2f}s")
+
+    result = router.route(
+        "get_news", ["primary", "backup"],
+        {"primary": _ok("p"), "backup": _ok("b")}, collect=True,
+    )
+    assert result == ["p", "b"]
+    print("✓ collect=True: tutti i risultati, in ordine di vendor")
+
+    print("\n✅ HEDGING: PASSED")
+
+
+def test_circuit_breaker_transitions():
+    """Test 4: closed -> open (errori consecutivi / rate limit) -> closed dopo il cooldown"""
+    print("\n" + "="*70)
+    print("TEST 4: Transizioni del circuit breaker")
+    print("="*70)
+
+    breaker = CircuitBreaker(failure_threshold=3, cooldown=0.2)
+    breaker.record_failure("av")
+    breaker.record_failure("av")
+    assert breaker.allow("av")
+    breaker.record_success("av")
+    breaker.record_failure("av")
+    breaker.record_failure("av")
+    assert breaker.allow("av")
+    print("✓ un successo azzera il conteggio degli errori consecutivi")
+
+    breaker.record_failure("av")
+    assert not breaker.allow("av")
+    print("✓ 3 errori consecutivi: circuito aperto")
+
+    time.sleep(0.25)
+    assert breaker.allow("av")
+    print("✓ dopo il cooldown il vendor viene riprovato")
+
+    breaker.record_failure("yf", rate_limited=True)
+    assert not breaker.allow("yf")
+    print("✓ rate limit: circuito aperto al primo errore")
+
+    # Nel router: vendor aperto saltato, poi riprovato dopo il cooldown
+    router = _router(vendor_breaker_failures=2, vendor_breaker_cooldown=0.2)
+    calls = []
+
+    def flaky(*args, **kwargs):
+        calls.append("av")
+        raise RateLimited("429")
+
+    impls = {"av": flaky, "yf": _ok("yf")}
+    router.route("m", ["av", "yf"], impls, rate_limit_errors=(RateLimited,))
+    assert router.route("m", ["av", "yf"], impls, rate_limit_errors=(RateLimited,)) == ["yf"]
+    assert calls == ["av"], calls
+    print("✓ vendor rate-limited saltato alla chiamata successiva")
+
+    time.sleep(0.25)
+    impls["av"] = _ok("av")
+    assert router.route("m", ["av", "yf"], impls) == ["av"]
+    assert router.breaker.allow("av")
+    print("✓ cooldown scaduto: vendor riprovato e circuito chiuso")
+
+    # Tutti i vendor aperti: vengono provati comunque
+    router.breaker.record_failure("av", rate_limited=True)
+    router.breaker.record_failure("yf", rate_limited=True)
+    assert router.route("m", ["av", "yf"], impls) == ["av"]
+    print("✓ tutti i circuiti aperti: vendor provati comunque")
+
+    print("\n✅ CIRCUIT BREAKER: PASSED")
+
+
+def test_per_run_config():
+    """Test 5: ogni run usa la config del proprio grafo, non dell'ultimo costruito"""
+    print("\n" + "="*70)
+    print("TEST 5: Config dei dataflow per run")
+    print("="*70)
+
+    # vendor_* passati alla singola chiamata, senza toccare i default del router
+    router = _router()
+    start = time.perf_counter()
+    result = router.route(
+        "get_indicators", ["slow", "fast"],
+        {"slow": _ok("late", delay=1.0), "fast": _ok("fast data")},
+        config={"vendor_timeouts": {"slow": 0.2}},
+    )
+    assert result == ["fast data"] and time.perf_counter() - start < 0.8
+    assert router.timeouts == {}
+    print("✓ timeout per chiamata applicato, router invariato")
+
+    class State(TypedDict):
+        vendor: str
+
+    def tool_node(state):
+        # Come route_to_vendor: la config si legge anche dai thread dei vendor
+        time.sleep(0.05)
+        vendor = lambda: get_config()["data_vendors"]["core_stock_apis"]
+        return {"vendor": router.route("get_stock_data", ["v"], {"v": vendor})[0]}
+
+    workflow = StateGraph(State)
+    workflow.add_node("tool", tool_node)
+    workflow.add_edge(START, "tool")
+    workflow.add_edge("tool", END)
+    graph = workflow.compile()
+
+    set_config({"data_vendors": {"core_stock_apis": "yfinance"}})
+    configs = {
+        name: {"data_vendors": {"core_stock_apis": name}}
+        for name in ("alpha_vantage", "local", "mcp_alpha_vantage")
+    }
+    with ThreadPoolExecutor(max_workers=3) as runs:
+        futures = {
+            name: runs.submit(graph.invoke, {"vendor": ""},
+                              **{"config": Propagator(config=cfg).get_graph_args()["config"]})
+            for name, cfg in configs.items()
+        }
+        for name, future in futures.items():
+            assert future.result()["vendor"] == name, (name, future.result())
+    assert get_config()["data_vendors"]["core_stock_apis"] == "yfinance"
+    print("✓ 3 run concorrenti con config diverse, config globale invariata")
+
+    print("\n✅ PER-RUN CONFIG: PASSED")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*70)
+    print("🧪 VENDOR ROUTER TEST SUITE")
+    print("="*70)
+
+    tests = [
+        ("Fallback", test_fallback),
+        ("Timeout", test_timeout),
+        ("Hedging", test_hedging),
+        ("Circuit Breaker", test_circuit_breaker_transitions),
+        ("Per-Run Config", test_per_run_config),
+    ]
+
+    failed = 0
+    for test_name, test_fn in tests:
+        try:
+            test_fn()
+        except Exception as e:
+            failed += 1
+            print(f"\n❌ Error in {test_name}: {e}")
+            import traceback
+            traceback.print_exc()
+
+    print(f"\nTotal: {len(tests) - failed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -1,6 +1,7 @@
 from .utils.agent_utils import create_msg_delete
 from .utils.agent_states import AgentState, InvestDebateState, RiskDebateState
 from .utils.memory import FinancialSituationMemory
+from .utils.debate_memory import DebateMemory, create_debate_memory
 
 from .analysts.fundamentals_analyst import create_fundamentals_analyst
 from .analysts.market_analyst import create_market_analyst
@@ -13,6 +14,7 @@ from .researchers.bull_researcher import create_bull_researcher
 from .risk_mgmt.aggressive_debator import create_aggressive_debator
 from .risk_mgmt.conservative_debator import create_conservative_debator
 from .risk_mgmt.neutral_debator import create_neutral_debator
+from .risk_mgmt.risk_debate_round import create_risk_debate_round
 
 from .managers.research_manager import create_research_manager
 from .managers.risk_manager import create_risk_manager
@@ -21,6 +23,8 @@ from .trader.trader import create_trader
 
 __all__ = [
     "FinancialSituationMemory",
+    "DebateMemory",
+    "create_debate_memory",
     "AgentState",
     "create_msg_delete",
     "InvestDebateState",
@@ -34,6 +38,7 @@ __all__ = [
     "create_news_analyst",
     "create_aggressive_debator",
     "create_risk_manager",
+    "create_risk_debate_round",
     "create_conservative_debator",
     "create_social_media_analyst",
     "create_trader",
@@ -1,7 +1,7 @@
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 import time
 import json
-from tradingagents.agents.utils.agent_utils import get_stock_data, get_indicators
+from tradingagents.agents.utils.agent_utils import get_stock_data, get_indicators, get_indicators_batch
 from tradingagents.dataflows.config import get_config
 
 
@@ -14,6 +14,7 @@ def create_market_analyst(llm):
 
         tools = [
             get_stock_data,
+            get_indicators_batch,
             get_indicators,
         ]
 
@@ -94,7 +95,7 @@ For swing trades, execute this priority filter:
 6. **Volatility Compression**: Bollinger Bandwidth inflection up (setup emerging)
 7. **Risk Management**: Stop at 1.5x ATR% below entry, Target at 3x ATR% (consistent sizing across all assets)
 
-When you tool call, use the exact indicator names above. Call get_stock_data first, then get_indicators with specific indicator names. Write a detailed swing trading analysis focusing on:
+When you tool call, use the exact indicator names above. Call get_stock_data first, then get_indicators_batch ONCE with the full list of chosen indicator names (use get_indicators only for a single follow-up indicator). Write a detailed swing trading analysis focusing on:
 - Current trend strength (ADX, ER)
 - Trend direction consensus (SuperTrend, Linear Regression, Ichimoku)
 - Momentum alignment (RSI, TSI, MACD)
@@ -137,7 +138,7 @@ For long-term positions, prioritize:
 3. **Valuation Context**: Bollinger Bands for relative valuation vs historical ranges
 4. **Risk Allocation**: ATR for portfolio position sizing
 
-When you tool call, use exact indicator names. Call get_stock_data first, then get_indicators. Write a detailed investment analysis focusing on:
+When you tool call, use exact indicator names. Call get_stock_data first, then get_indicators_batch ONCE with the full list of chosen indicators. Write a detailed investment analysis focusing on:
 - Long-term trend status (200 SMA, monthly MACD)
 - Strategic accumulation zones (RSI, Bollinger Bands)
 - Risk-adjusted position sizing recommendations
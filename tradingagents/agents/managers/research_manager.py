@@ -1,8 +1,10 @@
 import time
 import json
 
+from tradingagents.agents.utils.debate_memory import debate_context
 
-def create_research_manager(llm, memory):
+
+def create_research_manager(llm, memory, debate_memory=None):
     def research_manager_node(state) -> dict:
         history = state["investment_debate_state"].get("history", "")
         market_research_report = state["market_report"]
@@ -19,6 +21,8 @@ def create_research_manager(llm, memory):
         for i, rec in enumerate(past_memories, 1):
             past_memory_str += rec["recommendation"] + "\n\n"
 
+        history_context, memory_state = debate_context(debate_memory, investment_debate_state)
+
         prompt = f"""As the portfolio manager and debate facilitator, your role is to critically evaluate this round of debate and make a definitive decision: align with the bear analyst, the bull analyst, or choose Hold only if it is strongly justified based on the arguments presented.
 
 Summarize the key points from both sides concisely, focusing on the most compelling evidence or reasoning. Your recommendation—Buy, Sell, or Hold—must be clear and actionable. Avoid defaulting to Hold simply because both sides have valid points; commit to a stance grounded in the debate's strongest arguments.
@@ -35,10 +39,11 @@ Here are your past reflections on mistakes:
 
 Here is the debate:
 Debate History:
-{history}"""
+{history_context}"""
         response = llm.invoke(prompt)
 
         new_investment_debate_state = {
+            **memory_state,
             "judge_decision": response.content,
             "history": investment_debate_state.get("history", ""),
             "bear_history": investment_debate_state.get("bear_history", ""),
@@ -1,8 +1,10 @@
 import time
 import json
 
+from tradingagents.agents.utils.debate_memory import debate_context
 
-def create_risk_manager(llm, memory):
+
+def create_risk_manager(llm, memory, debate_memory=None):
     def risk_manager_node(state) -> dict:
 
         company_name = state["company_of_interest"]
@@ -22,6 +24,8 @@ def create_risk_manager(llm, memory):
         for i, rec in enumerate(past_memories, 1):
             past_memory_str += rec["recommendation"] + "\n\n"
 
+        history_context, memory_state = debate_context(debate_memory, risk_debate_state)
+
         prompt = f"""As the Risk Management Judge and Debate Facilitator, your goal is to evaluate the debate between three risk analysts—Aggressive, Neutral, and Conservative—and determine the best course of action for the trader. Your decision must result in a clear recommendation: Buy, Sell, or Hold. Choose Hold only if strongly justified by specific arguments, not as a fallback when all sides seem valid. Strive for clarity and decisiveness.
 
 Guidelines for Decision-Making:
@@ -37,7 +41,7 @@ Deliverables:
 ---
 
 **Analysts Debate History:**  
-{history}
+{history_context}
 
 ---
 
@@ -46,6 +50,7 @@ Focus on actionable insights and continuous improvement. Build on past lessons,
         response = llm.invoke(prompt)
 
         new_risk_debate_state = {
+            **memory_state,
             "judge_decision": response.content,
             "history": risk_debate_state["history"],
             "aggressive_history": risk_debate_state["aggressive_history"],
@@ -2,8 +2,10 @@ from langchain_core.messages import AIMessage
 import time
 import json
 
+from tradingagents.agents.utils.debate_memory import debate_context
 
-def create_bull_researcher(llm, memory):
+
+def create_bull_researcher(llm, memory, debate_memory=None):
     def bull_node(state) -> dict:
         investment_debate_state = state["investment_debate_state"]
         history = investment_debate_state.get("history", "")
@@ -22,6 +24,8 @@ def create_bull_researcher(llm, memory):
         for i, rec in enumerate(past_memories, 1):
             past_memory_str += rec["recommendation"] + "\n\n"
 
+        history_context, memory_state = debate_context(debate_memory, investment_debate_state)
+
         prompt = f"""You are a Bull Analyst advocating for investing in the stock. Your task is to build a strong, evidence-based case emphasizing growth potential, competitive advantages, and positive market indicators. Leverage the provided research and data to address concerns and counter bearish arguments effectively.
 
 Key points to focus on:
@@ -36,7 +40,7 @@ Market research report: {market_research_report}
 Social media sentiment report: {sentiment_report}
 Latest world affairs news: {news_report}
 Company fundamentals report: {fundamentals_report}
-Conversation history of the debate: {history}
+Conversation history of the debate: {history_context}
 Last bear argument: {current_response}
 Reflections from similar situations and lessons learned: {past_memory_str}
 Use this information to deliver a compelling bull argument, refute the bear's concerns, and engage in a dynamic debate that demonstrates the strengths of the bull position. You must also address reflections and learn from lessons and mistakes you made in the past.
@@ -47,6 +51,7 @@ Use this information to deliver a compelling bull argument, refute the bear's co
         argument = f"Bull Analyst: {response.content}"
 
         new_investment_debate_state = {
+            **memory_state,
             "history": history + "\n" + argument,
             "bull_history": bull_history + "\n" + argument,
             "bear_history": investment_debate_state.get("bear_history", ""),
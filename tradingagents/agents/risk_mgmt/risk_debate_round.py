@@ -0,0 +1,59 @@
+from langchain_core.runnables.config import ContextThreadPoolExecutor
+
+
+# Fixed merge order: the transcript is identical whatever analyst finishes first
+RISK_DEBATORS = ("aggressive", "conservative", "neutral")
+
+
+def create_risk_debate_round(
+    aggressive_node, conservative_node, neutral_node, debate_memory=None
+):
+    """Run one risk-debate round with the three analysts in parallel.
+
+    Every analyst answers the transcript of the previous round (the same input
+    state), so the three LLM calls run concurrently. Their arguments are then
+    appended to RiskDebateState in a fixed order (aggressive, conservative,
+    neutral), so the resulting state is deterministic.
+
+    With a debate_memory, the rolling summary is brought up to date once
+    before the fan-out instead of by each analyst concurrently.
+    """
+    nodes = dict(zip(RISK_DEBATORS, (aggressive_node, conservative_node, neutral_node)))
+
+    def risk_debate_round_node(state) -> dict:
+        risk_debate_state = state["risk_debate_state"]
+        if debate_memory is not None:
+            risk_debate_state = {**risk_debate_state, **debate_memory.update(risk_debate_state)}
+            state = {**state, "risk_debate_state": risk_debate_state}
+
+        # ContextThreadPoolExecutor propagates the run config (callbacks, tags)
+        with ContextThreadPoolExecutor(max_workers=len(nodes)) as executor:
+            futures = {name: executor.submit(node, state) for name, node in nodes.items()}
+            results = {
+                name: future.result()["risk_debate_state"] for name, future in futures.items()
+            }
+        arguments = {name: result[f"current_{name}_response"] for name, result in results.items()}
+
+        new_risk_debate_state = {
+            "history": risk_debate_state.get("history", ""),
+            "latest_speaker": "Neutral",
+            "count": risk_debate_state["count"] + len(RISK_DEBATORS),
+        }
+        if "summarized_turns" in risk_debate_state:
+            # A tighter per-analyst budget may have summarized further: keep the most advanced
+            latest = max(
+                [risk_debate_state, *results.values()], key=lambda s: s.get("summarized_turns", 0)
+            )
+            new_risk_debate_state["history_summary"] = latest["history_summary"]
+            new_risk_debate_state["summarized_turns"] = latest["summarized_turns"]
+        for name in RISK_DEBATORS:
+            argument = arguments[name]
+            new_risk_debate_state["history"] += "\n" + argument
+            new_risk_debate_state[f"{name}_history"] = (
+                risk_debate_state.get(f"{name}_history", "") + "\n" + argument
+            )
+            new_risk_debate_state[f"current_{name}_response"] = argument
+
+        return {"risk_debate_state": new_risk_debate_state}
+
+    return risk_debate_round_node
@@ -19,6 +19,10 @@ class InvestDebateState(TypedDict):
     current_response: Annotated[str, "Latest response"]  # Last response
     judge_decision: Annotated[str, "Final judge decision"]  # Last response
     count: Annotated[int, "Length of the current conversation"]  # Conversation length
+    history_summary: Annotated[
+        str, "Rolling summary of the turns older than the verbatim window"
+    ]  # Only set when debate memory is enabled
+    summarized_turns: Annotated[int, "Number of turns folded into history_summary"]
 
 
 # Risk management team state
@@ -45,6 +49,10 @@ class RiskDebateState(TypedDict):
     ]  # Last response
     judge_decision: Annotated[str, "Judge's decision"]
     count: Annotated[int, "Length of the current conversation"]  # Conversation length
+    history_summary: Annotated[
+        str, "Rolling summary of the turns older than the verbatim window"
+    ]  # Only set when debate memory is enabled
+    summarized_turns: Annotated[int, "Number of turns folded into history_summary"]
 
 
 class AgentState(MessagesState):
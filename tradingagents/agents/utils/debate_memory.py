@@ -0,0 +1,154 @@
+"""Bounded-context memory for the bull/bear and risk debates.
+
+The debate transcript (`history`) grows by one turn per node, and every node
+re-embeds it in its prompt next to the four analyst reports. DebateMemory
+keeps what a node sees bounded: the last K turns verbatim plus a rolling
+summary of the older turns, trimmed to a per-node token budget. The summary
+is updated incrementally (only the turns that left the verbatim window are
+sent to the summarizer) and travels in the debate state as
+`history_summary` / `summarized_turns`; the full `history` is still stored
+unchanged for reports and logs.
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+# Every turn is appended as "\n<Speaker> Analyst: ..."
+_TURN_START = re.compile(
+    r"\n(?=(?:Bull|Bear|Aggressive|Conservative|Neutral) Analyst: )"
+)
+
+
+def split_turns(history: str) -> List[str]:
+    """Split a debate transcript into turns (one per speaker intervention)."""
+    return [turn for turn in _TURN_START.split(history) if turn.strip()]
+
+
+def estimate_tokens(text: str) -> int:
+    """Provider-agnostic token estimate (~4 characters per token)."""
+    return (len(text) + 3) // 4
+
+
+class DebateMemory:
+    """Last K turns verbatim + incrementally summarized older turns."""
+
+    def __init__(
+        self,
+        llm,
+        keep_last_turns: int = 4,
+        token_budget: int = 3000,
+        summary_tokens: int = 400,
+        node_budgets: Optional[Dict[str, int]] = None,
+    ):
+        """Initialize the debate memory.
+
+        Args:
+            llm: Chat model used to update the summary (the quick-thinking LLM)
+            keep_last_turns: Number of most recent turns always kept verbatim
+            token_budget: Default token budget for the debate history in a prompt
+            summary_tokens: Target length of the rolling summary
+            node_budgets: Per-node overrides of token_budget, keyed by node name
+        """
+        self.llm = llm
+        self.keep_last_turns = max(1, int(keep_last_turns))
+        self.token_budget = int(token_budget)
+        self.summary_tokens = int(summary_tokens)
+        self.node_budgets = dict(node_budgets or {})
+
+    def for_node(self, node_name: str) -> "DebateMemory":
+        """Memory sharing the same summarizer, with the budget of one graph node."""
+        return DebateMemory(
+            self.llm,
+            keep_last_turns=self.keep_last_turns,
+            token_budget=self.node_budgets.get(node_name, self.token_budget),
+            summary_tokens=self.summary_tokens,
+        )
+
+    def update(self, debate_state: Dict[str, Any]) -> Dict[str, Any]:
+        """Fold the turns that no longer fit verbatim into the rolling summary.
+
+        Returns the `history_summary` / `summarized_turns` keys to store in the
+        debate state (unchanged values if nothing new had to be summarized).
+        """
+        turns = split_turns(debate_state.get("history", ""))
+        summary = debate_state.get("history_summary", "")
+        summarized = debate_state.get("summarized_turns", 0)
+
+        # Older than the last K turns, or pushed out by the token budget
+        cutoff = len(turns) - self.keep_last_turns
+        verbatim_budget = self.token_budget - self.summary_tokens
+        while cutoff < len(turns) - 1 and estimate_tokens(
+            "\n".join(turns[max(cutoff, 0):])
+        ) > verbatim_budget:
+            cutoff += 1
+
+        if cutoff > summarized:
+            summary = self._summarize(summary, turns[summarized:cutoff])
+            summarized = cutoff
+        return {"history_summary": summary, "summarized_turns": summarized}
+
+    def render(self, debate_state: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        """Debate history to embed in a prompt, plus the state updates to return."""
+        updates = self.update(debate_state)
+        history = debate_state.get("history", "")
+        if not updates["summarized_turns"]:
+            # Short debate: prompt identical to the one with the full history
+            return _clip(history, self.token_budget), updates
+
+        recent = "\n".join(split_turns(history)[updates["summarized_turns"]:])
+        summary = updates["history_summary"]
+        context = (
+            f"\n[Summary of the earlier turns]\n{summary}\n\n"
+            f"[Most recent turns]\n"
+        )
+        return context + _clip(recent, self.token_budget - estimate_tokens(context)), updates
+
+    def _summarize(self, summary: str, turns: List[str]) -> str:
+        words = self.summary_tokens * 3 // 4
+        prompt = f"""You maintain a running summary of a multi-agent trading debate. Update the existing summary with the new turns below.
+
+Keep, for each speaker, their key arguments, the figures and evidence they cite, the points conceded and the points still disputed. Drop repetition and rhetoric. Reply with the updated summary only, in at most {words} words.
+
+Existing summary:
+{summary or "(none)"}
+
+New turns:
+{chr(10).join(turns)}"""
+        return self.llm.invoke(prompt).content.strip()
+
+
+def _clip(text: str, token_budget: int) -> str:
+    """Keep the tail of text (the most recent part) within token_budget."""
+    max_chars = max(token_budget, 0) * 4
+    if len(text) <= max_chars:
+        return text
+    return "[...]" + text[len(text) - max_chars:]
+
+
+def debate_context(
+    debate_memory: Optional[DebateMemory], debate_state: Dict[str, Any]
+) -> Tuple[str, Dict[str, Any]]:
+    """History to put in a node prompt; the full history when memory is off."""
+    if debate_memory is None:
+        return debate_state.get("history", ""), {}
+    return debate_memory.render(debate_state)
+
+
+def create_debate_memory(llm, config: Dict[str, Any]) -> Optional[DebateMemory]:
+    """Build the debate memory from config, or None to embed the full history.
+
+    Config keys:
+        debate_memory_turns: turns kept verbatim (None/0 disables the memory)
+        debate_token_budget: default token budget for the debate history
+        debate_node_token_budgets: per-node budgets, e.g. {"Risk Judge": 6000}
+        debate_summary_tokens: target length of the rolling summary
+    """
+    if not config.get("debate_memory_turns"):
+        return None
+    return DebateMemory(
+        llm,
+        keep_last_turns=config["debate_memory_turns"],
+        token_budget=config.get("debate_token_budget", 3000),
+        summary_tokens=config.get("debate_summary_tokens", 400),
+        node_budgets=config.get("debate_node_token_budgets"),
+    )
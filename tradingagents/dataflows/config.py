@@ -1,6 +1,11 @@
 import tradingagents.default_config as default_config
 from typing import Dict, Optional
 
+from langchain_core.runnables.config import var_child_runnable_config
+
+# Key of config["configurable"] holding the config of the graph being run
+RUN_CONFIG_KEY = "dataflow_config"
+
 # Use default config but allow it to be overridden
 _config: Optional[Dict] = None
 
@@ -21,9 +26,19 @@ def set_config(config: Dict):
 
 
 def get_config() -> Dict:
-    """Get the current configuration."""
+    """Get the current configuration.
+
+    Inside a graph run (nodes, tools and the vendor threads they start) this
+    is the config of the graph being run, passed by Propagator.get_graph_args
+    as configurable["dataflow_config"]; graphs with different configs can
+    then run concurrently in one process. Elsewhere it is the process-wide
+    config from set_config().
+    """
     if _config is None:
         initialize_config()
+    run_config = (var_child_runnable_config.get() or {}).get("configurable", {}).get(RUN_CONFIG_KEY)
+    if run_config is not None:
+        return {**_config, **run_config}
     return _config.copy()
 
 
@@ -2,7 +2,7 @@
 dashboard_unified.py - Unified HTML Dashboard
 Combines FASE 3 reporting + swing_system visualization
 
-Single-file HTML output with:
+HTML output (CSS/JS shared in <output dir>/static/) with:
   - Interactive tabs
   - Responsive design
   - Color-coded signals
@@ -11,10 +11,13 @@ Single-file HTML output with:
 """
 
 import json
+import os
 from datetime import datetime
 from typing import List, Dict, Optional
 import pandas as pd
 
+from ..utils.static_assets import asset_tags
+
 
 def create_dashboard_html(scan_results: List[Dict] = None,
                          backtest_results: Dict = None,
@@ -44,6 +47,7 @@ def create_dashboard_html(scan_results: List[Dict] = None,
         scan_results=scan_results,
         backtest_results=backtest_results,
         positions=positions,
+        asset_dir=os.path.dirname(os.path.abspath(output_path)),
     )
     
     with open(output_path, "w") as f:
@@ -53,11 +57,13 @@ def create_dashboard_html(scan_results: List[Dict] = None,
 
 
 def _build_html(title: str, scan_results: List[Dict], 
-                backtest_results: Dict, positions: List[Dict]) -> str:
-    """Costruisce HTML."""
+                backtest_results: Dict, positions: List[Dict],
+                asset_dir: Optional[str] = None) -> str:
+    """Costruisce HTML (asset_dir=None: CSS/JS inline)."""
     
-    styles = _get_css()
-    scripts = _get_js()
+    head_assets, body_assets = asset_tags(
+        asset_dir, "dashboard_unified", css=_get_css(), js=_get_js()
+    )
     
     scan_html = _build_scan_tab(scan_results)
     backtest_html = _build_backtest_tab(backtest_results)
@@ -69,9 +75,7 @@ def _build_html(title: str, scan_results: List[Dict],
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{title}</title>
-    <style>
-{styles}
-    </style>
+    {head_assets}
 </head>
 <body>
     <header>
@@ -93,9 +97,7 @@ def _build_html(title: str, scan_results: List[Dict],
         </div>
     </div>
     
-    <script>
-{scripts}
-    </script>
+    {body_assets}
 </body>
 </html>"""
     
@@ -1,9 +1,15 @@
+import asyncio
+import logging
+import time
 from typing import Annotated
 
+from langchain_core.callbacks import dispatch_custom_event
+
 # Import from vendor-specific modules
 from .y_finance import (
     get_YFin_data_online,
     get_stock_stats_indicators_window,
+    get_stock_stats_indicators_table,
     get_fundamentals as get_yfinance_fundamentals,
     get_balance_sheet as get_yfinance_balance_sheet,
     get_cashflow as get_yfinance_cashflow,
@@ -40,6 +46,16 @@ from .mcp_alpha_vantage import (
 # Configuration and routing logic
 from .config import get_config
 
+from .vendor_router import VendorRouter
+
+logger = logging.getLogger(__name__)
+
+# Custom callback event reporting each vendor attempt (see graph/profiler.py)
+VENDOR_ATTEMPT_EVENT = "vendor_attempt"
+
+# Shared router: circuit breaker state and latency stats persist across calls
+_router = VendorRouter()
+
 # Tools organized by category
 TOOLS_CATEGORIES = {
     "core_stock_apis": {
@@ -51,7 +67,8 @@ TOOLS_CATEGORIES = {
     "technical_indicators": {
         "description": "Technical analysis indicators",
         "tools": [
-            "get_indicators"
+            "get_indicators",
+            "get_indicators_batch"
         ]
     },
     "fundamental_data": {
@@ -93,6 +110,9 @@ VENDOR_METHODS = {
         "mcp_alpha_vantage": get_mcp_indicator,
         "yfinance": get_stock_stats_indicators_window,
     },
+    "get_indicators_batch": {
+        "yfinance": get_stock_stats_indicators_table,
+    },
     # fundamental_data
     "get_fundamentals": {
         "alpha_vantage": get_alpha_vantage_fundamentals,
@@ -154,8 +174,30 @@ def get_vendor(category: str, method: str = None) -> str:
     # Fall back to category-level configuration
     return config.get("data_vendors", {}).get(category, "default")
 
+def _report_vendor_attempt(method: str, vendor: str, attempt: int, started: float, error=None):
+    """Emit a vendor attempt to the callbacks of the enclosing tool run, if any."""
+    try:
+        dispatch_custom_event(VENDOR_ATTEMPT_EVENT, {
+            "method": method,
+            "vendor": vendor,
+            "attempt": attempt,
+            "ok": error is None,
+            "duration": time.perf_counter() - started,
+            "error": repr(error) if error is not None else None,
+        })
+    except RuntimeError:
+        pass  # Called outside a tool/runnable run: nobody to report to
+
 def route_to_vendor(method: str, *args, **kwargs):
-    """Route method calls to appropriate vendor implementation with fallback support."""
+    """Route method calls to appropriate vendor implementation with fallback support.
+
+    Vendors are tried in the configured order (primary first, then the other
+    available vendors as fallbacks) with per-vendor timeouts, optional hedged
+    fallbacks and circuit breakers (see vendor_router.py). With a single
+    primary vendor the first successful result is returned; with several
+    comma-separated primaries all vendors are queried concurrently and their
+    results concatenated.
+    """
     category = get_category_for_method(method)
     vendor_config = get_vendor(category, method)
 
@@ -165,96 +207,40 @@ def route_to_vendor(method: str, *args, **kwargs):
     if method not in VENDOR_METHODS:
         raise ValueError(f"Method '{method}' not supported")
 
-    # Get all available vendors for this method for fallback
-    all_available_vendors = list(VENDOR_METHODS[method].keys())
-    
     # Create fallback vendor list: primary vendors first, then remaining vendors as fallbacks
     fallback_vendors = primary_vendors.copy()
-    for vendor in all_available_vendors:
+    for vendor in VENDOR_METHODS[method]:
         if vendor not in fallback_vendors:
             fallback_vendors.append(vendor)
 
-    # Debug: Print fallback ordering
-    primary_str = " → ".join(primary_vendors)
-    fallback_str = " → ".join(fallback_vendors)
-    print(f"DEBUG: {method} - Primary: [{primary_str}] | Full fallback order: [{fallback_str}]")
-
-    # Track results and execution state
-    results = []
-    vendor_attempt_count = 0
-    any_primary_vendor_attempted = False
-    successful_vendor = None
-
-    for vendor in fallback_vendors:
-        if vendor not in VENDOR_METHODS[method]:
-            if vendor in primary_vendors:
-                print(f"INFO: Vendor '{vendor}' not supported for method '{method}', falling back to next vendor")
-            continue
-
-        vendor_impl = VENDOR_METHODS[method][vendor]
-        is_primary_vendor = vendor in primary_vendors
-        vendor_attempt_count += 1
-
-        # Track if we attempted any primary vendor
-        if is_primary_vendor:
-            any_primary_vendor_attempted = True
-
-        # Debug: Print current attempt
-        vendor_type = "PRIMARY" if is_primary_vendor else "FALLBACK"
-        print(f"DEBUG: Attempting {vendor_type} vendor '{vendor}' for {method} (attempt #{vendor_attempt_count})")
-
-        # Handle list of methods for a vendor
-        if isinstance(vendor_impl, list):
-            vendor_methods = [(impl, vendor) for impl in vendor_impl]
-            print(f"DEBUG: Vendor '{vendor}' has multiple implementations: {len(vendor_methods)} functions")
-        else:
-            vendor_methods = [(vendor_impl, vendor)]
-
-        # Run methods for this vendor
-        vendor_results = []
-        for impl_func, vendor_name in vendor_methods:
-            try:
-                print(f"DEBUG: Calling {impl_func.__name__} from vendor '{vendor_name}'...")
-                result = impl_func(*args, **kwargs)
-                vendor_results.append(result)
-                print(f"SUCCESS: {impl_func.__name__} from vendor '{vendor_name}' completed successfully")
-                    
-            except AlphaVantageRateLimitError as e:
-                if vendor == "alpha_vantage":
-                    print(f"RATE_LIMIT: Alpha Vantage rate limit exceeded, falling back to next available vendor")
-                    print(f"DEBUG: Rate limit details: {e}")
-                # Continue to next vendor for fallback
-                continue
-            except Exception as e:
-                # Log error but continue with other implementations
-                print(f"FAILED: {impl_func.__name__} from vendor '{vendor_name}' failed: {e}")
-                continue
-
-        # Add this vendor's results
-        if vendor_results:
-            results.extend(vendor_results)
-            successful_vendor = vendor
-            result_summary = f"Got {len(vendor_results)} result(s)"
-            print(f"SUCCESS: Vendor '{vendor}' succeeded - {result_summary}")
-            
-            # Stopping logic: Stop after first successful vendor for single-vendor configs
-            # Multiple vendor configs (comma-separated) may want to collect from multiple sources
-            if len(primary_vendors) == 1:
-                print(f"DEBUG: Stopping after successful vendor '{vendor}' (single-vendor config)")
-                break
-        else:
-            print(f"FAILED: Vendor '{vendor}' produced no results")
-
-    # Final result summary
-    if not results:
-        print(f"FAILURE: All {vendor_attempt_count} vendor attempts failed for method '{method}'")
-        raise RuntimeError(f"All vendor implementations failed for method '{method}'")
-    else:
-        print(f"FINAL: Method '{method}' completed with {len(results)} result(s) from {vendor_attempt_count} vendor attempt(s)")
+    unsupported = [v for v in primary_vendors if v not in VENDOR_METHODS[method]]
+    if unsupported:
+        logger.info("vendor_unsupported method=%s vendors=%s", method, unsupported)
+    logger.debug("vendor_route method=%s order=%s", method, fallback_vendors)
+
+    def report(vendor, attempt, started, error):
+        _report_vendor_attempt(method, vendor, attempt, started, error)
+
+    results = _router.route(
+        method,
+        fallback_vendors,
+        VENDOR_METHODS[method],
+        args,
+        kwargs,
+        collect=len(primary_vendors) > 1,
+        rate_limit_errors=(AlphaVantageRateLimitError, MCPRateLimitError),
+        on_attempt=report,
+        config=get_config(),
+    )
 
     # Return single result if only one, otherwise concatenate as string
     if len(results) == 1:
         return results[0]
     else:
         # Convert all results to strings and concatenate
-        return '\n'.join(str(result) for result in results)
\ No newline at end of file
+        return '\n'.join(str(result) for result in results)
+
+
+async def aroute_to_vendor(method: str, *args, **kwargs):
+    """Async route_to_vendor: waits on a worker thread, keeping the event loop free."""
+    return await asyncio.to_thread(route_to_vendor, method, *args, **kwargs)
@@ -13,10 +13,12 @@ LOGICA:
 
 import numpy as np
 import pandas as pd
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
 from typing import Optional, List
 
+from tradingagents.dataflows.pivot_engine import pivot_table
+
 
 # ═════════════════════════════════════════════════════════════════════════════
 # ENUMS E DATACLASSES
@@ -42,7 +44,7 @@ class TrendState(str, Enum):
     UNDEFINED = "UNDEFINED"
 
 
-@dataclass
+@dataclass(slots=True)
 class Pivot:
     """Identifica un swing high o low locale"""
     bar_index:  int
@@ -68,7 +70,7 @@ class Pivot:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class StructureSignal:
     """Segnale di rottura strutturale (BOS/CHoCH)"""
     bar_index:     int
@@ -112,7 +114,7 @@ def find_pivots(df: pd.DataFrame,
                 right_bars: int = 5,
                 min_prominence_pct: float = 1.0) -> List[Pivot]:
     """
-    Identifica pivot high e low con finestra rolling.
+    Identifica pivot high e low con il motore vettoriale condiviso (pivot_engine).
     
     Un pivot high a barra i richiede:
       - high[i] == max(high[i-left : i+right+1])
@@ -128,50 +130,18 @@ def find_pivots(df: pd.DataFrame,
     Returns:
         Lista di Pivot ordinati per bar_index
     """
-    highs   = df["high"].values
-    lows    = df["low"].values
-    volumes = df["volume"].values if "volume" in df.columns else np.ones(len(df))
-    n       = len(df)
-    pivots  = []
-
-    for i in range(left_bars, n - right_bars):
-        # Pivot HIGH
-        window_h = highs[i - left_bars : i + right_bars + 1]
-        if highs[i] == window_h.max():
-            left_min  = lows[i - left_bars : i].min() if i > left_bars else lows[i]
-            right_min = lows[i + 1 : i + right_bars + 1].min() if i + right_bars < n else lows[i]
-            prominence = highs[i] - max(left_min, right_min)
-            prom_pct = prominence / highs[i] * 100 if highs[i] > 0 else 0
-
-            if prom_pct >= min_prominence_pct:
-                pivots.append(Pivot(
-                    bar_index=i,
-                    timestamp=df.index[i],
-                    price=highs[i],
-                    is_high=True,
-                    prominence=prominence,
-                    volume=volumes[i],
-                ))
-
-        # Pivot LOW
-        window_l = lows[i - left_bars : i + right_bars + 1]
-        if lows[i] == window_l.min():
-            left_max = highs[i - left_bars : i].max() if i > left_bars else highs[i]
-            right_max = highs[i + 1 : i + right_bars + 1].max() if i + right_bars < n else highs[i]
-            prominence = min(left_max, right_max) - lows[i]
-            prom_pct = prominence / lows[i] * 100 if lows[i] > 0 else 0
-
-            if prom_pct >= min_prominence_pct:
-                pivots.append(Pivot(
-                    bar_index=i,
-                    timestamp=df.index[i],
-                    price=lows[i],
-                    is_high=False,
-                    prominence=prominence,
-                    volume=volumes[i],
-                ))
-
-    return sorted(pivots, key=lambda p: p.bar_index)
+    table = pivot_table(df, left_bars, right_bars, min_prominence_pct)
+    return [
+        Pivot(
+            bar_index=int(r["bar_index"]),
+            timestamp=df.index[r["bar_index"]],
+            price=r["price"],
+            is_high=bool(r["is_high"]),
+            prominence=r["prominence"],
+            volume=r["volume"],
+        )
+        for r in table.data
+    ]
 
 
 # ═════════════════════════════════════════════════════════════════════════════
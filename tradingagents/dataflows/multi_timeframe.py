@@ -12,11 +12,11 @@ Solution: Dual TF = 2 calls per symbol (not 3-4 with intraday)
 import pandas as pd
 import yfinance as yf
 from datetime import datetime, timedelta
-from typing import Dict, Tuple, Optional
+from typing import Dict, Mapping, Tuple, Optional
 from dataclasses import dataclass
 
 from .cache_manager import CacheManager
-from .technical_calculations import get_all_indicators
+from .technical_calculations import IndicatorEngine
 
 
 @dataclass
@@ -25,7 +25,7 @@ class TimeframeData:
     symbol: str
     timeframe: str  # 'daily' or 'weekly'
     ohlcv: pd.DataFrame  # OHLCV data
-    indicators: Dict  # All calculated indicators
+    indicators: Mapping  # Indicator name -> series (lazily computed)
     last_update: datetime
     
     def latest(self, indicator_name: str, offset: int = 0):
@@ -187,8 +187,8 @@ class MultiTimeframeLayer:
             force_refresh=force_refresh
         )
         
-        # Calculate all indicators for this timeframe
-        indicators = get_all_indicators(ohlcv, swing_mode=True)
+        # Indicators are computed lazily, on first access, with shared intermediates
+        indicators = IndicatorEngine(ohlcv, swing_mode=True)
         
         return TimeframeData(
             symbol=symbol,
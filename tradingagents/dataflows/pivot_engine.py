@@ -0,0 +1,446 @@
+"""
+pivot_engine.py
+═════════════════════════════════════════════════════════════════════════════
+Motore pivot unico — vettoriale (batch) e incrementale (streaming)
+
+Condiviso da:
+  - swing_system/market_structure.py           (find_pivots)
+  - tradingagents/dataflows/market_structure_choch.py (find_pivots)
+  - tradingagents/dataflows/structure_detector.py     (PivotFinder, strict=True)
+
+DEFINIZIONE (identica in batch e in streaming):
+  Pivot HIGH alla barra i se:
+    - high[i] == max(high[i-left : i+right+1])     (strict=True → high[i] > ogni altra barra)
+    - prominence = high[i] - max(min(low[i-left:i]), min(low[i+1:i+right+1]))
+    - prominence / high[i] * 100 >= min_prominence_pct
+  Pivot LOW simmetrico su low/high.
+
+  Zero lookahead: la barra i viene confermata solo alla barra i + right_bars.
+
+Il risultato è una PivotTable: un array strutturato NumPy (una riga per pivot)
+invece di una lista di oggetti. La conversione in dict avviene solo su
+richiesta (to_records), tipicamente al momento del report.
+────────────────────────────────────────────────────────────────────────────────
+"""
+
+from collections import deque
+from typing import Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+# ═════════════════════════════════════════════════════════════════════════════
+# TABELLA PIVOT (struct-of-arrays)
+# ═════════════════════════════════════════════════════════════════════════════
+
+NAT = np.iinfo(np.int64).min        # timestamp mancante (stesso valore di pd.NaT)
+
+LABEL_NONE = -1
+LABEL_NAMES = ("HH", "LH", "HL", "LL")   # codice label = indice in questa tupla
+
+PIVOT_DTYPE = np.dtype([
+    ("bar_index",  np.int64),
+    ("timestamp",  np.int64),       # nanosecondi epoch, NAT se assente
+    ("price",      np.float64),
+    ("is_high",    np.bool_),
+    ("prominence", np.float64),
+    ("volume",     np.float64),
+    ("label",      np.int8),        # LABEL_NONE oppure indice in LABEL_NAMES
+])
+
+
+class PivotTable:
+    """Pivot confermati, ordinati per bar_index (high prima del low sulla stessa barra)."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: Optional[np.ndarray] = None):
+        self.data = np.empty(0, dtype=PIVOT_DTYPE) if data is None else data
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __iter__(self) -> Iterator[np.void]:
+        return iter(self.data)
+
+    def __repr__(self) -> str:
+        n_high = int(self.data["is_high"].sum())
+        return f"PivotTable(n={len(self)}, highs={n_high}, lows={len(self) - n_high})"
+
+    # ── colonne
+    @property
+    def bar_index(self) -> np.ndarray:
+        return self.data["bar_index"]
+
+    @property
+    def timestamp(self) -> np.ndarray:
+        return self.data["timestamp"]
+
+    @property
+    def price(self) -> np.ndarray:
+        return self.data["price"]
+
+    @property
+    def is_high(self) -> np.ndarray:
+        return self.data["is_high"]
+
+    @property
+    def prominence(self) -> np.ndarray:
+        return self.data["prominence"]
+
+    @property
+    def volume(self) -> np.ndarray:
+        return self.data["volume"]
+
+    @property
+    def label(self) -> np.ndarray:
+        return self.data["label"]
+
+    # ── selezioni
+    def highs(self) -> "PivotTable":
+        return PivotTable(self.data[self.data["is_high"]])
+
+    def lows(self) -> "PivotTable":
+        return PivotTable(self.data[~self.data["is_high"]])
+
+    def confirmed_before(self, bar_index: int) -> "PivotTable":
+        """Pivot con bar_index < bar_index (vista, nessuna copia)."""
+        end = int(np.searchsorted(self.data["bar_index"], bar_index, side="left"))
+        return PivotTable(self.data[:end])
+
+    @staticmethod
+    def concat(tables: List["PivotTable"]) -> "PivotTable":
+        if not tables:
+            return PivotTable()
+        data = np.concatenate([t.data for t in tables])
+        order = np.lexsort((~data["is_high"], data["bar_index"]))
+        return PivotTable(data[order])
+
+    # ── conversione (lazy, solo per report/export)
+    def label_str(self, row: int) -> str:
+        code = int(self.data["label"][row])
+        return LABEL_NAMES[code] if code != LABEL_NONE else "?"
+
+    def record(self, row: int) -> dict:
+        """Una riga come dict (stesso formato di Pivot.to_dict)."""
+        r = self.data[row]
+        return {
+            "bar_index":  int(r["bar_index"]),
+            "timestamp":  timestamp_str(int(r["timestamp"])),
+            "price":      round(float(r["price"]), 6),
+            "type":       "HIGH" if r["is_high"] else "LOW",
+            "label":      self.label_str(row),
+            "prominence": round(float(r["prominence"]), 6),
+            "volume":     round(float(r["volume"]), 0),
+        }
+
+    def to_records(self) -> List[dict]:
+        return [self.record(row) for row in range(len(self.data))]
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.data)
+
+
+def timestamp_str(ts: int) -> str:
+    """int64 ns → stringa come str(pd.Timestamp)."""
+    return str(pd.Timestamp(ts)) if ts != NAT else "NaT"
+
+
+def classify_labels(table: PivotTable,
+                    first_high: str = "HH",
+                    first_low: str = "HL") -> PivotTable:
+    """
+    Assegna HH/LH/HL/LL in modo vettoriale confrontando ogni pivot con il
+    precedente dello stesso tipo. Il primo high/low riceve first_high/first_low.
+    Restituisce una nuova tabella (l'originale non viene modificata).
+    """
+    data = table.data.copy()
+    for is_high, up, down, first in ((True,  "HH", "LH", first_high),
+                                     (False, "HL", "LL", first_low)):
+        rows = np.flatnonzero(data["is_high"] == is_high)
+        if not len(rows):
+            continue
+        prices = data["price"][rows]
+        data["label"][rows[0]]  = LABEL_NAMES.index(first)
+        data["label"][rows[1:]] = np.where(prices[1:] > prices[:-1],
+                                           LABEL_NAMES.index(up), LABEL_NAMES.index(down))
+    return PivotTable(data)
+
+
+def timestamps_ns(index) -> np.ndarray:
+    """Converte un indice/colonna di date in int64 ns; NAT se non datetime."""
+    if isinstance(index, pd.DatetimeIndex):
+        if index.tz is not None:
+            index = index.tz_convert(None)
+        return index.values.astype("datetime64[ns]").view(np.int64)
+    values = np.asarray(index)
+    if np.issubdtype(values.dtype, np.datetime64):
+        return values.astype("datetime64[ns]").view(np.int64)
+    return np.full(len(values), NAT, dtype=np.int64)
+
+
+def _check_bars(left_bars: int, right_bars: int) -> None:
+    if left_bars < 1 or right_bars < 1:
+        raise ValueError("left_bars e right_bars devono essere >= 1")
+
+
+# ═════════════════════════════════════════════════════════════════════════════
+# BATCH — un solo passaggio vettoriale
+# ═════════════════════════════════════════════════════════════════════════════
+
+def compute_pivots(highs: np.ndarray,
+                   lows: np.ndarray,
+                   volumes: Optional[np.ndarray] = None,
+                   timestamps: Optional[np.ndarray] = None,
+                   left_bars: int = 5,
+                   right_bars: int = 5,
+                   min_prominence_pct: Optional[float] = 1.0,
+                   strict: bool = False) -> PivotTable:
+    """
+    Identifica i pivot su array OHLC senza loop Python.
+
+    Per ogni barra candidata i ∈ [left, n-right) calcola con sliding_window_view
+    max/min dei lati sinistro (left barre) e destro (right barre); il pivot è
+    confermato se la barra domina entrambi i lati.
+
+    Args:
+        highs, lows:         array dei massimi/minimi
+        volumes:             array volumi (default 0)
+        timestamps:          int64 ns per barra (default NAT)
+        left_bars:           barre a sinistra per identificazione
+        right_bars:          barre a destra per conferma (ritardo)
+        min_prominence_pct:  rilievo minimo come % del prezzo (None = nessun filtro)
+        strict:              True = estremo stretto (nessun pareggio nella finestra)
+
+    Returns:
+        PivotTable ordinata per bar_index
+    """
+    _check_bars(left_bars, right_bars)
+    highs = np.asarray(highs, dtype=np.float64)
+    lows  = np.asarray(lows, dtype=np.float64)
+    n     = len(highs)
+    L, R  = left_bars, right_bars
+
+    if n < L + R + 1:
+        return PivotTable()
+
+    volumes    = np.zeros(n) if volumes is None else np.asarray(volumes, dtype=np.float64)
+    timestamps = np.full(n, NAT, dtype=np.int64) if timestamps is None else np.asarray(timestamps, dtype=np.int64)
+
+    # Candidati c ∈ [L, n-R): lato sinistro = [c-L, c), lato destro = (c, c+R]
+    centers = np.arange(L, n - R)
+    hc, lc  = highs[L:n - R], lows[L:n - R]
+
+    left_max_h  = sliding_window_view(highs, L).max(axis=1)[:n - R - L]
+    left_min_l  = sliding_window_view(lows,  L).min(axis=1)[:n - R - L]
+    right_max_h = sliding_window_view(highs, R).max(axis=1)[L + 1:n - R + 1]
+    right_min_l = sliding_window_view(lows,  R).min(axis=1)[L + 1:n - R + 1]
+
+    with np.errstate(invalid="ignore"):
+        if strict:
+            is_ph = (hc > left_max_h) & (hc > right_max_h)
+            is_pl = (lc < left_min_l) & (lc < right_min_l)
+        else:
+            is_ph = (hc >= left_max_h) & (hc >= right_max_h)
+            is_pl = (lc <= left_min_l) & (lc <= right_min_l)
+
+    # Stessa convenzione della versione a loop: sulla prima barra utile il lato
+    # sinistro della prominence usa la barra stessa.
+    left_min_prom = left_min_l.copy()
+    left_max_prom = left_max_h.copy()
+    left_min_prom[0] = lc[0]
+    left_max_prom[0] = hc[0]
+
+    prom_h = hc - np.maximum(left_min_prom, right_min_l)
+    prom_l = np.minimum(left_max_prom, right_max_h) - lc
+
+    if min_prominence_pct is not None:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pct_h = np.where(hc > 0, prom_h / hc * 100, 0.0)
+            pct_l = np.where(lc > 0, prom_l / lc * 100, 0.0)
+            is_ph &= pct_h >= min_prominence_pct
+            is_pl &= pct_l >= min_prominence_pct
+
+    idx_h, idx_l = centers[is_ph], centers[is_pl]
+    table = np.empty(len(idx_h) + len(idx_l), dtype=PIVOT_DTYPE)
+    nh = len(idx_h)
+
+    table["bar_index"][:nh]  = idx_h
+    table["price"][:nh]      = highs[idx_h]
+    table["is_high"][:nh]    = True
+    table["prominence"][:nh] = prom_h[is_ph]
+
+    table["bar_index"][nh:]  = idx_l
+    table["price"][nh:]      = lows[idx_l]
+    table["is_high"][nh:]    = False
+    table["prominence"][nh:] = prom_l[is_pl]
+
+    table["timestamp"] = timestamps[table["bar_index"]]
+    table["volume"]    = volumes[table["bar_index"]]
+    table["label"]     = LABEL_NONE
+
+    order = np.lexsort((~table["is_high"], table["bar_index"]))
+    return PivotTable(table[order])
+
+
+def pivot_table(df: pd.DataFrame,
+                left_bars: int = 5,
+                right_bars: int = 5,
+                min_prominence_pct: Optional[float] = 1.0,
+                strict: bool = False) -> PivotTable:
+    """compute_pivots() su un DataFrame OHLCV (timestamp da DatetimeIndex o colonna 'date')."""
+    volumes = df["volume"].values if "volume" in df.columns else np.ones(len(df))
+    dates   = df["date"] if "date" in df.columns else df.index
+    return compute_pivots(
+        df["high"].values, df["low"].values, volumes, timestamps_ns(dates),
+        left_bars, right_bars, min_prominence_pct, strict,
+    )
+
+
+# ═════════════════════════════════════════════════════════════════════════════
+# STREAMING — conferma incrementale barra per barra
+# ═════════════════════════════════════════════════════════════════════════════
+
+class _MonotonicWindow:
+    """Max (o min) su finestra scorrevole di lunghezza fissa, O(1) ammortizzato per push."""
+
+    __slots__ = ("size", "is_max", "_q", "_last_nan")
+
+    def __init__(self, size: int, is_max: bool):
+        self.size      = size
+        self.is_max    = is_max
+        self._q        = deque()        # (indice, valore) monotoni
+        self._last_nan = -1             # ultima barra NaN (propaga NaN come ndarray.max)
+
+    def push(self, index: int, value: float) -> None:
+        if value != value:
+            self._last_nan = index
+        else:
+            q = self._q
+            if self.is_max:
+                while q and q[-1][1] <= value:
+                    q.pop()
+            else:
+                while q and q[-1][1] >= value:
+                    q.pop()
+            q.append((index, value))
+        start = index - self.size + 1
+        while self._q and self._q[0][0] < start:
+            self._q.popleft()
+
+    def value(self, last_index: int) -> float:
+        if self._last_nan > last_index - self.size or not self._q:
+            return np.nan
+        return self._q[0][1]
+
+
+class PivotEngine:
+    """
+    Pivot finder incrementale con la stessa definizione di compute_pivots().
+
+    Ogni update() aggiunge una barra e conferma (eventualmente) la barra
+    right_bars posizioni indietro. I pivot confermati sono accumulati in un
+    array strutturato a crescita geometrica; update() restituisce una vista
+    sui soli pivot nuovi.
+
+    Esempio:
+        engine = PivotEngine(left_bars=5, right_bars=5)
+        for ts, bar in df.iterrows():
+            new = engine.update(bar["high"], bar["low"], bar["volume"], ts)
+            if len(new):
+                ...
+        engine.table  # PivotTable completa, identica a pivot_table(df)
+    """
+
+    def __init__(self,
+                 left_bars: int = 5,
+                 right_bars: int = 5,
+                 min_prominence_pct: Optional[float] = 1.0,
+                 strict: bool = False):
+        _check_bars(left_bars, right_bars)
+        self.left_bars          = left_bars
+        self.right_bars         = right_bars
+        self.min_prominence_pct = min_prominence_pct
+        self.strict             = strict
+
+        self.n_bars = 0
+        self._bars  = deque(maxlen=right_bars + 1)    # barre [t-R, t] non ancora uscite
+        self._left_max_h  = _MonotonicWindow(left_bars,  is_max=True)
+        self._left_min_l  = _MonotonicWindow(left_bars,  is_max=False)
+        self._right_max_h = _MonotonicWindow(right_bars, is_max=True)
+        self._right_min_l = _MonotonicWindow(right_bars, is_max=False)
+
+        self._data = np.empty(64, dtype=PIVOT_DTYPE)
+        self._size = 0
+
+    @property
+    def table(self) -> PivotTable:
+        return PivotTable(self._data[:self._size])
+
+    def update(self, high: float, low: float, volume: float = 0.0, timestamp=None) -> PivotTable:
+        """Aggiunge una barra; restituisce i pivot confermati da questa barra (0, 1 o 2)."""
+        t = self.n_bars
+        L, R = self.left_bars, self.right_bars
+
+        # La barra più vecchia esce dal buffer ed entra nel lato sinistro
+        if len(self._bars) == R + 1:
+            old_i, old_h, old_l, _, _ = self._bars[0]
+            self._left_max_h.push(old_i, old_h)
+            self._left_min_l.push(old_i, old_l)
+
+        ts = NAT if timestamp is None else int(pd.Timestamp(timestamp).value)
+        self._bars.append((t, float(high), float(low), float(volume), ts))
+        self._right_max_h.push(t, float(high))
+        self._right_min_l.push(t, float(low))
+        self.n_bars += 1
+
+        start = self._size
+        c = t - R
+        if c >= L:
+            self._confirm(c, t)
+        return PivotTable(self._data[start:self._size])
+
+    def _confirm(self, c: int, t: int) -> None:
+        _, hc, lc, vol, ts = self._bars[0]
+        L = self.left_bars
+
+        left_max_h  = self._left_max_h.value(c - 1)
+        left_min_l  = self._left_min_l.value(c - 1)
+        right_max_h = self._right_max_h.value(t)
+        right_min_l = self._right_min_l.value(t)
+
+        if self.strict:
+            is_ph = hc > left_max_h and hc > right_max_h
+            is_pl = lc < left_min_l and lc < right_min_l
+        else:
+            is_ph = hc >= left_max_h and hc >= right_max_h
+            is_pl = lc <= left_min_l and lc <= right_min_l
+
+        if is_ph:
+            left_min = lc if c == L else left_min_l
+            prominence = hc - np.maximum(left_min, right_min_l)
+            if self._passes(prominence, hc):
+                self._append(c, ts, hc, True, prominence, vol)
+
+        if is_pl:
+            left_max = hc if c == L else left_max_h
+            prominence = np.minimum(left_max, right_max_h) - lc
+            if self._passes(prominence, lc):
+                self._append(c, ts, lc, False, prominence, vol)
+
+    def _passes(self, prominence: float, price: float) -> bool:
+        if self.min_prominence_pct is None:
+            return True
+        prom_pct = prominence / price * 100 if price > 0 else 0.0
+        return prom_pct >= self.min_prominence_pct
+
+    def _append(self, bar_index: int, ts: int, price: float,
+                is_high: bool, prominence: float, volume: float) -> None:
+        if self._size == len(self._data):
+            grown = np.empty(len(self._data) * 2, dtype=PIVOT_DTYPE)
+            grown[:self._size] = self._data
+            self._data = grown
+        self._data[self._size] = (bar_index, ts, price, is_high, prominence, volume, LABEL_NONE)
+        self._size += 1
@@ -1,9 +1,10 @@
 import requests
 import time
 import json
-from datetime import datetime, timedelta
+import hashlib
+from datetime import datetime, timedelta, timezone
 from contextlib import contextmanager
-from typing import Annotated
+from typing import Annotated, Dict, List, Optional, Tuple
 import os
 import re
 
@@ -49,87 +50,227 @@ ticker_to_company = {
 }
 
 
-def fetch_top_from_category(
+# Per-file index persisted in <category>/.index/<file>.json, rebuilt when the
+# .jsonl changes (size/mtime) or the ticker map below changes
+INDEX_DIR = ".index"
+INDEX_VERSION = 1
+
+# In-process copy of the loaded indexes: {jsonl path: index}
+_index_cache: Dict[str, dict] = {}
+
+
+def _search_terms(query: str) -> List[str]:
+    """Company name(s) plus the ticker itself, as matched in posts."""
+    company = ticker_to_company.get(query)
+    if company is None:
+        return [query]
+    terms = company.split(" OR ") if "OR" in company else [company]
+    return terms + [query]
+
+
+def _ticker_map_digest() -> str:
+    return hashlib.sha256(
+        json.dumps(ticker_to_company, sort_keys=True).encode("utf-8")
+    ).hexdigest()[:16]
+
+
+def _matches(terms: List[str], post: dict) -> bool:
+    return any(
+        re.search(term, post["title"], re.IGNORECASE)
+        or re.search(term, post["selftext"], re.IGNORECASE)
+        for term in terms
+    )
+
+
+def _post_date(post: dict) -> str:
+    return datetime.fromtimestamp(post["created_utc"], timezone.utc).strftime("%Y-%m-%d")
+
+
+def build_reddit_index(path: str, with_tickers: bool = True) -> dict:
+    """
+    Scan one subreddit .jsonl file once and index it
+    Args:
+        path: Path to the .jsonl file
+        with_tickers: Also index the posts mentioning each ticker/company
+    Returns:
+        dict: {"dates": {yyyy-mm-dd: [[offset, length], ...]},
+               "tickers": {ticker: [offset, ...]} or None} plus validation fields
+    """
+    stat = os.stat(path)
+    dates: Dict[str, List[Tuple[int, int]]] = {}
+    tickers: Dict[str, List[int]] = {}
+    # One alternation per ticker: same matches as searching each term in turn
+    patterns = {
+        ticker: re.compile("|".join(_search_terms(ticker)), re.IGNORECASE)
+        for ticker in (ticker_to_company if with_tickers else ())
+    }
+
+    offset = 0
+    with open(path, "rb") as f:
+        for line in f:
+            start, offset = offset, offset + len(line)
+            # skip empty lines
+            if not line.strip():
+                continue
+            post = json.loads(line)
+            dates.setdefault(_post_date(post), []).append((start, len(line)))
+            for ticker, pattern in patterns.items():
+                if pattern.search(post["title"]) or pattern.search(post["selftext"]):
+                    tickers.setdefault(ticker, []).append(start)
+
+    return {
+        "version": INDEX_VERSION,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "tickers_digest": _ticker_map_digest(),
+        "dates": dates,
+        "tickers": tickers if with_tickers else None,
+    }
+
+
+def load_reddit_index(path: str, with_tickers: bool = True) -> dict:
+    """
+    Index of a .jsonl file: from memory, from disk, or built (and saved) once
+    Args:
+        path: Path to the .jsonl file
+        with_tickers: Require the ticker index (company news categories)
+    Returns:
+        dict: The index (see build_reddit_index)
+    """
+    stat = os.stat(path)
+
+    def valid(index: Optional[dict]) -> bool:
+        return (
+            index is not None
+            and index.get("version") == INDEX_VERSION
+            and index.get("size") == stat.st_size
+            and index.get("mtime_ns") == stat.st_mtime_ns
+            and index.get("tickers_digest") == _ticker_map_digest()
+            and (index.get("tickers") is not None or not with_tickers)
+        )
+
+    index = _index_cache.get(path)
+    if valid(index):
+        return index
+
+    index_dir = os.path.join(os.path.dirname(path), INDEX_DIR)
+    index_path = os.path.join(index_dir, os.path.basename(path) + ".json")
+    try:
+        with open(index_path, "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        index = None
+
+    if not valid(index):
+        index = build_reddit_index(path, with_tickers)
+        try:
+            os.makedirs(index_dir, exist_ok=True)
+            tmp_path = f"{index_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(index, f)
+            os.replace(tmp_path, index_path)
+        except OSError:
+            pass  # read-only data folder: keep the index in memory only
+
+    _index_cache[path] = index
+    return index
+
+
+def fetch_top_from_category_range(
     category: Annotated[
         str, "Category to fetch top post from. Collection of subreddits."
     ],
-    date: Annotated[str, "Date to fetch top posts from."],
-    max_limit: Annotated[int, "Maximum number of posts to fetch."],
+    start_date: Annotated[str, "First date (yyyy-mm-dd) to fetch top posts from."],
+    end_date: Annotated[str, "Last date (yyyy-mm-dd) to fetch top posts from."],
+    max_limit: Annotated[int, "Maximum number of posts to fetch per day."],
     query: Annotated[str, "Optional query to search for in the subreddit."] = None,
     data_path: Annotated[
         str,
         "Path to the data folder. Default is 'reddit_data'.",
     ] = "reddit_data",
 ):
-    base_path = data_path
-
-    all_content = []
+    """
+    Top posts of every day in [start_date, end_date], reading each file once
+    Only the lines indexed for those dates (and, for company categories, for
+    the query) are read and parsed. Per day the result is the same as
+    fetch_top_from_category: the top max_limit // n_files posts by upvotes of
+    each subreddit file, days in chronological order.
+    """
+    category_path = os.path.join(data_path, category)
+    data_files = [f for f in os.listdir(category_path) if f.endswith(".jsonl")]
 
-    if max_limit < len(os.listdir(os.path.join(base_path, category))):
+    if max_limit < len(data_files):
         raise ValueError(
             "REDDIT FETCHING ERROR: max limit is less than the number of files in the category. Will not be able to fetch any posts"
         )
 
-    limit_per_subreddit = max_limit // len(
-        os.listdir(os.path.join(base_path, category))
-    )
+    limit_per_subreddit = max_limit // len(data_files)
+    filter_query = "company" in category and query
 
-    for data_file in os.listdir(os.path.join(base_path, category)):
-        # check if data_file is a .jsonl file
-        if not data_file.endswith(".jsonl"):
-            continue
+    # {date: [top posts of file 1, top posts of file 2, ...]}
+    posts_by_date: Dict[str, List[dict]] = {}
 
-        all_content_curr_subreddit = []
+    for data_file in data_files:
+        path = os.path.join(category_path, data_file)
+        index = load_reddit_index(path, with_tickers="company" in category)
 
-        with open(os.path.join(base_path, category, data_file), "rb") as f:
-            for i, line in enumerate(f):
-                # skip empty lines
-                if not line.strip():
-                    continue
+        lines = [
+            tuple(entry)
+            for date, entries in index["dates"].items()
+            if start_date <= date <= end_date
+            for entry in entries
+        ]
+        # Known tickers use the index; free-text queries are matched below
+        indexed_query = filter_query and query in ticker_to_company
+        if indexed_query:
+            matching = set(index["tickers"].get(query, []))
+            lines = [entry for entry in lines if entry[0] in matching]
 
-                parsed_line = json.loads(line)
+        curr_subreddit: Dict[str, List[dict]] = {}
+        with open(path, "rb") as f:
+            for offset, length in sorted(lines):
+                f.seek(offset)
+                parsed_line = json.loads(f.read(length))
 
-                # select only lines that are from the date
-                post_date = datetime.utcfromtimestamp(
-                    parsed_line["created_utc"]
-                ).strftime("%Y-%m-%d")
-                if post_date != date:
+                if filter_query and not indexed_query and not _matches(
+                    _search_terms(query), parsed_line
+                ):
                     continue
 
-                # if is company_news, check that the title or the content has the company's name (query) mentioned
-                if "company" in category and query:
-                    search_terms = []
-                    if "OR" in ticker_to_company[query]:
-                        search_terms = ticker_to_company[query].split(" OR ")
-                    else:
-                        search_terms = [ticker_to_company[query]]
-
-                    search_terms.append(query)
-
-                    found = False
-                    for term in search_terms:
-                        if re.search(
-                            term, parsed_line["title"], re.IGNORECASE
-                        ) or re.search(term, parsed_line["selftext"], re.IGNORECASE):
-                            found = True
-                            break
+                post_date = _post_date(parsed_line)
+                curr_subreddit.setdefault(post_date, []).append(
+                    {
+                        "title": parsed_line["title"],
+                        "content": parsed_line["selftext"],
+                        "url": parsed_line["url"],
+                        "upvotes": parsed_line["ups"],
+                        "posted_date": post_date,
+                    }
+                )
 
-                    if not found:
-                        continue
+        for post_date, posts in curr_subreddit.items():
+            # sort by upvotes in descending order (stable: file order on ties)
+            posts.sort(key=lambda x: x["upvotes"], reverse=True)
+            posts_by_date.setdefault(post_date, []).extend(posts[:limit_per_subreddit])
 
-                post = {
-                    "title": parsed_line["title"],
-                    "content": parsed_line["selftext"],
-                    "url": parsed_line["url"],
-                    "upvotes": parsed_line["ups"],
-                    "posted_date": post_date,
-                }
-
-                all_content_curr_subreddit.append(post)
-
-        # sort all_content_curr_subreddit by upvote_ratio in descending order
-        all_content_curr_subreddit.sort(key=lambda x: x["upvotes"], reverse=True)
+    all_content = []
+    for post_date in sorted(posts_by_date):
+        all_content.extend(posts_by_date[post_date])
+    return all_content
 
-        all_content.extend(all_content_curr_subreddit[:limit_per_subreddit])
 
-    return all_content
+def fetch_top_from_category(
+    category: Annotated[
+        str, "Category to fetch top post from. Collection of subreddits."
+    ],
+    date: Annotated[str, "Date to fetch top posts from."],
+    max_limit: Annotated[int, "Maximum number of posts to fetch."],
+    query: Annotated[str, "Optional query to search for in the subreddit."] = None,
+    data_path: Annotated[
+        str,
+        "Path to the data folder. Default is 'reddit_data'.",
+    ] = "reddit_data",
+):
+    return fetch_top_from_category_range(
+        category, date, date, max_limit, query=query, data_path=data_path
+    )
@@ -11,24 +11,319 @@ Architecture:
 Purpose: Professional screener reports for daily/weekly review
 """
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from datetime import datetime
 from typing import List, Dict, Optional
 import base64
+import os
 from io import BytesIO
 
 from .multi_timeframe import MultiTimeframeLayer, MultiTimeframeData
 from .scoring_engine import ScoringEngine, SignalScore, TradeDirection
 from .structure_detector import SwingClassifier
 from .backtester import BacktestResult
+from ..utils.chart_data import downsample_ohlc, epoch_ms
+from ..utils.static_assets import asset_tags, plot_payload
+
+# Default price chart window (bars; None = full history) and maximum bars
+# sent to the browser, reached only by windows longer than that
+CHART_DAYS = 60
+CHART_MAX_POINTS = 400
+
+SCREENER_CSS = """
+* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+body {
+    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    padding: 20px;
+    color: #333;
+}
+
+.container {
+    max-width: 1400px;
+    margin: 0 auto;
+    background: white;
+    border-radius: 12px;
+    box-shadow: 0 10px 40px rgba(0,0,0,0.2);
+    overflow: hidden;
+}
+
+.header {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: white;
+    padding: 40px;
+    text-align: center;
+}
+
+.header h1 {
+    font-size: 2.5em;
+    margin-bottom: 10px;
+}
+
+.header .timestamp {
+    font-size: 1em;
+    opacity: 0.9;
+}
+
+.summary {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+    gap: 20px;
+    padding: 30px;
+    background: #f8f9fa;
+    border-bottom: 2px solid #e9ecef;
+}
+
+.summary-card {
+    background: white;
+    padding: 20px;
+    border-radius: 8px;
+    box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+    text-align: center;
+}
+
+.summary-card .value {
+    font-size: 2em;
+    font-weight: bold;
+    color: #667eea;
+    margin-bottom: 5px;
+}
+
+.summary-card .label {
+    font-size: 0.9em;
+    color: #6c757d;
+}
+
+.signals-section {
+    padding: 40px;
+}
+
+.signal-card {
+    background: white;
+    border: 2px solid #e9ecef;
+    border-radius: 12px;
+    padding: 30px;
+    margin-bottom: 30px;
+    transition: transform 0.2s, box-shadow 0.2s;
+}
+
+.signal-card:hover {
+    transform: translateY(-5px);
+    box-shadow: 0 8px 25px rgba(0,0,0,0.15);
+}
+
+.signal-header {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    margin-bottom: 20px;
+    padding-bottom: 15px;
+    border-bottom: 2px solid #e9ecef;
+}
+
+.signal-symbol {
+    font-size: 2em;
+    font-weight: bold;
+    color: #2c3e50;
+}
+
+.signal-scores {
+    display: flex;
+    gap: 20px;
+}
+
+.score-badge {
+    padding: 10px 20px;
+    border-radius: 25px;
+    font-weight: bold;
+    font-size: 1.1em;
+}
+
+.score-long {
+    background: #d4edda;
+    color: #155724;
+    border: 2px solid #28a745;
+}
+
+.score-short {
+    background: #f8d7da;
+    color: #721c24;
+    border: 2px solid #dc3545;
+}
+
+.score-high {
+    background: #28a745;
+    color: white;
+}
+
+.score-moderate {
+    background: #ffc107;
+    color: #333;
+}
+
+.score-low {
+    background: #6c757d;
+    color: white;
+}
+
+.signal-details {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
+    gap: 20px;
+    margin-bottom: 20px;
+}
+
+.detail-box {
+    background: #f8f9fa;
+    padding: 15px;
+    border-radius: 8px;
+    border-left: 4px solid #667eea;
+}
+
+.detail-box h4 {
+    color: #667eea;
+    margin-bottom: 10px;
+    font-size: 1em;
+}
+
+.detail-box ul {
+    list-style: none;
+    font-size: 0.9em;
+    line-height: 1.8;
+}
+
+.detail-box ul li {
+    padding: 3px 0;
+}
+
+.strength {
+    color: #28a745;
+}
+
+.weakness {
+    color: #dc3545;
+}
+
+.chart-container {
+    margin-top: 20px;
+    border-radius: 8px;
+    overflow: hidden;
+    box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+}
+
+.footer {
+    background: #2c3e50;
+    color: white;
+    text-align: center;
+    padding: 20px;
+    font-size: 0.9em;
+}
+
+@media print {
+    body {
+        padding: 0;
+        background: white;
+    }
+
+    .signal-card {
+        page-break-inside: avoid;
+    }
+}
+"""
+
+BACKTEST_CSS = """
+body {
+    font-family: Arial, sans-serif;
+    max-width: 1200px;
+    margin: 40px auto;
+    padding: 20px;
+    background: #f5f5f5;
+}
+
+.header {
+    background: #2c3e50;
+    color: white;
+    padding: 30px;
+    border-radius: 8px;
+    margin-bottom: 30px;
+}
+
+.metrics {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+    gap: 20px;
+    margin-bottom: 30px;
+}
+
+.metric-card {
+    background: white;
+    padding: 20px;
+    border-radius: 8px;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+}
+
+.metric-value {
+    font-size: 2em;
+    font-weight: bold;
+    color: #3498db;
+}
+
+.metric-label {
+    color: #7f8c8d;
+    margin-top: 5px;
+}
+
+table {
+    width: 100%;
+    background: white;
+    border-collapse: collapse;
+    border-radius: 8px;
+    overflow: hidden;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+}
+
+th, td {
+    padding: 12px;
+    text-align: left;
+    border-bottom: 1px solid #ecf0f1;
+}
+
+th {
+    background: #34495e;
+    color: white;
+}
+
+.positive {
+    color: #27ae60;
+    font-weight: bold;
+}
+
+.negative {
+    color: #e74c3c;
+    font-weight: bold;
+}
+"""
 
 
 class ReportGenerator:
     """Generate professional HTML reports with charts"""
     
-    def __init__(self):
+    def __init__(self, chart_days: Optional[int] = CHART_DAYS, chart_max_points: int = CHART_MAX_POINTS):
+        """
+        Args:
+            chart_days: Daily bars shown in each price chart (None = full history)
+            chart_max_points: Longer windows are aggregated to this many bars
+        """
+        self.chart_days = chart_days
+        self.chart_max_points = chart_max_points
         self.mtf_layer = MultiTimeframeLayer()
         self.scorer = ScoringEngine()
         self.classifier = SwingClassifier()
@@ -91,7 +386,8 @@ class ReportGenerator:
         html = self._build_html_report(
             signals=high_quality,
             title=title,
-            timestamp=datetime.now()
+            timestamp=datetime.now(),
+            asset_dir=os.path.dirname(os.path.abspath(output_path)) if output_path else None,
         )
         
         # Save to file
@@ -106,9 +402,15 @@ class ReportGenerator:
         self,
         signals: List[Dict],
         title: str,
-        timestamp: datetime
+        timestamp: datetime,
+        asset_dir: Optional[str] = None
     ) -> str:
-        """Build complete HTML report"""
+        """Build complete HTML report
+
+        CSS and Plotly are shared files in <asset_dir>/static (None = inline CSS,
+        Plotly from CDN); charts are embedded as JSON payloads.
+        """
+        head_assets, body_assets = asset_tags(asset_dir, "screener", css=SCREENER_CSS, plotly=True)
         
         # Sort signals by best score (LONG or SHORT)
         signals_sorted = sorted(
@@ -124,212 +426,7 @@ class ReportGenerator:
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{title}</title>
-    <script src="https://cdn.plot.ly/plotly-2.26.0.min.js"></script>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            padding: 20px;
-            color: #333;
-        }}
-        
-        .container {{
-            max-width: 1400px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 12px;
-            box-shadow: 0 10px 40px rgba(0,0,0,0.2);
-            overflow: hidden;
-        }}
-        
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 40px;
-            text-align: center;
-        }}
-        
-        .header h1 {{
-            font-size: 2.5em;
-            margin-bottom: 10px;
-        }}
-        
-        .header .timestamp {{
-            font-size: 1em;
-            opacity: 0.9;
-        }}
-        
-        .summary {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            padding: 30px;
-            background: #f8f9fa;
-            border-bottom: 2px solid #e9ecef;
-        }}
-        
-        .summary-card {{
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-            text-align: center;
-        }}
-        
-        .summary-card .value {{
-            font-size: 2em;
-            font-weight: bold;
-            color: #667eea;
-            margin-bottom: 5px;
-        }}
-        
-        .summary-card .label {{
-            font-size: 0.9em;
-            color: #6c757d;
-        }}
-        
-        .signals-section {{
-            padding: 40px;
-        }}
-        
-        .signal-card {{
-            background: white;
-            border: 2px solid #e9ecef;
-            border-radius: 12px;
-            padding: 30px;
-            margin-bottom: 30px;
-            transition: transform 0.2s, box-shadow 0.2s;
-        }}
-        
-        .signal-card:hover {{
-            transform: translateY(-5px);
-            box-shadow: 0 8px 25px rgba(0,0,0,0.15);
-        }}
-        
-        .signal-header {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 20px;
-            padding-bottom: 15px;
-            border-bottom: 2px solid #e9ecef;
-        }}
-        
-        .signal-symbol {{
-            font-size: 2em;
-            font-weight: bold;
-            color: #2c3e50;
-        }}
-        
-        .signal-scores {{
-            display: flex;
-            gap: 20px;
-        }}
-        
-        .score-badge {{
-            padding: 10px 20px;
-            border-radius: 25px;
-            font-weight: bold;
-            font-size: 1.1em;
-        }}
-        
-        .score-long {{
-            background: #d4edda;
-            color: #155724;
-            border: 2px solid #28a745;
-        }}
-        
-        .score-short {{
-            background: #f8d7da;
-            color: #721c24;
-            border: 2px solid #dc3545;
-        }}
-        
-        .score-high {{
-            background: #28a745;
-            color: white;
-        }}
-        
-        .score-moderate {{
-            background: #ffc107;
-            color: #333;
-        }}
-        
-        .score-low {{
-            background: #6c757d;
-            color: white;
-        }}
-        
-        .signal-details {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 20px;
-            margin-bottom: 20px;
-        }}
-        
-        .detail-box {{
-            background: #f8f9fa;
-            padding: 15px;
-            border-radius: 8px;
-            border-left: 4px solid #667eea;
-        }}
-        
-        .detail-box h4 {{
-            color: #667eea;
-            margin-bottom: 10px;
-            font-size: 1em;
-        }}
-        
-        .detail-box ul {{
-            list-style: none;
-            font-size: 0.9em;
-            line-height: 1.8;
-        }}
-        
-        .detail-box ul li {{
-            padding: 3px 0;
-        }}
-        
-        .strength {{
-            color: #28a745;
-        }}
-        
-        .weakness {{
-            color: #dc3545;
-        }}
-        
-        .chart-container {{
-            margin-top: 20px;
-            border-radius: 8px;
-            overflow: hidden;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        }}
-        
-        .footer {{
-            background: #2c3e50;
-            color: white;
-            text-align: center;
-            padding: 20px;
-            font-size: 0.9em;
-        }}
-        
-        @media print {{
-            body {{
-                padding: 0;
-                background: white;
-            }}
-            
-            .signal-card {{
-                page-break-inside: avoid;
-            }}
-        }}
-    </style>
+    {head_assets}
 </head>
 <body>
     <div class="container">
@@ -374,6 +471,7 @@ class ReportGenerator:
             <p>⚠️ Not financial advice. For educational purposes only.</p>
         </div>
     </div>
+""" + body_assets + """
 </body>
 </html>
 """
@@ -486,9 +584,33 @@ class ReportGenerator:
         return html
     
     def _create_chart(self, mtf: MultiTimeframeData, symbol: str) -> str:
-        """Create Plotly chart for symbol"""
+        """Create Plotly chart for symbol
+
+        Shows the last chart_days bars; windows longer than chart_max_points
+        (e.g. chart_days=None on a long history) are aggregated per bucket.
+        Series are embedded as typed arrays instead of JSON lists: float32
+        prices and indicators, float64 volume (float32 rounds counts above
+        ~16.7M) and epoch-ms dates.
+        """
         
-        df = mtf.daily.ohlcv.tail(60)  # Last 60 days
+        df = mtf.daily.ohlcv[['date', 'open', 'high', 'low', 'close', 'volume']]
+        if self.chart_days is not None:
+            df = df.tail(self.chart_days)
+        df = df.copy()
+        
+        # Indicators aligned to the last bars, then downsampled with them
+        for name in ('close_200_sma', 'supertrend', 'adx'):
+            series = mtf.daily.indicators.get(name)
+            if series is not None and len(series) > 0:
+                values = pd.Series(series).tail(len(df)).to_numpy(dtype=float)
+                df[name] = np.concatenate([np.full(len(df) - len(values), np.nan), values])
+        df = downsample_ohlc(df, self.chart_max_points)
+        
+        x = epoch_ms(df['date'])
+        col = {
+            c: df[c].to_numpy(dtype=np.float64 if c == 'volume' else np.float32)
+            for c in df.columns if c != 'date'
+        }
         
         # Create subplots
         fig = make_subplots(
@@ -502,11 +624,11 @@ class ReportGenerator:
         # Candlestick chart
         fig.add_trace(
             go.Candlestick(
-                x=df['date'],
-                open=df['open'],
-                high=df['high'],
-                low=df['low'],
-                close=df['close'],
+                x=x,
+                open=col['open'],
+                high=col['high'],
+                low=col['low'],
+                close=col['close'],
                 name='Price',
                 increasing_line_color='#28a745',
                 decreasing_line_color='#dc3545'
@@ -515,12 +637,11 @@ class ReportGenerator:
         )
         
         # 200 SMA
-        sma_200 = mtf.daily.indicators.get('close_200_sma')
-        if sma_200 is not None and len(sma_200) > 0:
+        if 'close_200_sma' in col:
             fig.add_trace(
                 go.Scatter(
-                    x=df['date'],
-                    y=sma_200.tail(60),
+                    x=x,
+                    y=col['close_200_sma'],
                     mode='lines',
                     name='200 SMA',
                     line=dict(color='blue', width=2)
@@ -529,12 +650,11 @@ class ReportGenerator:
             )
         
         # SuperTrend
-        supertrend = mtf.daily.indicators.get('supertrend')
-        if supertrend is not None and len(supertrend) > 0:
+        if 'supertrend' in col:
             fig.add_trace(
                 go.Scatter(
-                    x=df['date'],
-                    y=supertrend.tail(60),
+                    x=x,
+                    y=col['supertrend'],
                     mode='lines',
                     name='SuperTrend',
                     line=dict(color='purple', width=2, dash='dash')
@@ -543,13 +663,12 @@ class ReportGenerator:
             )
         
         # Volume bars
-        colors = ['#28a745' if df.iloc[i]['close'] >= df.iloc[i]['open'] else '#dc3545' 
-                  for i in range(len(df))]
+        colors = np.where(col['close'] >= col['open'], '#28a745', '#dc3545').tolist()
         
         fig.add_trace(
             go.Bar(
-                x=df['date'],
-                y=df['volume'],
+                x=x,
+                y=col['volume'],
                 name='Volume',
                 marker_color=colors,
                 showlegend=False
@@ -558,12 +677,11 @@ class ReportGenerator:
         )
         
         # ADX
-        adx = mtf.daily.indicators.get('adx')
-        if adx is not None and len(adx) > 0:
+        if 'adx' in col:
             fig.add_trace(
                 go.Scatter(
-                    x=df['date'],
-                    y=adx.tail(60),
+                    x=x,
+                    y=col['adx'],
                     mode='lines',
                     name='ADX',
                     line=dict(color='orange', width=2),
@@ -591,15 +709,17 @@ class ReportGenerator:
             font=dict(size=10)
         )
         
+        # Epoch-ms x values on date axes
+        fig.update_xaxes(type='date')
+        
         # Update y-axes
         fig.update_yaxes(title_text="Price", row=1, col=1, gridcolor='#e9ecef')
         fig.update_yaxes(title_text="Volume", row=2, col=1, gridcolor='#e9ecef')
         fig.update_yaxes(title_text="ADX", row=3, col=1, gridcolor='#e9ecef')
         
-        # Convert to HTML div
-        chart_html = fig.to_html(include_plotlyjs=False, div_id=f"chart_{symbol}")
-        
-        return chart_html
+        # Chart div + JSON payload (rendered by the shared Plotly script)
+        chart_id = f"chart_{symbol}"
+        return f'<div id="{chart_id}"></div>\n' + plot_payload(chart_id, fig)
     
     def generate_backtest_report(
         self,
@@ -608,83 +728,17 @@ class ReportGenerator:
     ) -> str:
         """Generate HTML report for backtest results"""
         
+        head_assets, _ = asset_tags(
+            os.path.dirname(os.path.abspath(output_path)) if output_path else None,
+            "backtest", css=BACKTEST_CSS,
+        )
+        
         html = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <title>Backtest Report - {result.symbol}</title>
-    <style>
-        body {{
-            font-family: Arial, sans-serif;
-            max-width: 1200px;
-            margin: 40px auto;
-            padding: 20px;
-            background: #f5f5f5;
-        }}
-        
-        .header {{
-            background: #2c3e50;
-            color: white;
-            padding: 30px;
-            border-radius: 8px;
-            margin-bottom: 30px;
-        }}
-        
-        .metrics {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            margin-bottom: 30px;
-        }}
-        
-        .metric-card {{
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        
-        .metric-value {{
-            font-size: 2em;
-            font-weight: bold;
-            color: #3498db;
-        }}
-        
-        .metric-label {{
-            color: #7f8c8d;
-            margin-top: 5px;
-        }}
-        
-        table {{
-            width: 100%;
-            background: white;
-            border-collapse: collapse;
-            border-radius: 8px;
-            overflow: hidden;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        
-        th, td {{
-            padding: 12px;
-            text-align: left;
-            border-bottom: 1px solid #ecf0f1;
-        }}
-        
-        th {{
-            background: #34495e;
-            color: white;
-        }}
-        
-        .positive {{
-            color: #27ae60;
-            font-weight: bold;
-        }}
-        
-        .negative {{
-            color: #e74c3c;
-            font-weight: bold;
-        }}
-    </style>
+    {head_assets}
 </head>
 <body>
     <div class="header">
@@ -2,7 +2,7 @@
 Structure Detection - Pivot Points, Swing Classification, ChoCH/BOS Detection
 
 Architecture:
-  1. Pivot Detection: Identify swing highs/lows using scipy.signal.argrelextrema
+  1. Pivot Detection: Identify swing highs/lows with the shared pivot engine (strict extrema)
   2. Swing Classification: Classify as HH/LH/HL/LL (Higher High, Lower High, etc.)
   3. ChoCH Detection: Change of Character (reversal point crossing)
   4. BOS Detection: Break of Structure (structure invalidation)
@@ -11,10 +11,11 @@ Architecture:
 
 import pandas as pd
 import numpy as np
-from scipy import signal
 from typing import Dict, List, Tuple, Any
 from dataclasses import dataclass
 
+from tradingagents.dataflows.pivot_engine import compute_pivots
+
 
 @dataclass
 class Pivot:
@@ -63,9 +64,16 @@ class PivotFinder:
         lows = df['low'].values
         dates = df.get('date', df.index).values
         
-        # Find local maxima and minima
-        high_indices = signal.argrelextrema(highs, np.greater, order=self.min_lookback)[0]
-        low_indices = signal.argrelextrema(lows, np.less, order=self.min_lookback)[0]
+        # Find strict local maxima and minima (confirmed after min_lookback bars)
+        table = compute_pivots(
+            highs, lows,
+            left_bars=self.min_lookback,
+            right_bars=self.min_lookback,
+            min_prominence_pct=None,
+            strict=True,
+        )
+        high_indices = table.bar_index[table.is_high]
+        low_indices = table.bar_index[~table.is_high]
         
         # Filter by minimum height to avoid noise
         close_vals = df['close'].values
@@ -5,7 +5,9 @@ Calcola indicatori tecnici localmente da dati OHLCV, eliminando necessità di AP
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Tuple, Optional
+from collections.abc import Mapping
+from operator import itemgetter
+from typing import Callable, Dict, Iterable, Tuple, Optional
 
 
 def calculate_sma(prices: pd.Series, period: int) -> pd.Series:
@@ -49,10 +51,12 @@ def calculate_macd(
 def calculate_bollinger_bands(
     prices: pd.Series, 
     period: int = 20, 
-    std_dev: float = 2.0
+    std_dev: float = 2.0,
+    middle: Optional[pd.Series] = None
 ) -> Tuple[pd.Series, pd.Series, pd.Series]:
-    """Bollinger Bands (Upper, Middle, Lower)"""
-    middle = calculate_sma(prices, period)
+    """Bollinger Bands (Upper, Middle, Lower). middle: SMA(period) già calcolata"""
+    if middle is None:
+        middle = calculate_sma(prices, period)
     std = prices.rolling(window=period).std()
     
     upper = middle + (std * std_dev)
@@ -61,18 +65,29 @@ def calculate_bollinger_bands(
     return upper, middle, lower
 
 
-def calculate_atr(
-    high: pd.Series, 
-    low: pd.Series, 
-    close: pd.Series, 
-    period: int = 14
+def calculate_true_range(
+    high: pd.Series,
+    low: pd.Series,
+    close: pd.Series
 ) -> pd.Series:
-    """Average True Range"""
+    """True Range: max(high-low, |high-prev close|, |low-prev close|)"""
     high_low = high - low
     high_close = (high - close.shift()).abs()
     low_close = (low - close.shift()).abs()
     
-    true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
+    return pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
+
+
+def calculate_atr(
+    high: pd.Series, 
+    low: pd.Series, 
+    close: pd.Series, 
+    period: int = 14,
+    true_range: Optional[pd.Series] = None
+) -> pd.Series:
+    """Average True Range. true_range: TR già calcolato (evita il ricalcolo)"""
+    if true_range is None:
+        true_range = calculate_true_range(high, low, close)
     atr = true_range.rolling(window=period).mean()
     
     return atr
@@ -93,7 +108,8 @@ def calculate_adx(
     high: pd.Series, 
     low: pd.Series, 
     close: pd.Series, 
-    period: int = 14
+    period: int = 14,
+    atr: Optional[pd.Series] = None
 ) -> Tuple[pd.Series, pd.Series, pd.Series]:
     """
     Average Directional Index (ADX) - Forza del Trend
@@ -101,14 +117,9 @@ def calculate_adx(
     
     ADX > 25: Trend forte
     ADX < 20: Trend debole/laterale
-    """
-    # True Range
-    tr = pd.DataFrame({
-        'hl': high - low,
-        'hc': (high - close.shift()).abs(),
-        'lc': (low - close.shift()).abs()
-    }).max(axis=1)
     
+    atr: ATR(period) già calcolato (evita il ricalcolo del True Range)
+    """
     # Directional Movement
     up_move = high - high.shift()
     down_move = low.shift() - low
@@ -120,7 +131,8 @@ def calculate_adx(
     minus_dm[(down_move > up_move) & (down_move > 0)] = down_move
     
     # Smoothed indicators
-    atr = tr.rolling(window=period).mean()
+    if atr is None:
+        atr = calculate_atr(high, low, close, period)
     plus_di = 100 * (plus_dm.rolling(window=period).mean() / atr)
     minus_di = 100 * (minus_dm.rolling(window=period).mean() / atr)
     
@@ -153,15 +165,18 @@ def calculate_supertrend(
     low: pd.Series,
     close: pd.Series,
     period: int = 10,
-    multiplier: float = 3.0
+    multiplier: float = 3.0,
+    atr: Optional[pd.Series] = None
 ) -> Tuple[pd.Series, pd.Series]:
     """
     SuperTrend Indicator - Direzione del Trend
     Returns: (supertrend_values, trend_direction)
     
     trend_direction: 1 = uptrend, -1 = downtrend
+    atr: ATR(period) già calcolato
     """
-    atr = calculate_atr(high, low, close, period)
+    if atr is None:
+        atr = calculate_atr(high, low, close, period)
     hl_avg = (high + low) / 2
     
     # Basic bands
@@ -341,7 +356,8 @@ def calculate_tsi(
 def calculate_bollinger_bandwidth(
     prices: pd.Series,
     period: int = 20,
-    std_dev: float = 2.0
+    std_dev: float = 2.0,
+    bands: Optional[Tuple[pd.Series, pd.Series, pd.Series]] = None
 ) -> pd.Series:
     """
     Bollinger Bandwidth - Volatility Compression Metric
@@ -356,8 +372,10 @@ def calculate_bollinger_bandwidth(
     - Falling bandwidth: Compressione (setup imminente)
     
     Fondamentale per identificare i periodi di setup pre-breakout
+    
+    bands: (upper, middle, lower) già calcolate da calculate_bollinger_bands
     """
-    upper, middle, lower = calculate_bollinger_bands(prices, period, std_dev)
+    upper, middle, lower = bands if bands is not None else calculate_bollinger_bands(prices, period, std_dev)
     
     bandwidth = ((upper - lower) / middle) * 100
     bandwidth = bandwidth.fillna(0)
@@ -447,7 +465,8 @@ def calculate_atr_percent(
     high: pd.Series,
     low: pd.Series,
     close: pd.Series,
-    period: int = 14
+    period: int = 14,
+    atr: Optional[pd.Series] = None
 ) -> pd.Series:
     """
     ATR Percentage - Volatilità normalizzata per comparazione cross-asset
@@ -467,116 +486,222 @@ def calculate_atr_percent(
     - Sizing coerente tra titoli a prezzi diversi
     - Calcolo stop loss uniforme (1.5x ATR% per tutti)
     - Calcolo target uniforme (3x ATR% = ~2-5% su daily)
+    
+    atr: ATR(period) già calcolato
     """
-    atr = calculate_atr(high, low, close, period)
+    if atr is None:
+        atr = calculate_atr(high, low, close, period)
     atr_percent = (atr / close) * 100
     atr_percent = atr_percent.fillna(0)
     
     return atr_percent
 
 
+# ==================== MOTORE LAZY (DAG DI DIPENDENZE) ====================
+
+# Ogni nodo dichiara i suoi input (altri nodi o colonne OHLCV) e la funzione
+# che lo calcola. Gli intermedi condivisi (TR, ATR, SMA20/Bollinger, max/min
+# rolling, regressione lineare) compaiono una sola volta nel grafo: chi chiede
+# 'adx' calcola solo TR → ATR14 → DMI, senza Ichimoku, TSI o regressioni.
+# Un nodo che restituisce None (es. vwma senza volumi) non è disponibile.
+
+SOURCE_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+
+# Indicatori di volume: non disponibili se la serie dei volumi è vuota o nulla
+_VOLUME_INDICATORS = ('vwma', 'volume_ratio')
+
+
+def _has_volume(volume: pd.Series) -> bool:
+    return volume.sum() > 0
+
+
+def _if_volume(fn: Callable) -> Callable:
+    return lambda volume, *args: fn(volume, *args) if _has_volume(volume) else None
+
+
+_INDICATOR_NODES: Dict[str, Tuple[Tuple[str, ...], Callable]] = {
+    # ── intermedi condivisi
+    'tr':             (('high', 'low', 'close'), calculate_true_range),
+    'atr_14':         (('high', 'low', 'close', 'tr'), lambda h, l, c, tr: calculate_atr(h, l, c, 14, true_range=tr)),
+    'atr_10':         (('high', 'low', 'close', 'tr'), lambda h, l, c, tr: calculate_atr(h, l, c, 10, true_range=tr)),
+    'sma_20':         (('close',), lambda c: calculate_sma(c, 20)),
+    'bollinger_20':   (('close', 'sma_20'), lambda c, mid: calculate_bollinger_bands(c, 20, 2.0, middle=mid)),
+    'high_max_20':    (('high',), lambda h: h.rolling(window=20).max()),
+    'low_min_20':     (('low',), lambda l: l.rolling(window=20).min()),
+    'macd_12_26_9':   (('close',), calculate_macd),
+    'dmi_14':         (('high', 'low', 'close', 'atr_14'), lambda h, l, c, atr: calculate_adx(h, l, c, 14, atr=atr)),
+    'supertrend_10':  (('high', 'low', 'close', 'atr_10'), lambda h, l, c, atr: calculate_supertrend(h, l, c, 10, 3.0, atr=atr)),
+    'linreg_20':      (('close',), lambda c: calculate_linear_regression(c, 20)),
+    'linreg_10':      (('close',), lambda c: calculate_linear_regression(c, 10)),
+    'ichimoku':       (('high', 'low', 'close'), calculate_ichimoku),
+    'tsi_13_7':       (('close',), calculate_tsi),
+
+    # ── indicatori base
+    'close_10_ema':   (('close',), lambda c: calculate_ema(c, 10)),
+    'close_50_sma':   (('close',), lambda c: calculate_sma(c, 50)),
+    'close_200_sma':  (('close',), lambda c: calculate_sma(c, 200)),
+    'rsi':            (('close',), lambda c: calculate_rsi(c, 14)),
+    'macd':           (('macd_12_26_9',), itemgetter(0)),
+    'macds':          (('macd_12_26_9',), itemgetter(1)),
+    'macdh':          (('macd_12_26_9',), itemgetter(2)),
+    'boll_ub':        (('bollinger_20',), itemgetter(0)),
+    'boll':           (('bollinger_20',), itemgetter(1)),
+    'boll_lb':        (('bollinger_20',), itemgetter(2)),
+    'atr':            (('atr_14',), lambda atr: atr),
+    'vwma':           (('volume', 'close'), _if_volume(lambda v, c: calculate_vwma(c, v, 20))),
+
+    # ── indicatori swing
+    'adx':                        (('dmi_14',), itemgetter(0)),
+    'plus_di':                    (('dmi_14',), itemgetter(1)),
+    'minus_di':                   (('dmi_14',), itemgetter(2)),
+    'er':                         (('close',), lambda c: calculate_efficiency_ratio(c, 10)),
+    'supertrend':                 (('supertrend_10',), itemgetter(0)),
+    'supertrend_direction':       (('supertrend_10',), itemgetter(1)),
+    'linear_regression':          (('linreg_20',), itemgetter(0)),
+    'linear_regression_slope':    (('linreg_20',), itemgetter(1)),
+    'linear_regression_r2':       (('linreg_20',), itemgetter(2)),
+    'ichimoku_tenkan_sen':        (('ichimoku',), itemgetter('tenkan_sen')),
+    'ichimoku_kijun_sen':         (('ichimoku',), itemgetter('kijun_sen')),
+    'ichimoku_senkou_span_a':     (('ichimoku',), itemgetter('senkou_span_a')),
+    'ichimoku_senkou_span_b':     (('ichimoku',), itemgetter('senkou_span_b')),
+    'ichimoku_chikou_span':       (('ichimoku',), itemgetter('chikou_span')),
+    'tsi':                        (('tsi_13_7',), itemgetter(0)),
+    'tsi_signal':                 (('tsi_13_7',), itemgetter(1)),
+    'linear_regression_20':       (('linreg_20',), itemgetter(0)),
+    'linear_regression_slope_20': (('linreg_20',), itemgetter(1)),
+    'linear_regression_20_r2':    (('linreg_20',), itemgetter(2)),
+    'linear_regression_10':       (('linreg_10',), itemgetter(0)),
+    'linear_regression_slope_10': (('linreg_10',), itemgetter(1)),
+    'linear_regression_10_r2':    (('linreg_10',), itemgetter(2)),
+    'bollinger_bandwidth':        (('close', 'bollinger_20'), lambda c, bands: calculate_bollinger_bandwidth(c, 20, 2.0, bands=bands)),
+    'volume_ratio':               (('volume',), _if_volume(lambda v: calculate_volume_ratio(v, 20))),
+    'donchian_high':              (('high_max_20',), lambda h: h),
+    'donchian_low':               (('low_min_20',), lambda l: l),
+    'donchian_mid':               (('high_max_20', 'low_min_20'), lambda h, l: (h + l) / 2),
+    'percent_from_200sma':        (('close', 'close_200_sma'), calculate_percent_from_200sma),
+    'atr_percent':                (('high', 'low', 'close', 'atr_14'), lambda h, l, c, atr: calculate_atr_percent(h, l, c, 14, atr=atr)),
+}
+
+# Output pubblici, nell'ordine storico di get_all_indicators
+BASE_INDICATORS = (
+    'close_10_ema', 'close_50_sma', 'close_200_sma', 'rsi',
+    'macd', 'macds', 'macdh', 'boll_ub', 'boll', 'boll_lb', 'atr', 'vwma',
+)
+SWING_INDICATORS = (
+    'adx', 'plus_di', 'minus_di', 'er', 'supertrend', 'supertrend_direction',
+    'linear_regression', 'linear_regression_slope', 'linear_regression_r2',
+    'ichimoku_tenkan_sen', 'ichimoku_kijun_sen', 'ichimoku_senkou_span_a',
+    'ichimoku_senkou_span_b', 'ichimoku_chikou_span', 'tsi', 'tsi_signal',
+    'linear_regression_20', 'linear_regression_slope_20', 'linear_regression_20_r2',
+    'linear_regression_10', 'linear_regression_slope_10', 'linear_regression_10_r2',
+    'bollinger_bandwidth', 'volume_ratio', 'donchian_high', 'donchian_low', 'donchian_mid',
+    'percent_from_200sma', 'atr_percent',
+)
+
+
+class IndicatorEngine(Mapping):
+    """
+    Calcolo lazy e memoizzato degli indicatori di un DataFrame OHLCV.
+    
+    Si comporta come un dict di sola lettura (engine['adx'], 'adx' in engine,
+    engine.get(...)): ogni indicatore viene calcolato al primo accesso insieme
+    ai soli nodi da cui dipende, e riusato per gli accessi successivi.
+    
+    Esempio:
+        engine = IndicatorEngine(df)
+        engine['adx']                        # calcola TR, ATR14, DMI
+        engine.compute(['atr', 'atr_percent'])  # riusa TR e ATR14
+    """
+    
+    def __init__(self, df: pd.DataFrame, swing_mode: bool = True):
+        if not all(col in df.columns for col in ['open', 'high', 'low', 'close']):
+            raise ValueError("DataFrame must contain 'open', 'high', 'low', 'close' columns")
+        
+        self.df = df
+        self.outputs = BASE_INDICATORS + (SWING_INDICATORS if swing_mode else ())
+        self._cache: Dict[str, any] = {}
+    
+    def node(self, name: str):
+        """Valore di un nodo qualsiasi (output, intermedio o colonna sorgente), memoizzato."""
+        if name in self._cache:
+            return self._cache[name]
+        
+        if name == 'volume':
+            value = self.df.get('volume', pd.Series([0] * len(self.df)))
+        elif name in SOURCE_COLUMNS:
+            value = self.df[name]
+        elif name in _INDICATOR_NODES:
+            inputs, fn = _INDICATOR_NODES[name]
+            args = [self.node(dep) for dep in inputs]
+            value = None if any(arg is None for arg in args) else fn(*args)
+        else:
+            raise KeyError(f"Unknown indicator: {name}")
+        
+        self._cache[name] = value
+        return value
+    
+    def compute(self, names: Iterable[str]) -> Dict[str, any]:
+        """
+        Dict {nome: valore} dei soli indicatori richiesti (omessi quelli non disponibili).
+
+        Accetta solo gli output pubblici (self.outputs): gli intermedi del DAG
+        ('tr', 'ichimoku', ...) restano interni e vanno letti con node().
+        """
+        names = list(names)
+        unknown = [name for name in names if name not in self.outputs]
+        if unknown:
+            raise ValueError(
+                f"Unknown indicators: {', '.join(unknown)}. "
+                f"Please choose from: {', '.join(self.outputs)}"
+            )
+        values = {name: self.node(name) for name in names}
+        return {name: value for name, value in values.items() if value is not None}
+    
+    # ── Mapping (solo gli output pubblici)
+    def __getitem__(self, name: str):
+        if name not in self.outputs:
+            raise KeyError(name)
+        value = self.node(name)
+        if value is None:
+            raise KeyError(name)
+        return value
+    
+    def __contains__(self, name) -> bool:
+        if name not in self.outputs:
+            return False
+        if name in _VOLUME_INDICATORS:
+            return _has_volume(self.node('volume'))
+        return True
+    
+    def __iter__(self):
+        return (name for name in self.outputs if name in self)
+    
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
 # ==================== FUNZIONE MASTER ====================
 
-def get_all_indicators(df: pd.DataFrame, swing_mode: bool = True) -> Dict[str, any]:
+def get_all_indicators(
+    df: pd.DataFrame,
+    swing_mode: bool = True,
+    indicators: Optional[Iterable[str]] = None
+) -> Dict[str, any]:
     """
-    Calcola tutti gli indicatori tecnici da un DataFrame OHLCV
+    Calcola gli indicatori tecnici da un DataFrame OHLCV
     
     Args:
         df: DataFrame con colonne ['open', 'high', 'low', 'close', 'volume']
         swing_mode: True per swing trading (include tutti gli indicatori avanzati)
+        indicators: sottoinsieme di indicatori da calcolare (default: tutti);
+                    vengono calcolati solo i nodi da cui dipendono
     
     Returns:
-        Dictionary con tutti gli indicatori calcolati
+        Dictionary con gli indicatori calcolati
     """
-    if not all(col in df.columns for col in ['open', 'high', 'low', 'close']):
-        raise ValueError("DataFrame must contain 'open', 'high', 'low', 'close' columns")
-    
-    close = df['close']
-    high = df['high']
-    low = df['low']
-    volume = df.get('volume', pd.Series([0] * len(df)))
-    
-    indicators = {}
-    
-    # Indicatori base (sempre calcolati)
-    indicators['close_10_ema'] = calculate_ema(close, 10)
-    indicators['close_50_sma'] = calculate_sma(close, 50)
-    indicators['close_200_sma'] = calculate_sma(close, 200)
-    
-    indicators['rsi'] = calculate_rsi(close, 14)
-    
-    macd, macds, macdh = calculate_macd(close)
-    indicators['macd'] = macd
-    indicators['macds'] = macds
-    indicators['macdh'] = macdh
-    
-    boll_ub, boll, boll_lb = calculate_bollinger_bands(close)
-    indicators['boll_ub'] = boll_ub
-    indicators['boll'] = boll
-    indicators['boll_lb'] = boll_lb
-    
-    indicators['atr'] = calculate_atr(high, low, close)
-    
-    if len(volume) > 0 and volume.sum() > 0:
-        indicators['vwma'] = calculate_vwma(close, volume, 20)
-    
-    # Indicatori avanzati per SWING TRADING
-    if swing_mode:
-        # Forza del trend
-        adx, plus_di, minus_di = calculate_adx(high, low, close, 14)
-        indicators['adx'] = adx
-        indicators['plus_di'] = plus_di
-        indicators['minus_di'] = minus_di
-        indicators['er'] = calculate_efficiency_ratio(close, 10)
-        
-        # Direzione del trend
-        supertrend, st_direction = calculate_supertrend(high, low, close, 10, 3.0)
-        indicators['supertrend'] = supertrend
-        indicators['supertrend_direction'] = st_direction
-        
-        linreg, linreg_slope, r_squared = calculate_linear_regression(close, 20)
-        indicators['linear_regression'] = linreg
-        indicators['linear_regression_slope'] = linreg_slope
-        indicators['linear_regression_r2'] = r_squared
-        
-        ichimoku = calculate_ichimoku(high, low, close)
-        indicators.update({f'ichimoku_{k}': v for k, v in ichimoku.items()})
-        
-        # Momentum
-        tsi, tsi_signal = calculate_tsi(close)  # Default: 13/7 for swing reactivity
-        indicators['tsi'] = tsi
-        indicators['tsi_signal'] = tsi_signal
-        
-        # Linear Regression - Dual periods: 20 (standard) and 10 (short-term reactive)
-        linreg_20, linreg_slope_20, r2_20 = calculate_linear_regression(close, 20)
-        linreg_10, linreg_slope_10, r2_10 = calculate_linear_regression(close, 10)
-        indicators['linear_regression_20'] = linreg_20
-        indicators['linear_regression_slope_20'] = linreg_slope_20
-        indicators['linear_regression_20_r2'] = r2_20
-        indicators['linear_regression_10'] = linreg_10
-        indicators['linear_regression_slope_10'] = linreg_slope_10
-        indicators['linear_regression_10_r2'] = r2_10
-        
-        # NEW: Bollinger Bandwidth - Volatility compression metric
-        indicators['bollinger_bandwidth'] = calculate_bollinger_bandwidth(close, 20, 2.0)
-        
-        # NEW: Volume Ratio - Breakout strength qualification
-        if len(volume) > 0 and volume.sum() > 0:
-            indicators['volume_ratio'] = calculate_volume_ratio(volume, 20)
-        
-        # NEW: Donchian Channel - Price-based structure
-        donchian_h, donchian_l, donchian_mid = calculate_donchian_channel(high, low, 20)
-        indicators['donchian_high'] = donchian_h
-        indicators['donchian_low'] = donchian_l
-        indicators['donchian_mid'] = donchian_mid
-        
-        # NEW: Percent from 200 SMA - Mean reversion screening
-        indicators['percent_from_200sma'] = calculate_percent_from_200sma(close, indicators['close_200_sma'])
-        
-        # NEW: ATR Percent - Cross-asset comparable volatility
-        indicators['atr_percent'] = calculate_atr_percent(high, low, close, 14)
-    
-    return indicators
+    engine = IndicatorEngine(df, swing_mode)
+    return engine.compute(engine.outputs if indicators is None else list(indicators))
 
 
 def format_indicators_for_display(indicators: Dict[str, any], decimals: int = 2) -> Dict[str, float]:
@@ -0,0 +1,298 @@
+"""Vendor routing with per-vendor timeouts, hedged fallbacks and circuit breakers.
+
+Used by interface.route_to_vendor. Vendor implementations are blocking
+(requests / yfinance), so every attempt runs on a shared thread pool while the
+calling thread waits with a deadline:
+
+- timeout: an attempt that exceeds its vendor timeout is abandoned and the
+  next vendor is tried (the worker finishes in the background, result dropped)
+- hedging: with a hedge percentile set, the fallback is started as soon as the
+  primary is slower than that percentile of its recent latencies; the first
+  successful answer wins
+- circuit breaker: a vendor that failed `failure_threshold` times in a row, or
+  hit a rate limit, is skipped for `cooldown` seconds (if every vendor is
+  tripped they are all tried anyway)
+"""
+
+import contextvars
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type
+
+logger = logging.getLogger(__name__)
+
+
+class VendorTimeoutError(TimeoutError):
+    """A vendor attempt exceeded its timeout."""
+
+
+class CircuitBreaker:
+    """Skip vendors that failed repeatedly or were rate-limited recently."""
+
+    def __init__(self, failure_threshold: int = 3, cooldown: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self._failures: Dict[str, int] = defaultdict(int)
+        self._open_until: Dict[str, float] = {}
+
+    def allow(self, vendor: str) -> bool:
+        with self._lock:
+            return time.monotonic() >= self._open_until.get(vendor, 0.0)
+
+    def record_success(self, vendor: str) -> None:
+        with self._lock:
+            self._failures.pop(vendor, None)
+            self._open_until.pop(vendor, None)
+
+    def record_failure(
+        self,
+        vendor: str,
+        rate_limited: bool = False,
+        failure_threshold: Optional[int] = None,
+        cooldown: Optional[float] = None,
+    ) -> None:
+        failure_threshold = failure_threshold or self.failure_threshold
+        cooldown = self.cooldown if cooldown is None else cooldown
+        with self._lock:
+            self._failures[vendor] += 1
+            if rate_limited or self._failures[vendor] >= failure_threshold:
+                self._open_until[vendor] = time.monotonic() + cooldown
+                self._failures[vendor] = 0
+                logger.warning(
+                    "vendor_circuit_open vendor=%s rate_limited=%s cooldown=%.0fs",
+                    vendor, rate_limited, cooldown,
+                )
+
+    def reset(self) -> None:
+        with self._lock:
+            self._failures.clear()
+            self._open_until.clear()
+
+
+class LatencyTracker:
+    """Rolling window of successful attempt latencies per (method, vendor)."""
+
+    def __init__(self, window: int = 50, min_samples: int = 5):
+        self.min_samples = min_samples
+        self._lock = threading.Lock()
+        self._samples: Dict[Tuple[str, str], deque] = defaultdict(lambda: deque(maxlen=window))
+
+    def record(self, method: str, vendor: str, seconds: float) -> None:
+        with self._lock:
+            self._samples[method, vendor].append(seconds)
+
+    def percentile(self, method: str, vendor: str, q: float) -> Optional[float]:
+        """q-th percentile in seconds, or None until min_samples are recorded."""
+        with self._lock:
+            samples = sorted(self._samples.get((method, vendor), ()))
+        if len(samples) < self.min_samples:
+            return None
+        return samples[min(len(samples) - 1, int(round(q / 100 * (len(samples) - 1))))]
+
+
+class VendorRouter:
+    """Run vendor implementations with timeouts, hedging and circuit breaking."""
+
+    def __init__(self, max_workers: int = 16):
+        self.breaker = CircuitBreaker()
+        self.latencies = LatencyTracker()
+        self.timeout = 30.0
+        self.timeouts: Dict[str, float] = {}
+        self.hedge_percentile: Optional[float] = None
+        self.hedge_min_delay = 1.0
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="vendor")
+
+    def configure(self, config: Dict[str, Any]) -> None:
+        """Apply the vendor_* settings of a TradingAgents config (default for every call)."""
+        settings = self._settings(config)
+        self.timeout = settings["timeout"]
+        self.timeouts = settings["timeouts"]
+        self.hedge_percentile = settings["hedge_percentile"]
+        self.hedge_min_delay = settings["hedge_min_delay"]
+        self.breaker.failure_threshold = settings["failure_threshold"]
+        self.breaker.cooldown = settings["cooldown"]
+
+    def _settings(self, config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """vendor_* settings of a config, or the configured defaults when None."""
+        if config is None:
+            return {
+                "timeout": self.timeout,
+                "timeouts": self.timeouts,
+                "hedge_percentile": self.hedge_percentile,
+                "hedge_min_delay": self.hedge_min_delay,
+                "failure_threshold": self.breaker.failure_threshold,
+                "cooldown": self.breaker.cooldown,
+            }
+        return {
+            "timeout": config.get("vendor_timeout", 30.0),
+            "timeouts": config.get("vendor_timeouts") or {},
+            "hedge_percentile": config.get("vendor_hedge_percentile"),
+            "hedge_min_delay": config.get("vendor_hedge_min_delay", 1.0),
+            "failure_threshold": config.get("vendor_breaker_failures", 3),
+            "cooldown": config.get("vendor_breaker_cooldown", 60.0),
+        }
+
+    def route(
+        self,
+        method: str,
+        vendors: Sequence[str],
+        impls: Dict[str, Any],
+        args: tuple = (),
+        kwargs: Optional[Dict[str, Any]] = None,
+        collect: bool = False,
+        rate_limit_errors: Tuple[Type[BaseException], ...] = (),
+        on_attempt: Optional[Callable[..., None]] = None,
+        config: Optional[Dict[str, Any]] = None,
+    ) -> List[Any]:
+        """Call `method` on the vendors in order of preference.
+
+        Args:
+            method: Method name (for logs, latency stats and errors)
+            vendors: Vendors in order of preference (primary first)
+            impls: vendor -> implementation (or list of implementations)
+            collect: Query every vendor concurrently and return all successful
+                results in vendor order, instead of the first success
+            rate_limit_errors: Exceptions that trip the vendor's breaker at once
+            on_attempt: Called as on_attempt(vendor, attempt, started, error)
+                from the calling thread after each finished attempt
+            config: Config whose vendor_* settings apply to this call only
+                (concurrent runs may use different ones); default: configure()
+
+        Returns:
+            List of results (one element unless collect=True).
+
+        Raises:
+            RuntimeError: If every vendor failed.
+        """
+        kwargs = kwargs or {}
+        settings = self._settings(config)
+        timeout = lambda vendor: settings["timeouts"].get(vendor, settings["timeout"])
+        candidates = [v for v in vendors if v in impls]
+        allowed = [v for v in candidates if self.breaker.allow(v)]
+        skipped = [v for v in candidates if v not in allowed]
+        if skipped:
+            logger.info("vendor_skipped method=%s vendors=%s reason=circuit_open", method, skipped)
+        if not allowed:
+            allowed = candidates  # Every vendor tripped: probe them all rather than fail blind
+
+        pending: Dict[Any, Tuple[str, int, float]] = {}
+        results: Dict[str, Any] = {}
+        queue = list(allowed)
+
+        def launch() -> None:
+            vendor = queue.pop(0)
+            attempt = len(allowed) - len(queue)
+            future = self._executor.submit(
+                contextvars.copy_context().run, _call_vendor, impls[vendor], args, kwargs
+            )
+            pending[future] = (vendor, attempt, time.perf_counter())
+            logger.debug("vendor_attempt method=%s vendor=%s attempt=%d", method, vendor, attempt)
+
+        def finish(vendor: str, attempt: int, started: float, error=None) -> None:
+            elapsed = time.perf_counter() - started
+            if error is None:
+                self.breaker.record_success(vendor)
+                self.latencies.record(method, vendor, elapsed)
+                logger.debug(
+                    "vendor_ok method=%s vendor=%s attempt=%d seconds=%.3f",
+                    method, vendor, attempt, elapsed,
+                )
+            else:
+                rate_limited = isinstance(error, rate_limit_errors)
+                self.breaker.record_failure(
+                    vendor, rate_limited, settings["failure_threshold"], settings["cooldown"]
+                )
+                logger.warning(
+                    "vendor_failed method=%s vendor=%s attempt=%d seconds=%.3f rate_limited=%s error=%r",
+                    method, vendor, attempt, elapsed, rate_limited, error,
+                )
+            if on_attempt is not None:
+                on_attempt(vendor, attempt, started, error)
+
+        for _ in range(len(queue) if collect else 1):
+            launch()
+
+        while pending:
+            now = time.perf_counter()
+            deadlines = {f: started + timeout(v) for f, (v, _, started) in pending.items()}
+            wake_at = min(deadlines.values())
+            hedge_at = None if collect or not queue else self._hedge_at(method, pending, settings)
+            if hedge_at is not None:
+                wake_at = min(wake_at, hedge_at)
+
+            done, _ = wait(list(pending), timeout=max(wake_at - now, 0), return_when=FIRST_COMPLETED)
+            for future in done:
+                vendor, attempt, started = pending.pop(future)
+                try:
+                    results[vendor] = future.result()
+                    finish(vendor, attempt, started)
+                except Exception as e:
+                    finish(vendor, attempt, started, e)
+                    if queue and not collect:
+                        launch()
+
+            if results and not collect:
+                # First success wins; slower hedged attempts still feed the latency stats
+                for future, (vendor, _, started) in pending.items():
+                    future.add_done_callback(self._record_late(method, vendor, started))
+                break
+
+            now = time.perf_counter()
+            for future in [f for f in pending if now >= deadlines.get(f, float("inf"))]:
+                vendor, attempt, started = pending.pop(future)
+                future.cancel()
+                finish(vendor, attempt, started, VendorTimeoutError(
+                    f"{vendor} exceeded {timeout(vendor):.1f}s"
+                ))
+                if queue and not collect:
+                    launch()
+
+            if hedge_at is not None and now >= hedge_at and queue:
+                logger.info(
+                    "vendor_hedge method=%s after=%.2fs next_vendor=%s", method,
+                    now - max(started for _, _, started in pending.values()), queue[0],
+                )
+                launch()
+
+        if not results:
+            raise RuntimeError(f"All vendor implementations failed for method '{method}'")
+        return [results[v] for v in allowed if v in results]
+
+    def _record_late(self, method: str, vendor: str, started: float) -> Callable:
+        def callback(future) -> None:
+            if not future.cancelled() and future.exception() is None:
+                self.latencies.record(method, vendor, time.perf_counter() - started)
+        return callback
+
+    def _hedge_at(
+        self, method: str, pending: Dict[Any, Tuple[str, int, float]], settings: Dict[str, Any]
+    ) -> Optional[float]:
+        """When to start the next vendor alongside the latest in-flight attempt."""
+        if not settings["hedge_percentile"] or not pending:
+            return None
+        vendor, _, started = max(pending.values(), key=lambda item: item[2])
+        threshold = self.latencies.percentile(method, vendor, settings["hedge_percentile"])
+        if threshold is None:
+            return None
+        return started + max(threshold, settings["hedge_min_delay"])
+
+
+def _call_vendor(impl: Any, args: tuple, kwargs: Dict[str, Any]) -> Any:
+    """Run one vendor; a vendor with several implementations returns their joined output."""
+    if not isinstance(impl, list):
+        return impl(*args, **kwargs)
+
+    outputs, errors = [], []
+    for func in impl:
+        try:
+            outputs.append(func(*args, **kwargs))
+        except Exception as e:
+            errors.append(e)
+            logger.warning("vendor_impl_failed impl=%s error=%r", func.__name__, e)
+    if not outputs:
+        raise errors[-1]
+    return outputs[0] if len(outputs) == 1 else "\n".join(str(o) for o in outputs)
@@ -0,0 +1,137 @@
+"""
+weekly_aggregator.py
+═════════════════════════════════════════════════════════════════════════════
+Aggregazione incrementale Daily → Weekly con lookup "as-of"
+
+Invece di chiamare df.resample("W-FRI") su tutto lo storico ad ogni barra
+(backtest walk-forward) o di scaricare una seconda serie weekly, le barre
+daily vengono aggiunte una alla volta e la barra weekly corrente viene
+aggiornata in O(1):
+
+  open   = primo open della settimana
+  high   = max degli high
+  low    = min dei low
+  close  = ultimo close
+  volume = somma dei volumi
+
+Per ogni barra daily i resta memorizzato lo stato parziale della sua
+settimana, quindi asof(i) restituisce esattamente resample_to_weekly(df[:i+1])
+(settimane chiuse + settimana in corso fino al giorno i) senza ricalcolo.
+────────────────────────────────────────────────────────────────────────────────
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+WEEKLY_COLUMNS = ["open", "high", "low", "close", "volume"]
+
+
+def week_label_ns(timestamp) -> int:
+    """Etichetta W-FRI (venerdì a mezzanotte) della settimana che contiene timestamp."""
+    ts = pd.Timestamp(timestamp)
+    if ts.tzinfo is not None:
+        ts = ts.tz_convert(None)
+    day = ts.normalize()
+    return int((day + pd.Timedelta(days=(4 - day.weekday()) % 7)).value)
+
+
+class WeeklyAggregator:
+    """
+    Serie weekly mantenuta incrementalmente a partire da barre daily.
+
+    Esempio:
+        agg = WeeklyAggregator.from_frame(df_daily)
+        agg.asof(100)        # DataFrame weekly visto alla barra daily 100
+        agg.append(ts, o, h, l, c, v)   # nuova barra live
+    """
+
+    def __init__(self):
+        # Per barra daily: settimana di appartenenza e barra weekly parziale a quel giorno
+        self._day_week:    List[int] = []
+        self._day_partial: List[Tuple[float, float, float, float, float]] = []
+
+        # Per settimana: etichetta e barra (l'ultima è aggiornata finché la settimana è aperta)
+        self._week_label: List[int] = []
+        self._week_bar:   List[Tuple[float, float, float, float, float]] = []
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "WeeklyAggregator":
+        agg = cls()
+        agg.extend(df)
+        return agg
+
+    # ── alimentazione
+    @property
+    def n_days(self) -> int:
+        return len(self._day_week)
+
+    @property
+    def n_weeks(self) -> int:
+        return len(self._week_label)
+
+    def append(self, timestamp, open_: float, high: float, low: float,
+               close: float, volume: float = 0.0) -> bool:
+        """
+        Aggiunge una barra daily. Restituisce True se la barra apre una nuova
+        settimana (cioè la settimana precedente è appena stata chiusa).
+        """
+        label = week_label_ns(timestamp)
+        new_week = not self._week_label or label != self._week_label[-1]
+
+        if new_week:
+            bar = (float(open_), float(high), float(low), float(close), float(volume))
+            self._week_label.append(label)
+            self._week_bar.append(bar)
+        else:
+            o, h, l, _, v = self._week_bar[-1]
+            bar = (o, max(h, float(high)), min(l, float(low)), float(close), v + float(volume))
+            self._week_bar[-1] = bar
+
+        self._day_week.append(len(self._week_label) - 1)
+        self._day_partial.append(bar)
+        return new_week and len(self._week_label) > 1
+
+    def extend(self, df: pd.DataFrame) -> None:
+        volumes = df["volume"].values if "volume" in df.columns else np.zeros(len(df))
+        for ts, o, h, l, c, v in zip(df.index, df["open"].values, df["high"].values,
+                                     df["low"].values, df["close"].values, volumes):
+            self.append(ts, o, h, l, c, v)
+
+    # ── lookup
+    def week_of(self, day_index: int) -> int:
+        """Indice della barra weekly che contiene la barra daily day_index."""
+        return self._day_week[day_index]
+
+    def week_bar(self, week_index: int) -> Tuple[float, float, float, float, float]:
+        """(open, high, low, close, volume) della settimana — definitiva se già chiusa."""
+        return self._week_bar[week_index]
+
+    def week_label(self, week_index: int) -> int:
+        return self._week_label[week_index]
+
+    def bar_asof(self, day_index: int) -> Tuple[float, float, float, float, float]:
+        """Barra weekly della settimana in corso, vista alla barra daily day_index."""
+        return self._day_partial[day_index]
+
+    def arrays_asof(self, day_index: int) -> dict:
+        """Colonne weekly (np.ndarray) viste alla barra daily day_index."""
+        w    = self._day_week[day_index]
+        bars = np.array(self._week_bar[:w] + [self._day_partial[day_index]], dtype=np.float64).reshape(-1, 5)
+        out  = {col: bars[:, k] for k, col in enumerate(WEEKLY_COLUMNS)}
+        out["timestamp"] = np.array(self._week_label[:w + 1], dtype=np.int64)
+        return out
+
+    def asof(self, day_index: int) -> pd.DataFrame:
+        """DataFrame weekly equivalente a resample_to_weekly(df.iloc[:day_index + 1])."""
+        cols  = self.arrays_asof(day_index)
+        index = pd.DatetimeIndex(cols.pop("timestamp").astype("datetime64[ns]"))
+        return pd.DataFrame(cols, index=index)[WEEKLY_COLUMNS]
+
+    def weekly_frame(self) -> pd.DataFrame:
+        """Serie weekly completa (ultima settimana eventualmente parziale)."""
+        if not self.n_days:
+            return pd.DataFrame(columns=WEEKLY_COLUMNS)
+        return self.asof(self.n_days - 1)
@@ -1,4 +1,5 @@
-from typing import Annotated
+from functools import lru_cache
+from typing import Annotated, List, Union
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 import yfinance as yf
@@ -46,6 +47,248 @@ def get_YFin_data_online(
 
     return header + csv_string
 
+# Descriptions returned with indicator values (also the list of supported indicators)
+INDICATOR_DESCRIPTIONS = {
+    # Moving Averages
+    "close_50_sma": (
+        "50 SMA: A medium-term trend indicator. "
+        "Usage: Identify trend direction and serve as dynamic support/resistance. "
+        "Tips: It lags price; combine with faster indicators for timely signals."
+    ),
+    "close_200_sma": (
+        "200 SMA: A long-term trend benchmark. "
+        "Usage: Confirm overall market trend and identify golden/death cross setups. "
+        "Tips: It reacts slowly; best for strategic trend confirmation rather than frequent trading entries."
+    ),
+    "close_10_ema": (
+        "10 EMA: A responsive short-term average. "
+        "Usage: Capture quick shifts in momentum and potential entry points. "
+        "Tips: Prone to noise in choppy markets; use alongside longer averages for filtering false signals."
+    ),
+    # MACD Related
+    "macd": (
+        "MACD: Computes momentum via differences of EMAs. "
+        "Usage: Look for crossovers and divergence as signals of trend changes. "
+        "Tips: Confirm with other indicators in low-volatility or sideways markets."
+    ),
+    "macds": (
+        "MACD Signal: An EMA smoothing of the MACD line. "
+        "Usage: Use crossovers with the MACD line to trigger trades. "
+        "Tips: Should be part of a broader strategy to avoid false positives."
+    ),
+    "macdh": (
+        "MACD Histogram: Shows the gap between the MACD line and its signal. "
+        "Usage: Visualize momentum strength and spot divergence early. "
+        "Tips: Can be volatile; complement with additional filters in fast-moving markets."
+    ),
+    # Momentum Indicators
+    "rsi": (
+        "RSI: Measures momentum to flag overbought/oversold conditions. "
+        "Usage: Apply 70/30 thresholds and watch for divergence to signal reversals. "
+        "Tips: In strong trends, RSI may remain extreme; always cross-check with trend analysis."
+    ),
+    # Volatility Indicators
+    "boll": (
+        "Bollinger Middle: A 20 SMA serving as the basis for Bollinger Bands. "
+        "Usage: Acts as a dynamic benchmark for price movement. "
+        "Tips: Combine with the upper and lower bands to effectively spot breakouts or reversals."
+    ),
+    "boll_ub": (
+        "Bollinger Upper Band: Typically 2 standard deviations above the middle line. "
+        "Usage: Signals potential overbought conditions and breakout zones. "
+        "Tips: Confirm signals with other tools; prices may ride the band in strong trends."
+    ),
+    "boll_lb": (
+        "Bollinger Lower Band: Typically 2 standard deviations below the middle line. "
+        "Usage: Indicates potential oversold conditions. "
+        "Tips: Use additional analysis to avoid false reversal signals."
+    ),
+    "atr": (
+        "ATR: Averages true range to measure volatility. "
+        "Usage: Set stop-loss levels and adjust position sizes based on current market volatility. "
+        "Tips: It's a reactive measure, so use it as part of a broader risk management strategy."
+    ),
+    # Volume-Based Indicators
+    "vwma": (
+        "VWMA: A moving average weighted by volume. "
+        "Usage: Confirm trends by integrating price action with volume data. "
+        "Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses."
+    ),
+    "mfi": (
+        "MFI: The Money Flow Index is a momentum indicator that uses both price and volume to measure buying and selling pressure. "
+        "Usage: Identify overbought (>80) or oversold (<20) conditions and confirm the strength of trends or reversals. "
+        "Tips: Use alongside RSI or MACD to confirm signals; divergence between price and MFI can indicate potential reversals."
+    ),
+    # ==================== SWING TRADING INDICATORS ====================
+    # Trend Strength
+    "adx": (
+        "ADX (Average Directional Index): Measures trend strength regardless of direction. "
+        "Usage: ADX > 25 = strong trend (good for swings), ADX < 20 = weak/sideways (avoid). "
+        "Tips: Essential for validating swing trade setups. Always check before entering position."
+    ),
+    "plus_di": (
+        "+DI (Plus Directional Indicator): Measures upward directional movement. "
+        "Usage: +DI > -DI suggests uptrend strength. Use with ADX to confirm bullish swing setups. "
+        "Tips: Rising +DI with ADX > 25 = strong uptrend."
+    ),
+    "minus_di": (
+        "-DI (Minus Directional Indicator): Measures downward directional movement. "
+        "Usage: -DI > +DI suggests downtrend strength. Use with ADX to confirm bearish swing setups. "
+        "Tips: Rising -DI with ADX > 25 = strong downtrend."
+    ),
+    "er": (
+        "ER (Efficiency Ratio): Measures trend efficiency vs noise. "
+        "Usage: ER near 1 = strong directional trend, ER near 0 = noisy/sideways market. "
+        "Tips: Filter swing trades: only trade when ER > 0.5 for high-quality setups."
+    ),
+    # Trend Direction
+    "supertrend": (
+        "SuperTrend: Dynamic support/resistance based on ATR. "
+        "Usage: Price above SuperTrend = uptrend, below = downtrend. Excellent for swing entries. "
+        "Tips: Combines volatility and price action. Low false signals in trending markets."
+    ),
+    "supertrend_direction": (
+        "SuperTrend Direction: Binary trend signal. "
+        "Usage: +1 = uptrend, -1 = downtrend. Clear directional signal for swing positioning. "
+        "Tips: Direction flip = potential trend reversal. Confirm with other indicators."
+    ),
+    "linear_regression": (
+        "Linear Regression Line: Fitted trend line over 20 periods. "
+        "Usage: Identifies mean reversion opportunities. Price far from line = potential reversion. "
+        "Tips: Use slope + R² together to assess trend quality."
+    ),
+    "linear_regression_slope": (
+        "Linear Regression Slope: Trend inclination measure. "
+        "Usage: Slope > 0 = uptrend, < 0 = downtrend. Magnitude shows trend strength. "
+        "Tips: Steep slope + high R² = strong consistent trend."
+    ),
+    "linear_regression_r2": (
+        "R-Squared: Measures linearity/consistency of trend. "
+        "Usage: R² near 1 = consistent linear trend, near 0 = choppy price action. "
+        "Tips: Only swing trade when R² > 0.6 for reliable trends."
+    ),
+    # Ichimoku Cloud Components
+    "ichimoku_tenkan_sen": (
+        "Ichimoku Conversion Line (Tenkan-sen): 9-period high+low midpoint. "
+        "Usage: Fast-moving reference for short-term momentum. "
+        "Tips: Price crossing Tenkan-sen signals short-term trend change."
+    ),
+    "ichimoku_kijun_sen": (
+        "Ichimoku Base Line (Kijun-sen): 26-period high+low midpoint. "
+        "Usage: Medium-term equilibrium price. Acts as dynamic support/resistance. "
+        "Tips: Strong signal when Tenkan crosses Kijun."
+    ),
+    "ichimoku_senkou_span_a": (
+        "Ichimoku Leading Span A (Cloud boundary): Average of Tenkan and Kijun, shifted forward. "
+        "Usage: Forms cloud top/bottom. Price above cloud = bullish, below = bearish. "
+        "Tips: Cloud acts as dynamic support/resistance zone."
+    ),
+    "ichimoku_senkou_span_b": (
+        "Ichimoku Leading Span B (Cloud boundary): 52-period high+low midpoint, shifted forward. "
+        "Usage: Forms cloud top/bottom. Thicker cloud = stronger support/resistance. "
+        "Tips: Cloud color change = major trend reversal signal."
+    ),
+    "ichimoku_chikou_span": (
+        "Ichimoku Lagging Span (Chikou): Current close shifted back 26 periods. "
+        "Usage: Confirms price momentum relative to past. Chikou above past price = bullish. "
+        "Tips: Chikou crossing price confirms trend strength."
+    ),
+    # TSI Momentum
+    "tsi": (
+        "TSI (True Strength Index): Double-smoothed momentum indicator with optimized swing params (13/7). "
+        "Usage: TSI > 0 indicates bullish momentum, TSI < 0 bearish. Crossover with signal line provides trade signals. "
+        "Tips: (13/7) params give 2-3 bar lead vs RSI, smoother without whipsaws. Essential for swing timing."
+    ),
+    "tsi_signal": (
+        "TSI Signal Line: Smoothed TSI for crossover analysis. "
+        "Usage: When TSI crosses above signal = buy signal, crosses below = sell signal. "
+        "Tips: Use with TSI for timing swing trade entries/exits."
+    ),
+    # Updated Linear Regression (dual periods)
+    "linear_regression_20": (
+        "Linear Regression Line (20 periods): Fitted trend over ~1 month. Mean reversion reference line. "
+        "Usage: Distance from LR line identifies overbought/oversold extremes. "
+        "Tips: Use r2_20 to qualify trend linearity (>0.6 = reliable, <0.4 = choppy)."
+    ),
+    "linear_regression_slope_20": (
+        "Linear Regression Slope (20): First derivative of 20-period trend line. "
+        "Usage: Slope > 0 = uptrend, < 0 = downtrend. Magnitude shows trend strength. "
+        "Tips: Steep slope + r2 > 0.6 = strong trend for swing entries."
+    ),
+    "linear_regression_20_r2": (
+        "R-Squared (20): Linearity metric of 20-period regression (0-1). "
+        "Usage: R² > 0.6 = consistent linear trend (swing-valid). R² < 0.4 = choppy. "
+        "Tips: Filter out choppy markets; only trade when R² > 0.55."
+    ),
+    "linear_regression_10": (
+        "Linear Regression Line (10 periods): Fitted trend over ~2 weeks. More reactive than 20-period. "
+        "Usage: Captures recent trend inflections faster. Use with 20-period for confluent signal. "
+        "Tips: When 10-period slope flips sign, potential reversal forming."
+    ),
+    "linear_regression_slope_10": (
+        "Linear Regression Slope (10): First derivative of 10-period trend line. "
+        "Usage: Faster trend direction changes than 20-period. Early reversal detection. "
+        "Tips: Divergence between slope_10 and slope_20 = inflection point (potential swing reversal)."
+    ),
+    "linear_regression_10_r2": (
+        "R-Squared (10): Linearity of recent 10-bar trend. "
+        "Usage: High r2_10 with negative slope_10 = pre-reversal compression (setup forming). "
+        "Tips: Monitor r2_10 < 0.3 = choppy oscillation (avoid), r2_10 > 0.7 = clean micro-trend."
+    ),
+    # NEW: Volume and Breakout Indicators
+    "bollinger_bandwidth": (
+        "Bollinger Bandwidth: (upper-lower)/middle*100. Volatility compression metric. "
+        "Usage: BW < 10 = extreme squeeze=breakout imminent. Rising BW = volatility increasing. "
+        "Tips: Rising from compression = setup inflection. Monitor change rate, not absolute value."
+    ),
+    "volume_ratio": (
+        "Volume Ratio: current_volume / SMA(volume,20). Breakout quality metric. "
+        "Usage: VR > 1.5 = STRONG BOS (high follow-through). VR < 0.7 = WEAK BOS (high failure). "
+        "Tips: CRITICAL for swing: BOS w/ VR>1.5 has 20-30% higher win rate. Filter breakouts by VR."
+    ),
+    "donchian_high": (
+        "Donchian Channel High (20): MAX(high,20). Structural resistance based on actual price. "
+        "Usage: Breakout above = true BOS vs false breakout. More reliable than Bollinger for swing. "
+        "Tips: Breakout above Donchian + rising ADX + VR>1.5 = high-confidence swing entry."
+    ),
+    "donchian_low": (
+        "Donchian Channel Low (20): MIN(low,20). Structural support based on actual price. "
+        "Usage: Breakdown below = structural support loss. Test of Donchian Low = swing short setup. "
+        "Tips: When price holds above Donchian Low after touch, reversal likely (mean reversion setup)."
+    ),
+    "donchian_mid": (
+        "Donchian Midline: (Donchian_High + Donchian_Low)/2. Dynamic center-pivot. "
+        "Usage: Acts as dynamic S/R, more responsive than 50 SMA for breakout context. "
+        "Tips: Price crossing Donchian Mid from below = momentum shift confirmation."
+    ),
+    # NEW: Screening Metrics
+    "percent_from_200sma": (
+        "Percent from 200 SMA: (close-200SMA)/200SMA*100. Mean-reversion distance metric. "
+        "Usage: >+20% = anti-reversion risk HIGH. <-20% = extreme accumulation potential. "
+        "Tips: CRITICAL filter for swing screening. Avoid setups >|25%| (statistically low win rate)."
+    ),
+    "atr_percent": (
+        "ATR Percent: (ATR/close)*100. Cross-asset comparable volatility (vs absolute ATR). "
+        "Usage: Allows uniform position sizing: 1.5x ATR% stop, 3x ATR% target across all assets. "
+        "Tips: ATR% >3% = volatile (reduce size). ATR% <1% = stable (increase size). Normalize your system."
+    ),
+}
+
+# New indicators that use technical_calculations.py
+ADVANCED_INDICATORS = [
+    'adx', 'plus_di', 'minus_di', 'er',
+    'supertrend', 'supertrend_direction',
+    'linear_regression_20', 'linear_regression_slope_20', 'linear_regression_20_r2',
+    'linear_regression_10', 'linear_regression_slope_10', 'linear_regression_10_r2',
+    'ichimoku_tenkan_sen', 'ichimoku_kijun_sen', 'ichimoku_senkou_span_a',
+    'ichimoku_senkou_span_b', 'ichimoku_chikou_span',
+    'tsi', 'tsi_signal',
+    'bollinger_bandwidth', 'volume_ratio',
+    'donchian_high', 'donchian_low', 'donchian_mid',
+    'percent_from_200sma', 'atr_percent'
+]
+
+
 def get_stock_stats_indicators_window(
     symbol: Annotated[str, "ticker symbol of the company"],
     indicator: Annotated[str, "technical indicator to get the analysis and report of"],
@@ -55,231 +298,7 @@ def get_stock_stats_indicators_window(
     look_back_days: Annotated[int, "how many days to look back"],
 ) -> str:
 
-    best_ind_params = {
-        # Moving Averages
-        "close_50_sma": (
-            "50 SMA: A medium-term trend indicator. "
-            "Usage: Identify trend direction and serve as dynamic support/resistance. "
-            "Tips: It lags price; combine with faster indicators for timely signals."
-        ),
-        "close_200_sma": (
-            "200 SMA: A long-term trend benchmark. "
-            "Usage: Confirm overall market trend and identify golden/death cross setups. "
-            "Tips: It reacts slowly; best for strategic trend confirmation rather than frequent trading entries."
-        ),
-        "close_10_ema": (
-            "10 EMA: A responsive short-term average. "
-            "Usage: Capture quick shifts in momentum and potential entry points. "
-            "Tips: Prone to noise in choppy markets; use alongside longer averages for filtering false signals."
-        ),
-        # MACD Related
-        "macd": (
-            "MACD: Computes momentum via differences of EMAs. "
-            "Usage: Look for crossovers and divergence as signals of trend changes. "
-            "Tips: Confirm with other indicators in low-volatility or sideways markets."
-        ),
-        "macds": (
-            "MACD Signal: An EMA smoothing of the MACD line. "
-            "Usage: Use crossovers with the MACD line to trigger trades. "
-            "Tips: Should be part of a broader strategy to avoid false positives."
-        ),
-        "macdh": (
-            "MACD Histogram: Shows the gap between the MACD line and its signal. "
-            "Usage: Visualize momentum strength and spot divergence early. "
-            "Tips: Can be volatile; complement with additional filters in fast-moving markets."
-        ),
-        # Momentum Indicators
-        "rsi": (
-            "RSI: Measures momentum to flag overbought/oversold conditions. "
-            "Usage: Apply 70/30 thresholds and watch for divergence to signal reversals. "
-            "Tips: In strong trends, RSI may remain extreme; always cross-check with trend analysis."
-        ),
-        # Volatility Indicators
-        "boll": (
-            "Bollinger Middle: A 20 SMA serving as the basis for Bollinger Bands. "
-            "Usage: Acts as a dynamic benchmark for price movement. "
-            "Tips: Combine with the upper and lower bands to effectively spot breakouts or reversals."
-        ),
-        "boll_ub": (
-            "Bollinger Upper Band: Typically 2 standard deviations above the middle line. "
-            "Usage: Signals potential overbought conditions and breakout zones. "
-            "Tips: Confirm signals with other tools; prices may ride the band in strong trends."
-        ),
-        "boll_lb": (
-            "Bollinger Lower Band: Typically 2 standard deviations below the middle line. "
-            "Usage: Indicates potential oversold conditions. "
-            "Tips: Use additional analysis to avoid false reversal signals."
-        ),
-        "atr": (
-            "ATR: Averages true range to measure volatility. "
-            "Usage: Set stop-loss levels and adjust position sizes based on current market volatility. "
-            "Tips: It's a reactive measure, so use it as part of a broader risk management strategy."
-        ),
-        # Volume-Based Indicators
-        "vwma": (
-            "VWMA: A moving average weighted by volume. "
-            "Usage: Confirm trends by integrating price action with volume data. "
-            "Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses."
-        ),
-        "mfi": (
-            "MFI: The Money Flow Index is a momentum indicator that uses both price and volume to measure buying and selling pressure. "
-            "Usage: Identify overbought (>80) or oversold (<20) conditions and confirm the strength of trends or reversals. "
-            "Tips: Use alongside RSI or MACD to confirm signals; divergence between price and MFI can indicate potential reversals."
-        ),
-        # ==================== SWING TRADING INDICATORS ====================
-        # Trend Strength
-        "adx": (
-            "ADX (Average Directional Index): Measures trend strength regardless of direction. "
-            "Usage: ADX > 25 = strong trend (good for swings), ADX < 20 = weak/sideways (avoid). "
-            "Tips: Essential for validating swing trade setups. Always check before entering position."
-        ),
-        "plus_di": (
-            "+DI (Plus Directional Indicator): Measures upward directional movement. "
-            "Usage: +DI > -DI suggests uptrend strength. Use with ADX to confirm bullish swing setups. "
-            "Tips: Rising +DI with ADX > 25 = strong uptrend."
-        ),
-        "minus_di": (
-            "-DI (Minus Directional Indicator): Measures downward directional movement. "
-            "Usage: -DI > +DI suggests downtrend strength. Use with ADX to confirm bearish swing setups. "
-            "Tips: Rising -DI with ADX > 25 = strong downtrend."
-        ),
-        "er": (
-            "ER (Efficiency Ratio): Measures trend efficiency vs noise. "
-            "Usage: ER near 1 = strong directional trend, ER near 0 = noisy/sideways market. "
-            "Tips: Filter swing trades: only trade when ER > 0.5 for high-quality setups."
-        ),
-        # Trend Direction
-        "supertrend": (
-            "SuperTrend: Dynamic support/resistance based on ATR. "
-            "Usage: Price above SuperTrend = uptrend, below = downtrend. Excellent for swing entries. "
-            "Tips: Combines volatility and price action. Low false signals in trending markets."
-        ),
-        "supertrend_direction": (
-            "SuperTrend Direction: Binary trend signal. "
-            "Usage: +1 = uptrend, -1 = downtrend. Clear directional signal for swing positioning. "
-            "Tips: Direction flip = potential trend reversal. Confirm with other indicators."
-        ),
-        "linear_regression": (
-            "Linear Regression Line: Fitted trend line over 20 periods. "
-            "Usage: Identifies mean reversion opportunities. Price far from line = potential reversion. "
-            "Tips: Use slope + R² together to assess trend quality."
-        ),
-        "linear_regression_slope": (
-            "Linear Regression Slope: Trend inclination measure. "
-            "Usage: Slope > 0 = uptrend, < 0 = downtrend. Magnitude shows trend strength. "
-            "Tips: Steep slope + high R² = strong consistent trend."
-        ),
-        "linear_regression_r2": (
-            "R-Squared: Measures linearity/consistency of trend. "
-            "Usage: R² near 1 = consistent linear trend, near 0 = choppy price action. "
-            "Tips: Only swing trade when R² > 0.6 for reliable trends."
-        ),
-        # Ichimoku Cloud Components
-        "ichimoku_tenkan_sen": (
-            "Ichimoku Conversion Line (Tenkan-sen): 9-period high+low midpoint. "
-            "Usage: Fast-moving reference for short-term momentum. "
-            "Tips: Price crossing Tenkan-sen signals short-term trend change."
-        ),
-        "ichimoku_kijun_sen": (
-            "Ichimoku Base Line (Kijun-sen): 26-period high+low midpoint. "
-            "Usage: Medium-term equilibrium price. Acts as dynamic support/resistance. "
-            "Tips: Strong signal when Tenkan crosses Kijun."
-        ),
-        "ichimoku_senkou_span_a": (
-            "Ichimoku Leading Span A (Cloud boundary): Average of Tenkan and Kijun, shifted forward. "
-            "Usage: Forms cloud top/bottom. Price above cloud = bullish, below = bearish. "
-            "Tips: Cloud acts as dynamic support/resistance zone."
-        ),
-        "ichimoku_senkou_span_b": (
-            "Ichimoku Leading Span B (Cloud boundary): 52-period high+low midpoint, shifted forward. "
-            "Usage: Forms cloud top/bottom. Thicker cloud = stronger support/resistance. "
-            "Tips: Cloud color change = major trend reversal signal."
-        ),
-        "ichimoku_chikou_span": (
-            "Ichimoku Lagging Span (Chikou): Current close shifted back 26 periods. "
-            "Usage: Confirms price momentum relative to past. Chikou above past price = bullish. "
-            "Tips: Chikou crossing price confirms trend strength."
-        ),
-        # TSI Momentum
-        "tsi": (
-            "TSI (True Strength Index): Double-smoothed momentum indicator with optimized swing params (13/7). "
-            "Usage: TSI > 0 indicates bullish momentum, TSI < 0 bearish. Crossover with signal line provides trade signals. "
-            "Tips: (13/7) params give 2-3 bar lead vs RSI, smoother without whipsaws. Essential for swing timing."
-        ),
-        "tsi_signal": (
-            "TSI Signal Line: Smoothed TSI for crossover analysis. "
-            "Usage: When TSI crosses above signal = buy signal, crosses below = sell signal. "
-            "Tips: Use with TSI for timing swing trade entries/exits."
-        ),
-        # Updated Linear Regression (dual periods)
-        "linear_regression_20": (
-            "Linear Regression Line (20 periods): Fitted trend over ~1 month. Mean reversion reference line. "
-            "Usage: Distance from LR line identifies overbought/oversold extremes. "
-            "Tips: Use r2_20 to qualify trend linearity (>0.6 = reliable, <0.4 = choppy)."
-        ),
-        "linear_regression_slope_20": (
-            "Linear Regression Slope (20): First derivative of 20-period trend line. "
-            "Usage: Slope > 0 = uptrend, < 0 = downtrend. Magnitude shows trend strength. "
-            "Tips: Steep slope + r2 > 0.6 = strong trend for swing entries."
-        ),
-        "linear_regression_20_r2": (
-            "R-Squared (20): Linearity metric of 20-period regression (0-1). "
-            "Usage: R² > 0.6 = consistent linear trend (swing-valid). R² < 0.4 = choppy. "
-            "Tips: Filter out choppy markets; only trade when R² > 0.55."
-        ),
-        "linear_regression_10": (
-            "Linear Regression Line (10 periods): Fitted trend over ~2 weeks. More reactive than 20-period. "
-            "Usage: Captures recent trend inflections faster. Use with 20-period for confluent signal. "
-            "Tips: When 10-period slope flips sign, potential reversal forming."
-        ),
-        "linear_regression_slope_10": (
-            "Linear Regression Slope (10): First derivative of 10-period trend line. "
-            "Usage: Faster trend direction changes than 20-period. Early reversal detection. "
-            "Tips: Divergence between slope_10 and slope_20 = inflection point (potential swing reversal)."
-        ),
-        "linear_regression_10_r2": (
-            "R-Squared (10): Linearity of recent 10-bar trend. "
-            "Usage: High r2_10 with negative slope_10 = pre-reversal compression (setup forming). "
-            "Tips: Monitor r2_10 < 0.3 = choppy oscillation (avoid), r2_10 > 0.7 = clean micro-trend."
-        ),
-        # NEW: Volume and Breakout Indicators
-        "bollinger_bandwidth": (
-            "Bollinger Bandwidth: (upper-lower)/middle*100. Volatility compression metric. "
-            "Usage: BW < 10 = extreme squeeze=breakout imminent. Rising BW = volatility increasing. "
-            "Tips: Rising from compression = setup inflection. Monitor change rate, not absolute value."
-        ),
-        "volume_ratio": (
-            "Volume Ratio: current_volume / SMA(volume,20). Breakout quality metric. "
-            "Usage: VR > 1.5 = STRONG BOS (high follow-through). VR < 0.7 = WEAK BOS (high failure). "
-            "Tips: CRITICAL for swing: BOS w/ VR>1.5 has 20-30% higher win rate. Filter breakouts by VR."
-        ),
-        "donchian_high": (
-            "Donchian Channel High (20): MAX(high,20). Structural resistance based on actual price. "
-            "Usage: Breakout above = true BOS vs false breakout. More reliable than Bollinger for swing. "
-            "Tips: Breakout above Donchian + rising ADX + VR>1.5 = high-confidence swing entry."
-        ),
-        "donchian_low": (
-            "Donchian Channel Low (20): MIN(low,20). Structural support based on actual price. "
-            "Usage: Breakdown below = structural support loss. Test of Donchian Low = swing short setup. "
-            "Tips: When price holds above Donchian Low after touch, reversal likely (mean reversion setup)."
-        ),
-        "donchian_mid": (
-            "Donchian Midline: (Donchian_High + Donchian_Low)/2. Dynamic center-pivot. "
-            "Usage: Acts as dynamic S/R, more responsive than 50 SMA for breakout context. "
-            "Tips: Price crossing Donchian Mid from below = momentum shift confirmation."
-        ),
-        # NEW: Screening Metrics
-        "percent_from_200sma": (
-            "Percent from 200 SMA: (close-200SMA)/200SMA*100. Mean-reversion distance metric. "
-            "Usage: >+20% = anti-reversion risk HIGH. <-20% = extreme accumulation potential. "
-            "Tips: CRITICAL filter for swing screening. Avoid setups >|25%| (statistically low win rate)."
-        ),
-        "atr_percent": (
-            "ATR Percent: (ATR/close)*100. Cross-asset comparable volatility (vs absolute ATR). "
-            "Usage: Allows uniform position sizing: 1.5x ATR% stop, 3x ATR% target across all assets. "
-            "Tips: ATR% >3% = volatile (reduce size). ATR% <1% = stable (increase size). Normalize your system."
-        ),
-    }
+    best_ind_params = INDICATOR_DESCRIPTIONS
 
     if indicator not in best_ind_params:
         raise ValueError(
@@ -337,36 +356,28 @@ def get_stock_stats_indicators_window(
     return result_str
 
 
-def _get_stock_stats_bulk(
-    symbol: Annotated[str, "ticker symbol of the company"],
-    indicator: Annotated[str, "technical indicator to calculate"],
-    curr_date: Annotated[str, "current date for reference"]
-) -> dict:
+def _load_stats_frame(symbol: str, curr_date: str):
     """
-    Optimized bulk calculation of stock stats indicators.
-    Fetches data once and calculates indicator for all available dates.
-    Returns dict mapping date strings to indicator values.
+    OHLCV frame used by the indicator calculations (lower-case columns + 'date'),
+    cut at curr_date. The full download is loaded once per (symbol, data source,
+    download day) and kept in memory, so indicator requests for the same ticker
+    share one frame whatever date they ask for.
     """
-    from .config import get_config
     import pandas as pd
-    import os
+    from .config import get_config
     
     config = get_config()
     online = config["data_vendors"]["technical_indicators"] != "local"
-    
-    # New indicators that use technical_calculations.py
-    ADVANCED_INDICATORS = [
-        'adx', 'plus_di', 'minus_di', 'er',
-        'supertrend', 'supertrend_direction',
-        'linear_regression_20', 'linear_regression_slope_20', 'linear_regression_20_r2',
-        'linear_regression_10', 'linear_regression_slope_10', 'linear_regression_10_r2',
-        'ichimoku_tenkan_sen', 'ichimoku_kijun_sen', 'ichimoku_senkou_span_a',
-        'ichimoku_senkou_span_b', 'ichimoku_chikou_span',
-        'tsi', 'tsi_signal',
-        'bollinger_bandwidth', 'volume_ratio',
-        'donchian_high', 'donchian_low', 'donchian_mid',
-        'percent_from_200sma', 'atr_percent'
-    ]
+    # The online download always spans 15y up to today: it only changes with the day
+    download_day = pd.Timestamp.today().strftime("%Y-%m-%d") if online else None
+    data = _load_stats_frame_cached(symbol, online, config.get("data_cache_dir", "data"), download_day)
+    data = data[pd.to_datetime(data["date"]) <= pd.to_datetime(curr_date)]
+    return data.reset_index(drop=True)
+
+
+@lru_cache(maxsize=32)
+def _load_stats_frame_cached(symbol: str, online: bool, data_cache_dir: str, download_day: str = None):
+    import pandas as pd
     
     # Get OHLCV data
     if not online:
@@ -374,7 +385,7 @@ def _get_stock_stats_bulk(
         try:
             data = pd.read_csv(
                 os.path.join(
-                    config.get("data_cache_dir", "data"),
+                    data_cache_dir,
                     f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
                 )
             )
@@ -382,18 +393,17 @@ def _get_stock_stats_bulk(
             raise Exception("Yahoo Finance data not fetched yet!")
     else:
         # Online data fetching with caching
-        today_date = pd.Timestamp.today()
-        curr_date_dt = pd.to_datetime(curr_date)
+        today_date = pd.Timestamp(download_day)
         
         end_date = today_date
         start_date = today_date - pd.DateOffset(years=15)
         start_date_str = start_date.strftime("%Y-%m-%d")
         end_date_str = end_date.strftime("%Y-%m-%d")
         
-        os.makedirs(config["data_cache_dir"], exist_ok=True)
+        os.makedirs(data_cache_dir, exist_ok=True)
         
         data_file = os.path.join(
-            config["data_cache_dir"],
+            data_cache_dir,
             f"{symbol}-YFin-data-{start_date_str}-{end_date_str}.csv",
         )
         
@@ -418,19 +428,36 @@ def _get_stock_stats_bulk(
         data = data.reset_index()
         data.columns = data.columns.str.lower()
     
+    return data
+
+
+def _get_stock_stats_bulk(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    indicator: Annotated[str, "technical indicator to calculate"],
+    curr_date: Annotated[str, "current date for reference"]
+) -> dict:
+    """
+    Optimized bulk calculation of stock stats indicators.
+    Fetches data once and calculates indicator for all available dates.
+    Returns dict mapping date strings to indicator values.
+    """
+    import pandas as pd
+    
+    data = _load_stats_frame(symbol, curr_date)
+    
     # Use advanced calculation for new indicators
     if indicator in ADVANCED_INDICATORS:
         from .technical_calculations import get_all_indicators
         
-        # Calculate all indicators at once
-        indicators_dict = get_all_indicators(data, swing_mode=True)
+        # Calculate only the requested indicator (and its shared intermediates)
+        indicators_dict = get_all_indicators(data, swing_mode=True, indicators=[indicator])
         
         # Extract the requested indicator
         if indicator in indicators_dict:
             indicator_series = indicators_dict[indicator]
             
             # Special handling for R² which is a scalar
-            if indicator == 'linear_regression_r2':
+            if not isinstance(indicator_series, pd.Series):
                 r2_value = indicators_dict[indicator]
                 result_dict = {}
                 for _, row in data.iterrows():
@@ -479,6 +506,90 @@ def _get_stock_stats_bulk(
         return result_dict
 
 
+def get_stock_stats_indicators_table(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    indicators: Annotated[Union[List[str], str], "technical indicators to get (list or comma-separated)"],
+    curr_date: Annotated[
+        str, "The current trading date you are trading on, YYYY-mm-dd"
+    ],
+    look_back_days: Annotated[int, "how many days to look back"],
+) -> str:
+    """
+    Batched variant of get_stock_stats_indicators_window.
+    Loads the OHLCV frame once, computes every requested indicator in a single
+    pass (shared intermediates via technical_calculations, one stockstats wrap
+    for the legacy ones) and returns one table aligned on trading dates,
+    followed by a one-line description per indicator.
+    """
+    import pandas as pd
+    
+    if isinstance(indicators, str):
+        indicators = indicators.split(",")
+    indicators = list(dict.fromkeys(ind.strip() for ind in indicators if ind.strip()))
+    
+    unsupported = [ind for ind in indicators if ind not in INDICATOR_DESCRIPTIONS]
+    if not indicators or unsupported:
+        raise ValueError(
+            f"Indicators {unsupported} are not supported. Please choose from: {list(INDICATOR_DESCRIPTIONS.keys())}"
+        )
+    
+    curr_date_dt = datetime.strptime(curr_date, "%Y-%m-%d")
+    before = curr_date_dt - relativedelta(days=look_back_days)
+    
+    try:
+        data = _load_stats_frame(symbol, curr_date)
+        dates = pd.to_datetime(data["date"])
+        if dates.dt.tz is not None:
+            dates = dates.dt.tz_localize(None)
+        columns = {}
+        
+        advanced = [ind for ind in indicators if ind in ADVANCED_INDICATORS]
+        if advanced:
+            from .technical_calculations import get_all_indicators
+            columns.update(get_all_indicators(data, swing_mode=True, indicators=advanced))
+        
+        legacy = [ind for ind in indicators if ind not in ADVANCED_INDICATORS]
+        if legacy:
+            from stockstats import wrap
+            
+            df = wrap(data.copy())
+            for ind in legacy:
+                columns[ind] = df[ind].values
+        
+        # R² values are scalars: broadcast over the whole window
+        table = pd.DataFrame(
+            {ind: pd.Series(columns.get(ind, float("nan")), index=data.index).values for ind in indicators},
+            index=dates.values,
+        )
+    except Exception as e:
+        print(f"Error getting batched indicator data: {e}")
+        # Fallback: one window per indicator
+        return "\n\n".join(
+            get_stock_stats_indicators_window(symbol, ind, curr_date, look_back_days)
+            for ind in indicators
+        )
+    
+    window = table[(table.index >= before) & (table.index <= curr_date_dt)].iloc[::-1]
+    
+    lines = [
+        f"## {symbol.upper()} indicators from {before.strftime('%Y-%m-%d')} to {curr_date} "
+        f"({len(window)} trading days, newest first):",
+        "",
+        "| date | " + " | ".join(indicators) + " |",
+        "|" + "---|" * (len(indicators) + 1),
+    ]
+    for date, row in window.iterrows():
+        values = ["N/A" if pd.isna(v) else f"{v:.4f}" for v in row.values]
+        lines.append(f"| {date.strftime('%Y-%m-%d')} | " + " | ".join(values) + " |")
+    
+    lines.append("")
+    for ind in indicators:
+        summary = INDICATOR_DESCRIPTIONS[ind].split("Usage:")[0].strip()
+        lines.append(f"- {ind}: {summary}")
+    
+    return "\n".join(lines)
+
+
 def get_stockstats_indicator(
     symbol: Annotated[str, "ticker symbol of the company"],
     indicator: Annotated[str, "technical indicator to get the analysis and report of"],
@@ -18,10 +18,37 @@ DEFAULT_CONFIG = {
     # Provider-specific thinking configuration
     "google_thinking_level": None,      # "high", "minimal", etc.
     "openai_reasoning_effort": None,    # "medium", "high", "low"
+    # Persistent LLM response cache (replays identical prompts from disk)
+    "llm_cache": False,
+    "llm_cache_path": None,             # Default: <data_cache_dir>/llm_cache.sqlite
+    "llm_cache_max_entries": 50_000,
+    "llm_cache_max_mb": 512,
     # Debate and discussion settings
     "max_debate_rounds": 1,
     "max_risk_discuss_rounds": 1,
+    "risk_debate_mode": "sequential",   # "sequential" or "parallel" (3 risk analysts per round concurrently)
+    # Bounded debate history: last N turns verbatim + rolling summary (None = full history)
+    "debate_memory_turns": None,
+    "debate_token_budget": 3000,        # Tokens of debate history per prompt
+    "debate_node_token_budgets": {},    # Per-node overrides, e.g. {"Risk Judge": 6000}
+    "debate_summary_tokens": 400,
     "max_recur_limit": 100,
+    # Checkpointing: None, "memory", "file" or "sqlite" (see graph/checkpointing.py)
+    "checkpointer": None,
+    "checkpoint_dir": None,             # Default: <results_dir>/checkpoints
+    # Final-state log: <state_log_dir>/<ticker>/TradingAgentsStrategy_logs/full_states_log.jsonl[.gz]
+    "state_log_dir": "eval_results",
+    "state_log_compress": False,
+    # Batch runs (propagate_many / apropagate): concurrent graph runs per LLM provider
+    # (shared by all graphs in the process; the first graph to run sets it)
+    "max_concurrent_runs": 4,
+    # Vendor routing (see dataflows/vendor_router.py)
+    "vendor_timeout": 30,               # Seconds per vendor attempt before falling back
+    "vendor_timeouts": {},              # Per-vendor overrides, e.g. {"alpha_vantage": 15}
+    "vendor_hedge_percentile": None,    # e.g. 95: start the fallback when the primary is slower than its p95
+    "vendor_hedge_min_delay": 1.0,      # Never hedge earlier than this (seconds)
+    "vendor_breaker_failures": 3,       # Consecutive failures before a vendor is skipped
+    "vendor_breaker_cooldown": 60,      # Seconds a failing / rate-limited vendor is skipped
     # Data vendor configuration
     # Category-level configuration (default for all tools in category)
     "data_vendors": {
@@ -6,6 +6,9 @@ from .setup import GraphSetup
 from .propagation import Propagator
 from .reflection import Reflector
 from .signal_processing import SignalProcessor
+from .profiler import GraphProfiler
+from .service import GraphService, ServiceBusyError
+from .streaming import StateTracker, StreamBridge, iter_graph_deltas
 
 __all__ = [
     "TradingAgentsGraph",
@@ -14,4 +17,10 @@ __all__ = [
     "Propagator",
     "Reflector",
     "SignalProcessor",
+    "GraphProfiler",
+    "GraphService",
+    "ServiceBusyError",
+    "StateTracker",
+    "StreamBridge",
+    "iter_graph_deltas",
 ]
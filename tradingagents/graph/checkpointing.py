@@ -0,0 +1,233 @@
+# TradingAgents/graph/checkpointing.py
+
+import asyncio
+import os
+import pickle
+import struct
+import threading
+from typing import Any, Dict, Iterator, Optional
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import InMemorySaver
+
+# Record framing in .ckpt files: 8-byte little-endian payload length + pickle
+_HEADER = struct.Struct("<Q")
+
+
+class _ThreadedAsyncMixin:
+    """Async checkpoint methods that run the sync ones in a worker thread.
+
+    Keeps checkpoint I/O off the event loop under apropagate(), and works on
+    any loop (propagate_many() starts a new one per call).
+    """
+
+    async def aget_tuple(self, config):
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(self, config, *, filter=None, before=None, limit=None):
+        items = await asyncio.to_thread(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for item in items:
+            yield item
+
+    async def aput(self, config, checkpoint, metadata, new_versions):
+        return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(self, config, writes, task_id, task_path=""):
+        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id):
+        await asyncio.to_thread(self.delete_thread, thread_id)
+
+
+class FileCheckpointSaver(_ThreadedAsyncMixin, InMemorySaver):
+    """Checkpoint saver that persists every run (thread) to its own file.
+
+    Works like InMemorySaver, but each checkpoint and each batch of writes is
+    appended to <directory>/<thread_id>.ckpt as one record holding only what
+    that call added, so a step costs one small append however long the run.
+    Runs are loaded lazily by replaying their records, so a new process can
+    resume a run that crashed midway without re-executing the nodes that had
+    already completed. A record torn by a crash is cut off on load.
+
+    Locks are per run: concurrent runs never wait on each other's disk I/O.
+    """
+
+    def __init__(self, directory: str, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.directory = directory
+        self._locks: Dict[str, threading.RLock] = {}
+        self._locks_guard = threading.Lock()
+        self._loaded = set()
+        os.makedirs(directory, exist_ok=True)
+
+    def _lock(self, thread_id: str) -> threading.RLock:
+        with self._locks_guard:
+            return self._locks.setdefault(thread_id, threading.RLock())
+
+    def _path(self, thread_id: str) -> str:
+        safe = "".join(ch if ch.isalnum() or ch in "-_." else "_" for ch in str(thread_id))
+        return os.path.join(self.directory, f"{safe}.ckpt")
+
+    def _ensure_loaded(self, thread_id: str) -> None:
+        """Replay the run's records (caller holds the run's lock)."""
+        if thread_id in self._loaded:
+            return
+        self._loaded.add(thread_id)
+        path = self._path(thread_id)
+        if not os.path.exists(path):
+            return
+
+        valid_end = 0
+        with open(path, "rb") as f:
+            while True:
+                header = f.read(_HEADER.size)
+                if len(header) < _HEADER.size:
+                    break
+                (size,) = _HEADER.unpack(header)
+                payload = f.read(size)
+                if len(payload) < size:
+                    break
+                try:
+                    record = pickle.loads(payload)
+                except Exception:
+                    break
+                self._apply(record)
+                valid_end = f.tell()
+
+        # Drop a record torn by a crash so the next append starts on a boundary
+        if valid_end < os.path.getsize(path):
+            with open(path, "r+b") as f:
+                f.truncate(valid_end)
+
+    def _apply(self, record) -> None:
+        kind = record[0]
+        if kind == "checkpoint":
+            _, thread_id, checkpoint_ns, checkpoint_id, entry, blobs = record
+            self.storage[thread_id][checkpoint_ns][checkpoint_id] = entry
+            self.blobs.update(blobs)
+        elif kind == "writes":
+            _, outer_key, writes = record
+            self.writes[outer_key].update(writes)
+
+    def _append(self, thread_id: str, record) -> None:
+        payload = pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL)
+        with open(self._path(thread_id), "ab") as f:
+            f.write(_HEADER.pack(len(payload)) + payload)
+
+    def thread_ids(self):
+        """Ids of all runs saved in the directory."""
+        return sorted(
+            name[: -len(".ckpt")] for name in os.listdir(self.directory) if name.endswith(".ckpt")
+        )
+
+    def get_tuple(self, config):
+        thread_id = config["configurable"]["thread_id"]
+        with self._lock(thread_id):
+            self._ensure_loaded(thread_id)
+            return super().get_tuple(config)
+
+    def list(self, config, **kwargs) -> Iterator:
+        if config:
+            thread_id = config["configurable"]["thread_id"]
+            with self._lock(thread_id):
+                self._ensure_loaded(thread_id)
+                items = list(super().list(config, **kwargs))
+            return iter(items)
+        for thread_id in self.thread_ids():
+            with self._lock(thread_id):
+                self._ensure_loaded(thread_id)
+        return iter(list(super().list(config, **kwargs)))
+
+    def put(self, config, checkpoint, metadata, new_versions):
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        with self._lock(thread_id):
+            self._ensure_loaded(thread_id)
+            result = super().put(config, checkpoint, metadata, new_versions)
+            blobs = {
+                key: self.blobs[key]
+                for key in ((thread_id, checkpoint_ns, k, v) for k, v in new_versions.items())
+            }
+            entry = self.storage[thread_id][checkpoint_ns][checkpoint["id"]]
+            self._append(
+                thread_id, ("checkpoint", thread_id, checkpoint_ns, checkpoint["id"], entry, blobs)
+            )
+        return result
+
+    def put_writes(self, config, writes, task_id, task_path=""):
+        thread_id = config["configurable"]["thread_id"]
+        outer_key = (
+            thread_id,
+            config["configurable"].get("checkpoint_ns", ""),
+            config["configurable"]["checkpoint_id"],
+        )
+        with self._lock(thread_id):
+            self._ensure_loaded(thread_id)
+            before = dict(self.writes.get(outer_key, {}))
+            super().put_writes(config, writes, task_id, task_path)
+            added = {
+                key: value
+                for key, value in self.writes.get(outer_key, {}).items()
+                if before.get(key) is not value
+            }
+            if added:
+                self._append(thread_id, ("writes", outer_key, added))
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self._lock(thread_id):
+            super().delete_thread(thread_id)
+            self._loaded.discard(thread_id)
+            if os.path.exists(self._path(thread_id)):
+                os.remove(self._path(thread_id))
+
+
+def _sqlite_saver(path: str) -> BaseCheckpointSaver:
+    """langgraph SqliteSaver that also serves the async API (apropagate / propagate_many)."""
+    try:
+        import sqlite3
+        from langgraph.checkpoint.sqlite import SqliteSaver
+    except ImportError as e:
+        raise ImportError(
+            "checkpointer='sqlite' requires langgraph-checkpoint-sqlite "
+            "(pip install langgraph-checkpoint-sqlite), or use checkpointer='file'"
+        ) from e
+
+    # SqliteSaver leaves the async methods unimplemented (AsyncSqliteSaver is
+    # bound to a single event loop); run the sync ones in a worker thread
+    class SqliteCheckpointSaver(_ThreadedAsyncMixin, SqliteSaver):
+        pass
+
+    conn = sqlite3.connect(path, check_same_thread=False)
+    return SqliteCheckpointSaver(conn)
+
+
+def create_checkpointer(config: Dict[str, Any]) -> Optional[BaseCheckpointSaver]:
+    """Build the checkpointer selected by config["checkpointer"].
+
+    Options:
+        None / "none": no checkpointing (default)
+        "memory": in-process only (resume after an exception, not after a crash)
+        "file": FileCheckpointSaver in config["checkpoint_dir"]
+        "sqlite": langgraph SqliteSaver on <checkpoint_dir>/checkpoints.sqlite
+                  (requires the langgraph-checkpoint-sqlite package)
+    All of them work with propagate() and with apropagate() / propagate_many().
+    """
+    kind = (config.get("checkpointer") or "none").lower()
+    if kind == "none":
+        return None
+
+    directory = config.get("checkpoint_dir") or os.path.join(
+        config.get("results_dir", "./results"), "checkpoints"
+    )
+
+    if kind == "memory":
+        return InMemorySaver()
+    if kind == "file":
+        return FileCheckpointSaver(directory)
+    if kind == "sqlite":
+        os.makedirs(directory, exist_ok=True)
+        return _sqlite_saver(os.path.join(directory, "checkpoints.sqlite"))
+
+    raise ValueError(f"Unknown checkpointer: {kind}")
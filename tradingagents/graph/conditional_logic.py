@@ -65,3 +65,9 @@ class ConditionalLogic:
         if state["risk_debate_state"]["latest_speaker"].startswith("Conservative"):
             return "Neutral Analyst"
         return "Aggressive Analyst"
+
+    def should_continue_risk_round(self, state: AgentState) -> str:
+        """Determine if the parallel risk debate needs another round."""
+        if state["risk_debate_state"]["count"] >= 3 * self.max_risk_discuss_rounds:
+            return "Risk Judge"
+        return "Risk Debate Round"
@@ -0,0 +1,300 @@
+# TradingAgents/graph/profiler.py
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import LLMResult
+
+from tradingagents.dataflows.interface import VENDOR_ATTEMPT_EVENT
+from tradingagents.llm_clients.response_cache import CACHE_STATUS_KEY
+
+_SUMMARY_COLUMNS = (
+    "kind", "name", "calls", "wall_s", "queue_s", "llm_calls", "llm_s",
+    "tokens_in", "tokens_out", "cache_hits", "vendor_attempts", "vendor_failures",
+)
+
+
+class GraphProfiler(BaseCallbackHandler):
+    """Callback handler recording a timed span for every node, LLM call and tool call.
+
+    Pass it in the graph run config (Propagator.get_graph_args(callbacks=[...]))
+    so LLM calls and tools inherit LangGraph's node metadata. Spans:
+        node    one per node execution (Market Analyst, Bull Researcher, ...);
+                queue is the gap since the previous node finished, i.e. time
+                spent in the scheduler rather than in the node itself
+        llm     model, wall time, tokens in/out (0 on cache hits), cache status
+        tool    tool name and wall time
+        vendor  one per route_to_vendor attempt (vendor, success, error)
+
+    Export with write_jsonl() or write_chrome_trace() (chrome://tracing,
+    Perfetto); summary() aggregates spans per node and per tool.
+    """
+
+    # Time spans in the calling thread, also under graph.astream
+    run_inline = True
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._lock = threading.Lock()
+        self._t0 = time.perf_counter()
+        self._open: Dict[UUID, Dict[str, Any]] = {}
+        self._last_node_end: Optional[float] = None
+        self.spans: List[Dict[str, Any]] = []
+
+    def _now(self) -> float:
+        return time.perf_counter() - self._t0
+
+    def _start(self, run_id: UUID, kind: str, name: str, metadata: Optional[Dict], **extra) -> None:
+        span = {
+            "kind": kind,
+            "name": name,
+            "node": (metadata or {}).get("langgraph_node"),
+            "start": self._now(),
+            "thread": threading.get_ident(),
+            **extra,
+        }
+        with self._lock:
+            if kind == "node":
+                gap = span["start"] - self._last_node_end if self._last_node_end is not None else 0.0
+                span["queue"] = max(gap, 0.0)
+            self._open[run_id] = span
+
+    def _end(self, run_id: UUID, error: Optional[BaseException] = None, **extra) -> None:
+        now = self._now()
+        with self._lock:
+            span = self._open.pop(run_id, None)
+            if span is None:
+                return
+            span.update(extra, end=now, duration=now - span["start"])
+            if error is not None:
+                span["error"] = repr(error)
+            if span["kind"] == "node":
+                self._last_node_end = now
+            self.spans.append(span)
+
+    # ── nodes
+    def on_chain_start(
+        self,
+        serialized: Dict[str, Any],
+        inputs: Dict[str, Any],
+        *,
+        run_id: UUID,
+        metadata: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> None:
+        node = (metadata or {}).get("langgraph_node")
+        # Runnables nested inside a node carry the same metadata but another name
+        if node and kwargs.get("name") == node:
+            self._start(run_id, "node", node, metadata)
+
+    def on_chain_end(self, outputs: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._end(run_id)
+
+    def on_chain_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._end(run_id, error)
+
+    # ── LLM calls
+    def on_chat_model_start(
+        self,
+        serialized: Dict[str, Any],
+        messages: List[List[Any]],
+        *,
+        run_id: UUID,
+        metadata: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> None:
+        self._start(run_id, "llm", _model_name(serialized, metadata, kwargs), metadata)
+
+    def on_llm_start(
+        self,
+        serialized: Dict[str, Any],
+        prompts: List[str],
+        *,
+        run_id: UUID,
+        metadata: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> None:
+        self._start(run_id, "llm", _model_name(serialized, metadata, kwargs), metadata)
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        tokens_in = tokens_out = 0
+        cache_status = None
+        try:
+            message = response.generations[0][0].message
+        except (IndexError, TypeError, AttributeError):
+            message = None
+        if isinstance(message, AIMessage):
+            cache_status = message.response_metadata.get(CACHE_STATUS_KEY)
+            usage = message.usage_metadata or {}
+            # Responses replayed from the LLM cache cost no tokens
+            if cache_status != "hit":
+                tokens_in = usage.get("input_tokens", 0)
+                tokens_out = usage.get("output_tokens", 0)
+        self._end(run_id, tokens_in=tokens_in, tokens_out=tokens_out, cache=cache_status)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._end(run_id, error)
+
+    # ── tools
+    def on_tool_start(
+        self,
+        serialized: Dict[str, Any],
+        input_str: str,
+        *,
+        run_id: UUID,
+        metadata: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> None:
+        name = (serialized or {}).get("name") or kwargs.get("name") or "tool"
+        self._start(run_id, "tool", name, metadata)
+
+    def on_tool_end(self, output: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._end(run_id)
+
+    def on_tool_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._end(run_id, error)
+
+    # ── vendor attempts (dispatched from route_to_vendor inside a tool run)
+    def on_custom_event(
+        self,
+        name: str,
+        data: Any,
+        *,
+        run_id: UUID,
+        metadata: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> None:
+        if name != VENDOR_ATTEMPT_EVENT:
+            return
+        now = self._now()
+        with self._lock:
+            tool = self._open.get(run_id, {}).get("name")
+            self.spans.append({
+                "kind": "vendor",
+                "name": f"{data['method']}:{data['vendor']}",
+                "node": (metadata or {}).get("langgraph_node"),
+                "tool": tool,
+                "start": now - data["duration"],
+                "end": now,
+                "duration": data["duration"],
+                "thread": threading.get_ident(),
+                "vendor": data["vendor"],
+                "attempt": data["attempt"],
+                "ok": data["ok"],
+                **({"error": data["error"]} if data.get("error") else {}),
+            })
+
+    # ── reporting
+    def summary(self) -> List[Dict[str, Any]]:
+        """Aggregated rows: one per node, then one per tool, slowest first."""
+        with self._lock:
+            spans = list(self.spans)
+
+        rows: Dict[tuple, Dict[str, Any]] = {}
+
+        def row(kind: str, name: str) -> Dict[str, Any]:
+            key = (kind, name)
+            if key not in rows:
+                rows[key] = dict.fromkeys(_SUMMARY_COLUMNS, 0)
+                rows[key].update(kind=kind, name=name, wall_s=0.0, queue_s=0.0, llm_s=0.0)
+            return rows[key]
+
+        for span in spans:
+            kind = span["kind"]
+            if kind in ("node", "tool"):
+                r = row(kind, span["name"])
+                r["calls"] += 1
+                r["wall_s"] += span["duration"]
+                r["queue_s"] += span.get("queue", 0.0)
+            elif kind == "llm":
+                r = row("node", span["node"] or "(outside graph)")
+                r["llm_calls"] += 1
+                r["llm_s"] += span["duration"]
+                r["tokens_in"] += span.get("tokens_in", 0)
+                r["tokens_out"] += span.get("tokens_out", 0)
+                r["cache_hits"] += span.get("cache") == "hit"
+            elif kind == "vendor":
+                r = row("tool", span["tool"] or span["name"].split(":")[0])
+                r["vendor_attempts"] += 1
+                r["vendor_failures"] += not span["ok"]
+
+        order = {"node": 0, "tool": 1}
+        return sorted(rows.values(), key=lambda r: (order[r["kind"]], -r["wall_s"]))
+
+    def summary_markdown(self) -> str:
+        """Summary as a markdown table (Chainlit, reports)."""
+        header = ["Node / tool", "Calls", "Wall (s)", "Queue (s)", "LLM calls", "LLM (s)",
+                  "Tokens in", "Tokens out", "Cache hits", "Vendor attempts"]
+        lines = ["| " + " | ".join(header) + " |", "|" + "---|" * len(header)]
+        for r in self.summary():
+            vendor = f"{r['vendor_attempts']} ({r['vendor_failures']} failed)" if r["vendor_attempts"] else ""
+            lines.append(
+                f"| {r['name']} | {r['calls']} | {r['wall_s']:.2f} | {r['queue_s']:.2f} "
+                f"| {r['llm_calls'] or ''} | {r['llm_s']:.2f} | {r['tokens_in'] or ''} "
+                f"| {r['tokens_out'] or ''} | {r['cache_hits'] or ''} | {vendor} |"
+            )
+        return "\n".join(lines)
+
+    def write_jsonl(self, path: Union[str, Path]) -> Path:
+        """One JSON object per span, in completion order."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            spans = list(self.spans)
+        with open(path, "w", encoding="utf-8") as f:
+            for span in spans:
+                f.write(json.dumps(span, default=str) + "\n")
+        return path
+
+    def write_chrome_trace(self, path: Union[str, Path]) -> Path:
+        """Chrome trace event file (open in chrome://tracing or ui.perfetto.dev)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            spans = list(self.spans)
+
+        lanes: Dict[int, int] = {}
+        events = []
+        for span in sorted(spans, key=lambda s: s["start"]):
+            tid = lanes.setdefault(span["thread"], len(lanes) + 1)
+            args = {k: v for k, v in span.items()
+                    if k not in ("kind", "name", "start", "end", "duration", "thread")}
+            events.append({
+                "name": span["name"],
+                "cat": span["kind"],
+                "ph": "X",
+                "ts": round(span["start"] * 1e6),
+                "dur": round(span["duration"] * 1e6),
+                "pid": 1,
+                "tid": tid,
+                "args": args,
+            })
+        events.extend(
+            {"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": f"thread {tid}"}}
+            for tid in lanes.values()
+        )
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, default=str)
+        return path
+
+    def write(self, path: Union[str, Path]) -> Path:
+        """Write a JSON-lines trace for *.jsonl paths, a Chrome trace otherwise."""
+        if str(path).endswith(".jsonl"):
+            return self.write_jsonl(path)
+        return self.write_chrome_trace(path)
+
+
+def _model_name(serialized: Dict[str, Any], metadata: Optional[Dict], kwargs: Dict) -> str:
+    return (
+        (metadata or {}).get("ls_model_name")
+        or kwargs.get("invocation_params", {}).get("model")
+        or kwargs.get("name")
+        or (serialized or {}).get("name")
+        or "llm"
+    )
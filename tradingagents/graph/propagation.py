@@ -1,6 +1,8 @@
 # TradingAgents/graph/propagation.py
 
+import uuid
 from typing import Dict, Any, List, Optional
+from tradingagents.dataflows.config import RUN_CONFIG_KEY
 from tradingagents.agents.utils.agent_states import (
     AgentState,
     InvestDebateState,
@@ -11,9 +13,38 @@ from tradingagents.agents.utils.agent_states import (
 class Propagator:
     """Handles state initialization and propagation through the graph."""
 
-    def __init__(self, max_recur_limit=100):
-        """Initialize with configuration parameters."""
+    def __init__(self, max_recur_limit=100, checkpointing=False, config=None):
+        """Initialize with configuration parameters.
+
+        Args:
+            max_recur_limit: Graph recursion limit.
+            checkpointing: The graph is compiled with a checkpointer, so every
+                run needs a thread id (see new_run_id).
+            config: Config of the graph; every run carries it so the dataflow
+                tools use it (see dataflows.config.get_config) whatever
+                other graphs the process has built.
+        """
         self.max_recur_limit = max_recur_limit
+        self.checkpointing = checkpointing
+        self.config = config
+
+    def new_run_id(
+        self,
+        company_name: Optional[str] = None,
+        trade_date: Optional[str] = None,
+        run_id: Optional[str] = None,
+    ) -> Optional[str]:
+        """Checkpoint thread id for a new run (None when the graph has no checkpointer).
+
+        Callers that may want to resume() the run create the id here and pass
+        it to get_graph_args.
+        """
+        if not self.checkpointing:
+            return None
+        if run_id:
+            return run_id
+        prefix = f"{company_name}_{trade_date}" if company_name else "run"
+        return f"{prefix}_{uuid.uuid4().hex[:8]}"
 
     def create_initial_state(
         self, company_name: str, trade_date: str
@@ -41,17 +72,36 @@ class Propagator:
             "news_report": "",
         }
 
-    def get_graph_args(self, callbacks: Optional[List] = None) -> Dict[str, Any]:
+    def get_graph_args(
+        self,
+        callbacks: Optional[List] = None,
+        run_id: Optional[str] = None,
+        stream_mode: str = "values",
+    ) -> Dict[str, Any]:
         """Get arguments for the graph invocation.
 
         Args:
             callbacks: Optional list of callback handlers for tool execution tracking.
                        Note: LLM callbacks are handled separately via LLM constructor.
+            run_id: Checkpoint thread id; with a checkpointer a new one is
+                generated when not given (read it back from
+                config["configurable"]["thread_id"]).
+            stream_mode: "values" streams the full state after every step;
+                "updates" streams {node: changed fields} only (apply them with
+                graph.streaming.StateTracker), which is much cheaper on long debates.
         """
         config = {"recursion_limit": self.max_recur_limit}
         if callbacks:
             config["callbacks"] = callbacks
+        configurable = {}
+        run_id = run_id or self.new_run_id()
+        if run_id:
+            configurable["thread_id"] = run_id
+        if self.config is not None:
+            configurable[RUN_CONFIG_KEY] = self.config
+        if configurable:
+            config["configurable"] = configurable
         return {
-            "stream_mode": "values",
+            "stream_mode": stream_mode,
             "config": config,
         }
@@ -0,0 +1,133 @@
+# TradingAgents/graph/service.py
+
+import asyncio
+import json
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from .trading_graph import TradingAgentsGraph
+
+
+class ServiceBusyError(RuntimeError):
+    """Raised when the run queue is full (admission control)."""
+
+
+class GraphService:
+    """Shared graphs plus a bounded worker pool for serving concurrent analyses.
+
+    - Graphs: one TradingAgentsGraph (compiled graph + LLM clients) per distinct
+      config, built once and shared by every request with that config. Requests
+      only use it read-only (graph.stream / astream with their own initial state
+      from the propagator, process_signal); the instance-level propagate()
+      bookkeeping (ticker, curr_state, log_states_dict) is not used here.
+      Every run carries its graph's config to the dataflow tools (vendor
+      routing, vendor_* settings; see Propagator.get_graph_args), so a graph
+      built later for another config doesn't change what earlier ones use.
+    - Runs: at most max_workers graph runs execute at once on a dedicated
+      thread pool, up to max_queue more wait in line, further requests are
+      rejected with ServiceBusyError instead of piling up.
+    - Metrics: running / queued counts and queue wait times (metrics()).
+    """
+
+    def __init__(self, max_workers: int = 2, max_queue: int = 8, max_graphs: int = 4):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.max_graphs = max_graphs
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="graph-run")
+        self._lock = threading.Lock()
+        self._graph_lock = threading.Lock()
+        self._graphs: "OrderedDict[str, TradingAgentsGraph]" = OrderedDict()
+        self._running = 0
+        self._queued = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._waits = deque(maxlen=200)
+
+    # ── graphs
+    def get_graph(
+        self,
+        config: Dict[str, Any],
+        selected_analysts: Optional[List[str]] = None,
+        factory: Callable[..., TradingAgentsGraph] = TradingAgentsGraph,
+    ) -> TradingAgentsGraph:
+        """Shared graph for this config (built on first use, least recently used evicted)."""
+        analysts = list(selected_analysts or ["market", "social", "news", "fundamentals"])
+        key = json.dumps([config, analysts], sort_keys=True, default=str)
+        with self._graph_lock:
+            graph = self._graphs.get(key)
+            if graph is None:
+                graph = factory(analysts, debug=False, config=dict(config))
+                self._graphs[key] = graph
+                while len(self._graphs) > self.max_graphs:
+                    self._graphs.popitem(last=False)
+            self._graphs.move_to_end(key)
+            return graph
+
+    # ── runs
+    def queue_position(self) -> int:
+        """Position a new request would take in the queue (0 = starts immediately)."""
+        with self._lock:
+            return max(self._running + self._queued - self.max_workers + 1, 0)
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> "asyncio.Future":
+        """Run fn(*args, **kwargs) on the worker pool; await the returned future.
+
+        Raises:
+            ServiceBusyError: If max_workers runs are executing and max_queue wait.
+        """
+        with self._lock:
+            if self._running + self._queued >= self.max_workers + self.max_queue:
+                self._rejected += 1
+                raise ServiceBusyError(
+                    f"{self._running} analyses running and {self._queued} queued"
+                )
+            self._queued += 1
+            self._submitted += 1
+        enqueued = time.perf_counter()
+
+        def run():
+            with self._lock:
+                self._queued -= 1
+                self._running += 1
+                self._waits.append(time.perf_counter() - enqueued)
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException:
+                with self._lock:
+                    self._failed += 1
+                raise
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._completed += 1
+            return result
+
+        return asyncio.wrap_future(self._executor.submit(run))
+
+    def metrics(self) -> Dict[str, Any]:
+        """Queue depth, throughput counters and queue wait times (seconds)."""
+        with self._lock:
+            waits = sorted(self._waits)
+            metrics = {
+                "running": self._running,
+                "queued": self._queued,
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+                "graphs": len(self._graphs),
+            }
+        metrics["wait_p50"] = waits[len(waits) // 2] if waits else 0.0
+        metrics["wait_p95"] = waits[int(0.95 * (len(waits) - 1))] if waits else 0.0
+        metrics["wait_max"] = waits[-1] if waits else 0.0
+        return metrics
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
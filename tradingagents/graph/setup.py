@@ -25,8 +25,16 @@ class GraphSetup:
         invest_judge_memory,
         risk_manager_memory,
         conditional_logic: ConditionalLogic,
+        risk_debate_mode: str = "sequential",
+        debate_memory=None,
     ):
-        """Initialize with required components."""
+        """Initialize with required components.
+
+        risk_debate_mode: "sequential" (Aggressive → Conservative → Neutral)
+        or "parallel" (the three risk analysts answer each round concurrently).
+        debate_memory: optional DebateMemory bounding the debate history each
+        debate node embeds in its prompt (None = full history).
+        """
         self.quick_thinking_llm = quick_thinking_llm
         self.deep_thinking_llm = deep_thinking_llm
         self.tool_nodes = tool_nodes
@@ -36,9 +44,17 @@ class GraphSetup:
         self.invest_judge_memory = invest_judge_memory
         self.risk_manager_memory = risk_manager_memory
         self.conditional_logic = conditional_logic
+        self.risk_debate_mode = risk_debate_mode
+        self.debate_memory = debate_memory
+
+    def _debate_memory(self, node_name: str):
+        """Debate memory with the token budget of one node, or None."""
+        if self.debate_memory is None:
+            return None
+        return self.debate_memory.for_node(node_name)
 
     def setup_graph(
-        self, selected_analysts=["market", "social", "news", "fundamentals"]
+        self, selected_analysts=["market", "social", "news", "fundamentals"], checkpointer=None
     ):
         """Set up and compile the agent workflow graph.
 
@@ -48,6 +64,8 @@ class GraphSetup:
                 - "social": Social media analyst
                 - "news": News analyst
                 - "fundamentals": Fundamentals analyst
+            checkpointer: Optional LangGraph checkpoint saver; state is saved after
+                every step so an interrupted run can be resumed by its thread_id
         """
         if len(selected_analysts) == 0:
             raise ValueError("Trading Agents Graph Setup Error: no analysts selected!")
@@ -87,22 +105,32 @@ class GraphSetup:
 
         # Create researcher and manager nodes
         bull_researcher_node = create_bull_researcher(
-            self.quick_thinking_llm, self.bull_memory
+            self.quick_thinking_llm, self.bull_memory, self._debate_memory("Bull Researcher")
         )
         bear_researcher_node = create_bear_researcher(
-            self.quick_thinking_llm, self.bear_memory
+            self.quick_thinking_llm, self.bear_memory, self._debate_memory("Bear Researcher")
         )
         research_manager_node = create_research_manager(
-            self.deep_thinking_llm, self.invest_judge_memory
+            self.deep_thinking_llm,
+            self.invest_judge_memory,
+            self._debate_memory("Research Manager"),
         )
         trader_node = create_trader(self.quick_thinking_llm, self.trader_memory)
 
         # Create risk analysis nodes
-        aggressive_analyst = create_aggressive_debator(self.quick_thinking_llm)
-        neutral_analyst = create_neutral_debator(self.quick_thinking_llm)
-        conservative_analyst = create_conservative_debator(self.quick_thinking_llm)
+        aggressive_analyst = create_aggressive_debator(
+            self.quick_thinking_llm, self._debate_memory("Aggressive Analyst")
+        )
+        neutral_analyst = create_neutral_debator(
+            self.quick_thinking_llm, self._debate_memory("Neutral Analyst")
+        )
+        conservative_analyst = create_conservative_debator(
+            self.quick_thinking_llm, self._debate_memory("Conservative Analyst")
+        )
         risk_manager_node = create_risk_manager(
-            self.deep_thinking_llm, self.risk_manager_memory
+            self.deep_thinking_llm,
+            self.risk_manager_memory,
+            self._debate_memory("Risk Judge"),
         )
 
         # Create workflow
@@ -121,9 +149,20 @@ class GraphSetup:
         workflow.add_node("Bear Researcher", bear_researcher_node)
         workflow.add_node("Research Manager", research_manager_node)
         workflow.add_node("Trader", trader_node)
-        workflow.add_node("Aggressive Analyst", aggressive_analyst)
-        workflow.add_node("Neutral Analyst", neutral_analyst)
-        workflow.add_node("Conservative Analyst", conservative_analyst)
+        if self.risk_debate_mode == "parallel":
+            workflow.add_node(
+                "Risk Debate Round",
+                create_risk_debate_round(
+                    aggressive_analyst,
+                    conservative_analyst,
+                    neutral_analyst,
+                    self._debate_memory("Risk Debate Round"),
+                ),
+            )
+        else:
+            workflow.add_node("Aggressive Analyst", aggressive_analyst)
+            workflow.add_node("Neutral Analyst", neutral_analyst)
+            workflow.add_node("Conservative Analyst", conservative_analyst)
         workflow.add_node("Risk Judge", risk_manager_node)
 
         # Define edges
@@ -170,33 +209,44 @@ class GraphSetup:
             },
         )
         workflow.add_edge("Research Manager", "Trader")
-        workflow.add_edge("Trader", "Aggressive Analyst")
-        workflow.add_conditional_edges(
-            "Aggressive Analyst",
-            self.conditional_logic.should_continue_risk_analysis,
-            {
-                "Conservative Analyst": "Conservative Analyst",
-                "Risk Judge": "Risk Judge",
-            },
-        )
-        workflow.add_conditional_edges(
-            "Conservative Analyst",
-            self.conditional_logic.should_continue_risk_analysis,
-            {
-                "Neutral Analyst": "Neutral Analyst",
-                "Risk Judge": "Risk Judge",
-            },
-        )
-        workflow.add_conditional_edges(
-            "Neutral Analyst",
-            self.conditional_logic.should_continue_risk_analysis,
-            {
-                "Aggressive Analyst": "Aggressive Analyst",
-                "Risk Judge": "Risk Judge",
-            },
-        )
+        if self.risk_debate_mode == "parallel":
+            workflow.add_edge("Trader", "Risk Debate Round")
+            workflow.add_conditional_edges(
+                "Risk Debate Round",
+                self.conditional_logic.should_continue_risk_round,
+                {
+                    "Risk Debate Round": "Risk Debate Round",
+                    "Risk Judge": "Risk Judge",
+                },
+            )
+        else:
+            workflow.add_edge("Trader", "Aggressive Analyst")
+            workflow.add_conditional_edges(
+                "Aggressive Analyst",
+                self.conditional_logic.should_continue_risk_analysis,
+                {
+                    "Conservative Analyst": "Conservative Analyst",
+                    "Risk Judge": "Risk Judge",
+                },
+            )
+            workflow.add_conditional_edges(
+                "Conservative Analyst",
+                self.conditional_logic.should_continue_risk_analysis,
+                {
+                    "Neutral Analyst": "Neutral Analyst",
+                    "Risk Judge": "Risk Judge",
+                },
+            )
+            workflow.add_conditional_edges(
+                "Neutral Analyst",
+                self.conditional_logic.should_continue_risk_analysis,
+                {
+                    "Aggressive Analyst": "Aggressive Analyst",
+                    "Risk Judge": "Risk Judge",
+                },
+            )
 
         workflow.add_edge("Risk Judge", END)
 
         # Compile and return
-        return workflow.compile()
+        return workflow.compile(checkpointer=checkpointer)
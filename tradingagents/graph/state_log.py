@@ -0,0 +1,209 @@
+# TradingAgents/graph/state_log.py
+
+import gzip
+import json
+import os
+import threading
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+class StateLog:
+    """Append-only, line-delimited log of final graph states.
+
+    One log per ticker in <root>/<ticker>/TradingAgentsStrategy_logs/:
+        full_states_log.jsonl[.gz]   one JSON record per run, appended
+        full_states_log.idx          one line per record: trade_date, offset, length
+
+    Each run costs one append (no rewrite of previous runs), so a backtest
+    over N dates writes O(N) bytes. With compress=True every record is its
+    own gzip member: the file stays a valid .gz stream for the streaming
+    reader and any record can still be read by offset. The index is rebuilt
+    from the log if it is missing or behind (e.g. after a crash), and a record
+    torn by the crash is cut off before the next append.
+    """
+
+    def __init__(self, root: str = "eval_results", compress: bool = False):
+        self.root = Path(root)
+        self.compress = compress
+        self._lock = threading.Lock()
+        self._indexes: Dict[str, Dict[str, Tuple[int, int]]] = {}
+
+    # ── paths
+    def _dir(self, ticker: str) -> Path:
+        return self.root / ticker / "TradingAgentsStrategy_logs"
+
+    def log_path(self, ticker: str) -> Path:
+        suffix = ".jsonl.gz" if self.compress else ".jsonl"
+        return self._dir(ticker) / f"full_states_log{suffix}"
+
+    def _index_path(self, ticker: str) -> Path:
+        return self.log_path(ticker).with_suffix(".idx")
+
+    # ── write
+    def append(self, ticker: str, trade_date: str, entry: Dict[str, Any]) -> None:
+        """Append the state of one run; a later run for the same date wins on lookup."""
+        line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+        data = gzip.compress(line) if self.compress else line
+
+        with self._lock:
+            index = self._index(ticker)
+            path = self.log_path(ticker)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "ab") as f:
+                offset = f.tell()
+                try:
+                    f.write(data)
+                    f.flush()
+                except BaseException:
+                    # Never leave a partial record for the next append to land behind
+                    f.truncate(offset)
+                    raise
+            with open(self._index_path(ticker), "a", encoding="utf-8") as f:
+                f.write(json.dumps([str(trade_date), offset, len(data)]) + "\n")
+            index[str(trade_date)] = (offset, len(data))
+
+    # ── read
+    def get(self, ticker: str, trade_date: str) -> Optional[Dict[str, Any]]:
+        """State logged for (ticker, trade_date), read directly by offset."""
+        with self._lock:
+            location = self._index(ticker).get(str(trade_date))
+        if location is None:
+            return None
+        offset, length = location
+        with open(self.log_path(ticker), "rb") as f:
+            f.seek(offset)
+            data = f.read(length)
+        if self.compress:
+            data = gzip.decompress(data)
+        return json.loads(data)
+
+    def dates(self, ticker: str) -> List[str]:
+        """Sorted trade dates logged for a ticker."""
+        with self._lock:
+            return sorted(self._index(ticker))
+
+    def tickers(self) -> List[str]:
+        if not self.root.exists():
+            return []
+        return sorted(d.name for d in self.root.iterdir() if self.log_path(d.name).exists())
+
+    def iter_states(
+        self,
+        ticker: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream logged states in append order, one record in memory at a time."""
+        for tk in [ticker] if ticker else self.tickers():
+            path = self.log_path(tk)
+            if not path.exists():
+                continue
+            for entry in self._read_records(path):
+                trade_date = str(entry.get("trade_date", ""))
+                if start_date and trade_date < start_date:
+                    continue
+                if end_date and trade_date > end_date:
+                    continue
+                yield entry
+
+    def _read_records(self, path: Path) -> Iterator[Dict[str, Any]]:
+        """Decoded records of one log; undecodable ones (torn by a crash) are skipped."""
+        opener = gzip.open if self.compress else open
+        with opener(path, "rb") as f:
+            try:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        continue
+            except (EOFError, OSError, zlib.error):
+                return  # truncated or corrupt gzip member at the end of the log
+
+    # ── index
+    def _index(self, ticker: str) -> Dict[str, Tuple[int, int]]:
+        """(Lazily loaded) trade_date -> (offset, length); caller holds the lock."""
+        if ticker in self._indexes:
+            return self._indexes[ticker]
+
+        index: Dict[str, Tuple[int, int]] = {}
+        log_path, index_path = self.log_path(ticker), self._index_path(ticker)
+        log_size = log_path.stat().st_size if log_path.exists() else 0
+        end = 0
+        if index_path.exists():
+            with open(index_path, encoding="utf-8") as f:
+                for line in f:
+                    trade_date, offset, length = json.loads(line)
+                    index[trade_date] = (offset, length)
+                    end = max(end, offset + length)
+
+        if end != log_size:
+            # A record was written but not indexed, or torn by a crash
+            index = self._rebuild_index(ticker)
+        self._indexes[ticker] = index
+        return index
+
+    def _rebuild_index(self, ticker: str) -> Dict[str, Tuple[int, int]]:
+        """Scan the log and rewrite the index (records only, no state kept).
+
+        The log is truncated to the end of its last valid record, so a record
+        torn by a crash never sits between two runs appended afterwards.
+        """
+        index: Dict[str, Tuple[int, int]] = {}
+        records = []
+        blob = b""
+        log_path = self.log_path(ticker)
+        if log_path.exists():
+            with open(log_path, "rb") as f:
+                blob = f.read()
+            records = list(_gzip_members(blob) if self.compress else _lines(blob))
+
+        rows = []
+        valid_end = 0
+        for offset, length, line in records:
+            if not line.endswith(b"\n"):
+                continue  # partial line: its JSON may parse, but the next append would join it
+            try:
+                trade_date = str(json.loads(line)["trade_date"])
+            except (ValueError, KeyError):
+                continue  # corrupt record
+            index[trade_date] = (offset, length)
+            rows.append(json.dumps([trade_date, offset, length]))
+            valid_end = offset + length
+
+        if valid_end < len(blob):
+            with open(log_path, "r+b") as f:
+                f.truncate(valid_end)
+
+        index_path = self._index_path(ticker)
+        if log_path.exists():
+            tmp_path = str(index_path) + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write("".join(row + "\n" for row in rows))
+            os.replace(tmp_path, index_path)
+        return index
+
+
+def _lines(blob: bytes) -> Iterator[Tuple[int, int, bytes]]:
+    offset = 0
+    for line in blob.splitlines(keepends=True):
+        yield offset, len(line), line
+        offset += len(line)
+
+
+def _gzip_members(blob: bytes) -> Iterator[Tuple[int, int, bytes]]:
+    offset = 0
+    while offset < len(blob):
+        decomp = zlib.decompressobj(wbits=31)
+        try:
+            line = decomp.decompress(blob[offset:])
+        except zlib.error:
+            return
+        if not decomp.eof:
+            return  # truncated last member
+        length = len(blob) - offset - len(decomp.unused_data)
+        yield offset, length, line
+        offset += length
@@ -0,0 +1,229 @@
+# TradingAgents/graph/streaming.py
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+from langchain_core.messages import RemoveMessage
+from langgraph.graph.message import REMOVE_ALL_MESSAGES
+
+_DONE = object()
+
+
+class StateTracker:
+    """Latest graph state plus the fields changed by each step.
+
+    Only the most recent state is kept (no trace of every chunk), so memory
+    stays flat however long the debates run. Works with both stream modes:
+        "updates"  {node: fields the node returned}; deltas are applied to
+                   the tracked state (the "messages" reducer is replayed)
+        "values"   full state after every step; the delta is computed by
+                   comparing it with the previous state
+    """
+
+    def __init__(self, initial_state: Optional[Dict[str, Any]] = None) -> None:
+        self.state: Dict[str, Any] = dict(initial_state or {})
+
+    def consume(self, chunk: Dict[str, Any], stream_mode: str = "values") -> List[Tuple[Optional[str], Dict[str, Any]]]:
+        """Apply one stream chunk; returns (node, delta) pairs (node is None in "values" mode)."""
+        if stream_mode == "updates":
+            # Parallel nodes of a superstep arrive as separate keys; nodes that
+            # return nothing (and "__interrupt__") carry no state update
+            return [
+                (node, self.apply_update(update))
+                for node, update in chunk.items()
+                if isinstance(update, dict)
+            ]
+        return [(None, self.apply(chunk))]
+
+    def apply_update(self, update: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply the fields returned by one node and return them as the delta.
+
+        For "messages" the delta holds only the messages added by the node.
+        """
+        state = dict(self.state)
+        delta = dict(update)
+        for key, value in update.items():
+            if key == "messages":
+                value = value if isinstance(value, list) else [value]
+                state["messages"] = _merge_messages(state.get("messages") or [], value)
+                delta["messages"] = [m for m in value if not isinstance(m, RemoveMessage)]
+            else:
+                state[key] = value
+        self.state = state
+        return delta
+
+    def apply(self, chunk: Dict[str, Any]) -> Dict[str, Any]:
+        """Take a "values" chunk (full state) and return the fields it changed.
+
+        For "messages" the delta holds only the messages added by the step.
+        """
+        previous = self.state
+        delta = {}
+        for key, value in chunk.items():
+            old = previous.get(key)
+            if key in previous and (old is value or old == value):
+                continue
+            if key == "messages" and isinstance(old, list) and old == value[:len(old)]:
+                value = value[len(old):]
+            delta[key] = value
+        self.state = chunk
+        return delta
+
+
+def _merge_messages(current: List[Any], new: List[Any]) -> List[Any]:
+    """Replay of the add_messages reducer.
+
+    Input messages (the initial ("human", ticker) tuple) get their id inside
+    the graph only, so a removal whose id is unknown here drops the first
+    message without an id instead.
+    """
+    merged = list(current)
+    for message in new:
+        message_id = getattr(message, "id", None)
+        if isinstance(message, RemoveMessage):
+            if message_id == REMOVE_ALL_MESSAGES:
+                merged = []
+                continue
+            ids = [getattr(m, "id", None) for m in merged]
+            target = message_id if message_id in ids else None
+            if target in ids:
+                del merged[ids.index(target)]
+            continue
+        for i, existing in enumerate(merged):
+            if message_id is not None and getattr(existing, "id", None) == message_id:
+                merged[i] = message
+                break
+        else:
+            merged.append(message)
+    return merged
+
+
+def iter_graph_deltas(
+    graph,
+    init_state: Dict[str, Any],
+    args: Dict[str, Any],
+    tracker: Optional[StateTracker] = None,
+) -> Iterator[Tuple[Optional[str], Dict[str, Any], Dict[str, Any]]]:
+    """Run graph.stream synchronously, yielding (node, delta, state) after every step.
+
+    Args:
+        graph: Compiled graph (TradingAgentsGraph.graph)
+        init_state: Initial state from Propagator.create_initial_state
+        args: Stream arguments from Propagator.get_graph_args (any stream_mode)
+        tracker: StateTracker to update (a new one seeded with init_state by default)
+    """
+    stream_mode = args.get("stream_mode", "values")
+    tracker = tracker if tracker is not None else StateTracker(init_state)
+    for chunk in graph.stream(init_state, **args):
+        for node, delta in tracker.consume(chunk, stream_mode):
+            yield node, delta, tracker.state
+
+
+class StreamBridge:
+    """Event-driven bridge from a blocking graph.stream to asyncio consumers.
+
+    The graph runs in a worker thread; every step is handed to the event loop
+    with loop.call_soon_threadsafe, so consumers wake exactly when a node
+    finishes (no polling) and read (node, delta) pairs with
+    `async for node, delta in bridge`. `bridge.state` is always the latest
+    full state.
+
+    Usage:
+        args = ta.propagator.get_graph_args(stream_mode="updates")
+        bridge = StreamBridge(ta.graph, init_state, args, submit=service.submit)
+        bridge.start()
+        async for node, delta in bridge:
+            ...
+        final_state = bridge.state
+    """
+
+    def __init__(
+        self,
+        graph,
+        init_state: Dict[str, Any],
+        args: Dict[str, Any],
+        submit: Optional[Callable[[Callable[[], None]], Awaitable[None]]] = None,
+        tracker: Optional[StateTracker] = None,
+    ):
+        """
+        Args:
+            graph: Compiled graph (TradingAgentsGraph.graph)
+            init_state: Initial state from Propagator.create_initial_state
+            args: Stream arguments from Propagator.get_graph_args
+            submit: Runs the blocking stream and returns an awaitable, e.g.
+                GraphService.submit (defaults to the loop's default executor)
+            tracker: StateTracker to update; to resume a checkpointed run pass
+                init_state=None and a tracker seeded with the saved state
+        """
+        self.graph = graph
+        self.init_state = init_state
+        self.args = args
+        self._submit = submit
+        self._tracker = tracker if tracker is not None else StateTracker(init_state)
+        self._queue: Optional[asyncio.Queue] = None
+        self._future: Optional[Awaitable[None]] = None
+        self._stop = threading.Event()
+
+    @property
+    def state(self) -> Dict[str, Any]:
+        """Latest full graph state (the initial state before the first step)."""
+        return self._tracker.state
+
+    def pending(self) -> int:
+        """Deltas delivered by the graph but not consumed yet."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def start(self) -> Awaitable[None]:
+        """Start the graph run; must be called from the event loop.
+
+        Raises whatever submit raises (e.g. ServiceBusyError).
+        """
+        loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        queue = self._queue
+
+        def push(item) -> None:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+            except RuntimeError:  # Event loop closed: nobody is listening anymore
+                self._stop.set()
+
+        def run() -> None:
+            try:
+                for node, delta, _ in iter_graph_deltas(self.graph, self.init_state, self.args, self._tracker):
+                    if self._stop.is_set():
+                        break
+                    push((node, delta))
+            except BaseException as e:
+                push(e)
+            finally:
+                push(_DONE)
+
+        if self._submit is not None:
+            self._future = self._submit(run)
+        else:
+            self._future = loop.run_in_executor(None, run)
+        return self._future
+
+    def close(self) -> None:
+        """Ask the worker to stop after the current step (consumer went away)."""
+        self._stop.set()
+
+    def __aiter__(self):
+        return self._deliver()
+
+    async def _deliver(self):
+        if self._queue is None:
+            self.start()
+        try:
+            while True:
+                item = await self._queue.get()
+                if item is _DONE:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            self.close()
+        await self._future
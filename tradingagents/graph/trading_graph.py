@@ -1,14 +1,16 @@
 # TradingAgents/graph/trading_graph.py
 
 import os
-from pathlib import Path
+import asyncio
+import threading
 import json
+from collections import deque
 from datetime import date
-from typing import Dict, Any, Tuple, List, Optional
+from typing import Dict, Any, Callable, Iterable, Tuple, List, Optional
 
 from langgraph.prebuilt import ToolNode
 
-from tradingagents.llm_clients import create_llm_client
+from tradingagents.llm_clients import create_llm_client, create_response_cache
 
 from tradingagents.agents import *
 from tradingagents.default_config import DEFAULT_CONFIG
@@ -24,6 +26,7 @@ from tradingagents.dataflows.config import set_config
 from tradingagents.agents.utils.agent_utils import (
     get_stock_data,
     get_indicators,
+    get_indicators_batch,
     get_fundamentals,
     get_balance_sheet,
     get_cashflow,
@@ -38,6 +41,9 @@ from .setup import GraphSetup
 from .propagation import Propagator
 from .reflection import Reflector
 from .signal_processing import SignalProcessor
+from .checkpointing import create_checkpointer
+from .state_log import StateLog
+from .streaming import StateTracker
 
 
 class TradingAgentsGraph:
@@ -62,7 +68,8 @@ class TradingAgentsGraph:
         self.config = config or DEFAULT_CONFIG
         self.callbacks = callbacks or []
 
-        # Update the interface's config
+        # Default dataflow config outside graph runs; runs carry self.config
+        # themselves (see Propagator), so graphs with other configs don't leak
         set_config(self.config)
 
         # Create necessary directories
@@ -78,17 +85,20 @@ class TradingAgentsGraph:
         if self.callbacks:
             llm_kwargs["callbacks"] = self.callbacks
 
+        # Optional persistent response cache, one namespace per provider/model
+        self.llm_cache = create_response_cache(self.config)
+
         deep_client = create_llm_client(
             provider=self.config["llm_provider"],
             model=self.config["deep_think_llm"],
             base_url=self.config.get("backend_url"),
-            **llm_kwargs,
+            **self._with_cache(llm_kwargs, self.config["deep_think_llm"]),
         )
         quick_client = create_llm_client(
             provider=self.config["llm_provider"],
             model=self.config["quick_think_llm"],
             base_url=self.config.get("backend_url"),
-            **llm_kwargs,
+            **self._with_cache(llm_kwargs, self.config["quick_think_llm"]),
         )
 
         self.deep_thinking_llm = deep_client.get_llm()
@@ -105,7 +115,10 @@ class TradingAgentsGraph:
         self.tool_nodes = self._create_tool_nodes()
 
         # Initialize components
-        self.conditional_logic = ConditionalLogic()
+        self.conditional_logic = ConditionalLogic(
+            max_debate_rounds=self.config.get("max_debate_rounds", 1),
+            max_risk_discuss_rounds=self.config.get("max_risk_discuss_rounds", 1),
+        )
         self.graph_setup = GraphSetup(
             self.quick_thinking_llm,
             self.deep_thinking_llm,
@@ -116,9 +129,15 @@ class TradingAgentsGraph:
             self.invest_judge_memory,
             self.risk_manager_memory,
             self.conditional_logic,
+            risk_debate_mode=self.config.get("risk_debate_mode", "sequential"),
+            debate_memory=create_debate_memory(self.quick_thinking_llm, self.config),
         )
 
-        self.propagator = Propagator()
+        # Checkpointing (every run then needs a thread id, see Propagator.new_run_id)
+        self.checkpointer = create_checkpointer(self.config)
+        self.propagator = Propagator(
+            checkpointing=self.checkpointer is not None, config=self.config
+        )
         self.reflector = Reflector(self.quick_thinking_llm)
         self.signal_processor = SignalProcessor(self.quick_thinking_llm)
 
@@ -126,9 +145,22 @@ class TradingAgentsGraph:
         self.curr_state = None
         self.ticker = None
         self.log_states_dict = {}  # date to full state dict
+        self.state_log = StateLog(
+            self.config.get("state_log_dir", "eval_results"),
+            compress=self.config.get("state_log_compress", False),
+        )
 
         # Set up the graph
-        self.graph = self.graph_setup.setup_graph(selected_analysts)
+        self.run_id = None
+        self.graph = self.graph_setup.setup_graph(
+            selected_analysts, checkpointer=self.checkpointer
+        )
+
+    def _with_cache(self, llm_kwargs: Dict[str, Any], model: str) -> Dict[str, Any]:
+        """Add the response cache (scoped to provider/model) to the LLM kwargs."""
+        if self.llm_cache is None:
+            return llm_kwargs
+        return {**llm_kwargs, "cache": self.llm_cache.scoped(self.config["llm_provider"], model)}
 
     def _get_provider_kwargs(self) -> Dict[str, Any]:
         """Get provider-specific kwargs for LLM client creation."""
@@ -156,6 +188,7 @@ class TradingAgentsGraph:
                     get_stock_data,
                     # Technical indicators
                     get_indicators,
+                    get_indicators_batch,
                 ]
             ),
             "social": ToolNode(
@@ -183,32 +216,83 @@ class TradingAgentsGraph:
             ),
         }
 
-    def propagate(self, company_name, trade_date):
-        """Run the trading agents graph for a company on a specific date."""
+    def propagate(self, company_name, trade_date, run_id=None):
+        """Run the trading agents graph for a company on a specific date.
+
+        With a checkpointer configured, the run is saved after every step under
+        run_id (generated if not given, available as self.run_id) and can be
+        continued with resume(run_id) if it fails midway.
+        """
 
         self.ticker = company_name
+        self.run_id = self.propagator.new_run_id(company_name, trade_date, run_id)
 
         # Initialize state
         init_agent_state = self.propagator.create_initial_state(
             company_name, trade_date
         )
-        args = self.propagator.get_graph_args()
+        args = self.propagator.get_graph_args(run_id=self.run_id)
+
+        final_state = self._run_graph(init_agent_state, args)
+
+        return self._finish_run(trade_date, final_state)
+
+    def resume(self, run_id):
+        """Continue a checkpointed run from its last completed step.
 
+        Nodes that already completed are not executed again; if the run had
+        already finished, its final state is returned without new LLM calls.
+        """
+        snapshot = self.get_checkpoint(run_id)
+        args = self.propagator.get_graph_args(run_id=run_id)
+
+        self.run_id = run_id
+        self.ticker = snapshot.values["company_of_interest"]
+        trade_date = snapshot.values["trade_date"]
+
+        if snapshot.next:
+            final_state = self._run_graph(None, args)
+        else:
+            final_state = snapshot.values
+
+        return self._finish_run(trade_date, final_state)
+
+    def get_checkpoint(self, run_id):
+        """Last saved snapshot of a checkpointed run.
+
+        snapshot.values is the state after the last completed step and
+        snapshot.next the nodes still to run (empty once the run finished).
+        Streaming callers resume with graph.stream(None, ...) using
+        get_graph_args(run_id=run_id), seeding their StateTracker with
+        snapshot.values.
+        """
+        if self.checkpointer is None:
+            raise ValueError("resume() requires a checkpointer (config['checkpointer'])")
+        config = self.propagator.get_graph_args(run_id=run_id)["config"]
+        snapshot = self.graph.get_state(config)
+        if not snapshot.values:
+            raise ValueError(f"No checkpoint found for run '{run_id}'")
+        return snapshot
+
+    def _run_graph(self, graph_input, args):
+        """Invoke the graph (graph_input=None continues from the checkpoint)."""
         if self.debug:
             # Debug mode with tracing
             trace = []
-            for chunk in self.graph.stream(init_agent_state, **args):
+            for chunk in self.graph.stream(graph_input, **args):
                 if len(chunk["messages"]) == 0:
                     pass
                 else:
                     chunk["messages"][-1].pretty_print()
                     trace.append(chunk)
 
-            final_state = trace[-1]
-        else:
-            # Standard mode without tracing
-            final_state = self.graph.invoke(init_agent_state, **args)
+            return trace[-1]
+
+        # Standard mode without tracing
+        return self.graph.invoke(graph_input, **args)
 
+    def _finish_run(self, trade_date, final_state):
+        """Store, log and process the final state of a run."""
         # Store current state for reflection
         self.curr_state = final_state
 
@@ -218,9 +302,134 @@ class TradingAgentsGraph:
         # Return decision and processed signal
         return final_state, self.process_signal(final_state["final_trade_decision"])
 
+    async def apropagate(
+        self,
+        company_name,
+        trade_date,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+        run_id: Optional[str] = None,
+    ):
+        """Async, re-entrant variant of propagate().
+
+        Each call runs with its own graph state and writes its own log file;
+        nothing is stored on the instance, so many calls can share this graph
+        concurrently. Concurrent runs are bounded per LLM provider by
+        config["max_concurrent_runs"] (see _provider_semaphore).
+
+        Args:
+            company_name: Ticker to analyze
+            trade_date: Trade date (YYYY-mm-dd)
+            on_progress: Optional callback receiving progress events
+                {"ticker", "trade_date", "run_id", "status", "state"} with status
+                "queued", "started", "update" (after every graph step), "done".
+            run_id: Checkpoint thread id (generated when a checkpointer is
+                configured); a failed job can be continued with resume(run_id).
+
+        Returns:
+            (final_state, decision) like propagate()
+        """
+        run_id = self.propagator.new_run_id(company_name, trade_date, run_id)
+
+        def emit(status, state=None):
+            if on_progress:
+                on_progress({
+                    "ticker": company_name,
+                    "trade_date": str(trade_date),
+                    "run_id": run_id,
+                    "status": status,
+                    "state": state,
+                })
+
+        emit("queued")
+        async with self._provider_semaphore():
+            emit("started")
+            init_agent_state = self.propagator.create_initial_state(
+                company_name, trade_date
+            )
+            args = self.propagator.get_graph_args(run_id=run_id, stream_mode="updates")
+
+            # Nodes stream only the fields they changed; the tracker keeps the
+            # full state current for progress events and the final result
+            tracker = StateTracker(init_agent_state)
+            try:
+                async for chunk in self.graph.astream(init_agent_state, **args):
+                    for _, delta in tracker.consume(chunk, "updates"):
+                        if self.debug:
+                            for message in delta.get("messages", []):
+                                message.pretty_print()
+                        emit("update", tracker.state)
+            except Exception as e:
+                # Keep the run id on the error so the job can be resumed
+                e.run_id = run_id
+                raise
+
+            final_state = tracker.state
+            decision = await asyncio.to_thread(
+                self.process_signal, final_state["final_trade_decision"]
+            )
+
+        await asyncio.to_thread(
+            self.state_log.append,
+            company_name,
+            str(trade_date),
+            self._state_log_entry(final_state),
+        )
+        emit("done", final_state)
+        return final_state, decision
+
+    async def apropagate_many(
+        self,
+        jobs: Iterable[Tuple[str, str]],
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> List[Any]:
+        """Run many (ticker, trade_date) jobs concurrently on this graph.
+
+        Returns one entry per job, in input order: the (final_state, decision)
+        tuple, or the exception raised by that job (a failing job does not
+        cancel the others).
+        """
+        return await asyncio.gather(
+            *(self.apropagate(ticker, trade_date, on_progress) for ticker, trade_date in jobs),
+            return_exceptions=True,
+        )
+
+    def propagate_many(
+        self,
+        jobs: Iterable[Tuple[str, str]],
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> List[Any]:
+        """Blocking wrapper around apropagate_many() for scripts and the CLI."""
+        return asyncio.run(self.apropagate_many(jobs, on_progress))
+
+    # Provider -> limit shared by every graph in the process (API rate limits are per provider)
+    _provider_limits: Dict[str, "_ProviderLimit"] = {}
+    _provider_limits_lock = threading.Lock()
+
+    def _provider_semaphore(self) -> "_AsyncSlot":
+        """Concurrency slot for this graph's LLM provider.
+
+        The first graph that runs on a provider sets its limit
+        (config["max_concurrent_runs"]); later graphs share that limit, so
+        runs already holding a slot stay counted.
+        """
+        provider = self.config.get("llm_provider", "").lower()
+        with self._provider_limits_lock:
+            limit = self._provider_limits.get(provider)
+            if limit is None:
+                limit = _ProviderLimit(self.config.get("max_concurrent_runs", 4))
+                self._provider_limits[provider] = limit
+        return _AsyncSlot(limit)
+
     def _log_state(self, trade_date, final_state):
-        """Log the final state to a JSON file."""
-        self.log_states_dict[str(trade_date)] = {
+        """Append the final state to the ticker's state log (see StateLog)."""
+        entry = self._state_log_entry(final_state)
+        self.log_states_dict[str(trade_date)] = entry
+        self.state_log.append(self.ticker, str(trade_date), entry)
+
+    @staticmethod
+    def _state_log_entry(final_state) -> Dict[str, Any]:
+        """Subset of the final state that is written to the state log."""
+        return {
             "company_of_interest": final_state["company_of_interest"],
             "trade_date": final_state["trade_date"],
             "market_report": final_state["market_report"],
@@ -250,34 +459,95 @@ class TradingAgentsGraph:
             "final_trade_decision": final_state["final_trade_decision"],
         }
 
-        # Save to file
-        directory = Path(f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/")
-        directory.mkdir(parents=True, exist_ok=True)
-
-        with open(
-            f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/full_states_log_{trade_date}.json",
-            "w",
-        ) as f:
-            json.dump(self.log_states_dict, f, indent=4)
+    def reflect_and_remember(self, returns_losses, state=None):
+        """Reflect on decisions and update memory based on returns.
 
-    def reflect_and_remember(self, returns_losses):
-        """Reflect on decisions and update memory based on returns."""
+        state defaults to the last propagate() run; pass a final state
+        returned by apropagate()/propagate_many() to reflect on a batch job.
+        """
+        state = state if state is not None else self.curr_state
         self.reflector.reflect_bull_researcher(
-            self.curr_state, returns_losses, self.bull_memory
+            state, returns_losses, self.bull_memory
         )
         self.reflector.reflect_bear_researcher(
-            self.curr_state, returns_losses, self.bear_memory
+            state, returns_losses, self.bear_memory
         )
         self.reflector.reflect_trader(
-            self.curr_state, returns_losses, self.trader_memory
+            state, returns_losses, self.trader_memory
         )
         self.reflector.reflect_invest_judge(
-            self.curr_state, returns_losses, self.invest_judge_memory
+            state, returns_losses, self.invest_judge_memory
         )
         self.reflector.reflect_risk_manager(
-            self.curr_state, returns_losses, self.risk_manager_memory
+            state, returns_losses, self.risk_manager_memory
         )
 
     def process_signal(self, full_signal):
         """Process a signal to extract the core decision."""
         return self.signal_processor.process_signal(full_signal)
+
+
+class _ProviderLimit:
+    """Counting semaphore shared across threads and event loops.
+
+    Not an asyncio.Semaphore, so the same provider limit holds across event
+    loops: propagate_many() starts a new loop per call, while Chainlit or
+    other callers may run apropagate() on their own loop. Waiters park on a
+    future of their own loop; release() hands the slot to the oldest waiter
+    and wakes it with call_soon_threadsafe (FIFO, no polling).
+    """
+
+    def __init__(self, limit: int):
+        self.limit = max(int(limit), 1)
+        self.active = 0
+        self._lock = threading.Lock()
+        self._waiters: deque = deque()  # (loop, future)
+
+    async def acquire(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self.active < self.limit and not self._waiters:
+                self.active += 1
+                return
+            waiter = (loop, loop.create_future())
+            self._waiters.append(waiter)
+        try:
+            await waiter[1]
+        except asyncio.CancelledError:
+            with self._lock:
+                handed_over = waiter not in self._waiters
+                if not handed_over:
+                    self._waiters.remove(waiter)
+            if handed_over:
+                self.release()  # The slot arrived together with the cancellation
+            raise
+
+    def release(self) -> None:
+        with self._lock:
+            while self._waiters:
+                loop, future = self._waiters.popleft()
+                try:
+                    loop.call_soon_threadsafe(_set_done, future)
+                    return  # Slot handed over: active count unchanged
+                except RuntimeError:
+                    continue  # Waiter's loop is closed
+            self.active -= 1
+
+
+def _set_done(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class _AsyncSlot:
+    """Async context manager holding one slot of a _ProviderLimit."""
+
+    def __init__(self, limit: _ProviderLimit):
+        self.limit = limit
+
+    async def __aenter__(self):
+        await self.limit.acquire()
+        return self
+
+    async def __aexit__(self, *exc):
+        self.limit.release()
@@ -1,4 +1,5 @@
 from .base_client import BaseLLMClient
 from .factory import create_llm_client
+from .response_cache import SQLiteResponseCache, create_response_cache
 
-__all__ = ["BaseLLMClient", "create_llm_client"]
+__all__ = ["BaseLLMClient", "create_llm_client", "SQLiteResponseCache", "create_response_cache"]
@@ -38,7 +38,7 @@ class GoogleClient(BaseLLMClient):
         """Return configured ChatGoogleGenerativeAI instance."""
         llm_kwargs = {"model": self.model}
 
-        for key in ("timeout", "max_retries", "google_api_key", "callbacks"):
+        for key in ("timeout", "max_retries", "google_api_key", "callbacks", "cache"):
             if key in self.kwargs:
                 llm_kwargs[key] = self.kwargs[key]
 
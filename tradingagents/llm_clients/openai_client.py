@@ -60,7 +60,7 @@ class OpenAIClient(BaseLLMClient):
         elif self.base_url:
             llm_kwargs["base_url"] = self.base_url
 
-        for key in ("timeout", "max_retries", "reasoning_effort", "api_key", "callbacks"):
+        for key in ("timeout", "max_retries", "reasoning_effort", "api_key", "callbacks", "cache"):
             if key in self.kwargs:
                 llm_kwargs[key] = self.kwargs[key]
 
@@ -0,0 +1,231 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import warnings
+from typing import Any, Dict, Optional
+
+from langchain_core._api import LangChainBetaWarning
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.load import dumps, loads
+
+# Marker written into response_metadata so callbacks can tell hits from misses
+CACHE_STATUS_KEY = "llm_cache"
+
+
+class SQLiteResponseCache(BaseCache):
+    """Persistent, size-bounded LLM response cache backed by SQLite.
+
+    Plugs into LangChain's chat model cache hook (`cache=` on the model), which
+    already normalizes messages (ids stripped) and includes the model params and
+    bound tool schemas in `llm_string`. Entries are keyed by
+    sha256(namespace, llm_string, prompt), where namespace is "provider:model",
+    so re-running the same deterministic prompts replays stored responses
+    instead of calling the API again.
+
+    Least recently used entries are evicted once the store exceeds max_entries
+    or max_bytes. Entry count and size are kept as running totals (shared by
+    the scoped views), so an insert doesn't scan the table; they are re-read
+    from the store only when a limit seems exceeded, which also picks up
+    entries written by other processes.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 50_000,
+        max_bytes: int = 512 * 1024 * 1024,
+        namespace: str = "",
+    ):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.namespace = namespace
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                namespace TEXT NOT NULL,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created REAL NOT NULL,
+                last_access REAL NOT NULL
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_last_access ON responses (last_access)")
+        self._conn.commit()
+        self._totals: Dict[str, int] = {}
+        self._load_totals()
+
+    def scoped(self, provider: str, model: str) -> "SQLiteResponseCache":
+        """Return a view on the same store, namespaced by provider and model."""
+        view = object.__new__(SQLiteResponseCache)
+        view.__dict__.update(self.__dict__)
+        view.namespace = f"{provider.lower()}:{model}"
+        view.hits = view.misses = 0
+        return view
+
+    def _key(self, prompt: str, llm_string: str) -> str:
+        payload = "\x00".join((self.namespace, llm_string, _strip_replay_markers(prompt)))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        """Return the cached generations, or None on a miss."""
+        key = self._key(prompt, llm_string)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._conn.execute(
+                "UPDATE responses SET last_access = ? WHERE key = ?", (time.time(), key)
+            )
+            self._conn.commit()
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", LangChainBetaWarning)
+            generations = loads(row[0], allowed_objects="core")
+        for generation in generations:
+            _mark(generation, "hit")
+        return generations
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        """Store freshly generated responses and evict old entries if needed."""
+        for generation in return_val:
+            _mark(generation, "miss")
+        value = dumps(list(return_val))
+        key = self._key(prompt, llm_string)
+        now = time.time()
+        with self._lock:
+            replaced = self._conn.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, self.namespace, value, len(value), now, now),
+            )
+            if replaced is None:
+                self._totals["count"] += 1
+            self._totals["bytes"] += len(value) - (replaced[0] if replaced else 0)
+            if self._totals["count"] > self.max_entries or self._totals["bytes"] > self.max_bytes:
+                self._evict()
+            self._conn.commit()
+
+    def _load_totals(self) -> None:
+        """Re-read entry count and size from the store (caller holds the lock or is __init__)."""
+        count, size = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        self._totals.update(count=count, bytes=size)
+
+    def _evict(self) -> None:
+        self._load_totals()
+        count, size = self._totals["count"], self._totals["bytes"]
+        if count <= self.max_entries and size <= self.max_bytes:
+            return
+
+        # Drop least recently used entries down to 90% of both limits
+        target_count = int(self.max_entries * 0.9)
+        target_size = int(self.max_bytes * 0.9)
+        rows = self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_access"
+        )
+        stale = []
+        for key, entry_size in rows:
+            if count <= target_count and size <= target_size:
+                break
+            stale.append((key,))
+            count -= 1
+            size -= entry_size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", stale)
+        self._totals.update(count=count, bytes=size)
+
+    def clear(self, **kwargs: Any) -> None:
+        """Remove this namespace's entries (all entries for an unscoped cache)."""
+        with self._lock:
+            if self.namespace:
+                self._conn.execute("DELETE FROM responses WHERE namespace = ?", (self.namespace,))
+            else:
+                self._conn.execute("DELETE FROM responses")
+            self._load_totals()
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this view plus the size of the whole store."""
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": entries,
+            "bytes": size,
+        }
+
+
+def _strip_replay_markers(prompt: str) -> str:
+    """Drop what a cache hit adds to an AI message from the prompt history.
+
+    Replayed messages carry our hit/miss marker and LangChain's zeroed
+    usage_metadata["total_cost"]. They travel into the next turn's history
+    (e.g. after a tool call), so without this a replayed conversation would
+    stop matching the keys stored on the first run after one turn.
+    """
+    if CACHE_STATUS_KEY not in prompt and '"total_cost"' not in prompt:
+        return prompt
+    try:
+        messages = json.loads(prompt)
+    except ValueError:
+        return prompt
+    for message in messages if isinstance(messages, list) else ():
+        kwargs = message.get("kwargs") if isinstance(message, dict) else None
+        if not isinstance(kwargs, dict):
+            continue
+        if isinstance(kwargs.get("response_metadata"), dict):
+            kwargs["response_metadata"].pop(CACHE_STATUS_KEY, None)
+        usage = kwargs.get("usage_metadata")
+        if isinstance(usage, dict):
+            usage.pop("total_cost", None)
+            if not usage:
+                del kwargs["usage_metadata"]
+    return json.dumps(messages)
+
+
+def _mark(generation: Any, status: str) -> None:
+    message = getattr(generation, "message", None)
+    if message is not None:
+        message.response_metadata = {**message.response_metadata, CACHE_STATUS_KEY: status}
+
+
+def create_response_cache(config: Dict[str, Any]) -> Optional[SQLiteResponseCache]:
+    """Build the shared response cache from config, or None if caching is off.
+
+    Config keys:
+        llm_cache: enable the cache (default False)
+        llm_cache_path: SQLite file (default <data_cache_dir>/llm_cache.sqlite)
+        llm_cache_max_entries / llm_cache_max_mb: eviction limits
+    """
+    if not config.get("llm_cache"):
+        return None
+
+    path = config.get("llm_cache_path") or os.path.join(
+        config.get("data_cache_dir", "data"), "llm_cache.sqlite"
+    )
+    return SQLiteResponseCache(
+        path,
+        max_entries=config.get("llm_cache_max_entries", 50_000),
+        max_bytes=int(config.get("llm_cache_max_mb", 512) * 1024 * 1024),
+    )
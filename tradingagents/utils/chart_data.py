@@ -0,0 +1,104 @@
+"""
+Dati dei grafici: downsampling e payload colonnari
+
+Per storici lunghi (20 anni, centinaia di ticker) i grafici non vengono
+serializzati punto per punto: le serie sono ridotte a poche centinaia di punti
+prima del rendering e codificate come typed array (base64 float32), disegnati
+poi dal browser.
+  - lttb_indices:    Largest-Triangle-Three-Buckets per curve (equity, indicatori)
+  - downsample_ohlc: barre aggregate per bucket (open first, high max, low min,
+                     close last, volume sum): minimi e massimi restano visibili
+  - typed_array:     {"dtype", "bdata"}, il formato letto nativamente da plotly.js
+"""
+
+import base64
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+# Aggregazione OHLCV per bucket; le altre colonne (indicatori) usano l'ultimo valore
+_OHLC_AGG = {
+    "open": "first",
+    "high": "max",
+    "low": "min",
+    "close": "last",
+    "volume": "sum",
+}
+
+
+def lttb_indices(y: Sequence[float], threshold: int, x: Optional[Sequence[float]] = None) -> np.ndarray:
+    """
+    Indici dei punti scelti da LTTB (primo e ultimo sempre inclusi)
+
+    Args:
+        y: Valori della serie
+        threshold: Numero massimo di punti da tenere
+        x: Ascisse (default: posizione)
+
+    Returns:
+        Indici ordinati; tutti gli indici se la serie è già abbastanza corta
+    """
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    x = np.arange(n, dtype=float) if x is None else np.asarray(x, dtype=float)
+
+    # threshold-2 bucket per i punti interni, [edges[i], edges[i+1])
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    edges = np.append(edges, n)
+    idx = np.empty(threshold, dtype=int)
+    idx[0], idx[-1] = 0, n - 1
+
+    a = 0
+    for i in range(threshold - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # Vertice C: media del bucket successivo (l'ultimo punto per l'ultimo bucket)
+        avg_x = x[hi:edges[i + 2]].mean()
+        avg_y = y[hi:edges[i + 2]].mean()
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(np.nanargmax(area)) if not np.isnan(area).all() else lo
+        idx[i + 1] = a
+    return idx
+
+
+def downsample_ohlc(df: pd.DataFrame, max_points: int, date_col: str = "date") -> pd.DataFrame:
+    """
+    Riduce un DataFrame OHLCV a max_points barre
+
+    Args:
+        df: Barre ordinate per data (colonne open/high/low/close/volume, più
+            eventuali indicatori)
+        max_points: Numero massimo di barre
+        date_col: Colonna data (prende la data della prima barra del bucket)
+
+    Returns:
+        df invariato se già abbastanza corto, altrimenti le barre aggregate
+    """
+    n = len(df)
+    if n <= max_points:
+        return df
+    buckets = np.arange(n) * max_points // n
+    agg = {col: _OHLC_AGG.get(col, "last") for col in df.columns}
+    if date_col in agg:
+        agg[date_col] = "first"
+    return df.groupby(buckets).agg(agg).reset_index(drop=True)
+
+
+def encode_f32(values: Sequence[float]) -> str:
+    """Serie come base64 di float32 little-endian (NaN = punto mancante)"""
+    return base64.b64encode(np.asarray(values, dtype="<f4").tobytes()).decode("ascii")
+
+
+def typed_array(values: Sequence[float]) -> Dict[str, Any]:
+    """Typed array float32 per plotly.js / JS del dashboard: {"dtype": "f4", "bdata": ...}"""
+    return {"dtype": "f4", "bdata": encode_f32(values)}
+
+
+def epoch_ms(dates: Any) -> np.ndarray:
+    """Date come millisecondi epoch float64 (asse "date" di plotly, colonnare)"""
+    ts = pd.to_datetime(pd.Series(dates))
+    if ts.dt.tz is not None:
+        ts = ts.dt.tz_localize(None)
+    return ts.astype("datetime64[ms]").astype("int64").to_numpy(dtype=float)
@@ -10,12 +10,146 @@ from datetime import datetime
 from typing import Dict, List, Any, Optional
 import os
 
+from .static_assets import asset_tags, plot_payload
+
+DASHBOARD_CSS = """
+* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+body {
+    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    min-height: 100vh;
+    padding: 20px;
+}
+
+.container {
+    max-width: 1400px;
+    margin: 0 auto;
+}
+
+header {
+    background: white;
+    padding: 30px;
+    border-radius: 10px;
+    margin-bottom: 30px;
+    box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+}
+
+header h1 {
+    color: #2c3e50;
+    margin-bottom: 10px;
+    font-size: 2.5em;
+}
+
+header p {
+    color: #7f8c8d;
+    font-size: 1.1em;
+}
+
+.info-bar {
+    display: flex;
+    justify-content: space-around;
+    margin-top: 20px;
+    border-top: 1px solid #ecf0f1;
+    padding-top: 20px;
+}
+
+.info-item {
+    text-align: center;
+}
+
+.info-label {
+    font-size: 0.9em;
+    color: #95a5a6;
+    text-transform: uppercase;
+    margin-bottom: 5px;
+}
+
+.info-value {
+    font-size: 1.3em;
+    font-weight: bold;
+    color: #2c3e50;
+}
+
+.grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(500px, 1fr));
+    gap: 20px;
+    margin-bottom: 20px;
+}
+
+.card {
+    background: white;
+    border-radius: 10px;
+    padding: 20px;
+    box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+    transition: transform 0.3s ease;
+}
+
+.card:hover {
+    transform: translateY(-5px);
+    box-shadow: 0 8px 12px rgba(0, 0, 0, 0.15);
+}
+
+.card h2 {
+    color: #2c3e50;
+    margin-bottom: 15px;
+    font-size: 1.3em;
+    border-bottom: 2px solid #667eea;
+    padding-bottom: 10px;
+}
+
+.full-width {
+    grid-column: 1 / -1;
+}
+
+footer {
+    text-align: center;
+    color: white;
+    margin-top: 40px;
+    padding-top: 20px;
+    border-top: 1px solid rgba(255, 255, 255, 0.2);
+}
+
+.timestamp {
+    font-size: 0.9em;
+    color: #95a5a6;
+}
+
+@media (max-width: 768px) {
+    .grid {
+        grid-template-columns: 1fr;
+    }
+
+    header h1 {
+        font-size: 1.8em;
+    }
+
+    .info-bar {
+        flex-direction: column;
+        gap: 15px;
+    }
+}
+"""
+
 
 class DashboardGenerator:
     """Generatore di grafici e dashboard trading"""
     
-    def __init__(self, output_dir: str = "./dashboards"):
+    def __init__(self, output_dir: str = "./dashboards", shared_assets: bool = True):
+        """
+        Args:
+            output_dir: Cartella delle dashboard
+            shared_assets: CSS/JS/Plotly scritti una volta in output_dir/static
+                (pagine leggere, funzionano offline); False = file HTML
+                autonomo con CSS inline e Plotly da CDN (es. per inviarlo come allegato)
+        """
         self.output_dir = output_dir
+        self.shared_assets = shared_assets
         os.makedirs(output_dir, exist_ok=True)
     
     def create_decision_gauge(
@@ -314,6 +448,10 @@ class DashboardGenerator:
             filename = f"dashboard_{ticker}_{timestamp}.html"
         
         filepath = os.path.join(self.output_dir, filename)
+        head_assets, body_assets = asset_tags(
+            self.output_dir if self.shared_assets else None,
+            "dashboard", css=DASHBOARD_CSS, plotly=True,
+        )
         
         # Crea HTML
         html_content = f"""
@@ -323,130 +461,7 @@ class DashboardGenerator:
             <meta charset="UTF-8">
             <meta name="viewport" content="width=device-width, initial-scale=1.0">
             <title>Dashboard Trading - {ticker}</title>
-            <script src="https://cdn.plot.ly/plotly-latest.min.js"></script>
-            <style>
-                * {{
-                    margin: 0;
-                    padding: 0;
-                    box-sizing: border-box;
-                }}
-                
-                body {{
-                    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    min-height: 100vh;
-                    padding: 20px;
-                }}
-                
-                .container {{
-                    max-width: 1400px;
-                    margin: 0 auto;
-                }}
-                
-                header {{
-                    background: white;
-                    padding: 30px;
-                    border-radius: 10px;
-                    margin-bottom: 30px;
-                    box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-                }}
-                
-                header h1 {{
-                    color: #2c3e50;
-                    margin-bottom: 10px;
-                    font-size: 2.5em;
-                }}
-                
-                header p {{
-                    color: #7f8c8d;
-                    font-size: 1.1em;
-                }}
-                
-                .info-bar {{
-                    display: flex;
-                    justify-content: space-around;
-                    margin-top: 20px;
-                    border-top: 1px solid #ecf0f1;
-                    padding-top: 20px;
-                }}
-                
-                .info-item {{
-                    text-align: center;
-                }}
-                
-                .info-label {{
-                    font-size: 0.9em;
-                    color: #95a5a6;
-                    text-transform: uppercase;
-                    margin-bottom: 5px;
-                }}
-                
-                .info-value {{
-                    font-size: 1.3em;
-                    font-weight: bold;
-                    color: #2c3e50;
-                }}
-                
-                .grid {{
-                    display: grid;
-                    grid-template-columns: repeat(auto-fit, minmax(500px, 1fr));
-                    gap: 20px;
-                    margin-bottom: 20px;
-                }}
-                
-                .card {{
-                    background: white;
-                    border-radius: 10px;
-                    padding: 20px;
-                    box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-                    transition: transform 0.3s ease;
-                }}
-                
-                .card:hover {{
-                    transform: translateY(-5px);
-                    box-shadow: 0 8px 12px rgba(0, 0, 0, 0.15);
-                }}
-                
-                .card h2 {{
-                    color: #2c3e50;
-                    margin-bottom: 15px;
-                    font-size: 1.3em;
-                    border-bottom: 2px solid #667eea;
-                    padding-bottom: 10px;
-                }}
-                
-                .full-width {{
-                    grid-column: 1 / -1;
-                }}
-                
-                footer {{
-                    text-align: center;
-                    color: white;
-                    margin-top: 40px;
-                    padding-top: 20px;
-                    border-top: 1px solid rgba(255, 255, 255, 0.2);
-                }}
-                
-                .timestamp {{
-                    font-size: 0.9em;
-                    color: #95a5a6;
-                }}
-                
-                @media (max-width: 768px) {{
-                    .grid {{
-                        grid-template-columns: 1fr;
-                    }}
-                    
-                    header h1 {{
-                        font-size: 1.8em;
-                    }}
-                    
-                    .info-bar {{
-                        flex-direction: column;
-                        gap: 15px;
-                    }}
-                }}
-            </style>
+            {head_assets}
         </head>
         <body>
             <div class="container">
@@ -514,24 +529,22 @@ class DashboardGenerator:
                 </footer>
             </div>
             
-            <script>
         """
         
-        # Aggiungi grafici Plotly
-        html_content += f"Plotly.newPlot('decision-chart', {decision_fig.to_json()}, {{}}, {{responsive: true}});\n"
-        html_content += f"Plotly.newPlot('sentiment-chart', {sentiment_fig.to_json()}, {{}}, {{responsive: true}});\n"
+        # Aggiungi grafici Plotly (payload JSON, disegnati dallo script condiviso)
+        html_content += plot_payload("decision-chart", decision_fig) + "\n"
+        html_content += plot_payload("sentiment-chart", sentiment_fig) + "\n"
         
         if price_fig:
-            html_content += f"Plotly.newPlot('price-chart', {price_fig.to_json()}, {{}}, {{responsive: true}});\n"
+            html_content += plot_payload("price-chart", price_fig) + "\n"
         
         if analyst_fig:
-            html_content += f"Plotly.newPlot('analyst-chart', {analyst_fig.to_json()}, {{}}, {{responsive: true}});\n"
+            html_content += plot_payload("analyst-chart", analyst_fig) + "\n"
         
         if performance_fig:
-            html_content += f"Plotly.newPlot('performance-chart', {performance_fig.to_json()}, {{}}, {{responsive: true}});\n"
+            html_content += plot_payload("performance-chart", performance_fig) + "\n"
         
-        html_content += """
-            </script>
+        html_content += body_assets + """
         </body>
         </html>
         """
@@ -0,0 +1,129 @@
+"""
+Asset statici condivisi per dashboard e report HTML
+
+CSS, JS e Plotly vengono scritti una sola volta in <output_dir>/static/ con
+nome versionato (hash del contenuto, versione di plotly.js): ogni pagina HTML
+contiene solo markup e dati (payload JSON) e li referenzia con path relativi.
+Plotly è copiato dal pacchetto Python, quindi le pagine funzionano offline.
+
+Senza output_dir (HTML restituito come stringa o inviato come file singolo)
+CSS/JS vengono inlinati e Plotly caricato da CDN, come in passato.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Any, Optional, Tuple, Union
+
+STATIC_DIR = "static"
+PLOTLY_CDN = "https://cdn.plot.ly/plotly-{version}.min.js"
+
+# Disegna ogni grafico dal suo payload JSON:
+# <script type="application/json" data-plot="id-div">{figura plotly}</script>
+PLOTLY_PAYLOAD_JS = """
+document.querySelectorAll('script[type="application/json"][data-plot]').forEach(function (el) {
+  var fig = JSON.parse(el.textContent);
+  Plotly.newPlot(el.dataset.plot, fig.data, fig.layout || {}, {responsive: true});
+});
+"""
+
+
+def _write_once(path: Path, content: Union[str, bytes]) -> None:
+    """Scrive il file solo se manca (scrittura + rename: mai file parziali)"""
+    if path.exists():
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    if isinstance(content, str):
+        tmp.write_text(content, encoding="utf-8")
+    else:
+        tmp.write_bytes(content)
+    os.replace(tmp, path)
+
+
+def publish_asset(output_dir: Union[str, Path], name: str, content: str, ext: str) -> str:
+    """
+    Pubblica un asset in <output_dir>/static/<name>-<hash>.<ext>
+
+    Returns:
+        Path relativo a output_dir, da usare in href/src
+    """
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:10]
+    filename = f"{name}-{digest}.{ext}"
+    _write_once(Path(output_dir) / STATIC_DIR / filename, content)
+    return f"{STATIC_DIR}/{filename}"
+
+
+def publish_plotly(output_dir: Union[str, Path]) -> str:
+    """Copia plotly.min.js del pacchetto installato (una volta per versione)"""
+    from plotly.offline import get_plotlyjs, get_plotlyjs_version
+
+    filename = f"plotly-{get_plotlyjs_version()}.min.js"
+    path = Path(output_dir) / STATIC_DIR / filename
+    if not path.exists():  # get_plotlyjs() legge ~3.5 MB: solo la prima volta
+        _write_once(path, get_plotlyjs())
+    return f"{STATIC_DIR}/{filename}"
+
+
+def plotly_cdn() -> str:
+    """URL CDN della stessa versione di plotly.js inclusa nel pacchetto
+    (il JSON di plotly>=6 usa array binari non letti dalle versioni 2.x)"""
+    from plotly.offline import get_plotlyjs_version
+
+    return PLOTLY_CDN.format(version=get_plotlyjs_version())
+
+
+def asset_tags(
+    output_dir: Optional[Union[str, Path]],
+    name: str,
+    css: Optional[str] = None,
+    js: Optional[str] = None,
+    plotly: bool = False,
+) -> Tuple[str, str]:
+    """
+    Tag HTML per gli asset di una pagina
+
+    Args:
+        output_dir: Cartella della pagina (None = asset inline, Plotly da CDN)
+        name: Prefisso dei file (es. "dashboard", "screener")
+        css: Foglio di stile della pagina
+        js: Script della pagina (eseguito a fine body, dopo i payload)
+        plotly: Include Plotly e il renderer dei payload JSON
+
+    Returns:
+        (tag per <head>, tag per fine <body>)
+    """
+    scripts = [s for s in ((PLOTLY_PAYLOAD_JS if plotly else None), js) if s]
+    head, body = [], []
+
+    if output_dir is None:
+        if plotly:
+            head.append(f'<script src="{plotly_cdn()}"></script>')
+        if css:
+            head.append(f"<style>{css}</style>")
+        body.extend(f"<script>{s}</script>" for s in scripts)
+        return "\n".join(head), "\n".join(body)
+
+    if plotly:
+        head.append(f'<script src="{publish_plotly(output_dir)}"></script>')
+    if css:
+        head.append(f'<link rel="stylesheet" href="{publish_asset(output_dir, name, css, "css")}">')
+    if scripts:
+        src = publish_asset(output_dir, name, "\n".join(scripts), "js")
+        body.append(f'<script src="{src}"></script>')
+    return "\n".join(head), "\n".join(body)
+
+
+def plot_payload(div_id: str, figure: Union[str, Any]) -> str:
+    """
+    Payload JSON di un grafico Plotly, disegnato nel div div_id da PLOTLY_PAYLOAD_JS
+
+    Args:
+        div_id: id del <div> di destinazione
+        figure: go.Figure o il suo JSON (fig.to_json())
+    """
+    data = figure if isinstance(figure, str) else figure.to_json()
+    # "</" chiuderebbe il tag <script> se presente in un testo della figura
+    data = data.replace("</", "<\\/")
+    return f'<script type="application/json" data-plot="{div_id}">{data}</script>'
+